@@ -698,7 +698,10 @@ export type AutomationConditionEvaluationNode = {
   endTimestamp: Maybe<Scalars['Float']['output']>;
   expandedLabel: Array<Scalars['String']['output']>;
   isPartitioned: Scalars['Boolean']['output'];
+  numCacheHits: Maybe<Scalars['Int']['output']>;
+  numCacheMisses: Maybe<Scalars['Int']['output']>;
   numCandidates: Maybe<Scalars['Int']['output']>;
+  numStorageQueries: Maybe<Scalars['Int']['output']>;
   numTrue: Scalars['Int']['output'];
   startTimestamp: Maybe<Scalars['Float']['output']>;
   uniqueId: Scalars['String']['output'];
@@ -7095,8 +7098,16 @@ export const buildAutomationConditionEvaluationNode = (
       overrides && overrides.hasOwnProperty('expandedLabel') ? overrides.expandedLabel! : [],
     isPartitioned:
       overrides && overrides.hasOwnProperty('isPartitioned') ? overrides.isPartitioned! : true,
+    numCacheHits:
+      overrides && overrides.hasOwnProperty('numCacheHits') ? overrides.numCacheHits! : 2417,
+    numCacheMisses:
+      overrides && overrides.hasOwnProperty('numCacheMisses') ? overrides.numCacheMisses! : 8840,
     numCandidates:
       overrides && overrides.hasOwnProperty('numCandidates') ? overrides.numCandidates! : 6123,
+    numStorageQueries:
+      overrides && overrides.hasOwnProperty('numStorageQueries')
+        ? overrides.numStorageQueries!
+        : 3391,
     numTrue: overrides && overrides.hasOwnProperty('numTrue') ? overrides.numTrue! : 5212,
     startTimestamp:
       overrides && overrides.hasOwnProperty('startTimestamp') ? overrides.startTimestamp! : 5.42,
@@ -18,9 +18,6 @@
 from dagster._core.storage.dagster_run import CANCELABLE_RUN_STATUSES
 from dagster._core.workspace.permissions import Permissions
 from dagster._utils.error import serializable_error_info_from_exc_info
-from starlette.concurrency import (
-    run_in_threadpool,  # can provide this indirectly if we dont want starlette dep in dagster-graphql
-)
 
 if TYPE_CHECKING:
     from dagster_graphql.schema.errors import (
@@ -260,9 +257,7 @@ async def gen_events_for_run(
     # load the existing events in chunks
     has_more = True
     while has_more:
-        # run the fetch in a thread since its sync
-        connection = await run_in_threadpool(
-            instance.get_records_for_run,
+        connection = await instance.get_records_for_run_async(
             run_id=run_id,
             cursor=after_cursor,
             limit=chunk_size,
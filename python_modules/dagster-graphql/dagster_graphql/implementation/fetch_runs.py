@@ -106,7 +106,7 @@ def get_run_group(graphene_info: "ResolveInfo", run_id: str) -> "GrapheneRunGrou
     )
 
 
-def get_runs(
+async def gen_runs(
     graphene_info: "ResolveInfo",
     filters: Optional[RunsFilter],
     cursor: Optional[str] = None,
@@ -122,7 +122,9 @@ def get_runs(
 
     return [
         GrapheneRun(record)
-        for record in instance.get_run_records(filters=filters, cursor=cursor, limit=limit)
+        for record in await instance.get_run_records_async(
+            filters=filters, cursor=cursor, limit=limit
+        )
     ]
 
 
@@ -359,27 +361,37 @@ def get_step_stats(
     return [GrapheneRunStepStats(stats) for stats in step_stats]
 
 
-def get_logs_for_run(
+async def gen_logs_for_run(
     graphene_info: "ResolveInfo",
     run_id: str,
     cursor: Optional[str] = None,
     limit: Optional[int] = None,
 ) -> Union["GrapheneRunNotFoundError", "GrapheneEventConnection"]:
     from dagster_graphql.implementation.events import from_event_record
+    from dagster_graphql.implementation.execution import get_chunk_size
     from dagster_graphql.schema.errors import GrapheneRunNotFoundError
     from dagster_graphql.schema.pipelines.pipeline import GrapheneEventConnection
 
-    instance = graphene_info.context.instance
-    run = instance.get_run_by_id(run_id)
-    if not run:
+    run_record = await RunRecord.gen(graphene_info.context, run_id)
+    if not run_record:
         return GrapheneRunNotFoundError(run_id)
 
-    conn = instance.get_records_for_run(run_id, cursor=cursor, limit=limit)
-    return GrapheneEventConnection(
-        events=[from_event_record(record.event_log_entry, run.job_name) for record in conn.records],
-        cursor=conn.cursor,
-        hasMore=conn.has_more,
-    )
+    job_name = run_record.dagster_run.job_name
+    instance = graphene_info.context.instance
+    events = []
+    # without a limit, fetch the log in chunks so that only one chunk of raw records is held in
+    # memory alongside the converted events
+    chunk_size = limit if limit is not None else get_chunk_size()
+    while True:
+        conn = await instance.get_records_for_run_async(run_id, cursor=cursor, limit=chunk_size)
+        events.extend(
+            from_event_record(record.event_log_entry, job_name) for record in conn.records
+        )
+        cursor = conn.cursor
+        if limit is not None or not conn.has_more:
+            break
+
+    return GrapheneEventConnection(events=events, cursor=conn.cursor, hasMore=conn.has_more)
 
 
 @record
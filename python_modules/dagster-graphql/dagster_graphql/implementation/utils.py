@@ -1,4 +1,5 @@
 import functools
+import inspect
 import sys
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from contextlib import contextmanager
@@ -216,6 +217,20 @@ def watch(fn: Callable[[Exception], None]) -> Iterator[None]:
 def capture_error(
     fn: Callable[P, T],
 ) -> Callable[P, Union[T, "GrapheneError", "GraphenePythonError"]]:
+    if inspect.iscoroutinefunction(fn):
+
+        @functools.wraps(fn)
+        async def _async_fn(*args: P.args, **kwargs: P.kwargs) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except UserFacingGraphQLError as de_exception:
+                return de_exception.error
+            except Exception as exc:
+                ErrorCapture.observer.get()(exc)
+                return ErrorCapture.on_exception(sys.exc_info())
+
+        return _async_fn  # type: ignore
+
     @functools.wraps(fn)
     def _fn(*args: P.args, **kwargs: P.kwargs) -> T:
         try:
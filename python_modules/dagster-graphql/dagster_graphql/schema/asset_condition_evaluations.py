@@ -221,6 +221,10 @@ class GrapheneAutomationConditionEvaluationNode(graphene.ObjectType):
     numTrue = graphene.NonNull(graphene.Int)
     numCandidates = graphene.Field(graphene.Int)
 
+    numStorageQueries = graphene.Field(graphene.Int)
+    numCacheHits = graphene.Field(graphene.Int)
+    numCacheMisses = graphene.Field(graphene.Int)
+
     isPartitioned = graphene.NonNull(graphene.Boolean)
 
     childUniqueIds = non_null_list(graphene.String)
@@ -240,6 +244,9 @@ def __init__(self, evaluation: AutomationConditionEvaluation):
             numCandidates=evaluation.candidate_subset.size
             if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
             else None,
+            numStorageQueries=evaluation.stats.num_storage_queries if evaluation.stats else None,
+            numCacheHits=evaluation.stats.num_cache_hits if evaluation.stats else None,
+            numCacheMisses=evaluation.stats.num_cache_misses if evaluation.stats else None,
             isPartitioned=evaluation.true_subset.is_partitioned,
             childUniqueIds=[
                 child.condition_snapshot.unique_id for child in evaluation.child_evaluations
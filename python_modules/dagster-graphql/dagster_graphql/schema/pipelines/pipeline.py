@@ -29,7 +29,7 @@
 from dagster_graphql.implementation.fetch_asset_checks import get_asset_checks_for_run_id
 from dagster_graphql.implementation.fetch_assets import get_assets_for_run, get_unique_asset_id
 from dagster_graphql.implementation.fetch_pipelines import get_job_reference_or_raise
-from dagster_graphql.implementation.fetch_runs import get_runs, get_stats, get_step_stats
+from dagster_graphql.implementation.fetch_runs import gen_runs, get_stats, get_step_stats
 from dagster_graphql.implementation.fetch_schedules import get_schedules_for_job
 from dagster_graphql.implementation.fetch_sensors import get_sensors_for_job
 from dagster_graphql.implementation.utils import (
@@ -478,9 +478,11 @@ def resolve_parentPipelineSnapshotId(self, graphene_info: ResolveInfo):
         if pipeline_snapshot_id is not None and graphene_info.context.instance.has_job_snapshot(
             pipeline_snapshot_id
         ):
-            snapshot = graphene_info.context.instance.get_job_snapshot(pipeline_snapshot_id)
-            if snapshot.lineage_snapshot is not None:
-                return snapshot.lineage_snapshot.parent_snapshot_id
+            lineage_snapshot = graphene_info.context.instance.get_job_snapshot_lineage(
+                pipeline_snapshot_id
+            )
+            if lineage_snapshot is not None:
+                return lineage_snapshot.parent_snapshot_id
         return None
 
     @capture_error
@@ -791,7 +793,7 @@ def resolve_metadata_entries(self, _graphene_info: ResolveInfo) -> list[Graphene
     def resolve_solidSelection(self, _graphene_info: ResolveInfo):
         return self.get_represented_job().op_selection
 
-    def resolve_runs(
+    async def resolve_runs(
         self, graphene_info: ResolveInfo, cursor: Optional[str] = None, limit: Optional[int] = None
     ) -> Sequence[GrapheneRun]:
         pipeline = self.get_represented_job()
@@ -806,7 +808,7 @@ def resolve_runs(
             )
         else:
             runs_filter = RunsFilter(job_name=pipeline.name)
-        return get_runs(graphene_info, runs_filter, cursor, limit)
+        return await gen_runs(graphene_info, runs_filter, cursor, limit)
 
     def resolve_schedules(self, graphene_info: ResolveInfo):
         represented_pipeline = self.get_represented_job()
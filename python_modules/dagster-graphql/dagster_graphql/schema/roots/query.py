@@ -70,10 +70,10 @@
     get_top_level_resources_or_error,
 )
 from dagster_graphql.implementation.fetch_runs import (
+    gen_logs_for_run,
     gen_run_by_id,
     get_assets_latest_info,
     get_execution_plan,
-    get_logs_for_run,
     get_run_group,
     get_run_tag_keys,
     get_run_tags,
@@ -1199,14 +1199,14 @@ def resolve_assetsLatestInfo(
         return get_assets_latest_info(graphene_info, step_keys_by_asset)
 
     @capture_error
-    def resolve_logsForRun(
+    async def resolve_logsForRun(
         self,
         graphene_info: ResolveInfo,
         runId: str,
         afterCursor: Optional[str] = None,
         limit: Optional[int] = None,
     ):
-        return get_logs_for_run(graphene_info, runId, afterCursor, limit)
+        return await gen_logs_for_run(graphene_info, runId, afterCursor, limit)
 
     def resolve_capturedLogsMetadata(
         self, graphene_info: ResolveInfo, logKey: Sequence[str]
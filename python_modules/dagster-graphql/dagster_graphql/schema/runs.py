@@ -10,7 +10,7 @@
 from dagster._utils.yaml_utils import load_run_config_yaml
 from graphene.types.generic import GenericScalar
 
-from dagster_graphql.implementation.fetch_runs import get_run_ids, get_runs, get_runs_count
+from dagster_graphql.implementation.fetch_runs import gen_runs, get_run_ids, get_runs_count
 from dagster_graphql.implementation.utils import UserFacingGraphQLError
 from dagster_graphql.schema.backfill import pipeline_execution_error_types
 from dagster_graphql.schema.errors import (
@@ -125,8 +125,8 @@ def __init__(self, filters, cursor, limit):
         self._cursor = cursor
         self._limit = limit
 
-    def resolve_results(self, graphene_info: ResolveInfo):
-        return get_runs(graphene_info, self._filters, self._cursor, self._limit)
+    async def resolve_results(self, graphene_info: ResolveInfo):
+        return await gen_runs(graphene_info, self._filters, self._cursor, self._limit)
 
     def resolve_count(self, graphene_info: ResolveInfo):
         return get_runs_count(graphene_info, self._filters)
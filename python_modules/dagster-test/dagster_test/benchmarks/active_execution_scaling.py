@@ -0,0 +1,164 @@
+# ruff: noqa: T201
+import argparse
+import time
+from collections import deque
+from collections.abc import Sequence
+
+from dagster import DynamicOut, DynamicOutput, job, op
+from dagster._core.events import DagsterEvent, DagsterEventType
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.objects import StepSuccessData
+from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
+from dagster._core.execution.retries import RetryMode
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure how the cost of scheduling a plan with ActiveExecution scales with the number of steps.
+
+For each size, a job with a dynamic fan-out op, a mapped op and a collecting op is planned, and
+ActiveExecution is driven to completion in-process as an executor would: steps are requested
+with `get_steps_to_execute` up to `--max-concurrent` in flight, and the oldest in-flight step is
+reported as having produced its outputs and succeeded each time around. The fan-out step maps to
+`size` keys, so the plan grows to `size + 2` steps once it resolves. No user code is run; the
+reported time is spent entirely in scheduling bookkeeping, and should grow linearly with size.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="active_execution_scaling",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--sizes",
+    type=int,
+    nargs="+",
+    default=[1000, 10000, 100000],
+    help="Numbers of mapped steps to schedule.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=64,
+    help="Maximum number of steps in flight at once.",
+)
+
+# ########################
+# ##### JOB
+# ########################
+
+JOB_NAME = "active_execution_scaling"
+
+
+@op(out=DynamicOut())
+def fan_out():
+    yield DynamicOutput(1, mapping_key="0")
+
+
+@op
+def mapped(x):
+    return x
+
+
+@op
+def collect(xs):
+    return sum(xs)
+
+
+@job(name=JOB_NAME)
+def dynamic_fan_out_job():
+    collect(fan_out().map(mapped).collect())
+
+
+# ########################
+# ##### EVENTS
+# ########################
+
+
+def _output_event(step_key: str, mapping_key=None) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_OUTPUT.value,
+        JOB_NAME,
+        step_key=step_key,
+        event_specific_data=StepOutputData(
+            step_output_handle=StepOutputHandle(step_key, "result", mapping_key)
+        ),
+    )
+
+
+def _success_event(step_key: str) -> DagsterEvent:
+    return DagsterEvent(
+        DagsterEventType.STEP_SUCCESS.value,
+        JOB_NAME,
+        step_key=step_key,
+        event_specific_data=StepSuccessData(duration_ms=1.0),
+    )
+
+
+def get_completion_events(step_key: str, size: int) -> Sequence[DagsterEvent]:
+    if step_key == "fan_out":
+        outputs = [_output_event(step_key, str(i)) for i in range(size)]
+    else:
+        outputs = [_output_event(step_key)]
+    return [*outputs, _success_event(step_key)]
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def schedule_plan(size: int, max_concurrent: int) -> int:
+    plan = create_execution_plan(dynamic_fan_out_job)
+    num_steps = 0
+    with ActiveExecution(
+        plan, retry_mode=RetryMode.DISABLED, max_concurrent=max_concurrent
+    ) as active_execution:
+        in_flight: deque[str] = deque()
+        while True:
+            # requesting steps is what resolves the mapped steps once the fan-out step succeeds
+            for step in active_execution.get_steps_to_execute():
+                in_flight.append(step.key)
+                num_steps += 1
+
+            if not in_flight:
+                break
+
+            step_key = in_flight.popleft()
+            for event in get_completion_events(step_key, size):
+                active_execution.handle_event(event)
+
+    return num_steps
+
+
+def main(sizes: Sequence[int], max_concurrent: int) -> None:
+    session = ProfilingSession(
+        name="ActiveExecution scaling",
+        experiment_settings={
+            "sizes": ", ".join(str(size) for size in sizes),
+            "max_concurrent": max_concurrent,
+        },
+    ).start()
+    session.log_start_message()
+
+    results = {}
+    for size in sizes:
+        start = time.time()
+        with session.logged_execution_time(f"schedule {size} mapped steps"):
+            num_steps = schedule_plan(size, max_concurrent)
+        results[size] = (num_steps, time.time() - start)
+
+    session.log_result_summary()
+    print()
+    for size, (num_steps, elapsed) in results.items():
+        print(
+            f"{size} mapped steps: {num_steps} steps scheduled in {elapsed:.2f}s "
+            f"({1_000_000 * elapsed / num_steps:.1f}us per step)"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.sizes, args.max_concurrent)
@@ -0,0 +1,160 @@
+# ruff: noqa: T201
+import argparse
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+
+from dagster import (
+    AssetIn,
+    AssetsDefinition,
+    BackfillPolicy,
+    DailyPartitionsDefinition,
+    TimeWindowPartitionMapping,
+    asset,
+    repository,
+)
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
+from dagster._core.execution.asset_backfill import (
+    AssetBackfillData,
+    AssetBackfillIterationResult,
+    execute_asset_backfill_iteration_inner,
+)
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.test_utils import environ, mock_workspace_from_repos
+from dagster._time import create_datetime
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the latency of a single asset backfill tick as the number of targeted partitions grows.
+The asset graph looks like this:
+
+    [N daily partitions]     [N daily partitions]      [N daily partitions, single run]
+    (root) ----------------> (downstream) ------------> (rollup, depends on previous day)
+
+For each partition count in `--num-partitions`, a backfill targeting every partition of every asset
+is created and its first tick, which walks the whole target from the roots to the leaves, is
+timed `--iterations` times.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="asset_backfill_tick_latency",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-partitions",
+    type=int,
+    nargs="+",
+    default=[30, 365, 3650],
+    help="Numbers of daily partitions to target in each experiment.",
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=3,
+    help="Number of times the first backfill tick is evaluated for each partition count.",
+)
+
+# ########################
+# ##### DEFINITIONS
+# ########################
+
+
+def get_assets(num_partitions: int) -> Sequence[AssetsDefinition]:
+    partitions_def = DailyPartitionsDefinition(
+        start_date=create_datetime(2000, 1, 1), end_date=_end_date(num_partitions)
+    )
+
+    @asset(partitions_def=partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def root(): ...
+
+    @asset(partitions_def=partitions_def, backfill_policy=BackfillPolicy.single_run())
+    def downstream(root): ...
+
+    @asset(
+        partitions_def=partitions_def,
+        backfill_policy=BackfillPolicy.single_run(),
+        ins={
+            "downstream": AssetIn(),
+            "rollup": AssetIn(
+                partition_mapping=TimeWindowPartitionMapping(start_offset=-1, end_offset=-1)
+            ),
+        },
+    )
+    def rollup(downstream, rollup): ...
+
+    return [root, downstream, rollup]
+
+
+def _end_date(num_partitions: int) -> datetime:
+    return create_datetime(2000, 1, 1) + timedelta(days=num_partitions)
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def main(num_partitions_list: Sequence[int], iterations: int) -> None:
+    session = ProfilingSession(
+        name="asset backfill tick latency",
+        experiment_settings={"num_partitions": num_partitions_list, "iterations": iterations},
+    ).start()
+    session.log_start_message()
+
+    with instance_for_test() as instance, environ({"ASSET_BACKFILL_CURSOR_DELAY_TIME": "0"}):
+        for num_partitions in num_partitions_list:
+            assets = get_assets(num_partitions)
+
+            @repository(name=f"repo_{num_partitions}")
+            def repo():
+                return assets
+
+            asset_graph = mock_workspace_from_repos([repo]).asset_graph
+            evaluation_time = _end_date(num_partitions)
+            backfill_data = AssetBackfillData.empty(
+                AssetGraphSubset.all(
+                    asset_graph, dynamic_partitions_store=instance, current_time=evaluation_time
+                ),
+                evaluation_time.timestamp(),
+                dynamic_partitions_store=instance,
+            )
+
+            for i in range(iterations):
+                with session.logged_execution_time(
+                    f"first tick, {num_partitions} partitions ({i + 1}/{iterations})"
+                ):
+                    asset_graph_view = AssetGraphView(
+                        temporal_context=TemporalContext(
+                            effective_dt=evaluation_time, last_event_id=None
+                        ),
+                        instance=instance,
+                        asset_graph=asset_graph,
+                    )
+                    result = None
+                    for result in execute_asset_backfill_iteration_inner(
+                        backfill_id=f"benchmark_{num_partitions}_{i}",
+                        asset_backfill_data=backfill_data,
+                        asset_graph=asset_graph,
+                        asset_graph_view=asset_graph_view,
+                        backfill_start_timestamp=backfill_data.backfill_start_timestamp,
+                        logger=logging.getLogger("asset_backfill_tick_latency"),
+                    ):
+                        if isinstance(result, AssetBackfillIterationResult):
+                            break
+                    assert isinstance(result, AssetBackfillIterationResult)
+                    requested = sum(
+                        len(run_request.asset_selection or [])
+                        for run_request in result.run_requests
+                    )
+                    assert requested == 3, requested
+
+    session.log_result_summary()
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_partitions, args.iterations)
@@ -0,0 +1,133 @@
+# ruff: noqa: T201
+import argparse
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from typing import Optional
+
+from dagster._core.events import DagsterEvent, DagsterEventType, EngineEventData
+from dagster._core.events.log import EventLogEntry
+from dagster._core.storage.event_log import ConsolidatedSqliteEventLogStorage
+from dagster._core.storage.event_log.base import EventLogConnection
+from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.utils import make_new_run_id
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the cost of watching many runs with `SqlPollingEventWatcher`, which is the event watcher
+used by the Postgres and MySQL event log storages.
+
+The benchmark subscribes `--num-subscriptions` callbacks, spread over `--num-runs` runs, against a
+consolidated SQLite event log storage. It writes one event to every run and measures how long it
+takes for every subscription to receive it. It then leaves the runs idle for `--idle-seconds` and
+counts the storage queries issued while idle, which shows the effect of the adaptive backoff.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="event_watch_fanout",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-subscriptions",
+    type=int,
+    default=1000,
+    help="Number of callbacks watching runs.",
+)
+
+parser.add_argument(
+    "--num-runs",
+    type=int,
+    default=200,
+    help="Number of distinct runs that the subscriptions are spread over.",
+)
+
+parser.add_argument(
+    "--idle-seconds",
+    type=float,
+    default=10.0,
+    help="How long to leave the runs idle while counting storage queries.",
+)
+
+
+class CountingEventLogStorage(ConsolidatedSqliteEventLogStorage):
+    """Counts the calls made by the event watcher to fetch new events."""
+
+    num_queries = 0
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Mapping[str, EventLogConnection]:
+        self.num_queries += 1
+        return super().get_records_for_runs(cursors_by_run_id, limit)
+
+
+def _event(run_id: str) -> EventLogEntry:
+    return EventLogEntry(
+        error_info=None,
+        user_message="",
+        level="debug",
+        run_id=run_id,
+        timestamp=time.time(),
+        dagster_event=DagsterEvent(
+            DagsterEventType.ENGINE_EVENT.value,
+            "event_watch_fanout",
+            event_specific_data=EngineEventData.in_process(999),
+        ),
+    )
+
+
+def main(num_subscriptions: int, num_runs: int, idle_seconds: float) -> None:
+    session = ProfilingSession(
+        name="Event watch fanout",
+        experiment_settings={
+            "num_subscriptions": num_subscriptions,
+            "num_runs": num_runs,
+            "idle_seconds": idle_seconds,
+        },
+    ).start()
+    session.log_start_message()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        storage = CountingEventLogStorage(tempdir)
+        watcher = SqlPollingEventWatcher(storage)
+        run_ids = [make_new_run_id() for _ in range(num_runs)]
+        received = threading.Semaphore(0)
+
+        num_threads_before = threading.active_count()
+        with session.logged_execution_time(f"subscribe {num_subscriptions} callbacks"):
+            for i in range(num_subscriptions):
+                watcher.watch_run(
+                    run_ids[i % num_runs], None, lambda _event, _cursor: received.release()
+                )
+        num_watcher_threads = threading.active_count() - num_threads_before
+
+        with session.logged_execution_time(f"write 1 event to each of {num_runs} runs"):
+            for run_id in run_ids:
+                storage.store_event(_event(run_id))
+
+        with session.logged_execution_time("deliver events to all subscriptions"):
+            for _ in range(num_subscriptions):
+                received.acquire()
+
+        num_queries_before_idle = storage.num_queries
+        with session.logged_execution_time(f"idle for {idle_seconds} seconds"):
+            time.sleep(idle_seconds)
+        num_idle_queries = storage.num_queries - num_queries_before_idle
+
+        watcher.close()
+        storage.dispose()
+
+    session.log_result_summary()
+    print()
+    print(f"watcher threads: {num_watcher_threads}")
+    print(f"storage queries while idle: {num_idle_queries}")
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_subscriptions, args.num_runs, args.idle_seconds)
@@ -0,0 +1,135 @@
+# ruff: noqa: T201
+import argparse
+import gzip
+import time
+from collections.abc import Mapping, Sequence
+from typing import Callable
+
+from dagster import Definitions
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._grpc.server import STREAMING_CHUNK_SIZE
+from dagster._grpc.utils import StreamingChunkDecoder, split_into_chunks
+from dagster._serdes import serialize_value, serialize_value_compact
+
+from dagster_test.toys.big_honkin_asset_graph import assets as big_honkin_assets
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the bytes sent over the wire when streaming a serialized RepositorySnap, as the
+`StreamingExternalRepository` gRPC call does, with and without the zlib compression of streamed
+chunks done by `split_into_chunks`.
+
+The snapshot is built from the `big_honkin_asset_graph` toy (1000 assets) and serialized with
+both serdes encodings. gRPC compresses each message with gzip, which is simulated here by
+gzip-compressing each chunk on its own. Compressed chunks are measured both with gRPC gzip
+compression on top, as dagster channels are configured, and without it.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="grpc_streaming_compression",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=10,
+    help="Number of times the snapshot is split into chunks and decoded in each mode.",
+)
+parser.add_argument(
+    "--chunk-size",
+    type=int,
+    default=STREAMING_CHUNK_SIZE,
+    help="Number of characters of the serialized snapshot in each streamed chunk.",
+)
+
+# ########################
+# ##### FIXTURES
+# ########################
+
+
+def get_serialized_snapshots() -> Mapping[str, str]:
+    repository_snap = RepositorySnap.from_def(
+        Definitions(assets=big_honkin_assets).get_repository_def()
+    )
+    return {
+        "json": serialize_value(repository_snap),
+        "compact": serialize_value_compact(repository_snap),
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def _grpc_gzip(chunk: str) -> bytes:
+    # grpc core compresses messages at the default zlib level
+    return gzip.compress(chunk.encode("utf-8"), compresslevel=6)
+
+
+def _no_grpc_compression(chunk: str) -> bytes:
+    return chunk.encode("utf-8")
+
+
+# (compress chunks with zlib, encoding of each message by gRPC)
+MODES: Mapping[str, tuple[bool, Callable[[str], bytes]]] = {
+    "plain chunks, grpc gzip": (False, _grpc_gzip),
+    "zlib chunks, grpc gzip": (True, _grpc_gzip),
+    "zlib chunks, no grpc compression": (True, _no_grpc_compression),
+}
+
+
+def _stream(serialized: str, chunk_size: int, compress: bool) -> str:
+    decoder = StreamingChunkDecoder() if compress else None
+    return "".join(
+        decoder.decode(chunk) if decoder else chunk
+        for chunk in split_into_chunks(serialized, chunk_size, compress)
+    )
+
+
+def main(iterations: int, chunk_size: int) -> None:
+    session = ProfilingSession(
+        name="grpc streaming compression",
+        experiment_settings={"iterations": iterations, "chunk_size": chunk_size},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("build snapshot fixtures"):
+        serialized_snapshots = get_serialized_snapshots()
+
+    results: list[Sequence[str]] = []
+    for encoding, serialized in serialized_snapshots.items():
+        for mode, (compress, encode_message) in MODES.items():
+            with session.logged_execution_time(f"{encoding} ({mode})"):
+                assert _stream(serialized, chunk_size, compress) == serialized
+                wire_size = sum(
+                    len(encode_message(chunk))
+                    for chunk in split_into_chunks(serialized, chunk_size, compress)
+                )
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    for chunk in split_into_chunks(serialized, chunk_size, compress):
+                        encode_message(chunk)
+                    _stream(serialized, chunk_size, compress)
+                stream_time = (time.perf_counter() - start) / iterations
+            results.append(
+                [
+                    encoding,
+                    mode,
+                    f"{len(serialized) / 1024:.1f}KiB",
+                    f"{wire_size / 1024:.1f}KiB",
+                    f"{1000 * stream_time:.1f}ms",
+                ]
+            )
+
+    session.log_result_summary()
+    print()
+    print("encoding, mode, size, wire size, encode and decode")
+    for row in results:
+        print(", ".join(row))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.iterations, args.chunk_size)
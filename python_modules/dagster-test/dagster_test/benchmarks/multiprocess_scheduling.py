@@ -0,0 +1,199 @@
+# ruff: noqa: T201
+import argparse
+import multiprocessing
+import time
+from collections.abc import Iterator
+from typing import Optional
+
+from dagster import DependencyDefinition, GraphDefinition, NodeInvocation, op
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.execution.plan.active import ActiveExecution
+from dagster._core.execution.plan.outputs import StepOutputHandle
+from dagster._core.execution.plan.plan import ExecutionPlan
+from dagster._core.execution.retries import RetryMode
+from dagster._core.executor.child_process_executor import (
+    ChildProcessCommand,
+    ChildProcessEventSelector,
+    execute_child_process_command,
+)
+
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Measure the scheduling overhead of the multiprocess executor's parent loop for a fan-out plan: a
+single root step followed by `--num-steps` independent steps.
+
+Step processes are simulated with a trivial child process command that sleeps for
+`--step-duration` seconds and reports the time it finished, so the measurement isolates the
+parent: ActiveExecution bookkeeping plus multiplexing the child processes' event queues. The loop
+mirrors `MultiprocessExecutor.execute` and is run in two modes:
+
+  * polling: each step iterator blocks on its own queue for up to a 20ms tick in turn, as the
+    executor did before it used a ChildProcessEventSelector.
+  * selector: step iterators poll without blocking and the loop waits on all child queues and
+    process sentinels at once.
+
+For each mode, the total wall time, the CPU time used by the parent process, and the mean latency
+between a child reporting its result and the parent receiving it are reported.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="multiprocess_scheduling",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--num-steps",
+    type=int,
+    default=10000,
+    help="Number of steps downstream of the root step.",
+)
+
+parser.add_argument(
+    "--max-concurrent",
+    type=int,
+    default=64,
+    help="Maximum number of child processes in flight.",
+)
+
+parser.add_argument(
+    "--step-duration",
+    type=float,
+    default=0.05,
+    help="Seconds each simulated step sleeps for.",
+)
+
+parser.add_argument(
+    "--start-method",
+    type=str,
+    default="fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn",
+    help="Multiprocessing start method used for the simulated steps.",
+)
+
+# ########################
+# ##### PLAN
+# ########################
+
+
+@op
+def root():
+    return 1
+
+
+@op
+def leaf(x):
+    return x
+
+
+def build_fan_out_plan(num_steps: int) -> ExecutionPlan:
+    dependencies = {
+        NodeInvocation("leaf", alias=f"leaf_{i}"): {"x": DependencyDefinition("root")}
+        for i in range(num_steps)
+    }
+    graph = GraphDefinition(name="fan_out", node_defs=[root, leaf], dependencies=dependencies)
+    return create_execution_plan(graph.to_job())
+
+
+class SimulatedStepCommand(ChildProcessCommand):
+    def __init__(self, duration: float):
+        self.duration = duration
+
+    def execute(self) -> Iterator[float]:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if self.duration:
+            time.sleep(self.duration)
+        yield time.time()
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+def run_plan(
+    plan: ExecutionPlan,
+    max_concurrent: int,
+    step_duration: float,
+    multiproc_ctx,
+    selector: Optional[ChildProcessEventSelector],
+) -> tuple[float, float]:
+    """Executes the plan with simulated steps, returning the parent CPU time used and the mean
+    latency between a child reporting its result and the parent receiving it.
+    """
+    latencies: list[float] = []
+    cpu_start = time.process_time()
+
+    with ActiveExecution(
+        plan, retry_mode=RetryMode.DISABLED, max_concurrent=max_concurrent
+    ) as active_execution:
+        active_iters: dict[str, Iterator] = {}
+        while not active_execution.is_complete or active_iters:
+            made_progress = False
+
+            steps = active_execution.get_steps_to_execute(limit=max_concurrent - len(active_iters))
+            for step in steps:
+                made_progress = True
+                active_iters[step.key] = execute_child_process_command(
+                    multiproc_ctx, SimulatedStepCommand(step_duration), selector
+                )
+
+            empty_iters = []
+            for key, step_iter in active_iters.items():
+                try:
+                    ret = next(step_iter)
+                except StopIteration:
+                    empty_iters.append(key)
+                    continue
+                if isinstance(ret, float):
+                    latencies.append(time.time() - ret)
+                    made_progress = True
+
+            for key in empty_iters:
+                del active_iters[key]
+                active_execution.mark_step_produced_output(StepOutputHandle(key, "result"))
+                active_execution.mark_success(key)
+                made_progress = True
+
+            if selector and not made_progress:
+                selector.wait(0.5)
+
+    return time.process_time() - cpu_start, sum(latencies) / len(latencies)
+
+
+def main(num_steps: int, max_concurrent: int, step_duration: float, start_method: str) -> None:
+    session = ProfilingSession(
+        name="Multiprocess scheduling overhead",
+        experiment_settings={
+            "num_steps": num_steps,
+            "max_concurrent": max_concurrent,
+            "step_duration": step_duration,
+            "start_method": start_method,
+        },
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time(f"build fan-out plan with {num_steps} steps"):
+        plan = build_fan_out_plan(num_steps)
+
+    multiproc_ctx = multiprocessing.get_context(start_method)
+    results = {}
+    for mode, selector in [("polling", None), ("selector", ChildProcessEventSelector())]:
+        start = time.time()
+        with session.logged_execution_time(f"execute plan ({mode})"):
+            cpu_time, mean_latency = run_plan(
+                plan, max_concurrent, step_duration, multiproc_ctx, selector
+            )
+        results[mode] = (time.time() - start, cpu_time, mean_latency)
+
+    session.log_result_summary()
+    print()
+    for mode, (wall_time, cpu_time, mean_latency) in results.items():
+        print(
+            f"{mode}: {wall_time:.2f}s wall, {cpu_time:.2f}s parent CPU "
+            f"({1000 * cpu_time / (num_steps + 1):.3f}ms per step), "
+            f"{1000 * mean_latency:.2f}ms mean result latency"
+        )
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.num_steps, args.max_concurrent, args.step_duration, args.start_method)
@@ -0,0 +1,119 @@
+# ruff: noqa: T201
+import argparse
+import time
+import zlib
+from collections.abc import Mapping, Sequence
+from typing import Callable
+
+from dagster import Definitions
+from dagster._core.definitions.asset_job import IMPLICIT_ASSET_JOB_NAME
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.remote_representation.external_data import RepositorySnap
+from dagster._core.snap import snapshot_from_execution_plan
+from dagster._serdes import deserialize_value, serialize_value, serialize_value_compact
+from dagster._serdes.serdes import PackableValue
+
+from dagster_test.toys.big_honkin_asset_graph import assets as big_honkin_assets
+from dagster_test.utils.benchmark import ProfilingSession
+
+DESC = """
+Compare the default JSON serdes encoding with the compact encoding written by
+`serialize_value_compact` on real snapshots.
+
+The fixtures are built from the `big_honkin_asset_graph` toy (1000 assets): the RepositorySnap
+returned by the `ExternalRepository` gRPC call, and the JobSnap and ExecutionPlanSnapshot of its
+implicit asset job, which run storage persists for every run. Each fixture is serialized and
+deserialized `--iterations` times with both encodings, and the payload size is reported both raw
+and zlib-compressed, as snapshots are stored.
+"""
+
+parser = argparse.ArgumentParser(
+    prog="serdes_compact",
+    description=DESC,
+)
+
+parser.add_argument(
+    "--iterations",
+    type=int,
+    default=10,
+    help="Number of times each fixture is serialized and deserialized with each encoding.",
+)
+
+# ########################
+# ##### FIXTURES
+# ########################
+
+
+def get_snapshot_fixtures() -> Mapping[str, PackableValue]:
+    defs = Definitions(assets=big_honkin_assets)
+    repository_def = defs.get_repository_def()
+    job_def = repository_def.get_job(IMPLICIT_ASSET_JOB_NAME)
+    execution_plan = create_execution_plan(job_def)
+    return {
+        "RepositorySnap": RepositorySnap.from_def(repository_def),
+        "JobSnap": job_def.get_job_snapshot(),
+        "ExecutionPlanSnapshot": snapshot_from_execution_plan(
+            execution_plan, job_def.get_job_snapshot_id()
+        ),
+    }
+
+
+# ########################
+# ##### MAIN
+# ########################
+
+
+ENCODINGS: Mapping[str, Callable[[PackableValue], str]] = {
+    "json": serialize_value,
+    "compact": serialize_value_compact,
+}
+
+
+def _time_per_iteration(fn: Callable[[], object], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def main(iterations: int) -> None:
+    session = ProfilingSession(
+        name="serdes compact encoding",
+        experiment_settings={"iterations": iterations},
+    ).start()
+    session.log_start_message()
+
+    with session.logged_execution_time("build snapshot fixtures"):
+        fixtures = get_snapshot_fixtures()
+
+    results: list[Sequence[str]] = []
+    for fixture_name, value in fixtures.items():
+        for encoding, serialize in ENCODINGS.items():
+            with session.logged_execution_time(f"{fixture_name} ({encoding})"):
+                serialized = serialize(value)
+                assert deserialize_value(serialized) == value
+                serialize_time = _time_per_iteration(lambda: serialize(value), iterations)
+                deserialize_time = _time_per_iteration(
+                    lambda: deserialize_value(serialized), iterations
+                )
+            results.append(
+                [
+                    fixture_name,
+                    encoding,
+                    f"{1000 * serialize_time:.1f}ms",
+                    f"{1000 * deserialize_time:.1f}ms",
+                    f"{len(serialized) / 1024:.0f}KiB",
+                    f"{len(zlib.compress(serialized.encode('utf-8'))) / 1024:.0f}KiB",
+                ]
+            )
+
+    session.log_result_summary()
+    print()
+    print("fixture, encoding, serialize, deserialize, size, zlib size")
+    for row in results:
+        print(", ".join(row))
+
+
+if __name__ == "__main__":
+    args = parser.parse_args()
+    main(args.iterations)
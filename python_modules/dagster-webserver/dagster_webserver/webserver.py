@@ -1,6 +1,6 @@
 import gzip
-import io
 import mimetypes
+import tempfile
 import uuid
 from os import path, walk
 from typing import Generic, Optional, TypeVar
@@ -19,6 +19,7 @@
 from dagster_graphql import __version__ as dagster_graphql_version
 from dagster_graphql.schema import create_schema
 from graphene import Schema
+from starlette.background import BackgroundTask
 from starlette.datastructures import MutableHeaders
 from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
@@ -44,6 +45,8 @@
 
 mimetypes.init()
 
+DEBUG_FILE_MAX_IN_MEMORY_BYTES = 16 * 1024 * 1024
+
 T_IWorkspaceProcessContext = TypeVar("T_IWorkspaceProcessContext", bound=IWorkspaceProcessContext)
 
 
@@ -119,15 +122,17 @@ async def download_debug_file_endpoint(self, request: Request):
         context = self.make_request_context(request)
 
         run = context.instance.get_run_by_id(run_id)
-        debug_payload = DebugRunPayload.build(context.instance, run)  # type: ignore  # (possible none)
 
-        result = io.BytesIO()
+        # spill large payloads to disk instead of holding them in memory
+        result = tempfile.SpooledTemporaryFile(max_size=DEBUG_FILE_MAX_IN_MEMORY_BYTES)
         with gzip.GzipFile(fileobj=result, mode="wb") as file:
-            debug_payload.write(file)
+            DebugRunPayload.write_for_run(context.instance, run, file)  # type: ignore  # (possible none)
 
         result.seek(0)  # be kind, please rewind
 
-        return StreamingResponse(result, media_type="application/gzip")
+        return StreamingResponse(
+            result, media_type="application/gzip", background=BackgroundTask(result.close)
+        )
 
     async def download_notebook(self, request: Request):
         try:
@@ -1,3 +1,5 @@
+import os
+import threading
 from collections.abc import Sequence
 from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
 
@@ -5,14 +7,90 @@
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import RemoteJobSubsetResult
-from dagster._core.remote_representation.origin import RemoteJobOrigin
+from dagster._core.remote_representation.external_data import (
+    JobDataSnap,
+    JobRefSnap,
+    RemoteJobSubsetResult,
+)
+from dagster._core.remote_representation.origin import RemoteJobOrigin, RemoteRepositoryOrigin
 from dagster._grpc.types import JobSubsetSnapshotArgs
 from dagster._serdes import deserialize_value
+from dagster._serdes.utils import hash_str
+from dagster._utils.error import SerializableErrorInfo
 
 if TYPE_CHECKING:
+    from dagster._core.storage.runs.snapshot_cache import SnapshotCache, SnapshotCacheStats
     from dagster._grpc.client import DagsterGrpcClient
 
+# The JobDataSnaps fetched on demand in this process for RemoteRepositorys that were loaded with
+# deferred snapshots, so that reloading a code location does not fetch unchanged jobs again.
+_job_data_snap_cache_lock = threading.Lock()
+_job_data_snap_cache: Optional["SnapshotCache"] = None
+
+
+def _get_job_data_snap_cache() -> "SnapshotCache":
+    from dagster._core.storage.runs.snapshot_cache import (
+        DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES,
+        SnapshotCache,
+    )
+
+    global _job_data_snap_cache  # noqa: PLW0603
+    with _job_data_snap_cache_lock:
+        if _job_data_snap_cache is None:
+            _job_data_snap_cache = SnapshotCache(
+                max_size_bytes=int(
+                    os.getenv(
+                        "DAGSTER_JOB_DATA_SNAP_CACHE_MAX_SIZE_BYTES",
+                        str(DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES),
+                    )
+                )
+            )
+        return _job_data_snap_cache
+
+
+def get_job_data_snap_cache_stats() -> "SnapshotCacheStats":
+    """Returns the stats of the cache of deferred JobDataSnaps in this process. Every miss is a
+    JobDataSnap that was fetched from a code server.
+    """
+    return _get_job_data_snap_cache().get_stats()
+
+
+def sync_get_job_data_snap_grpc(
+    api_client: "DagsterGrpcClient",
+    repository_origin: RemoteRepositoryOrigin,
+    job_ref: JobRefSnap,
+) -> JobDataSnap:
+    from dagster._grpc.client import DagsterGrpcClient
+
+    check.inst_param(api_client, "api_client", DagsterGrpcClient)
+    check.inst_param(repository_origin, "repository_origin", RemoteRepositoryOrigin)
+    check.inst_param(job_ref, "job_ref", JobRefSnap)
+
+    cache_key = hash_str(
+        ":".join(
+            [
+                repository_origin.get_id(),
+                job_ref.name,
+                job_ref.snapshot_id,
+                job_ref.parent_snapshot_id or "",
+            ]
+        )
+    )
+    job_data_snap_cache = _get_job_data_snap_cache()
+    cached = job_data_snap_cache.get(cache_key)
+    if cached is not None:
+        return check.inst(cached, JobDataSnap)
+
+    reply = api_client.external_job(repository_origin, job_ref.name)
+    if reply.serialized_error:
+        raise DagsterUserCodeProcessError.from_error_info(
+            deserialize_value(reply.serialized_error, SerializableErrorInfo)
+        )
+
+    job_data_snap = deserialize_value(reply.serialized_job_data, JobDataSnap)
+    job_data_snap_cache.set(cache_key, job_data_snap, len(reply.serialized_job_data))
+    return job_data_snap
+
 
 def sync_get_external_job_subset_grpc(
     api_client: "DagsterGrpcClient",
@@ -1,18 +1,100 @@
+import threading
+from collections import OrderedDict
 from collections.abc import Mapping
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import dagster._check as check
 from dagster._core.errors import DagsterUserCodeProcessError
-from dagster._core.remote_representation.external_data import RepositoryErrorSnap, RepositorySnap
+from dagster._core.remote_representation.external_data import (
+    RepositoryErrorSnap,
+    RepositorySnap,
+    RepositorySnapUpdate,
+)
 from dagster._serdes import deserialize_value
 
 if TYPE_CHECKING:
     from dagster._core.remote_representation import CodeLocation
     from dagster._grpc.client import DagsterGrpcClient
 
+MAX_HELD_REPOSITORY_SNAPS = 64
+
+# The RepositorySnap most recently fetched in this process from each gRPC server for each code
+# location, repository and value of defer_snapshots, with its snapshot id, so that fetching it
+# again from the same server only transfers what changed. Keyed by server id so that snapshots are
+# never shared between servers, and bounded to the most recently used entries.
+_held_repository_snaps_lock = threading.Lock()
+_held_repository_snaps: OrderedDict[tuple[str, str, str, bool], tuple[str, RepositorySnap]] = (
+    OrderedDict()
+)
+
+_HeldRepositorySnapKey = Optional[tuple[str, str, str, bool]]
+
+
+def _get_held_repository_snap_key(
+    code_location: "CodeLocation", repository_name: str, defer_snapshots: bool
+) -> _HeldRepositorySnapKey:
+    from dagster._core.remote_representation.code_location import GrpcServerCodeLocation
+
+    if not isinstance(code_location, GrpcServerCodeLocation):
+        return None
+    return (code_location.server_id, code_location.name, repository_name, defer_snapshots)
+
+
+def _get_held_repository_snap(
+    key: _HeldRepositorySnapKey,
+) -> tuple[str, Optional[RepositorySnap]]:
+    if key is None:
+        return "", None
+    with _held_repository_snaps_lock:
+        held = _held_repository_snaps.get(key)
+        if held is None:
+            return "", None
+        _held_repository_snaps.move_to_end(key)
+        return held
+
+
+def _hold_repository_snap(
+    key: _HeldRepositorySnapKey, snapshot_id: str, repository_snap: RepositorySnap
+) -> None:
+    if key is None:
+        return
+    with _held_repository_snaps_lock:
+        _held_repository_snaps[key] = (snapshot_id, repository_snap)
+        _held_repository_snaps.move_to_end(key)
+        while len(_held_repository_snaps) > MAX_HELD_REPOSITORY_SNAPS:
+            _held_repository_snaps.popitem(last=False)
+
+
+def _resolve_repository_snap(
+    key: _HeldRepositorySnapKey,
+    serialized_repository_data: str,
+    held_snapshot_id: str,
+    held_repository_snap: Optional[RepositorySnap],
+) -> RepositorySnap:
+    result = deserialize_value(
+        serialized_repository_data, (RepositorySnap, RepositoryErrorSnap, RepositorySnapUpdate)
+    )
+
+    if isinstance(result, RepositoryErrorSnap):
+        raise DagsterUserCodeProcessError.from_error_info(result.error)
+
+    if not isinstance(result, RepositorySnapUpdate):
+        # the server does not support updates
+        return result
+
+    check.invariant(
+        result.base_snapshot_id in (None, held_snapshot_id),
+        f"Received an update to RepositorySnap {result.base_snapshot_id}, which is not held",
+    )
+    repository_snap = result.apply(held_repository_snap)
+    _hold_repository_snap(key, result.snapshot_id, repository_snap)
+    return repository_snap
+
 
 def sync_get_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool = False,
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
@@ -20,34 +102,37 @@ def sync_get_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        key = _get_held_repository_snap_key(code_location, repository_name, defer_snapshots)
+        held_snapshot_id, held_repository_snap = _get_held_repository_snap(key)
         external_repository_chunks = list(
             api_client.streaming_external_repository(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
+                held_snapshot_id=held_snapshot_id,
             )
         )
 
-        result = deserialize_value(
+        repo_datas[repository_name] = _resolve_repository_snap(
+            key,
             "".join(
                 [
                     chunk["serialized_external_repository_chunk"]
                     for chunk in external_repository_chunks
                 ]
             ),
-            (RepositorySnap, RepositoryErrorSnap),
+            held_snapshot_id,
+            held_repository_snap,
         )
-
-        if isinstance(result, RepositoryErrorSnap):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
     return repo_datas
 
 
 async def gen_streaming_external_repositories_data_grpc(
-    api_client: "DagsterGrpcClient", code_location: "CodeLocation"
+    api_client: "DagsterGrpcClient",
+    code_location: "CodeLocation",
+    defer_snapshots: bool = False,
 ) -> Mapping[str, RepositorySnap]:
     from dagster._core.remote_representation import CodeLocation, RemoteRepositoryOrigin
 
@@ -55,28 +140,29 @@ async def gen_streaming_external_repositories_data_grpc(
 
     repo_datas = {}
     for repository_name in code_location.repository_names:  # type: ignore
+        key = _get_held_repository_snap_key(code_location, repository_name, defer_snapshots)
+        held_snapshot_id, held_repository_snap = _get_held_repository_snap(key)
         external_repository_chunks = [
             chunk
             async for chunk in api_client.gen_streaming_external_repository(
                 remote_repository_origin=RemoteRepositoryOrigin(
                     code_location.origin,
                     repository_name,
-                )
+                ),
+                defer_snapshots=defer_snapshots,
+                held_snapshot_id=held_snapshot_id,
             )
         ]
 
-        result = deserialize_value(
+        repo_datas[repository_name] = _resolve_repository_snap(
+            key,
             "".join(
                 [
                     chunk["serialized_external_repository_chunk"]
                     for chunk in external_repository_chunks
                 ]
             ),
-            (RepositorySnap, RepositoryErrorSnap),
+            held_snapshot_id,
+            held_repository_snap,
         )
-
-        if isinstance(result, RepositoryErrorSnap):
-            raise DagsterUserCodeProcessError.from_error_info(result.error)
-
-        repo_datas[repository_name] = result
     return repo_datas
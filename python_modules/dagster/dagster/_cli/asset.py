@@ -1,4 +1,5 @@
-from collections.abc import Mapping
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
 
 import click
 
@@ -10,13 +11,22 @@
     python_job_config_argument,
     python_origin_target_argument,
 )
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
+from dagster._core.definitions.asset_key import AssetCheckKey
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.backfill_policy import BackfillPolicyType
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluation,
+)
 from dagster._core.definitions.events import AssetKey
 from dagster._core.errors import DagsterInvalidSubsetError, DagsterUnknownPartitionError
 from dagster._core.execution.api import execute_job
 from dagster._core.instance import DagsterInstance
 from dagster._core.origin import JobPythonOrigin
+from dagster._core.storage.partition_status_cache import (
+    check_asset_status_cache_value,
+    rebuild_asset_status_cache_value,
+)
 from dagster._core.storage.tags import (
     ASSET_PARTITION_RANGE_END_TAG,
     ASSET_PARTITION_RANGE_START_TAG,
@@ -283,3 +293,213 @@ def asset_wipe_cache_command(key, **cli_args):
             click.echo("Cleared the partitions status cache")
         else:
             click.echo("Exiting without wiping the partitions status cache")
+
+
+@asset_cli.command(name="rebuild-partitions-status-cache")
+@python_origin_target_argument
+@click.option("--select", help="Asset selection to target", required=False)
+@click.option(
+    "--check",
+    "check_only",
+    is_flag=True,
+    help=(
+        "Compare the partitions status cache with partition statuses computed from the event log,"
+        " without rebuilding it"
+    ),
+)
+def asset_rebuild_cache_command(**kwargs):
+    r"""Rebuilds the asset partitions status cache of partitioned assets from the event logs,
+    discarding the cached partition statuses. With `--check`, reports the assets whose cached
+    partition statuses disagree with the event logs instead.
+
+    \b
+    Usage:
+      dagster asset rebuild-partitions-status-cache -m <module> --select <selection>
+      dagster asset rebuild-partitions-status-cache -m <module> --check
+    """
+    repository_origin = get_repository_python_origin_from_kwargs(kwargs)
+    recon_repo = recon_repository_from_origin(repository_origin)
+    repo_def = recon_repo.get_definition()
+
+    select = kwargs.get("select")
+    if select is not None:
+        asset_selection = AssetSelection.from_coercible(select.split(","))
+    else:
+        asset_selection = AssetSelection.all()
+
+    asset_graph = repo_def.asset_graph
+    asset_keys = sorted(
+        asset_key
+        for asset_key in asset_selection.resolve(asset_graph, allow_missing=True)
+        if asset_graph.get(asset_key).partitions_def is not None
+    )
+
+    with get_instance_for_cli() as instance:
+        if instance.can_read_asset_status_cache() is False:
+            raise click.UsageError(
+                "Error, the instance does not support caching asset status. Rebuilding the cache is"
+                " not supported."
+            )
+
+        if kwargs.get("check_only"):
+            num_inconsistent = 0
+            for asset_key in asset_keys:
+                statuses = check_asset_status_cache_value(
+                    instance, asset_key, asset_graph.get(asset_key).partitions_def
+                )
+                if statuses:
+                    num_inconsistent += 1
+                    click.echo(
+                        f"{asset_key.to_user_string()}: inconsistent"
+                        f" {', '.join(status.value for status in statuses)} partitions"
+                    )
+            if num_inconsistent:
+                raise click.ClickException(
+                    f"Found {num_inconsistent} assets with an inconsistent partitions status cache"
+                )
+            click.echo("The partitions status cache is consistent")
+            return
+
+        for asset_key in asset_keys:
+            rebuild_asset_status_cache_value(
+                instance, asset_key, asset_graph.get(asset_key).partitions_def
+            )
+            click.echo(f"Rebuilt the partitions status cache of {asset_key.to_user_string()}")
+
+
+@asset_cli.command(name="profile-automation-conditions")
+@click.argument("key", required=False)
+@click.option(
+    "--evaluation-id",
+    type=int,
+    required=False,
+    help="Automation condition evaluation to profile. Defaults to the latest evaluation of KEY.",
+)
+def asset_profile_automation_conditions_command(key, evaluation_id):
+    r"""Prints the time spent, storage queries and cache hits of each node in the automation
+    condition evaluations stored for an asset or asset check. With only `--evaluation-id`, reports
+    the time and queries spent in each type of condition across all entities in that evaluation.
+
+    \b
+    Usage:
+      dagster asset profile-automation-conditions <asset_key>
+      dagster asset profile-automation-conditions <asset_key>:<check_name> --evaluation-id 12
+      dagster asset profile-automation-conditions --evaluation-id 12
+    """
+    if key is None and evaluation_id is None:
+        raise click.UsageError(
+            "Error, you must specify an asset or asset check key or an `--evaluation-id`."
+        )
+
+    with get_instance_for_cli() as instance:
+        schedule_storage = check.not_none(instance.schedule_storage)
+        if key is None:
+            records = schedule_storage.get_auto_materialize_evaluations_for_evaluation_id(
+                evaluation_id
+            )
+            if not records:
+                raise click.ClickException(f"No automation condition evaluation {evaluation_id}")
+            _echo_condition_type_profile(
+                [record.get_evaluation_with_run_ids().evaluation for record in records]
+            )
+            return
+
+        entity_key = (
+            AssetCheckKey.from_user_string(key) if ":" in key else AssetKey.from_user_string(key)
+        )
+        if evaluation_id is None:
+            records = schedule_storage.get_auto_materialize_asset_evaluations(entity_key, limit=1)
+        else:
+            records = [
+                record
+                for record in schedule_storage.get_auto_materialize_evaluations_for_evaluation_id(
+                    evaluation_id
+                )
+                if record.key == entity_key
+            ]
+        if not records:
+            raise click.ClickException(
+                f"No automation condition evaluations found for {entity_key.to_user_string()}"
+            )
+
+        record = records[0]
+        click.echo(f"Evaluation {record.evaluation_id} of {entity_key.to_user_string()}")
+        click.echo(
+            f"{'time':>10} {'self time':>10} {'true':>8} {'candidates':>10} {'queries':>8}"
+            f" {'cache hits':>10}  condition"
+        )
+        _echo_condition_node_profile(record.get_evaluation_with_run_ids().evaluation, depth=0)
+
+
+def _get_duration(evaluation: AutomationConditionEvaluation) -> float:
+    if evaluation.start_timestamp is None or evaluation.end_timestamp is None:
+        return 0.0
+    return evaluation.end_timestamp - evaluation.start_timestamp
+
+
+def _get_self_profile(evaluation: AutomationConditionEvaluation) -> tuple[float, int, int]:
+    """Returns the time, storage queries and cache hits of a node, excluding its children."""
+    # children may be evaluated concurrently, so their durations can exceed the parent's
+    duration = max(
+        _get_duration(evaluation)
+        - sum(_get_duration(child) for child in evaluation.child_evaluations),
+        0.0,
+    )
+    if evaluation.stats is None:
+        return duration, 0, 0
+    return (
+        duration,
+        evaluation.stats.num_storage_queries
+        - sum(
+            child.stats.num_storage_queries for child in evaluation.child_evaluations if child.stats
+        ),
+        evaluation.stats.num_cache_hits
+        - sum(child.stats.num_cache_hits for child in evaluation.child_evaluations if child.stats),
+    )
+
+
+def _get_node_name(evaluation: AutomationConditionEvaluation) -> str:
+    snapshot = evaluation.condition_snapshot
+    name = snapshot.name or snapshot.class_name
+    return f"{name} ({snapshot.label})" if snapshot.label else name
+
+
+def _echo_condition_node_profile(evaluation: AutomationConditionEvaluation, depth: int) -> None:
+    self_duration, _, _ = _get_self_profile(evaluation)
+    num_candidates = (
+        str(evaluation.candidate_subset.size)
+        if isinstance(evaluation.candidate_subset, SerializableEntitySubset)
+        else "all"
+    )
+    click.echo(
+        f"{_get_duration(evaluation) * 1000:>8.1f}ms {self_duration * 1000:>8.1f}ms"
+        f" {evaluation.true_subset.size:>8} {num_candidates:>10}"
+        f" {evaluation.stats.num_storage_queries if evaluation.stats else '-':>8}"
+        f" {evaluation.stats.num_cache_hits if evaluation.stats else '-':>10}"
+        f"  {'  ' * depth}{_get_node_name(evaluation)}"
+    )
+    for child in evaluation.child_evaluations:
+        _echo_condition_node_profile(child, depth=depth + 1)
+
+
+def _echo_condition_type_profile(evaluations: Sequence[AutomationConditionEvaluation]) -> None:
+    profiles: dict[str, list] = defaultdict(lambda: [0, 0.0, 0, 0])
+    for evaluation in evaluations:
+        for node in evaluation.iter_nodes():
+            duration, num_storage_queries, num_cache_hits = _get_self_profile(node)
+            profile = profiles[_get_node_name(node)]
+            profile[0] += 1
+            profile[1] += duration
+            profile[2] += num_storage_queries
+            profile[3] += num_cache_hits
+
+    click.echo(
+        f"{'condition':<40} {'calls':>8} {'self time':>12} {'queries':>8} {'cache hits':>10}"
+    )
+    for name, (num_calls, duration, num_storage_queries, num_cache_hits) in sorted(
+        profiles.items(), key=lambda item: -item[1][1]
+    ):
+        click.echo(
+            f"{name:<40} {num_calls:>8} {duration * 1000:>10.1f}ms {num_storage_queries:>8}"
+            f" {num_cache_hits:>10}"
+        )
@@ -1,12 +1,14 @@
 from collections.abc import Sequence
-from typing import NamedTuple
+from typing import IO, NamedTuple, Optional
+from uuid import uuid4
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
 from dagster._core.instance import DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnap
 from dagster._core.storage.dagster_run import DagsterRun
-from dagster._serdes import serialize_value, whitelist_for_serdes
+from dagster._serdes import pack_value, serialize_value, whitelist_for_serdes
+from dagster._seven import json
 
 
 @whitelist_for_serdes(
@@ -60,5 +62,42 @@ def build(cls, instance: DagsterInstance, run: DagsterRun) -> "DebugRunPayload":
             ),
         )
 
+    @classmethod
+    def write_for_run(
+        cls,
+        instance: DagsterInstance,
+        run: DagsterRun,
+        output_file: IO[bytes],
+        page_size: Optional[int] = None,
+    ) -> None:
+        """Writes the same serialized payload as `DebugRunPayload.build(instance, run).write(...)`,
+        but streams the events of the run to the file in pages instead of loading them all into
+        memory, so that exporting a run with a very large event log does not run out of memory.
+        """
+        from dagster import __version__ as dagster_version
+
+        payload = cls(
+            version=dagster_version,
+            dagster_run=run,
+            event_list=[],
+            job_snapshot=instance.get_job_snapshot(run.job_snapshot_id),  # type: ignore  # (possible none)
+            execution_plan_snapshot=instance.get_execution_plan_snapshot(
+                run.execution_plan_snapshot_id  # type: ignore  # (possible none)
+            ),
+        )
+        # serialize everything but the events, then splice the streamed events in at the
+        # position of a placeholder that cannot collide with any other serialized value
+        placeholder = f"__event_list_{uuid4().hex}__"
+        packed = dict(check.inst(pack_value(payload), dict))
+        packed["event_list"] = placeholder
+        prefix, suffix = json.dumps(packed).split(f'"{placeholder}"')
+
+        output_file.write(f"{prefix}[".encode())
+        for i, record in enumerate(instance.iter_records_for_run(run.run_id, page_size=page_size)):
+            if i > 0:
+                output_file.write(b", ")
+            output_file.write(serialize_value(record.event_log_entry).encode("utf-8"))
+        output_file.write(f"]{suffix}".encode())
+
     def write(self, output_file):
         return output_file.write(serialize_value(self).encode("utf-8"))
@@ -21,6 +21,7 @@
 
 MAX_ENTITIES = 500
 EMIT_BACKFILLS_METADATA_KEY = "dagster/emit_backfills"
+MAX_EVALUATION_WORKERS_METADATA_KEY = "dagster/max_evaluation_workers"
 DEFAULT_AUTOMATION_CONDITION_SENSOR_NAME = "default_automation_condition_sensor"
 
 
@@ -105,6 +106,11 @@ class AutomationConditionSensorDefinition(SensorDefinition):
         default_condition (Optional[AutomationCondition]): (experimental) If provided, this condition will
             be used for any selected assets or asset checks which do not have an automation condition defined.
             Requires `use_user_code_server` to be set to `True`.
+        max_evaluation_workers (Optional[int]): (experimental) If set to a value greater than 1, the
+            targeted assets and checks will be split into independent shards which are evaluated in
+            parallel in up to this many subprocesses. Useful for sensors which target large asset
+            graphs made up of many disconnected components. Not supported when `use_user_code_server`
+            is set to `True`.
 
     Examples:
         .. code-block:: python
@@ -154,6 +160,7 @@ def __init__(
         emit_backfills: bool = True,
         use_user_code_server: bool = False,
         default_condition: Optional[AutomationCondition] = None,
+        max_evaluation_workers: Optional[int] = None,
     ):
         self._use_user_code_server = use_user_code_server
         check.bool_param(emit_backfills, "allow_backfills")
@@ -166,12 +173,23 @@ def __init__(
             "default_condition",
             "Setting a `default_condition` for a non-user-code AutomationConditionSensorDefinition is not supported.",
         )
+        check.opt_int_param(max_evaluation_workers, "max_evaluation_workers")
+        check.param_invariant(
+            not (max_evaluation_workers and self._use_user_code_server),
+            "max_evaluation_workers",
+            "Setting `max_evaluation_workers` for a user-code AutomationConditionSensorDefinition is not supported.",
+        )
 
         self._run_tags = normalize_tags(run_tags)
 
         # only store this value in the metadata if it's True
         if emit_backfills:
             metadata = {**(metadata or {}), EMIT_BACKFILLS_METADATA_KEY: True}
+        if max_evaluation_workers:
+            metadata = {
+                **(metadata or {}),
+                MAX_EVALUATION_WORKERS_METADATA_KEY: max_evaluation_workers,
+            }
 
         super().__init__(
             name=check_valid_name(name),
@@ -200,6 +218,11 @@ def asset_selection(self) -> AssetSelection:
     def emit_backfills(self) -> bool:
         return EMIT_BACKFILLS_METADATA_KEY in self.metadata
 
+    @property
+    def max_evaluation_workers(self) -> Optional[int]:
+        value = self.metadata.get(MAX_EVALUATION_WORKERS_METADATA_KEY)
+        return cast(int, value.value) if value else None
+
     @property
     def default_condition(self) -> Optional[AutomationCondition]:
         return self._default_condition
@@ -1,7 +1,9 @@
 import datetime
 import logging
+import multiprocessing
 from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from typing import TYPE_CHECKING, AbstractSet, Any, Optional, cast  # noqa: UP035
 
 import dagster._check as check
@@ -21,6 +23,7 @@
     AutomationConditionEvaluator,
 )
 from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
     AutomationConditionEvaluation,
 )
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
@@ -31,9 +34,11 @@
     ASSET_PARTITION_RANGE_END_TAG,
     ASSET_PARTITION_RANGE_START_TAG,
 )
+from dagster._serdes import deserialize_value, serialize_value_compact
 
 if TYPE_CHECKING:
     from dagster._core.instance import DagsterInstance
+    from dagster._core.instance.ref import InstanceRef
 
 
 class AutomationTickEvaluationContext:
@@ -51,6 +56,7 @@ def __init__(
         emit_backfills: bool,
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
+        max_evaluation_workers: Optional[int] = None,
     ):
         resolved_entity_keys = {
             entity_key
@@ -71,6 +77,9 @@ def __init__(
             evaluation_time=evaluation_time,
             logger=logger,
         )
+        self._instance = instance
+        self._logger = logger
+        self._max_evaluation_workers = max_evaluation_workers
         self._materialize_run_tags = materialize_run_tags
         self._observe_run_tags = observe_run_tags
         self._auto_observe_asset_keys = auto_observe_asset_keys or set()
@@ -133,11 +142,13 @@ def _build_run_requests(self, entity_subsets: Sequence[EntitySubset]) -> Sequenc
         )
 
     def _get_updated_cursor(
-        self, results: Iterable[AutomationResult], observe_run_requests: Iterable[RunRequest]
+        self,
+        condition_cursors: Sequence[AutomationConditionCursor],
+        observe_run_requests: Iterable[RunRequest],
     ) -> AssetDaemonCursor:
         return self.cursor.with_updates(
             evaluation_id=self._evaluation_id,
-            condition_cursors=[result.get_new_cursor() for result in results],
+            condition_cursors=condition_cursors,
             newly_observe_requested_asset_keys=[
                 asset_key
                 for run_request in observe_run_requests
@@ -149,20 +160,83 @@ def _get_updated_cursor(
             evaluation_timestamp=self._evaluator.evaluation_time.timestamp(),
         )
 
-    def _get_updated_evaluations(
-        self, results: Iterable[AutomationResult]
-    ) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
-        # only record evaluation results where something changed
-        updated_evaluations = []
-        for result in results:
-            previous_cursor = self.cursor.get_previous_condition_cursor(result.key)
-            if (
-                previous_cursor is None
-                or previous_cursor.result_value_hash != result.value_hash
-                or not result.true_subset.is_empty
-            ):
-                updated_evaluations.append(result.serializable_evaluation)
-        return updated_evaluations
+    def _get_evaluation_shards(self) -> Sequence[AbstractSet[EntityKey]]:
+        if not self._max_evaluation_workers or self._max_evaluation_workers <= 1:
+            return [self._evaluator.entity_keys]
+        if self._instance.is_ephemeral:
+            self._logger.warning(
+                "Cannot evaluate automation conditions in subprocesses with an ephemeral instance, "
+                "evaluating all entities in the current process."
+            )
+            return [self._evaluator.entity_keys]
+        return get_evaluation_shards(
+            self._evaluator.entity_keys, self.asset_graph, self._max_evaluation_workers
+        )
+
+    def _evaluate_shards_in_subprocesses(
+        self, shards: Sequence[AbstractSet[EntityKey]]
+    ) -> tuple[
+        Sequence[AutomationConditionCursor],
+        Sequence[AutomationConditionEvaluation[EntityKey]],
+        Sequence[EntitySubset[EntityKey]],
+    ]:
+        self._logger.info(
+            f"Evaluating {self._total_keys} entities in {len(shards)} independent shards across "
+            "subprocesses."
+        )
+        asset_graph_view = self._evaluator.asset_graph_view
+        with ProcessPoolExecutor(
+            max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_shard,
+                    instance_ref=self._instance.get_ref(),
+                    asset_graph=self.asset_graph,
+                    entity_keys=shard,
+                    cursor=self.cursor,
+                    emit_backfills=self._evaluator.emit_backfills,
+                    default_condition=self._evaluator.default_condition,
+                    evaluation_time=asset_graph_view.effective_dt,
+                    last_event_id=asset_graph_view.last_event_id,
+                )
+                for shard in shards
+            ]
+            shard_outputs = [
+                (
+                    deserialize_value(serialized_cursors, list),
+                    deserialize_value(serialized_evaluations, list),
+                    deserialize_value(serialized_subsets, list),
+                )
+                for serialized_cursors, serialized_evaluations, serialized_subsets in (
+                    future.result() for future in futures
+                )
+            ]
+
+        # merge the outputs of each shard in topological order, so that the result does not depend
+        # on how the shards were formed or which one finished first
+        toposort_index_by_key = {
+            key: i
+            for i, key in enumerate(
+                key for level in self.asset_graph.toposorted_entity_keys_by_level for key in level
+            )
+        }
+        condition_cursors = sorted(
+            (cursor for cursors, _, _ in shard_outputs for cursor in cursors),
+            key=lambda cursor: toposort_index_by_key[cursor.key],
+        )
+        evaluations = sorted(
+            (evaluation for _, evaluations, _ in shard_outputs for evaluation in evaluations),
+            key=lambda evaluation: toposort_index_by_key[evaluation.key],
+        )
+        entity_subsets = [
+            check.not_none(asset_graph_view.get_subset_from_serializable_subset(subset))
+            for subset in sorted(
+                (subset for _, _, subsets in shard_outputs for subset in subsets),
+                key=lambda subset: toposort_index_by_key[subset.key],
+            )
+        ]
+        return condition_cursors, evaluations, entity_subsets
 
     def evaluate(
         self,
@@ -170,12 +244,113 @@ def evaluate(
         Sequence[RunRequest], AssetDaemonCursor, Sequence[AutomationConditionEvaluation[EntityKey]]
     ]:
         observe_run_requests = self._legacy_build_auto_observe_run_requests()
-        results, entity_subsets = self._evaluator.evaluate()
+
+        shards = self._get_evaluation_shards()
+        if len(shards) > 1:
+            condition_cursors, evaluations, entity_subsets = self._evaluate_shards_in_subprocesses(
+                shards
+            )
+        else:
+            results, entity_subsets = self._evaluator.evaluate()
+            condition_cursors = self._evaluator.get_new_condition_cursors()
+            evaluations = _get_updated_evaluations(self.cursor, results)
 
         return (
             [*self._build_run_requests(entity_subsets), *observe_run_requests],
-            self._get_updated_cursor(results, observe_run_requests),
-            self._get_updated_evaluations(results),
+            self._get_updated_cursor(condition_cursors, observe_run_requests),
+            evaluations,
+        )
+
+
+def _get_updated_evaluations(
+    cursor: AssetDaemonCursor, results: Iterable[AutomationResult]
+) -> Sequence[AutomationConditionEvaluation[EntityKey]]:
+    # only record evaluation results where something changed
+    updated_evaluations = []
+    for result in results:
+        previous_cursor = cursor.get_previous_condition_cursor(result.key)
+        if (
+            previous_cursor is None
+            or previous_cursor.result_value_hash != result.value_hash
+            or not result.true_subset.is_empty
+        ):
+            updated_evaluations.append(result.serializable_evaluation)
+    return updated_evaluations
+
+
+def get_evaluation_shards(
+    entity_keys: AbstractSet[EntityKey], asset_graph: BaseAssetGraph, max_shards: int
+) -> Sequence[AbstractSet[EntityKey]]:
+    """Splits the provided entity keys into at most `max_shards` groups which can be evaluated
+    independently of each other. The evaluation of an entity may depend on the results of its
+    parents and of the other entities in its execution set, so each connected component of the
+    graph formed by those relationships is always assigned to a single shard.
+    """
+    root_by_key: dict[EntityKey, EntityKey] = {key: key for key in entity_keys}
+
+    def _find_root(key: EntityKey) -> EntityKey:
+        while root_by_key[key] != key:
+            root_by_key[key] = root_by_key[root_by_key[key]]
+            key = root_by_key[key]
+        return key
+
+    for key in entity_keys:
+        node = asset_graph.get(key)
+        neighbor_keys = set(node.parent_entity_keys)
+        if isinstance(key, AssetKey):
+            neighbor_keys |= asset_graph.get(key).execution_set_entity_keys
+        for neighbor_key in neighbor_keys:
+            if neighbor_key in root_by_key:
+                root_by_key[_find_root(neighbor_key)] = _find_root(key)
+
+    keys_by_root: dict[EntityKey, list[EntityKey]] = defaultdict(list)
+    for key in sorted(entity_keys, key=lambda k: k.to_user_string()):
+        keys_by_root[_find_root(key)].append(key)
+
+    # assign the largest components first, each to the currently smallest shard
+    shards: list[set[EntityKey]] = [set() for _ in range(min(max_shards, len(keys_by_root)))]
+    for component in sorted(
+        keys_by_root.values(), key=lambda keys: (-len(keys), keys[0].to_user_string())
+    ):
+        min(shards, key=len).update(component)
+    return shards
+
+
+def _evaluate_shard(
+    *,
+    instance_ref: "InstanceRef",
+    asset_graph: BaseAssetGraph,
+    entity_keys: AbstractSet[EntityKey],
+    cursor: AssetDaemonCursor,
+    emit_backfills: bool,
+    default_condition: Optional[AutomationCondition],
+    evaluation_time: datetime.datetime,
+    last_event_id: Optional[int],
+) -> tuple[str, str, str]:
+    """Evaluates a single shard of entities in a subprocess, with its own AssetGraphView. Returns
+    the serialized condition cursors, updated evaluations, and requested subsets of the shard, as
+    subsets may hold references to the instance which cannot be pickled.
+    """
+    from dagster._core.instance import DagsterInstance
+
+    with DagsterInstance.from_ref(instance_ref) as instance:
+        evaluator = AutomationConditionEvaluator(
+            entity_keys=entity_keys,
+            default_condition=default_condition,
+            instance=instance,
+            asset_graph=asset_graph,
+            emit_backfills=emit_backfills,
+            cursor=cursor,
+            evaluation_time=evaluation_time,
+            last_event_id=last_event_id,
+        )
+        results, entity_subsets = evaluator.evaluate()
+        return (
+            serialize_value_compact(evaluator.get_new_condition_cursors()),
+            serialize_value_compact(_get_updated_evaluations(cursor, results)),
+            serialize_value_compact(
+                [subset.convert_to_serializable_subset() for subset in entity_subsets]
+            ),
         )
 
 
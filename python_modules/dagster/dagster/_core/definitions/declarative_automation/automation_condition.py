@@ -20,6 +20,7 @@
     AssetSubsetWithMetadata,
     AutomationConditionCursor,
     AutomationConditionEvaluation,
+    AutomationConditionEvaluationStats,
     AutomationConditionNodeCursor,
     AutomationConditionNodeSnapshot,
     AutomationConditionSnapshot,
@@ -84,6 +85,18 @@ def my_asset(): ...
     def requires_cursor(self) -> bool:
         return True
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        """Whether the result of evaluating this condition over a given entity and candidate subset
+        may depend on the root entity whose condition is being evaluated, other than through the
+        previous temporal context of that entity. For example, conditions which read their own
+        cursor depend on the root entity, as cursors are stored per root entity.
+
+        Results of subtrees which do not depend on the root entity may be shared between all
+        entities that depend on the same entity on a tick.
+        """
+        return True
+
     @property
     def children(self) -> Sequence["AutomationCondition"]:
         return []
@@ -152,6 +165,16 @@ def has_rule_condition(self) -> bool:
             return True
         return any(child.has_rule_condition for child in self.children)
 
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        """Returns True if the result of this condition may differ between an evaluation at
+        `previous_evaluation_time` and one at `evaluation_time`, even if no new events were stored
+        for the evaluated entity or its dependencies in between. Conditions which cannot make this
+        guarantee must return True, as otherwise their evaluation may be skipped.
+        """
+        return True
+
     @property
     def is_serializable(self) -> bool:
         if not is_whitelisted_for_serdes_object(self):
@@ -658,6 +681,16 @@ def with_label(self, label: Optional[str]) -> Self:
         """Returns a copy of this AutomationCondition with a human-readable label."""
         return copy(self, label=label)
 
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        # by default, builtin conditions only depend on the state of the event log, the
+        # definitions, and the results of their children
+        return any(
+            child.may_change_without_new_events(previous_evaluation_time, evaluation_time)
+            for child in self.children
+        )
+
 
 class AutomationResult(Generic[T_EntityKey]):
     """The result of evaluating an AutomationCondition."""
@@ -778,6 +811,11 @@ def serializable_evaluation(self) -> AutomationConditionEvaluation:
             child_evaluations=[
                 child_result.serializable_evaluation for child_result in self._child_results
             ],
+            stats=AutomationConditionEvaluationStats(
+                num_storage_queries=self._context.cache_stats.num_storage_queries,
+                num_cache_hits=self._context.cache_stats.num_cache_hits,
+                num_cache_misses=self._context.cache_stats.num_cache_misses,
+            ),
         )
 
     def set_internal_serializable_subset_override(self, override: SerializableEntitySubset) -> None:
@@ -799,6 +837,7 @@ def get_new_cursor(self) -> AutomationConditionCursor:
             last_event_id=self._context.max_storage_id,
             node_cursors_by_unique_id=self.get_child_node_cursors(),
             result_value_hash=self.value_hash,
+            input_hash=self._context.input_hash,
         )
 
     def get_serializable_subset(self) -> SerializableEntitySubset:
@@ -1,10 +1,12 @@
 import asyncio
+import dataclasses
 import datetime
 import logging
 from collections import defaultdict
 from collections.abc import Mapping, Sequence
 from typing import TYPE_CHECKING, AbstractSet, Optional  # noqa: UP035
 
+import dagster._check as check
 from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
 from dagster._core.asset_graph_view.entity_subset import EntitySubset
 from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
@@ -16,13 +18,34 @@
     AutomationResult,
 )
 from dagster._core.definitions.declarative_automation.automation_context import AutomationContext
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionCursor,
+)
+from dagster._core.definitions.declarative_automation.shared_result_cache import (
+    SharedAutomationResultCache,
+)
 from dagster._core.definitions.events import AssetKey
+from dagster._core.event_api import EventLogCursor, EventLogRecord, EventRecordsFilter
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, DagsterEventType
 from dagster._core.instance import DagsterInstance
+from dagster._core.storage.dagster_run import DagsterRun, RunsFilter
 from dagster._time import get_current_datetime
+from dagster._utils.cached_method import cached_method
+from dagster._utils.security import non_secure_md5_hash_str
 
 if TYPE_CHECKING:
     from dagster._utils.caching_instance_queryer import CachingInstanceQueryer
 
+# if more new events than this have been stored since the previous evaluation, all entities are
+# evaluated rather than working out which ones could possibly have changed
+MAX_NEW_EVENTS_TO_TRACK = 5000
+
+FINISHED_RUN_EVENT_TYPES = (
+    DagsterEventType.RUN_SUCCESS,
+    DagsterEventType.RUN_FAILURE,
+    DagsterEventType.RUN_CANCELED,
+)
+
 
 class AutomationConditionEvaluator:
     def __init__(
@@ -35,13 +58,16 @@ def __init__(
         emit_backfills: bool,
         default_condition: Optional[AutomationCondition] = None,
         evaluation_time: Optional[datetime.datetime] = None,
+        last_event_id: Optional[int] = None,
         logger: logging.Logger = logging.getLogger("dagster.automation"),
     ):
         self.entity_keys = entity_keys
         self.asset_graph_view = AssetGraphView(
             temporal_context=TemporalContext(
                 effective_dt=evaluation_time or get_current_datetime(),
-                last_event_id=instance.event_log_storage.get_maximum_record_id(),
+                last_event_id=last_event_id
+                if last_event_id is not None
+                else instance.event_log_storage.get_maximum_record_id(),
             ),
             instance=instance,
             asset_graph=asset_graph,
@@ -67,6 +93,10 @@ def __init__(
         self.legacy_data_time_resolver = CachingDataTimeResolver(self.instance_queryer)
 
         self.request_subsets_by_key: dict[EntityKey, EntitySubset] = {}
+        self.shared_result_cache = SharedAutomationResultCache()
+
+        self.skip_unchanged_entities = _instance.auto_materialize_skip_unchanged_entities
+        self.input_hashes_by_key: dict[EntityKey, str] = {}
 
     @property
     def instance_queryer(self) -> "CachingInstanceQueryer":
@@ -113,6 +143,17 @@ async def async_evaluate(
         num_conditions = len(self.entity_keys)
         num_evaluated = 0
 
+        changed_entity_keys = None
+        if self.skip_unchanged_entities:
+            self.input_hashes_by_key = {
+                entity_key: self._compute_input_hash(entity_key) for entity_key in self.entity_keys
+            }
+            changed_entity_keys = self._get_changed_entity_keys()
+            self.logger.info(
+                f"{len(changed_entity_keys)} of {num_conditions} entities may have changed since "
+                "their previous evaluation."
+            )
+
         async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
             self.logger.debug(
                 f"Evaluating {entity_key.to_user_string()} ({num_evaluated+offset}/{num_conditions})"
@@ -143,14 +184,243 @@ async def _evaluate_entity_async(entity_key: EntityKey, offset: int):
                 _evaluate_entity_async(entity_key, offset)
                 for offset, entity_key in enumerate(topo_level)
                 if entity_key in self.entity_keys
+                and self._should_evaluate(entity_key, changed_entity_keys)
             ]
             await asyncio.gather(*coroutines)
             num_evaluated += len(coroutines)
 
+        if num_evaluated < num_conditions:
+            self.logger.info(
+                f"Skipped {num_conditions - num_evaluated} entities whose inputs have not changed "
+                "since their previous evaluation."
+            )
+
         return list(self.current_results_by_key.values()), [
             v for v in self.request_subsets_by_key.values() if not v.is_empty
         ]
 
+    def get_new_condition_cursors(self) -> Sequence[AutomationConditionCursor]:
+        """Returns the cursors to store after this evaluation. Entities which were skipped keep
+        their previous cursor, with its last_event_id advanced to that of this evaluation, as no
+        new events were stored for them or their dependencies in the meantime. This keeps the
+        range of events read on the next evaluation from growing while they remain skipped.
+        """
+        cursors = [result.get_new_cursor() for result in self.current_results_by_key.values()]
+        last_event_id = self.asset_graph_view.last_event_id
+        for key in self.entity_keys:
+            if key in self.current_results_by_key:
+                continue
+            cursor = self.cursor.get_previous_condition_cursor(key)
+            if cursor is not None and last_event_id is not None:
+                cursors.append(dataclasses.replace(cursor, last_event_id=last_event_id))
+        return cursors
+
+    def _get_execution_set_keys(self, key: EntityKey) -> AbstractSet[EntityKey]:
+        if isinstance(key, AssetKey):
+            return self.asset_graph.get(key).execution_set_entity_keys
+        return {key}
+
+    def _get_input_entity_keys(self, key: EntityKey) -> AbstractSet[EntityKey]:
+        """Returns the set of entity keys whose state may be read when evaluating the condition of
+        the given key.
+        """
+        node = self.asset_graph.get(key)
+        input_keys = {key, *node.parent_entity_keys}
+        if isinstance(node, BaseAssetNode):
+            input_keys |= node.check_keys
+        return input_keys
+
+    def _should_evaluate(
+        self, key: EntityKey, changed_entity_keys: Optional[AbstractSet[EntityKey]]
+    ) -> bool:
+        if changed_entity_keys is None or key in changed_entity_keys:
+            return True
+        # unchanged entities still need to be evaluated if something they depend on will be
+        # requested on this tick
+        return any(
+            not self.request_subsets_by_key[parent_key].is_empty
+            for execution_set_key in self._get_execution_set_keys(key)
+            for parent_key in self.asset_graph.get(execution_set_key).parent_entity_keys
+            if parent_key in self.request_subsets_by_key
+        )
+
+    @cached_method
+    def _get_partitions_state_token(self, *, key: EntityKey) -> str:
+        """Returns a string which changes whenever the set of partitions of the given key, or the
+        subset of them targeted by in-progress backfills, changes.
+        """
+        node = self.asset_graph.get(key)
+        if not isinstance(node, BaseAssetNode):
+            return ""
+        tokens = []
+        partitions_def = node.partitions_def
+        if partitions_def is not None:
+            tokens.append(partitions_def.get_serializable_unique_identifier(self.instance_queryer))
+            tokens.append(
+                str(
+                    partitions_def.get_last_partition_key(
+                        current_time=self.evaluation_time,
+                        dynamic_partitions_store=self.instance_queryer,
+                    )
+                )
+            )
+
+        backfill_subset = self.instance_queryer.get_active_backfill_in_progress_asset_graph_subset()
+        if key in backfill_subset.non_partitioned_asset_keys:
+            tokens.append("backfill_in_progress")
+        elif key in backfill_subset.partitions_subsets_by_asset_key:
+            tokens.append(backfill_subset.partitions_subsets_by_asset_key[key].serialize())
+        return ",".join(tokens)
+
+    def _compute_input_hash(self, key: EntityKey) -> str:
+        """Returns a hash of the inputs to the evaluation of the given key which are not tracked in
+        the event log: the condition itself, the code version, the dependencies, and the partitions
+        state of the key and its dependencies.
+        """
+        node = self.asset_graph.get(key)
+        condition = check.not_none(node.automation_condition or self.default_condition)
+        parts = [
+            condition.get_unique_id(),
+            str(node.code_version) if isinstance(node, BaseAssetNode) else "",
+            *(
+                f"{input_key.to_user_string()}:{self._get_partitions_state_token(key=input_key)}"
+                for input_key in sorted(
+                    self._get_input_entity_keys(key), key=lambda k: k.to_user_string()
+                )
+            ),
+        ]
+        return non_secure_md5_hash_str("".join(parts).encode())
+
+    def _get_changed_entity_keys(self) -> AbstractSet[EntityKey]:
+        """Returns the set of entity keys whose evaluation result may differ from their previous
+        evaluation, either because new events were stored for them or their dependencies, because
+        one of the time-based conditions they contain may have changed, or because the inputs to
+        their evaluation which are not tracked in the event log have changed. Keys which are not in
+        this set only need to be evaluated if one of their dependencies is requested on this tick.
+        """
+        changed_keys: set[EntityKey] = set()
+        previous_last_event_ids: dict[EntityKey, int] = {}
+        for key in self.entity_keys:
+            cursor = self.cursor.get_previous_condition_cursor(key)
+            if cursor is None or cursor.input_hash != self.input_hashes_by_key[key]:
+                changed_keys.add(key)
+                continue
+
+            condition = check.not_none(
+                self.asset_graph.get(key).automation_condition or self.default_condition
+            )
+            if condition.may_change_without_new_events(
+                cursor.temporal_context.effective_dt, self.evaluation_time
+            ) or any(
+                not previous_cursor.previous_requested_subset.is_empty
+                for previous_cursor in (
+                    self.cursor.get_previous_condition_cursor(input_key)
+                    for input_key in self._get_input_entity_keys(key)
+                )
+                if previous_cursor is not None
+            ):
+                changed_keys.add(key)
+                continue
+
+            previous_last_event_ids[key] = cursor.last_event_id or 0
+
+        last_event_id = self.asset_graph_view.last_event_id
+        if previous_last_event_ids and last_event_id is not None:
+            new_event_ids_by_key = self._get_latest_new_event_id_by_key(
+                min(previous_last_event_ids.values())
+            )
+            if new_event_ids_by_key is None:
+                self.logger.info(
+                    f"More than {MAX_NEW_EVENTS_TO_TRACK} new events have been stored since the "
+                    "previous evaluation, evaluating all entities."
+                )
+                return self.entity_keys
+
+            for key, previous_last_event_id in previous_last_event_ids.items():
+                if any(
+                    new_event_ids_by_key.get(input_key, 0) > previous_last_event_id
+                    for input_key in self._get_input_entity_keys(key)
+                ):
+                    changed_keys.add(key)
+
+        # entities which must be executed together are always evaluated together
+        return {
+            key
+            for key in self.entity_keys
+            if not changed_keys.isdisjoint(self._get_execution_set_keys(key))
+        }
+
+    def _get_latest_new_event_id_by_key(
+        self, after_storage_id: int
+    ) -> Optional[Mapping[EntityKey, int]]:
+        """Returns the storage id of the latest event stored after the given storage id for each
+        entity key with new events, including the completion of runs which targeted it. Returns
+        None if too many new events exist to track them individually.
+        """
+        instance = self.asset_graph_view.instance
+        new_event_ids_by_key: dict[EntityKey, int] = {}
+
+        def _add_event_id(key: EntityKey, storage_id: int) -> None:
+            new_event_ids_by_key[key] = max(storage_id, new_event_ids_by_key.get(key, 0))
+
+        event_types = set(ASSET_EVENTS)
+        if not instance.event_log_storage.is_run_sharded:
+            # run-sharded storages do not index asset check events across runs, so changes to
+            # checks are picked up when the run that executed them completes instead
+            event_types |= ASSET_CHECK_EVENTS
+
+        for event_type in event_types:
+            records = instance.event_log_storage.get_event_records(
+                EventRecordsFilter(event_type=event_type, after_cursor=after_storage_id),
+                limit=MAX_NEW_EVENTS_TO_TRACK + 1,
+                ascending=True,
+            )
+            if len(records) > MAX_NEW_EVENTS_TO_TRACK:
+                return None
+            for record in records:
+                key = _get_entity_key_for_event_record(record)
+                if key is not None:
+                    _add_event_id(key, record.storage_id)
+
+        finished_run_event_ids: dict[str, int] = {}
+        for event_type in FINISHED_RUN_EVENT_TYPES:
+            records = instance.fetch_run_status_changes(
+                event_type,
+                limit=MAX_NEW_EVENTS_TO_TRACK + 1,
+                cursor=EventLogCursor.from_storage_id(after_storage_id).to_string(),
+                ascending=True,
+            ).records
+            if len(records) > MAX_NEW_EVENTS_TO_TRACK:
+                return None
+            for record in records:
+                finished_run_event_ids[record.run_id] = record.storage_id
+
+        if finished_run_event_ids:
+            for run in instance.get_runs(RunsFilter(run_ids=list(finished_run_event_ids.keys()))):
+                for key in self._get_entity_keys_for_run(run):
+                    _add_event_id(key, finished_run_event_ids[run.run_id])
+
+        return new_event_ids_by_key
+
+    def _get_entity_keys_for_run(self, run: DagsterRun) -> AbstractSet[EntityKey]:
+        if run.asset_selection is not None or run.asset_check_selection is not None:
+            return {*(run.asset_selection or []), *(run.asset_check_selection or [])}
+
+        # runs which target an entire job do not record their selection, so fall back to the
+        # entities that the run planned to execute
+        planned_records = self.asset_graph_view.instance.get_records_for_run(
+            run.run_id,
+            of_type={
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED,
+            },
+        ).records
+        return {
+            key
+            for key in (_get_entity_key_for_event_record(record) for record in planned_records)
+            if key is not None
+        }
+
     async def evaluate_entity(self, key: EntityKey) -> None:
         # evaluate the condition of this asset
         result = await AutomationContext.create(key=key, evaluator=self).evaluate_async()
@@ -180,6 +450,9 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
         execution_set_keys = self.asset_graph.get(asset_key).execution_set_entity_keys
 
         if len(execution_set_keys) > 1 and result.true_subset.size > 0:
+            # shared results may depend on the requested subsets of entities that were already
+            # evaluated, which are about to change
+            self.shared_result_cache.clear()
             for neighbor_key in execution_set_keys:
                 if isinstance(neighbor_key, AssetKey):
                     self.legacy_expected_data_time_by_key[neighbor_key] = (
@@ -201,3 +474,14 @@ def _handle_execution_set(self, result: AutomationResult[AssetKey]) -> None:
                     )
 
                 self._add_request_subset(neighbor_true_subset)
+
+
+def _get_entity_key_for_event_record(record: EventLogRecord) -> Optional[EntityKey]:
+    dagster_event = record.event_log_entry.dagster_event
+    if dagster_event is None:
+        return None
+    elif dagster_event.event_type == DagsterEventType.ASSET_CHECK_EVALUATION:
+        return dagster_event.asset_check_evaluation_data.asset_check_key
+    elif dagster_event.event_type == DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED:
+        return dagster_event.asset_check_planned_data.asset_check_key
+    return dagster_event.asset_key
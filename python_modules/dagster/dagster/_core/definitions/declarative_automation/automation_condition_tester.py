@@ -137,11 +137,16 @@ def my_dbt_assets(context: AssetExecutionContext, dbt: DbtCliResource):
         else AssetDaemonCursor.empty(),
     )
     results, requested_subsets = evaluator.evaluate()
+    # do not forget about cursors of entities which were skipped on this evaluation
+    condition_cursors_by_key = {
+        **evaluator.cursor.previous_condition_cursors_by_key,
+        **{cursor.key: cursor for cursor in evaluator.get_new_condition_cursors()},
+    }
     cursor = AssetDaemonCursor(
         evaluation_id=0,
         last_observe_request_timestamp_by_asset_key={},
         previous_evaluation_state=None,
-        previous_condition_cursors=[result.get_new_cursor() for result in results],
+        previous_condition_cursors=list(condition_cursors_by_key.values()),
     )
 
     return EvaluateAutomationConditionsResult(
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import inspect
 import logging
@@ -23,8 +24,12 @@
     HistoricalAllPartitionsSubsetSentinel,
     StructuredCursor,
 )
+from dagster._core.definitions.declarative_automation.shared_result_cache import (
+    SharedAutomationResultCache,
+)
 from dagster._core.definitions.partition import PartitionsDefinition
 from dagster._time import get_current_datetime
+from dagster._utils.cache_stats import CacheStats, record_cache_stats
 
 if TYPE_CHECKING:
     from dagster._core.definitions.base_asset_graph import BaseAssetGraph
@@ -59,9 +64,12 @@ class AutomationContext(Generic[T_EntityKey]):
     parent_context: Optional["AutomationContext"]
 
     _cursor: Optional[AutomationConditionCursor]
+    _input_hash: Optional[str]
     _legacy_context: Optional[LegacyRuleEvaluationContext]
 
     _root_log: logging.Logger
+    _cache_stats: CacheStats
+    _shared_result_cache: Optional[SharedAutomationResultCache]
 
     @staticmethod
     def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "AutomationContext":
@@ -80,10 +88,13 @@ def create(key: EntityKey, evaluator: "AutomationConditionEvaluator") -> "Automa
             request_subsets_by_key=evaluator.request_subsets_by_key,
             parent_context=None,
             _cursor=evaluator.cursor.get_previous_condition_cursor(key),
+            _input_hash=evaluator.input_hashes_by_key.get(key),
             _legacy_context=LegacyRuleEvaluationContext.create(key, evaluator)
             if condition.has_rule_condition and isinstance(key, AssetKey)
             else None,
             _root_log=evaluator.logger,
+            _cache_stats=CacheStats(),
+            _shared_result_cache=evaluator.shared_result_cache,
         )
 
     def for_child_condition(
@@ -104,24 +115,68 @@ def for_child_condition(
             request_subsets_by_key=self.request_subsets_by_key,
             parent_context=self,
             _cursor=self._cursor,
+            _input_hash=self._input_hash,
             _legacy_context=self._legacy_context.for_child(
                 child_condition, condition_unqiue_id, candidate_subset
             )
             if self._legacy_context
             else None,
             _root_log=self._root_log,
+            _cache_stats=CacheStats(),
+            _shared_result_cache=self._shared_result_cache
+            if self._legacy_context is None
+            else None,
         )
 
     async def evaluate_async(self) -> AutomationResult[T_EntityKey]:
-        if inspect.iscoroutinefunction(self.condition.evaluate):
-            return await self.condition.evaluate(self)
-        return self.condition.evaluate(self)
+        cache = self._shared_result_cache
+        cache_key = cache.get_cache_key(self) if cache is not None else None
+        if cache is None or cache_key is None:
+            return await self._evaluate_async()
+
+        shared_result = cache.get(cache_key, self.candidate_subset)
+        if shared_result is not None:
+            check.not_none(self.parent_context).cache_stats.num_cache_hits += 1
+            return await shared_result
+
+        # other entities which depend on this entity may be evaluated concurrently, so the future
+        # is shared before evaluation starts
+        future = asyncio.get_running_loop().create_future()
+        cache.set(cache_key, self.candidate_subset, future)
+        try:
+            result = await self._evaluate_async()
+        except Exception as e:
+            future.set_exception(e)
+            # the exception is re-raised here, so it does not need to be retrieved from the future
+            future.exception()
+            raise
+        future.set_result(result)
+        return result
+
+    async def _evaluate_async(self) -> AutomationResult[T_EntityKey]:
+        with record_cache_stats(self._cache_stats):
+            if inspect.iscoroutinefunction(self.condition.evaluate):
+                result = await self.condition.evaluate(self)
+            else:
+                result = self.condition.evaluate(self)
+        # children may be evaluated in separate asyncio tasks, so their counts are rolled up into
+        # the parent explicitly rather than recorded against it directly
+        if self.parent_context is not None:
+            self.parent_context.cache_stats.add(self._cache_stats)
+        return result
 
     @property
     def log(self) -> logging.Logger:
         """The logger for the current condition evaluation."""
         return self._root_log.getChild(self.condition.__class__.__name__)
 
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Counters for the cached method calls and storage queries made while evaluating this
+        condition and its children.
+        """
+        return self._cache_stats
+
     @property
     def asset_graph(self) -> "BaseAssetGraph":
         return self.asset_graph_view.asset_graph
@@ -202,6 +257,13 @@ def previous_evaluation_time(self) -> Optional[datetime.datetime]:
         """The `evaluation_time` value used on the previous tick's evaluation."""
         return self._cursor.temporal_context.effective_dt if self._cursor else None
 
+    @property
+    def input_hash(self) -> Optional[str]:
+        """A hash of the inputs to this tick's evaluation which are not tracked in the event log,
+        if unchanged entities may be skipped on subsequent evaluations.
+        """
+        return self._input_hash
+
     @property
     def previous_temporal_context(self) -> Optional[TemporalContext]:
         """The `temporal_context` value used on the previous tick's evaluation."""
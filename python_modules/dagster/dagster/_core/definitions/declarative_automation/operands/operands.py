@@ -110,6 +110,12 @@ def description(self) -> str:
     def name(self) -> str:
         return "will_be_requested"
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        # only depends on the root entity through whether it can execute in the same run as this
+        # entity, which is part of the key under which shared results are cached
+        return False
+
     def _executable_with_root_context_key(self, context: AutomationContext) -> bool:
         # TODO: once we can launch backfills via the asset daemon, this can be removed
         from dagster._core.definitions.asset_graph import executable_in_same_run
@@ -136,6 +142,11 @@ class NewlyRequestedCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "newly_requested"
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        # the previous requested subset is stored on the cursor of the root entity
+        return True
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return context.previous_requested_subset or context.get_empty_subset()
 
@@ -147,6 +158,10 @@ class LatestRunExecutedWithRootTargetCondition(SubsetAutomationCondition):
     def name(self) -> str:
         return "executed_with_root_target"
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return True
+
     async def compute_subset(self, context: AutomationContext) -> EntitySubset:
         return await context.asset_graph_view.compute_latest_run_executed_with_subset(
             from_subset=context.candidate_subset, target=context.root_context.key
@@ -187,6 +202,11 @@ def _get_previous_cron_tick(self, effective_dt: datetime.datetime) -> datetime.d
         )
         return next(previous_ticks)
 
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        return self._get_previous_cron_tick(evaluation_time) >= previous_evaluation_time
+
     def compute_subset(self, context: AutomationContext) -> EntitySubset:
         previous_cron_tick = self._get_previous_cron_tick(context.evaluation_time)
         if (
@@ -19,6 +19,10 @@ class SubsetAutomationCondition(BuiltinAutomationCondition[T_EntityKey]):
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return False
+
     @abstractmethod
     def compute_subset(
         self, context: AutomationContext[T_EntityKey]
@@ -1,3 +1,4 @@
+import datetime
 from collections.abc import Mapping, Sequence
 from typing import AbstractSet  # noqa: UP035
 
@@ -61,6 +62,12 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        # the downstream conditions are only resolved at evaluation time
+        return True
+
     def _get_ignored_conditions(
         self, context: AutomationContext[AssetKey]
     ) -> AbstractSet[AutomationCondition]:
@@ -36,6 +36,10 @@ def children(self) -> Sequence[AutomationCondition[T_EntityKey]]:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return any(child.depends_on_root_entity for child in self.children)
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
@@ -85,6 +89,10 @@ def children(self) -> Sequence[AutomationCondition[T_EntityKey]]:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return any(child.depends_on_root_entity for child in self.children)
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
@@ -123,6 +131,10 @@ def name(self) -> str:
     def children(self) -> Sequence[AutomationCondition[T_EntityKey]]:
         return [self.operand]
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return self.operand.depends_on_root_entity
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
@@ -1,4 +1,5 @@
 import asyncio
+import datetime
 from abc import abstractmethod
 from typing import AbstractSet  # noqa: UP035
 
@@ -38,6 +39,15 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return self.operand.depends_on_root_entity
+
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        return self.operand.may_change_without_new_events(previous_evaluation_time, evaluation_time)
+
     def _get_check_keys(
         self, key: AssetKey, asset_graph: BaseAssetGraph[BaseAssetNode]
     ) -> AbstractSet[AssetCheckKey]:
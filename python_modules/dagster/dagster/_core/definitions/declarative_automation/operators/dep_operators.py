@@ -1,3 +1,4 @@
+import datetime
 from abc import abstractmethod
 from typing import TYPE_CHECKING, AbstractSet, Any, Generic, Optional  # noqa: UP035
 
@@ -30,6 +31,15 @@ class EntityMatchesCondition(
     def name(self) -> str:
         return self.key.to_user_string()
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return self.operand.depends_on_root_entity
+
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        return self.operand.may_change_without_new_events(previous_evaluation_time, evaluation_time)
+
     async def evaluate(
         self, context: AutomationContext[T_EntityKey]
     ) -> AutomationResult[T_EntityKey]:
@@ -87,6 +97,15 @@ def name(self) -> str:
     def requires_cursor(self) -> bool:
         return False
 
+    @property
+    def depends_on_root_entity(self) -> bool:
+        return self.operand.depends_on_root_entity
+
+    def may_change_without_new_events(
+        self, previous_evaluation_time: datetime.datetime, evaluation_time: datetime.datetime
+    ) -> bool:
+        return self.operand.may_change_without_new_events(previous_evaluation_time, evaluation_time)
+
     def allow(self, selection: "AssetSelection") -> "DepsAutomationCondition":
         """Returns a copy of this condition that will only consider dependencies within the provided
         AssetSelection.
@@ -82,7 +82,25 @@ def frozen_metadata(self) -> frozenset[tuple[str, MetadataValue]]:
         return frozenset(self.metadata.items())
 
 
-@whitelist_for_serdes(storage_name="AssetConditionEvaluation")
+@whitelist_for_serdes
+@record
+class AutomationConditionEvaluationStats:
+    """Profiling counters collected while evaluating a node in the evaluation tree. Counts include
+    the work done while evaluating the node's children.
+
+    Attributes:
+        num_storage_queries: The number of SQL statements executed against the instance's
+            storage.
+        num_cache_hits: The number of cached method calls served from a cache.
+        num_cache_misses: The number of cached method calls that had to compute their result.
+    """
+
+    num_storage_queries: int
+    num_cache_hits: int
+    num_cache_misses: int
+
+
+@whitelist_for_serdes(storage_name="AssetConditionEvaluation", skip_when_none_fields={"stats"})
 @dataclass
 class AutomationConditionEvaluation(Generic[T_EntityKey]):
     """Serializable representation of the results of evaluating a node in the evaluation tree."""
@@ -99,6 +117,8 @@ class AutomationConditionEvaluation(Generic[T_EntityKey]):
 
     child_evaluations: Sequence["AutomationConditionEvaluation"]
 
+    stats: Optional[AutomationConditionEvaluationStats] = None
+
     @property
     def key(self) -> T_EntityKey:
         return self.true_subset.key
@@ -161,7 +181,7 @@ def get_structured_cursor(
         return None
 
 
-@whitelist_for_serdes
+@whitelist_for_serdes(skip_when_none_fields={"input_hash"})
 @dataclass
 class AutomationConditionCursor(Generic[T_EntityKey]):
     """Incremental state calculated during the evaluation of a AutomationCondition. This may be used
@@ -175,6 +195,9 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
             tree to any incremental state calculated for it.
         result_hash: A unique hash of the result for this tick. Used to determine if anything
             has changed since the last time this was evaluated.
+        input_hash: A unique hash of the inputs to the evaluation which are not tracked in the
+            event log, such as the condition itself and the set of partitions. Only set when
+            unchanged entities may be skipped on subsequent evaluations.
     """
 
     previous_requested_subset: SerializableEntitySubset
@@ -183,6 +206,7 @@ class AutomationConditionCursor(Generic[T_EntityKey]):
 
     node_cursors_by_unique_id: Mapping[str, AutomationConditionNodeCursor]
     result_value_hash: str
+    input_hash: Optional[str] = None
 
     @staticmethod
     def backcompat_from_evaluation_state(
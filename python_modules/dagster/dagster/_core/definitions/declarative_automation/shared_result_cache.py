@@ -0,0 +1,131 @@
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import TYPE_CHECKING, Optional
+
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.definitions.declarative_automation.automation_condition import (
+    AutomationCondition,
+    AutomationResult,
+)
+from dagster._serdes.errors import SerializationError
+from dagster._serdes.serdes import serialize_value
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from dagster._core.definitions.declarative_automation.automation_context import (
+        AutomationContext,
+    )
+
+DEFAULT_SHARED_RESULT_CACHE_SIZE = 10000
+
+
+class SharedAutomationResultCache:
+    """Caches the results of evaluating condition subtrees over the dependencies of an entity, so
+    that entities which share a dependency and a structurally identical condition (e.g. the
+    `any_deps_missing` operand of `AutomationCondition.eager()`) only evaluate it once per tick.
+
+    Only subtrees in which no node depends on the root entity being evaluated are cached. Entries
+    are keyed on the serialized subtree and unique id of the condition node, the entity key, the
+    previous temporal context of the root entity, and whether the root entity can execute in the
+    same run as the entity. The least recently used entries are evicted once more than `max_size`
+    results are cached.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_SHARED_RESULT_CACHE_SIZE):
+        self._max_size = max_size
+        self._entries_by_key: OrderedDict[
+            Hashable, list[tuple[EntitySubset, asyncio.Future[AutomationResult]]]
+        ] = OrderedDict()
+        self._num_results = 0
+        # conditions are held onto so that their ids cannot be reused within a tick
+        self._structure_keys_by_condition_id: dict[
+            int, tuple[AutomationCondition, Optional[str]]
+        ] = {}
+
+    @property
+    def num_results(self) -> int:
+        return self._num_results
+
+    def _get_structure_key(self, condition: AutomationCondition) -> Optional[str]:
+        """Returns a string identifying the full structure of the given condition subtree if its
+        results may be shared, otherwise None.
+        """
+        condition_id = id(condition)
+        if condition_id not in self._structure_keys_by_condition_id:
+            structure_key = None
+            if not condition.depends_on_root_entity:
+                # unique ids do not cover the operands of dep and check conditions, and condition
+                # equality does not compare types, so the serialized subtree is used instead
+                try:
+                    structure_key = serialize_value(condition)
+                except SerializationError:
+                    pass
+            self._structure_keys_by_condition_id[condition_id] = (condition, structure_key)
+        return self._structure_keys_by_condition_id[condition_id][1]
+
+    def get_cache_key(self, context: "AutomationContext") -> Optional[Hashable]:
+        """Returns the key under which the result of the given context may be shared, or None if
+        it may not be shared.
+        """
+        from dagster._core.definitions.asset_graph import executable_in_same_run
+
+        # results are only shared for the dependencies of the root entity
+        parent_context = context.parent_context
+        if parent_context is None or parent_context.key == context.key:
+            return None
+        structure_key = self._get_structure_key(context.condition)
+        if structure_key is None:
+            return None
+
+        root_key = context.root_context.key
+        return (
+            structure_key,
+            context.condition_unique_id,
+            context.key,
+            context.previous_temporal_context,
+            executable_in_same_run(
+                asset_graph=context.asset_graph, child_key=root_key, parent_key=context.key
+            ),
+        )
+
+    def get(
+        self, cache_key: Hashable, candidate_subset: EntitySubset
+    ) -> Optional["asyncio.Future[AutomationResult]"]:
+        """Returns a future for the shared result of evaluating over the given candidate subset,
+        which may still be in the process of being evaluated.
+        """
+        entries = self._entries_by_key.get(cache_key)
+        if entries is None:
+            return None
+        self._entries_by_key.move_to_end(cache_key)
+        for entry_candidate_subset, future in entries:
+            if (
+                entry_candidate_subset is candidate_subset
+                or entry_candidate_subset.get_internal_value()
+                == candidate_subset.get_internal_value()
+            ):
+                return future
+        return None
+
+    def set(
+        self,
+        cache_key: Hashable,
+        candidate_subset: EntitySubset,
+        future: "asyncio.Future[AutomationResult]",
+    ) -> None:
+        entry = (candidate_subset, future)
+        if cache_key in self._entries_by_key:
+            self._entries_by_key[cache_key].append(entry)
+            self._entries_by_key.move_to_end(cache_key)
+        else:
+            self._entries_by_key[cache_key] = [entry]
+        self._num_results += 1
+
+        while self._num_results > self._max_size:
+            _, evicted = self._entries_by_key.popitem(last=False)
+            self._num_results -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries_by_key.clear()
+        self._num_results = 0
@@ -7,7 +7,7 @@
 
 import dagster._check as check
 from dagster._annotations import public
-from dagster._builtins import Int
+from dagster._builtins import Bool, Int
 from dagster._config import Field, Noneable, Selector, UserConfigSchema
 from dagster._core.definitions.configurable import (
     ConfiguredDefinitionConfigSchema,
@@ -332,12 +332,29 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
     if start_selector:
         start_method, start_cfg = next(iter(start_selector.items()))
 
+    # the worker pool is enabled by the presence of its config, even if empty
+    worker_pool_cfg = check.opt_nullable_dict_elem(config, "worker_pool")
+
     return MultiprocessExecutor(
         max_concurrent=check.opt_int_elem(config, "max_concurrent"),
         tag_concurrency_limits=check.opt_list_elem(config, "tag_concurrency_limits"),
         retries=RetryMode.from_config(check.dict_elem(config, "retries")),  # type: ignore
         start_method=start_method,
         explicit_forkserver_preload=check.opt_list_elem(start_cfg, "preload_modules", of_type=str),
+        forkserver_preload_code_location=check.opt_bool_param(
+            start_cfg.get("preload_code_location"), "preload_code_location"
+        ),
+        use_worker_pool=worker_pool_cfg is not None,
+        max_steps_per_worker=(
+            check.opt_int_elem(worker_pool_cfg, "max_steps_per_worker")
+            if worker_pool_cfg is not None
+            else None
+        ),
+        max_worker_memory_mb=(
+            check.opt_int_elem(worker_pool_cfg, "max_worker_memory_mb")
+            if worker_pool_cfg is not None
+            else None
+        ),
     )
 
 
@@ -375,6 +392,18 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                                     " `dagster` module is preloaded."
                                 ),
                             ),
+                            "preload_code_location": Field(
+                                Bool,
+                                is_required=False,
+                                description=(
+                                    "Whether to preload the module or package that the job's code"
+                                    " location was loaded from, so that step processes start with"
+                                    " the user code already imported. Defaults to true when"
+                                    " `preload_modules` is not specified; set it to true to preload"
+                                    " the code location in addition to `preload_modules`. Code"
+                                    " locations loaded from a python file are never preloaded."
+                                ),
+                            ),
                         },
                         description=(
                             "Configure the multiprocess executor to start subprocesses "
@@ -390,6 +419,34 @@ def _core_multiprocess_executor_creation(config: ExecutorConfig) -> "Multiproces
                 "https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods."
             ),
         ),
+        "worker_pool": Field(
+            {
+                "max_steps_per_worker": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process with a fresh one after it has executed this many"
+                        " steps. By default, workers are reused for the rest of the run."
+                    ),
+                ),
+                "max_worker_memory_mb": Field(
+                    Noneable(Int),
+                    default_value=None,
+                    description=(
+                        "Replace a worker process with a fresh one once its peak resident memory"
+                        " reaches this many megabytes, checked after each step. By default, workers"
+                        " are not replaced based on memory usage."
+                    ),
+                ),
+            },
+            is_required=False,
+            description=(
+                "Execute steps in a pool of long-lived worker processes instead of starting a new"
+                " process for every step. Each worker loads the job and the instance once and then"
+                " executes steps as they become ready. At most `max_concurrent` workers are"
+                " started."
+            ),
+        ),
         "retries": get_retries_config(),
     },
     description="Execute each step in an individual process.",
@@ -419,6 +476,22 @@ def multiprocess_executor(init_context):
     concurrently. By default, or if you set ``max_concurrent`` to be None or 0, this is the return value of
     :py:func:`python:multiprocessing.cpu_count`.
 
+    Starting a process for every step means loading the job's code once per step. For jobs with
+    many short steps, the ``worker_pool`` config instead keeps a pool of worker processes that each
+    load the code once and execute steps as they become ready:
+
+    .. code-block:: yaml
+
+        execution:
+          config:
+            multiprocess:
+              worker_pool:
+                max_steps_per_worker: 100
+                max_worker_memory_mb: 2048
+
+    Both limits are optional; when one is reached, the worker exits after its current step and is
+    replaced by a fresh process.
+
     Execution priority can be configured using the ``dagster/priority`` tag via op metadata,
     where the higher the number the higher the priority. 0 is the default and both positive
     and negative numbers can be used.
@@ -10,6 +10,8 @@
 from dagster._core.definitions.partition import (
     DefaultPartitionsSubset,
     DynamicPartitionsDefinition,
+    OrdinalPartitionsSubset,
+    PartitionKeyOrdinals,
     PartitionsDefinition,
     PartitionsSubset,
     StaticPartitionsDefinition,
@@ -30,6 +32,7 @@
     get_multidimensional_partition_tag,
 )
 from dagster._time import get_current_datetime
+from dagster._utils.cached_method import cached_method
 
 INVALID_STATIC_PARTITIONS_KEY_CHARACTERS = set(["|", ",", "[", "]"])
 
@@ -208,8 +211,25 @@ def __init__(self, partitions_defs: Mapping[str, PartitionsDefinition]):
 
     @property
     def partitions_subset_class(self) -> type["PartitionsSubset"]:
+        if self.has_fixed_partition_keys:
+            return OrdinalPartitionsSubset
         return DefaultPartitionsSubset
 
+    @property
+    def has_fixed_partition_keys(self) -> bool:
+        return all(
+            isinstance(dim.partitions_def, StaticPartitionsDefinition)
+            for dim in self._partitions_defs
+        )
+
+    @cached_method
+    def get_partition_key_ordinals(self) -> PartitionKeyOrdinals:
+        check.invariant(
+            self.has_fixed_partition_keys,
+            "Only multi-partitions definitions with static dimensions have fixed partition keys",
+        )
+        return PartitionKeyOrdinals(self.get_partition_keys())
+
     def get_partition_keys_in_range(
         self,
         partition_key_range: PartitionKeyRange,
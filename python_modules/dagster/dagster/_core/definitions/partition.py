@@ -1,11 +1,16 @@
+import bisect
 import copy
 import hashlib
+import heapq
 import json
+import math
+import os
 from abc import ABC, abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import (  # noqa: UP035
     AbstractSet,
     Any,
@@ -37,6 +42,7 @@
 from dagster._core.instance import DagsterInstance, DynamicPartitionsStore
 from dagster._core.storage.tags import PARTITION_NAME_TAG, PARTITION_SET_TAG
 from dagster._serdes import whitelist_for_serdes
+from dagster._serdes.serdes import JsonSerializableValue, NamedTupleSerializer, WhitelistMap
 from dagster._utils import xor
 from dagster._utils.cached_method import cached_method
 from dagster._utils.tags import normalize_tags
@@ -125,6 +131,13 @@ class PartitionsDefinition(ABC, Generic[T_str]):
     def partitions_subset_class(self) -> type["PartitionsSubset"]:
         return DefaultPartitionsSubset
 
+    def get_partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        """Returns the partition keys of the PartitionsDefinition indexed by position. Only
+        implemented by definitions whose partition keys do not depend on the current time or on
+        dynamic partitions, which use OrdinalPartitionsSubset as their subset class.
+        """
+        check.failed(f"{self.__class__.__name__} does not have a fixed set of partition keys")
+
     @abstractmethod
     @public
     def get_partition_keys(
@@ -334,6 +347,14 @@ def __init__(self, partition_keys: Sequence[str]):
 
         self._partition_keys = partition_keys
 
+    @property
+    def partitions_subset_class(self) -> type["PartitionsSubset"]:
+        return OrdinalPartitionsSubset
+
+    @cached_method
+    def get_partition_key_ordinals(self) -> "PartitionKeyOrdinals":
+        return PartitionKeyOrdinals(self._partition_keys)
+
     @public
     def get_partition_keys(
         self,
@@ -1201,6 +1222,8 @@ def can_deserialize(
         )
 
     def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrdinalPartitionsSubset):
+            return other == self
         return isinstance(other, DefaultPartitionsSubset) and self.subset == other.subset
 
     def __len__(self) -> int:
@@ -1224,6 +1247,362 @@ def empty_subset(
         return DefaultPartitionsSubset()
 
 
+class PartitionKeyOrdinals:
+    """The partition keys of a PartitionsDefinition whose keys are fixed at definition time, along
+    with an index from each key to its position in the definition.
+    """
+
+    def __init__(self, partition_keys: Sequence[str]):
+        self.partition_keys = partition_keys
+        self._ordinals_by_key = {key: ordinal for ordinal, key in enumerate(partition_keys)}
+
+    def get_ordinal(self, partition_key: str) -> Optional[int]:
+        return self._ordinals_by_key.get(partition_key)
+
+    @cached_property
+    def partition_keys_hash(self) -> str:
+        """Identifies the ordered partition keys, so that ordinals can be checked against the keys
+        they were computed from.
+        """
+        return hashlib.sha1(json.dumps(list(self.partition_keys)).encode("utf-8")).hexdigest()
+
+
+# A run is a half-open range [start, end) of partition key ordinals. Sequences of runs are kept
+# sorted, non-overlapping and non-adjacent, so that every subset has exactly one representation.
+OrdinalRun: TypeAlias = tuple[int, int]
+
+
+def _runs_from_ordinals(ordinals: Iterable[int]) -> Sequence[OrdinalRun]:
+    runs: list[OrdinalRun] = []
+    for ordinal in sorted(set(ordinals)):
+        if runs and runs[-1][1] == ordinal:
+            runs[-1] = (runs[-1][0], ordinal + 1)
+        else:
+            runs.append((ordinal, ordinal + 1))
+    return runs
+
+
+def _union_runs(left: Sequence[OrdinalRun], right: Sequence[OrdinalRun]) -> Sequence[OrdinalRun]:
+    runs: list[OrdinalRun] = []
+    for start, end in heapq.merge(left, right):
+        if runs and start <= runs[-1][1]:
+            runs[-1] = (runs[-1][0], max(runs[-1][1], end))
+        else:
+            runs.append((start, end))
+    return runs
+
+
+def _intersect_runs(
+    left: Sequence[OrdinalRun], right: Sequence[OrdinalRun]
+) -> Sequence[OrdinalRun]:
+    runs: list[OrdinalRun] = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        start = max(left[i][0], right[j][0])
+        end = min(left[i][1], right[j][1])
+        if start < end:
+            runs.append((start, end))
+        if left[i][1] < right[j][1]:
+            i += 1
+        else:
+            j += 1
+    return runs
+
+
+def _difference_runs(
+    left: Sequence[OrdinalRun], right: Sequence[OrdinalRun]
+) -> Sequence[OrdinalRun]:
+    runs: list[OrdinalRun] = []
+    j = 0
+    for left_start, end in left:
+        # skip the runs being removed that end before this one starts
+        while j < len(right) and right[j][1] <= left_start:
+            j += 1
+        start = left_start
+        k = j
+        while k < len(right) and right[k][0] < end:
+            if right[k][0] > start:
+                runs.append((start, right[k][0]))
+            start = max(start, right[k][1])
+            k += 1
+        if start < end:
+            runs.append((start, end))
+    return runs
+
+
+def _should_serialize_ordinal_runs() -> bool:
+    return str(os.getenv("DAGSTER_SERIALIZE_ORDINAL_PARTITIONS_SUBSETS")).lower() in (
+        "1",
+        "true",
+        "t",
+    )
+
+
+class OrdinalPartitionsSubsetSerializer(NamedTupleSerializer):
+    # Runs of ordinals can't be interpreted without the partitions definition, so the subset is
+    # stored as the equivalent DefaultPartitionsSubset.
+    def pack_items(
+        self,
+        value: "OrdinalPartitionsSubset",
+        whitelist_map: WhitelistMap,
+        object_handler: Callable[[Any, WhitelistMap, str], JsonSerializableValue],
+        descent_path: str,
+    ) -> Iterator[tuple[str, JsonSerializableValue]]:
+        default_serializer = whitelist_map.object_serializers[DefaultPartitionsSubset.__name__]
+        yield from default_serializer.pack_items(
+            value.to_serializable_subset(), whitelist_map, object_handler, descent_path
+        )
+
+
+@whitelist_for_serdes(serializer=OrdinalPartitionsSubsetSerializer)
+class OrdinalPartitionsSubset(
+    NamedTuple(
+        "_OrdinalPartitionsSubset",
+        [("partitions_def", PartitionsDefinition), ("runs", Sequence[OrdinalRun])],
+    ),
+    PartitionsSubset,
+):
+    """A subset of a PartitionsDefinition whose partition keys are fixed at definition time, such
+    as a StaticPartitionsDefinition. Rather than storing partition keys, the subset stores runs of
+    consecutive positions in the definition's list of keys, so set operations between subsets of
+    the same definition take time proportional to the number of runs rather than the number of
+    keys, and the serialized form stays small for large, mostly contiguous subsets.
+
+    When serialized with serdes, the subset is stored as the equivalent DefaultPartitionsSubset.
+    """
+
+    # Shares its versions with DefaultPartitionsSubset, whose serialized forms it can read. Version
+    # 2 stores runs of ordinals, which are only meaningful for the partitions definition they were
+    # serialized with, and can't be read by older versions of dagster. It is only written when
+    # DAGSTER_SERIALIZE_ORDINAL_PARTITIONS_SUBSETS is set, otherwise version 1 is written.
+    SERIALIZATION_VERSION = 2
+
+    def __new__(
+        cls,
+        partitions_def: PartitionsDefinition,
+        runs: Optional[Sequence[OrdinalRun]] = None,
+    ):
+        return super().__new__(
+            cls,
+            partitions_def=check.inst_param(partitions_def, "partitions_def", PartitionsDefinition),
+            runs=tuple(runs) if runs else (),
+        )
+
+    def _with_runs(self, runs: Sequence[OrdinalRun]) -> "OrdinalPartitionsSubset":
+        # NamedTuple._replace can't be used, since PartitionsSubset overrides __len__
+        return OrdinalPartitionsSubset(self.partitions_def, runs)
+
+    @property
+    def _ordinals(self) -> PartitionKeyOrdinals:
+        return self.partitions_def.get_partition_key_ordinals()
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.runs
+
+    def get_partition_keys(self) -> AbstractSet[str]:
+        partition_keys = self._ordinals.partition_keys
+        return {key for start, end in self.runs for key in partition_keys[start:end]}
+
+    def get_partition_keys_not_in_subset(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Iterable[str]:
+        partition_keys = self._ordinals.partition_keys
+        return {
+            key
+            for start, end in _difference_runs([(0, len(partition_keys))], self.runs)
+            for key in partition_keys[start:end]
+        }
+
+    def get_partition_key_ranges(
+        self,
+        partitions_def: PartitionsDefinition,
+        current_time: Optional[datetime] = None,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> Sequence[PartitionKeyRange]:
+        partition_keys = self._ordinals.partition_keys
+        return [
+            PartitionKeyRange(partition_keys[start], partition_keys[end - 1])
+            for start, end in self.runs
+        ]
+
+    def _get_runs_for_partition_keys(
+        self, partition_keys: Iterable[str]
+    ) -> Optional[Sequence[OrdinalRun]]:
+        ordinals = []
+        for partition_key in partition_keys:
+            ordinal = self._ordinals.get_ordinal(partition_key)
+            if ordinal is None:
+                return None
+            ordinals.append(ordinal)
+        return _runs_from_ordinals(ordinals)
+
+    def _get_runs_for_subset(self, other: PartitionsSubset) -> Optional[Sequence[OrdinalRun]]:
+        """The runs of another subset of the same partitions definition, or None if it contains
+        keys that are not in this subset's partitions definition.
+        """
+        if isinstance(other, OrdinalPartitionsSubset) and (
+            other.partitions_def is self.partitions_def
+            or other.partitions_def == self.partitions_def
+        ):
+            return other.runs
+        return self._get_runs_for_partition_keys(other.get_partition_keys())
+
+    def with_partition_keys(self, partition_keys: Iterable[str]) -> PartitionsSubset:
+        partition_keys = list(partition_keys)
+        runs = self._get_runs_for_partition_keys(partition_keys)
+        if runs is None:
+            # keys that are not in the partitions definition cannot be represented by ordinals
+            return DefaultPartitionsSubset(self.get_partition_keys() | set(partition_keys))
+        return self._with_runs(_union_runs(self.runs, runs))
+
+    def with_partition_key_range(
+        self,
+        partitions_def: PartitionsDefinition,
+        partition_key_range: PartitionKeyRange,
+        dynamic_partitions_store: Optional[DynamicPartitionsStore] = None,
+    ) -> PartitionsSubset:
+        start = self._ordinals.get_ordinal(partition_key_range.start)
+        end = self._ordinals.get_ordinal(partition_key_range.end)
+        if start is None or end is None:
+            return super().with_partition_key_range(
+                partitions_def, partition_key_range, dynamic_partitions_store
+            )
+        return self._with_runs(_union_runs(self.runs, [(start, end + 1)]))
+
+    def __or__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty or isinstance(other, AllPartitionsSubset):
+            return super().__or__(other)
+        runs = self._get_runs_for_subset(other)
+        if runs is None:
+            return super().__or__(other)
+        return self._with_runs(_union_runs(self.runs, runs))
+
+    def __sub__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty or isinstance(other, AllPartitionsSubset):
+            return super().__sub__(other)
+        runs = self._get_runs_for_subset(other)
+        if runs is None:
+            return super().__sub__(other)
+        return self._with_runs(_difference_runs(self.runs, runs))
+
+    def __and__(self, other: PartitionsSubset) -> PartitionsSubset:
+        if self is other or other.is_empty or isinstance(other, AllPartitionsSubset):
+            return super().__and__(other)
+        runs = self._get_runs_for_subset(other)
+        if runs is None:
+            return super().__and__(other)
+        return self._with_runs(_intersect_runs(self.runs, runs))
+
+    def serialize(self) -> str:
+        if not _should_serialize_ordinal_runs():
+            # the key form can be read by older processes and after the partition keys change
+            return self.to_serializable_subset().serialize()
+
+        return json.dumps(
+            {
+                "version": self.SERIALIZATION_VERSION,
+                "partition_keys_hash": self._ordinals.partition_keys_hash,
+                "runs": [list(run) for run in self.runs],
+            }
+        )
+
+    @classmethod
+    def from_serialized(
+        cls, partitions_def: PartitionsDefinition, serialized: str
+    ) -> PartitionsSubset:
+        data = json.loads(serialized)
+        empty_subset = cls(partitions_def)
+
+        if isinstance(data, list):
+            # backwards compatibility
+            return empty_subset.with_partition_keys(data)
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return empty_subset.with_partition_keys(data.get("subset"))
+        elif data.get("version") != cls.SERIALIZATION_VERSION:
+            raise DagsterInvalidDeserializationVersionError(
+                f"Attempted to deserialize partition subset with version {data.get('version')},"
+                f" but only versions {DefaultPartitionsSubset.SERIALIZATION_VERSION} and"
+                f" {cls.SERIALIZATION_VERSION} are supported."
+            )
+
+        if (
+            data.get("partition_keys_hash")
+            != partitions_def.get_partition_key_ordinals().partition_keys_hash
+        ):
+            raise DagsterInvalidDeserializationVersionError(
+                "Attempted to deserialize a partition subset that was serialized for a different"
+                " set of partition keys."
+            )
+        return cls(partitions_def, [(start, end) for start, end in data.get("runs")])
+
+    @classmethod
+    def can_deserialize(
+        cls,
+        partitions_def: PartitionsDefinition,
+        serialized: str,
+        serialized_partitions_def_unique_id: Optional[str],
+        serialized_partitions_def_class_name: Optional[str],
+    ) -> bool:
+        if (
+            serialized_partitions_def_class_name is not None
+            and serialized_partitions_def_class_name != partitions_def.__class__.__name__
+        ):
+            return False
+
+        data = json.loads(serialized)
+        if isinstance(data, list):
+            return True
+        elif data.get("version") == DefaultPartitionsSubset.SERIALIZATION_VERSION:
+            return data.get("subset") is not None
+        elif data.get("version") == cls.SERIALIZATION_VERSION:
+            # ordinals can only be interpreted against the same partition keys
+            return (
+                data.get("partition_keys_hash")
+                == partitions_def.get_partition_key_ordinals().partition_keys_hash
+            )
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, OrdinalPartitionsSubset):
+            return self.runs == other.runs and (
+                other.partitions_def is self.partitions_def
+                or other.partitions_def == self.partitions_def
+            )
+        elif isinstance(other, DefaultPartitionsSubset):
+            return self.get_partition_keys() == other.subset
+        return False
+
+    def __len__(self) -> int:
+        return sum(end - start for start, end in self.runs)
+
+    def __contains__(self, value) -> bool:
+        ordinal = self._ordinals.get_ordinal(value)
+        if ordinal is None:
+            return False
+        # the last run that starts at or before the ordinal
+        index = bisect.bisect_right(self.runs, (ordinal, math.inf)) - 1
+        return index >= 0 and ordinal < self.runs[index][1]
+
+    def __repr__(self) -> str:
+        return f"OrdinalPartitionsSubset(runs={list(self.runs)})"
+
+    @classmethod
+    def create_empty_subset(
+        cls, partitions_def: Optional[PartitionsDefinition] = None
+    ) -> "OrdinalPartitionsSubset":
+        return cls(check.not_none(partitions_def))
+
+    def empty_subset(self) -> "OrdinalPartitionsSubset":
+        return self._with_runs([])
+
+    def to_serializable_subset(self) -> PartitionsSubset:
+        return DefaultPartitionsSubset(self.get_partition_keys())
+
+
 class AllPartitionsSubset(
     NamedTuple(
         "_AllPartitionsSubset",
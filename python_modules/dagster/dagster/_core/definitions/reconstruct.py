@@ -26,6 +26,7 @@
     CustomPointer,
     FileCodePointer,
     ModuleCodePointer,
+    PackageCodePointer,
     get_python_file_from_target,
 )
 from dagster._core.definitions.asset_check_spec import AssetCheckKey
@@ -317,9 +318,9 @@ def get_python_origin_id(self) -> str:
         return self.get_python_origin().get_id()
 
     def get_module(self) -> Optional[str]:
-        """Return the module the job is found in, the origin is a module code pointer."""
+        """Return the module the job is found in, if the origin is a module or package code pointer."""
         pointer = self.get_python_origin().get_repo_pointer()
-        if isinstance(pointer, ModuleCodePointer):
+        if isinstance(pointer, (ModuleCodePointer, PackageCodePointer)):
             return pointer.module
 
         return None
@@ -13,7 +13,10 @@
 from dagster._core.definitions.metadata.metadata_value import (
     CodeLocationReconstructionMetadataValue,
 )
-from dagster._core.definitions.repository_definition.repository_data import RepositoryData
+from dagster._core.definitions.repository_definition.repository_data import (
+    CachingRepositoryData,
+    RepositoryData,
+)
 from dagster._core.definitions.repository_definition.valid_definitions import (
     RepositoryElementDefinition as RepositoryElementDefinition,
 )
@@ -177,6 +180,13 @@ def load_all_definitions(self) -> None:
         # force load of all lazy constructed code artifacts
         self._repository_data.load_all_definitions()
 
+    @property
+    def has_static_definitions(self) -> bool:
+        """Whether the definitions of the repository are fixed once loaded. Custom RepositoryData
+        implementations may return different definitions each time they are called.
+        """
+        return isinstance(self._repository_data, CachingRepositoryData)
+
     @public
     @property
     def job_names(self) -> Sequence[str]:
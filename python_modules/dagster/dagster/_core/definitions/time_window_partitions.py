@@ -38,6 +38,8 @@
 from dagster._utils.cronstring import get_fixed_minute_interval, is_basic_daily, is_basic_hourly
 from dagster._utils.partitions import DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE
 from dagster._utils.schedules import (
+    MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL,
+    apply_fold_and_post_transition,
     cron_string_iterator,
     cron_string_repeats_every_hour,
     is_valid_cron_schedule,
@@ -216,6 +218,82 @@ def to_public_time_window(self) -> TimeWindow:
         return TimeWindow(start=self.start, end=self.end)
 
 
+class _FixedIntervalTicks(NamedTuple):
+    """Closed-form tick arithmetic for schedules whose ticks are a fixed number of seconds apart
+    regardless of DST, e.g. hourly and "*/15 * * * *" schedules. Ticks are indexed relative to a
+    known tick, which pins down their phase (including for timezones with non-hour UTC offsets).
+    """
+
+    anchor_timestamp: float
+    interval_seconds: int
+    timezone: str
+
+    def tick(self, index: int) -> datetime:
+        return datetime.fromtimestamp(
+            self.anchor_timestamp + index * self.interval_seconds, tz=get_timezone(self.timezone)
+        )
+
+    def index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the first tick that is at or after the given timestamp."""
+        return -int((self.anchor_timestamp - timestamp) // self.interval_seconds)
+
+
+class _CalendarTicks(NamedTuple):
+    """Closed-form tick arithmetic for daily, weekly, and monthly schedules. Ticks happen at a
+    fixed wall-clock time, so each tick is indexed by the calendar day, week, or month that it
+    falls on, and DST transitions are resolved the same way that cron_string_iterator resolves
+    them.
+    """
+
+    schedule_type: ScheduleType
+    minute: int
+    hour: int
+    # cron day of week for weekly schedules, day of month for monthly schedules
+    day: int
+    timezone: str
+
+    def _date_for_index(self, index: int) -> date:
+        if self.schedule_type == ScheduleType.DAILY:
+            return date.fromordinal(index)
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            # date ordinals are congruent mod 7 to their cron day of week (0 is Sunday)
+            return date.fromordinal(index * 7 + self.day)
+        else:
+            return date(index // 12, index % 12 + 1, self.day)
+
+    def _index_for_date(self, local_date: date) -> int:
+        """Returns the index of the last tick that falls on or before the given date."""
+        if self.schedule_type == ScheduleType.DAILY:
+            return local_date.toordinal()
+        elif self.schedule_type == ScheduleType.WEEKLY:
+            return (local_date.toordinal() - self.day) // 7
+        else:
+            index = local_date.year * 12 + local_date.month - 1
+            return index if local_date.day >= self.day else index - 1
+
+    def tick(self, index: int) -> datetime:
+        tick_date = self._date_for_index(index)
+        return apply_fold_and_post_transition(
+            datetime(
+                tick_date.year,
+                tick_date.month,
+                tick_date.day,
+                self.hour,
+                self.minute,
+                tzinfo=get_timezone(self.timezone),
+            )
+        )
+
+    def index_at_or_after(self, timestamp: float) -> int:
+        """Returns the index of the first tick that is at or after the given timestamp."""
+        index = self._index_for_date(
+            datetime.fromtimestamp(timestamp, tz=get_timezone(self.timezone)).date()
+        )
+        # the tick on the same local date may still be earlier than the timestamp, but the tick
+        # on any later date never is
+        return index if self.tick(index).timestamp() >= timestamp else index + 1
+
+
 @whitelist_for_serdes
 @record_custom(
     field_to_new_mapping={
@@ -363,6 +441,84 @@ def _get_current_timestamp(self, current_time: Optional[datetime]) -> float:
 
         return current_time.timestamp()
 
+    @cached_property
+    def _closed_form_ticks(self) -> Optional[Union[_FixedIntervalTicks, _CalendarTicks]]:
+        """Tick arithmetic that maps between tick indexes and datetimes in constant time, for the
+        schedules that support it. Returns None for other cron schedules, which must be iterated.
+        """
+        schedule_type = self.schedule_type
+        fixed_minute_interval = get_fixed_minute_interval(self.cron_schedule)
+        if schedule_type == ScheduleType.HOURLY or fixed_minute_interval:
+            first_tick = next(
+                iter(
+                    cron_string_iterator(
+                        self.start.timestamp(), self.cron_schedule, self.timezone, start_offset=-1
+                    )
+                )
+            )
+            return _FixedIntervalTicks(
+                anchor_timestamp=first_tick.timestamp(),
+                interval_seconds=60 * (fixed_minute_interval or 60),
+                timezone=self.timezone,
+            )
+        elif schedule_type == ScheduleType.DAILY:
+            return _CalendarTicks(
+                schedule_type=schedule_type,
+                minute=self.minute_offset,
+                hour=self.hour_offset,
+                day=0,
+                timezone=self.timezone,
+            )
+        elif schedule_type == ScheduleType.WEEKLY:
+            return _CalendarTicks(
+                schedule_type=schedule_type,
+                minute=self.minute_offset,
+                hour=self.hour_offset,
+                day=self.day_offset % 7,
+                timezone=self.timezone,
+            )
+        elif (
+            schedule_type == ScheduleType.MONTHLY
+            and 1 <= self.day_offset <= MAX_DAY_OF_MONTH_WITH_GUARANTEED_MONTHLY_INTERVAL
+        ):
+            return _CalendarTicks(
+                schedule_type=schedule_type,
+                minute=self.minute_offset,
+                hour=self.hour_offset,
+                day=self.day_offset,
+                timezone=self.timezone,
+            )
+        return None
+
+    def _get_num_partitions_from_ticks(
+        self, ticks: Union[_FixedIntervalTicks, _CalendarTicks], current_timestamp: float
+    ) -> int:
+        """Closed-form equivalent of len(self.get_partition_keys(current_time))."""
+        first_index = ticks.index_at_or_after(self.start.timestamp())
+
+        def _num_windows_ending_at_or_before(timestamp: float) -> int:
+            last_index = ticks.index_at_or_after(timestamp)
+            if ticks.tick(last_index).timestamp() > timestamp:
+                last_index -= 1
+            return max(0, last_index - first_index)
+
+        num_partitions = _num_windows_ending_at_or_before(current_timestamp) + max(
+            0, self.end_offset
+        )
+        if self.end:
+            num_partitions = min(
+                num_partitions, _num_windows_ending_at_or_before(self.end.timestamp())
+            )
+        return max(0, num_partitions + min(0, self.end_offset))
+
+    def _time_window_at_or_after(self, timestamp: float) -> TimeWindow:
+        """Returns the first time window that starts at or after the given timestamp."""
+        ticks = self._closed_form_ticks
+        if ticks is None:
+            return next(iter(self._iterate_time_windows(timestamp)))
+        index = ticks.index_at_or_after(timestamp)
+        return TimeWindow(ticks.tick(index), ticks.tick(index + 1))
+
     def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
         if self.is_basic_daily:
             return (
@@ -383,6 +539,14 @@ def get_num_partitions_in_window(self, time_window: TimeWindow) -> int:
             minutes_in_window = (time_window.end.timestamp() - time_window.start.timestamp()) / 60
             return int(minutes_in_window // fixed_minute_interval)
 
+        ticks = self._closed_form_ticks
+        if ticks is not None:
+            return max(
+                0,
+                ticks.index_at_or_after(time_window.end.timestamp())
+                - ticks.index_at_or_after(time_window.start.timestamp()),
+            )
+
         return len(self.get_partition_keys_in_time_window(time_window))
 
     def get_num_partitions(
@@ -409,6 +573,17 @@ def get_partition_keys_between_indexes(
         # partition keys included within the indices.
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        ticks = self._closed_form_ticks
+        if ticks is not None:
+            num_partitions = self._get_num_partitions_from_ticks(ticks, current_timestamp)
+            first_index = ticks.index_at_or_after(self.start.timestamp())
+            return [
+                dst_safe_strftime(
+                    ticks.tick(first_index + idx), self.timezone, self.fmt, self.cron_schedule
+                )
+                for idx in range(max(0, start_idx), min(end_idx, num_partitions))
+            ]
+
         partitions_past_current_time = 0
         partition_keys = []
         reached_end = False
@@ -447,6 +622,12 @@ def get_partition_keys(
     ) -> Sequence[str]:
         current_timestamp = self._get_current_timestamp(current_time=current_time)
 
+        ticks = self._closed_form_ticks
+        if ticks is not None:
+            return self.get_partition_keys_between_indexes(
+                0, self._get_num_partitions_from_ticks(ticks, current_timestamp), current_time
+            )
+
         partitions_past_current_time = 0
         partition_keys: list[str] = []
         for time_window in self._iterate_time_windows(self.start.timestamp()):
@@ -501,7 +682,7 @@ def __hash__(self):
     @functools.lru_cache(maxsize=100)
     def time_window_for_partition_key(self, partition_key: str) -> TimeWindow:
         partition_key_dt = dst_safe_strptime(partition_key, self.timezone, self.fmt)
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp())))
+        return self._time_window_at_or_after(partition_key_dt.timestamp())
 
     @functools.lru_cache(maxsize=5)
     def time_windows_for_partition_keys(
@@ -512,6 +693,41 @@ def time_windows_for_partition_keys(
         if len(partition_keys) == 0:
             return []
 
+        if self._closed_form_ticks is not None:
+            partition_key_time_windows = sorted(
+                (
+                    self._time_window_at_or_after(
+                        dst_safe_strptime(partition_key, self.timezone, self.fmt).timestamp()
+                    )
+                    for partition_key in partition_keys
+                ),
+                key=lambda tw: tw.start.timestamp(),
+            )
+        else:
+            partition_key_time_windows = self._iterate_time_windows_for_partition_keys(
+                partition_keys
+            )
+
+        if validate:
+            start_time_window = self.get_first_partition_window()
+            end_time_window = self.get_last_partition_window()
+
+            if start_time_window is None or end_time_window is None:
+                check.failed("No partitions in the PartitionsDefinition")
+
+            start_timestamp = start_time_window.start.timestamp()
+            end_timestamp = end_time_window.end.timestamp()
+
+            partition_key_time_windows = [
+                tw
+                for tw in partition_key_time_windows
+                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
+            ]
+        return partition_key_time_windows
+
+    def _iterate_time_windows_for_partition_keys(
+        self, partition_keys: frozenset[str]
+    ) -> list[TimeWindow]:
         sorted_pks = sorted(
             partition_keys,
             key=lambda pk: dst_safe_strptime(pk, self.timezone, self.fmt).timestamp(),
@@ -536,22 +752,6 @@ def time_windows_for_partition_keys(
                     )
                 )
                 partition_key_time_windows.append(next(cur_windows_iterator))
-
-        if validate:
-            start_time_window = self.get_first_partition_window()
-            end_time_window = self.get_last_partition_window()
-
-            if start_time_window is None or end_time_window is None:
-                check.failed("No partitions in the PartitionsDefinition")
-
-            start_timestamp = start_time_window.start.timestamp()
-            end_timestamp = end_time_window.end.timestamp()
-
-            partition_key_time_windows = [
-                tw
-                for tw in partition_key_time_windows
-                if tw.start.timestamp() >= start_timestamp and tw.end.timestamp() <= end_timestamp
-            ]
         return partition_key_time_windows
 
     def start_time_for_partition_key(self, partition_key: str) -> datetime:
@@ -561,7 +761,7 @@ def start_time_for_partition_key(self, partition_key: str) -> datetime:
         # the datetime format might not include granular components, so we need to recover them,
         # e.g. if cron_schedule="0 7 * * *" and fmt="%Y-%m-%d".
         # we make the assumption that the parsed partition key is <= the start datetime.
-        return next(iter(self._iterate_time_windows(partition_key_dt.timestamp()))).start
+        return self._time_window_at_or_after(partition_key_dt.timestamp()).start
 
     def get_next_partition_key(
         self, partition_key: str, current_time: Optional[datetime] = None
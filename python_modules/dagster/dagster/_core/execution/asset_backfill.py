@@ -3,19 +3,29 @@
 import os
 import sys
 import time
-from collections import defaultdict
 from collections.abc import Iterable, Mapping, Sequence
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional, Union, cast  # noqa: UP035
 
 import dagster._check as check
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView, TemporalContext
+from dagster._core.asset_graph_view.bfs import (
+    AssetGraphViewBfsFilterConditionResult,
+    bfs_filter_asset_graph_view,
+)
+from dagster._core.asset_graph_view.entity_subset import EntitySubset
+from dagster._core.asset_graph_view.serializable_entity_subset import SerializableEntitySubset
 from dagster._core.definitions.asset_graph_subset import AssetGraphSubset
 from dagster._core.definitions.asset_selection import KeysAssetSelection
 from dagster._core.definitions.automation_tick_evaluation_context import (
     build_run_requests_with_backfill_policies,
 )
-from dagster._core.definitions.base_asset_graph import BaseAssetGraph, BaseAssetNode
+from dagster._core.definitions.base_asset_graph import (
+    BaseAssetGraph,
+    BaseAssetNode,
+    sort_key_for_asset_partition,
+)
 from dagster._core.definitions.events import AssetKey, AssetKeyPartitionKey
 from dagster._core.definitions.partition import PartitionsDefinition, PartitionsSubset
 from dagster._core.definitions.partition_key_range import PartitionKeyRange
@@ -192,6 +202,11 @@ def with_run_requests_submitted(
     def get_target_root_asset_partitions(
         self, instance_queryer: CachingInstanceQueryer
     ) -> Iterable[AssetKeyPartitionKey]:
+        return list(self.get_target_root_subset(instance_queryer).iterate_asset_partitions())
+
+    def get_target_root_subset(self, instance_queryer: CachingInstanceQueryer) -> AssetGraphSubset:
+        """Returns the targeted partitions that are not downstream of any other targeted partition."""
+
         def _get_self_and_downstream_targeted_subset(
             initial_subset: AssetGraphSubset,
         ) -> AssetGraphSubset:
@@ -263,7 +278,7 @@ def _get_self_and_downstream_targeted_subset(
                 " This is likely a system error. Please report this issue to the Dagster team."
             )
 
-        return list(root_subset.iterate_asset_partitions())
+        return root_subset
 
     def get_target_partitions_subset(self, asset_key: AssetKey) -> PartitionsSubset:
         # Return the targeted partitions for the root partitioned asset keys
@@ -1000,12 +1015,12 @@ def execute_asset_backfill_iteration(
         check.failed("Backfill must be an asset backfill")
 
     backfill_start_datetime = datetime_from_timestamp(backfill.backfill_timestamp)
-    instance_queryer = CachingInstanceQueryer(
+    asset_graph_view = AssetGraphView(
+        temporal_context=TemporalContext(effective_dt=backfill_start_datetime, last_event_id=None),
         instance=instance,
         asset_graph=asset_graph,
-        loading_context=workspace_context,
-        evaluation_time=backfill_start_datetime,
     )
+    instance_queryer = asset_graph_view.get_inner_queryer_for_back_compat()
 
     previous_asset_backfill_data = _check_validity_and_deserialize_asset_backfill_data(
         workspace_context, backfill, asset_graph, instance_queryer, logger
@@ -1038,7 +1053,7 @@ def execute_asset_backfill_iteration(
             for result in execute_asset_backfill_iteration_inner(
                 backfill_id=backfill.backfill_id,
                 asset_backfill_data=previous_asset_backfill_data,
-                instance_queryer=instance_queryer,
+                asset_graph_view=asset_graph_view,
                 asset_graph=asset_graph,
                 backfill_start_timestamp=backfill.backfill_timestamp,
                 logger=logger,
@@ -1320,26 +1335,43 @@ def _get_failed_and_downstream_asset_partitions(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
     asset_graph: RemoteWorkspaceAssetGraph,
+    asset_graph_view: AssetGraphView,
     instance_queryer: CachingInstanceQueryer,
-    backfill_start_timestamp: float,
     materialized_subset: AssetGraphSubset,
 ) -> AssetGraphSubset:
-    failed_and_downstream_subset = AssetGraphSubset.from_asset_partition_set(
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda asset_partitions, _: (
-                any(
-                    asset_partition in asset_backfill_data.target_subset
-                    for asset_partition in asset_partitions
-                ),
-                "",
+    def _in_target_condition(
+        candidates_unit: AssetGraphSubset, _: AssetGraphSubset
+    ) -> AssetGraphViewBfsFilterConditionResult:
+        # an execution set is included for every partition that any of its assets target
+        targeted_value = None
+        for entity_subset in asset_graph_view.iterate_asset_subsets(candidates_unit):
+            value = entity_subset.compute_intersection(
+                asset_graph_view.get_entity_subset_from_asset_graph_subset(
+                    asset_backfill_data.target_subset, entity_subset.key
+                )
+            ).get_internal_value()
+            targeted_value = value if targeted_value is None else targeted_value | value
+        return AssetGraphViewBfsFilterConditionResult(
+            passed_asset_graph_subset=(
+                _with_value_for_keys(asset_graph_view, candidates_unit.asset_keys, targeted_value)
+                if targeted_value is not None
+                else AssetGraphSubset.empty()
             ),
-            _get_failed_asset_partitions(
-                instance_queryer, backfill_id, asset_graph, materialized_subset
+            excluded_asset_graph_subsets_and_reasons=[],
+        )
+
+    failed_and_downstream_subset, _ = bfs_filter_asset_graph_view(
+        asset_graph_view,
+        _in_target_condition,
+        initial_asset_graph_subset=AssetGraphSubset.from_asset_partition_set(
+            set(
+                _get_failed_asset_partitions(
+                    instance_queryer, backfill_id, asset_graph, materialized_subset
+                )
             ),
-            evaluation_time=datetime_from_timestamp(backfill_start_timestamp),
-        )[0],
-        asset_graph,
+            asset_graph,
+        ),
+        include_full_execution_set=True,
     )
     return failed_and_downstream_subset
 
@@ -1394,7 +1426,7 @@ def execute_asset_backfill_iteration_inner(
     backfill_id: str,
     asset_backfill_data: AssetBackfillData,
     asset_graph: RemoteWorkspaceAssetGraph,
-    instance_queryer: CachingInstanceQueryer,
+    asset_graph_view: AssetGraphView,
     backfill_start_timestamp: float,
     logger: logging.Logger,
 ) -> Iterable[Optional[AssetBackfillIterationResult]]:
@@ -1406,16 +1438,18 @@ def execute_asset_backfill_iteration_inner(
     This is a generator so that we can return control to the daemon and let it heartbeat during
     expensive operations.
     """
-    initial_candidates: set[AssetKeyPartitionKey] = set()
+    instance_queryer = asset_graph_view.get_inner_queryer_for_back_compat()
+
+    initial_candidates = AssetGraphSubset.empty()
     request_roots = not asset_backfill_data.requested_runs_for_target_roots
     if request_roots:
         logger.info(
             "Not all root assets (assets in backfill that do not have parents in the backill) have been requested, finding root assets."
         )
-        target_roots = asset_backfill_data.get_target_root_asset_partitions(instance_queryer)
-        initial_candidates.update(target_roots)
+        target_root_subset = asset_backfill_data.get_target_root_subset(instance_queryer)
+        initial_candidates |= target_root_subset
         logger.info(
-            f"Root assets that have not yet been requested:\n {_asset_graph_subset_to_str(AssetGraphSubset.from_asset_partition_set(set(target_roots), asset_graph), asset_graph)}"
+            f"Root assets that have not yet been requested:\n {_asset_graph_subset_to_str(target_root_subset, asset_graph)}"
         )
 
         yield None
@@ -1453,6 +1487,14 @@ def execute_asset_backfill_iteration_inner(
             else "No relevant assets materialized since last tick."
         )
 
+        # fetch the latest storage ids of the targeted assets and their parents in bulk
+        instance_queryer.prefetch_latest_storage_ids_by_partition(
+            {
+                key
+                for asset_key in asset_backfill_data.target_subset.asset_keys
+                for key in [asset_key, *asset_graph.get(asset_key).parent_keys]
+            }
+        )
         parent_materialized_asset_partitions = set().union(
             *(
                 instance_queryer.asset_partitions_with_newly_updated_parents_and_new_cursor(
@@ -1462,7 +1504,9 @@ def execute_asset_backfill_iteration_inner(
                 for asset_key in asset_backfill_data.target_subset.asset_keys
             )
         )
-        initial_candidates.update(parent_materialized_asset_partitions)
+        initial_candidates |= AssetGraphSubset.from_asset_partition_set(
+            parent_materialized_asset_partitions, asset_graph
+        )
 
         yield None
 
@@ -1470,53 +1514,40 @@ def execute_asset_backfill_iteration_inner(
             backfill_id,
             asset_backfill_data,
             asset_graph,
+            asset_graph_view,
             instance_queryer,
-            backfill_start_timestamp,
             updated_materialized_subset,
         )
 
         yield None
 
-    backfill_start_datetime = datetime_from_timestamp(backfill_start_timestamp)
-
-    asset_partitions_to_request, not_requested_and_reasons = (
-        asset_graph.bfs_filter_asset_partitions(
-            instance_queryer,
-            lambda unit, visited: should_backfill_atomic_asset_partitions_unit(
-                candidates_unit=unit,
-                asset_partitions_to_request=visited,
-                asset_graph=asset_graph,
-                materialized_subset=updated_materialized_subset,
-                requested_subset=asset_backfill_data.requested_subset,
+    asset_subset_to_request, not_requested_and_reasons = bfs_filter_asset_graph_view(
+        asset_graph_view,
+        lambda candidates_unit, asset_graph_subset_matched_so_far: (
+            _should_backfill_atomic_asset_subset_unit(
+                asset_graph_view,
+                candidates_unit=candidates_unit,
+                asset_graph_subset_matched_so_far=asset_graph_subset_matched_so_far,
                 target_subset=asset_backfill_data.target_subset,
+                requested_subset=asset_backfill_data.requested_subset,
+                materialized_subset=updated_materialized_subset,
                 failed_and_downstream_subset=failed_and_downstream_subset,
-                dynamic_partitions_store=instance_queryer,
-                current_time=backfill_start_datetime,
-            ),
-            initial_asset_partitions=initial_candidates,
-            evaluation_time=backfill_start_datetime,
-        )
+            )
+        ),
+        initial_asset_graph_subset=initial_candidates,
+        include_full_execution_set=True,
     )
 
     logger.info(
-        f"Asset partitions to request:\n {_asset_graph_subset_to_str(AssetGraphSubset.from_asset_partition_set(asset_partitions_to_request, asset_graph), asset_graph)}"
-        if asset_partitions_to_request
+        f"Asset partitions to request:\n {_asset_graph_subset_to_str(asset_subset_to_request, asset_graph)}"
+        if asset_subset_to_request
         else "No asset partitions to request."
     )
     if len(not_requested_and_reasons) > 0:
-
-        def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
-            return ", ".join(
-                f"({key.asset_key.to_user_string()}, {key.partition_key})"
-                if key.partition_key
-                else key.asset_key.to_user_string()
-                for key in keys
-            )
-
-        not_requested_str = "\n".join(
+        not_requested_str = "\n\n".join(
             [
-                f"[{_format_keys(keys)}] - Reason: {reason}."
-                for keys, reason in not_requested_and_reasons
+                f"{_asset_graph_subset_to_str(subset, asset_graph)}Reason: {reason}."
+                for subset, reason in not_requested_and_reasons
             ]
         )
         logger.info(
@@ -1524,7 +1555,7 @@ def _format_keys(keys: Iterable[AssetKeyPartitionKey]):
         )
 
     run_requests = build_run_requests_with_backfill_policies(
-        asset_partitions=asset_partitions_to_request,
+        asset_partitions=set(asset_subset_to_request.iterate_asset_partitions()),
         asset_graph=asset_graph,
         dynamic_partitions_store=instance_queryer,
     )
@@ -1650,77 +1681,348 @@ def can_run_with_parent(
         return False, failed_reason
 
 
-def should_backfill_atomic_asset_partitions_unit(
+def _with_value_for_keys(
+    asset_graph_view: AssetGraphView,
+    asset_keys: Iterable[AssetKey],
+    value: Union[bool, PartitionsSubset],
+) -> AssetGraphSubset:
+    """Returns an AssetGraphSubset containing the same partitions for each of the given assets,
+    which must share a partitions definition (e.g. the assets of an execution set).
+    """
+    return AssetGraphSubset.from_entity_subsets(
+        [
+            check.not_none(
+                asset_graph_view.get_subset_from_serializable_subset(
+                    SerializableEntitySubset(key=asset_key, value=value)
+                )
+            )
+            for asset_key in asset_keys
+        ]
+    )
+
+
+def _parent_subset_failure_reason(
+    asset_graph: RemoteWorkspaceAssetGraph, parent_key: AssetKey, candidate_key: AssetKey
+) -> Optional[str]:
+    """Returns the reason no partition of the candidate asset can be materialized in the same run
+    as its parent, if applicable.
+    """
+    parent_node = asset_graph.get(parent_key)
+    candidate_node = asset_graph.get(candidate_key)
+    if parent_node.backfill_policy != candidate_node.backfill_policy:
+        return f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} have different backfill policies so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key} is materialized."
+    if (
+        parent_node.resolve_to_singular_repo_scoped_node().repository_handle
+        != candidate_node.resolve_to_singular_repo_scoped_node().repository_handle
+    ):
+        return f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} are in different code locations so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized."
+    if parent_node.partitions_def != candidate_node.partitions_def:
+        return f"parent {parent_node.key.to_user_string()} and {candidate_node.key.to_user_string()} have different partitions definitions so they cannot be materialized in the same run. {candidate_node.key.to_user_string()} can be materialized once {parent_node.key.to_user_string()} is materialized."
+    return None
+
+
+def _can_run_with_parent_subset(
     asset_graph: RemoteWorkspaceAssetGraph,
-    candidates_unit: Iterable[AssetKeyPartitionKey],
-    asset_partitions_to_request: AbstractSet[AssetKeyPartitionKey],
+    parent_key: AssetKey,
+    candidate_key: AssetKey,
+    target_subset: AssetGraphSubset,
+    requested_parent_subset: EntitySubset[AssetKey],
+) -> bool:
+    """Returns if the candidate asset can be materialized in the same run as the requested
+    partitions of its parent. Mirrors the partition mapping checks in can_run_with_parent.
+    """
+    parent_node = asset_graph.get(parent_key)
+    candidate_node = asset_graph.get(candidate_key)
+    partition_mapping = asset_graph.get_partition_mapping(
+        candidate_key, parent_asset_key=parent_key
+    )
+    if (
+        (not candidate_node.is_partitioned and not parent_node.is_partitioned)
+        or isinstance(partition_mapping, IdentityPartitionMapping)
+        or (
+            isinstance(partition_mapping, TimeWindowPartitionMapping)
+            and partition_mapping.start_offset == 0
+            and partition_mapping.end_offset == 0
+        )
+    ):
+        return True
+
+    parent_target_subset = target_subset.get_asset_subset(parent_key, asset_graph)
+    return (
+        parent_node.backfill_policy is not None
+        and parent_target_subset.value
+        == target_subset.get_asset_subset(candidate_key, asset_graph).value
+        and (
+            parent_node.backfill_policy.max_partitions_per_run is None
+            or parent_node.backfill_policy.max_partitions_per_run > requested_parent_subset.size
+        )
+        and requested_parent_subset.size == parent_target_subset.size
+    )
+
+
+def _filter_self_dependent_subset(
+    asset_graph_view: AssetGraphView,
+    candidate_subset: EntitySubset[AssetKey],
+    unit_asset_keys: AbstractSet[AssetKey],
+    matched_subset: EntitySubset[AssetKey],
+    target_subset: AssetGraphSubset,
+    materialized_subset: AssetGraphSubset,
+) -> tuple[EntitySubset[AssetKey], Sequence[tuple[EntitySubset[AssetKey], str]]]:
+    """Partitions of a self-dependent asset can only be requested together when each depends on
+    partitions that are already requested. When runs are size-limited, they are checked one at a
+    time, earliest first.
+    """
+    asset_graph = cast(RemoteWorkspaceAssetGraph, asset_graph_view.asset_graph)
+    key = candidate_subset.key
+    backfill_policy = asset_graph.get(key).backfill_policy
+    if backfill_policy is not None and backfill_policy.max_partitions_per_run is None:
+        # without a run size limit the order doesn't matter, so repeatedly drop the partitions
+        # whose unmaterialized parent partitions are neither requested nor still passing
+        requested_subset = matched_subset.compute_union(candidate_subset)
+        pending_subset = asset_graph_view.get_entity_subset_from_asset_graph_subset(
+            target_subset, key
+        ).compute_difference(
+            asset_graph_view.get_entity_subset_from_asset_graph_subset(materialized_subset, key)
+        )
+        blocked_subset = asset_graph_view.compute_child_subset(
+            key,
+            asset_graph_view.compute_parent_subset(key, candidate_subset)
+            .compute_intersection(pending_subset)
+            .compute_difference(requested_subset),
+        ).compute_intersection(candidate_subset)
+        all_blocked_subset = blocked_subset
+        while not blocked_subset.is_empty:
+            blocked_subset = (
+                asset_graph_view.compute_child_subset(key, blocked_subset)
+                .compute_intersection(candidate_subset)
+                .compute_difference(all_blocked_subset)
+            )
+            all_blocked_subset = all_blocked_subset.compute_union(blocked_subset)
+        return candidate_subset.compute_difference(all_blocked_subset), (
+            [
+                (
+                    all_blocked_subset,
+                    f"parent {key.to_user_string()} is not requested in this iteration",
+                )
+            ]
+            if not all_blocked_subset.is_empty
+            else []
+        )
+
+    requested_partition_keys = {
+        asset_partition.partition_key
+        for asset_partition in matched_subset.expensively_compute_asset_partitions()
+    }
+    passed: set[AssetKeyPartitionKey] = set()
+    failed_and_reasons: list[tuple[EntitySubset[AssetKey], str]] = []
+    for candidate in sorted(
+        candidate_subset.expensively_compute_asset_partitions(),
+        key=lambda asset_partition: sort_key_for_asset_partition(asset_graph, asset_partition),
+    ):
+        candidates_unit = [
+            AssetKeyPartitionKey(asset_key, candidate.partition_key)
+            for asset_key in unit_asset_keys
+        ]
+        for parent in asset_graph.get_parents_partitions(
+            asset_graph_view.get_inner_queryer_for_back_compat(),
+            asset_graph_view.effective_dt,
+            *candidate,
+        ).parent_partitions:
+            if (
+                parent.asset_key != key
+                or parent not in target_subset
+                or parent in materialized_subset
+            ):
+                continue
+            can_run, failed_reason = can_run_with_parent(
+                parent,
+                candidate,
+                candidates_unit,
+                asset_graph,
+                target_subset,
+                {key: requested_partition_keys},
+            )
+            if not can_run:
+                failed_and_reasons.append(
+                    (
+                        asset_graph_view.get_asset_subset_from_asset_partitions(key, {candidate}),
+                        failed_reason,
+                    )
+                )
+                break
+        else:
+            passed.add(candidate)
+            requested_partition_keys.add(candidate.partition_key)
+
+    return asset_graph_view.get_asset_subset_from_asset_partitions(key, passed), failed_and_reasons
+
+
+def _should_backfill_atomic_asset_subset_unit(
+    asset_graph_view: AssetGraphView,
+    candidates_unit: AssetGraphSubset,
+    asset_graph_subset_matched_so_far: AssetGraphSubset,
     target_subset: AssetGraphSubset,
     requested_subset: AssetGraphSubset,
     materialized_subset: AssetGraphSubset,
     failed_and_downstream_subset: AssetGraphSubset,
-    dynamic_partitions_store: DynamicPartitionsStore,
-    current_time: datetime,
-) -> tuple[bool, str]:
+) -> AssetGraphViewBfsFilterConditionResult:
     """Args:
-    candidates_unit: A set of asset partitions that must all be materialized if any is
-        materialized.
+    candidates_unit: A subset of an execution set, with the same partitions for each asset, that
+        must all be materialized if any is materialized.
 
-    returns if the candidates_unit can be materialized in this tick of the backfill, and the reason
-    it cannot, if applicable
+    returns the portion of the candidates_unit that can be materialized in this tick of the
+    backfill, and the portions that cannot along with the reason why
     """
-    for candidate in candidates_unit:
-        candidate_asset_partition_string = f"Asset {candidate.asset_key.to_user_string()} {f'with partition {candidate.partition_key}' if candidate.partition_key is not None else ''}"
-        if candidate not in target_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} is not targeted by backfill",
-            )
-        elif candidate in failed_and_downstream_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} has failed or is downstream of a failed asset",
-            )
-        elif candidate in materialized_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} was already materialized by backfill",
-            )
-        elif candidate in requested_subset:
-            return (
-                False,
-                f"{candidate_asset_partition_string} was already requested by backfill",
-            )
+    asset_graph = cast(RemoteWorkspaceAssetGraph, asset_graph_view.asset_graph)
+    unit_asset_keys = candidates_unit.asset_keys
+    failed_and_reasons: list[tuple[AssetGraphSubset, str]] = []
+    passed_value: Optional[Union[bool, PartitionsSubset]] = None
+
+    def _entity_subset(
+        asset_graph_subset: AssetGraphSubset, asset_key: AssetKey
+    ) -> EntitySubset[AssetKey]:
+        return asset_graph_view.get_entity_subset_from_asset_graph_subset(
+            asset_graph_subset, asset_key
+        )
 
-        parent_partitions_result = asset_graph.get_parents_partitions(
-            dynamic_partitions_store, current_time, *candidate
+    def _exclude(
+        subset: EntitySubset[AssetKey], excluded_subset: EntitySubset[AssetKey], reason: str
+    ) -> EntitySubset[AssetKey]:
+        # any partition that fails for one asset fails for the whole execution set
+        if not excluded_subset.is_empty:
+            failed_and_reasons.append(
+                (
+                    _with_value_for_keys(
+                        asset_graph_view, unit_asset_keys, excluded_subset.get_internal_value()
+                    ),
+                    reason,
+                )
+            )
+        return subset.compute_difference(excluded_subset)
+
+    for unit_subset in asset_graph_view.iterate_asset_subsets(candidates_unit):
+        key = unit_subset.key
+        candidate_subset = _exclude(
+            unit_subset,
+            unit_subset.compute_difference(_entity_subset(target_subset, key)),
+            "Not targeted by backfill",
         )
-        if parent_partitions_result.required_but_nonexistent_parents_partitions:
-            raise DagsterInvariantViolationError(
-                f"Asset partition {candidate}"
-                " depends on invalid partition keys"
-                f" {parent_partitions_result.required_but_nonexistent_parents_partitions}"
+        candidate_subset = _exclude(
+            candidate_subset,
+            candidate_subset.compute_intersection(
+                _entity_subset(failed_and_downstream_subset, key)
+            ),
+            "Has failed or is downstream of a failed asset",
+        )
+        candidate_subset = _exclude(
+            candidate_subset,
+            candidate_subset.compute_intersection(_entity_subset(materialized_subset, key)),
+            "Was already materialized by backfill",
+        )
+        candidate_subset = _exclude(
+            candidate_subset,
+            candidate_subset.compute_intersection(_entity_subset(requested_subset, key)),
+            "Was already requested by backfill",
+        )
+
+        for parent_key in sorted(asset_graph.get(key).parent_keys):
+            if candidate_subset.is_empty:
+                break
+            if parent_key == key:
+                continue
+
+            parent_subset, required_but_nonexistent_subset = (
+                asset_graph_view.compute_parent_subset_and_required_but_nonexistent_subset(
+                    parent_key, candidate_subset
+                )
             )
+            if not required_but_nonexistent_subset.is_empty:
+                raise DagsterInvariantViolationError(
+                    f"Asset partition {candidate_subset.expensively_compute_asset_partitions()}"
+                    " depends on invalid partition keys"
+                    f" {required_but_nonexistent_subset.expensively_compute_asset_partitions()}"
+                )
 
-        asset_partitions_to_request_map: dict[AssetKey, set[Optional[str]]] = defaultdict(set)
-        for asset_partition in asset_partitions_to_request:
-            asset_partitions_to_request_map[asset_partition.asset_key].add(
-                asset_partition.partition_key
+            unmaterialized_parent_subset = parent_subset.compute_intersection(
+                _entity_subset(target_subset, parent_key)
+            ).compute_difference(_entity_subset(materialized_subset, parent_key))
+            if unmaterialized_parent_subset.is_empty:
+                continue
+            waiting_subset = asset_graph_view.compute_child_subset(
+                key, unmaterialized_parent_subset
+            ).compute_intersection(candidate_subset)
+            if waiting_subset.is_empty:
+                continue
+
+            parent_failure_reason = _parent_subset_failure_reason(asset_graph, parent_key, key)
+            if parent_failure_reason:
+                candidate_subset = _exclude(candidate_subset, waiting_subset, parent_failure_reason)
+                continue
+
+            matched_parent_subset = _entity_subset(asset_graph_subset_matched_so_far, parent_key)
+            unrequested_parent_subset = unmaterialized_parent_subset.compute_difference(
+                matched_parent_subset.compute_union(_entity_subset(candidates_unit, parent_key))
             )
+            if not unrequested_parent_subset.is_empty:
+                blocked_subset = asset_graph_view.compute_child_subset(
+                    key, unrequested_parent_subset
+                ).compute_intersection(waiting_subset)
+                candidate_subset = _exclude(
+                    candidate_subset,
+                    blocked_subset,
+                    f"parent {parent_key.to_user_string()}"
+                    + (
+                        f" with partitions {_partition_subset_str(unrequested_parent_subset.get_internal_subset_value(), check.not_none(asset_graph.get(parent_key).partitions_def))}"
+                        if unrequested_parent_subset.is_partitioned
+                        else ""
+                    )
+                    + " is not requested in this iteration",
+                )
+                waiting_subset = waiting_subset.compute_difference(blocked_subset)
+
+            if not waiting_subset.is_empty and not _can_run_with_parent_subset(
+                asset_graph, parent_key, key, target_subset, matched_parent_subset
+            ):
+                candidate_subset = _exclude(
+                    candidate_subset,
+                    waiting_subset,
+                    f"partition mapping between {parent_key.to_user_string()} and {key.to_user_string()} is not simple and "
+                    f"{parent_key.to_user_string()} does not meet requirements of: targeting the same partitions as "
+                    f"{key.to_user_string()}, have all of its partitions requested in this iteration, having "
+                    "a backfill policy, and that backfill policy size limit is not exceeded by adding "
+                    f"{key.to_user_string()} to the run. {key.to_user_string()} can be materialized once {parent_key.to_user_string()} is materialized.",
+                )
 
-        for parent in parent_partitions_result.parent_partitions:
-            if parent in target_subset and parent not in materialized_subset:
-                can_run, failed_reason = can_run_with_parent(
-                    parent,
-                    candidate,
-                    candidates_unit,
-                    asset_graph,
-                    target_subset,
-                    asset_partitions_to_request_map,
+        if key in asset_graph.get(key).parent_keys and not candidate_subset.is_empty:
+            candidate_subset, self_dependency_failures = _filter_self_dependent_subset(
+                asset_graph_view,
+                candidate_subset,
+                unit_asset_keys,
+                _entity_subset(asset_graph_subset_matched_so_far, key),
+                target_subset,
+                materialized_subset,
+            )
+            for failed_subset, reason in self_dependency_failures:
+                failed_and_reasons.append(
+                    (
+                        _with_value_for_keys(
+                            asset_graph_view, unit_asset_keys, failed_subset.get_internal_value()
+                        ),
+                        reason,
+                    )
                 )
-                if not can_run:
-                    return False, failed_reason
 
-    return True, ""
+        value = candidate_subset.get_internal_value()
+        passed_value = value if passed_value is None else passed_value & value
+
+    return AssetGraphViewBfsFilterConditionResult(
+        passed_asset_graph_subset=(
+            _with_value_for_keys(asset_graph_view, unit_asset_keys, passed_value)
+            if passed_value
+            else AssetGraphSubset.empty()
+        ),
+        excluded_asset_graph_subsets_and_reasons=failed_and_reasons,
+    )
 
 
 def _get_failed_asset_partitions(
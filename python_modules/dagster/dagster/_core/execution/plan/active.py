@@ -1,4 +1,6 @@
+import heapq
 import time
+from collections import defaultdict
 from collections.abc import Iterator, Mapping, Sequence
 from types import TracebackType
 from typing import Any, Callable, Optional, Union, cast
@@ -74,7 +76,19 @@ def __init__(
         self._step_outputs: set[StepOutputHandle] = set(self._plan.known_state.ready_outputs)
 
         # All steps to be executed start out here in _pending
-        self._pending: dict[str, set[str]] = dict(self._plan.get_executable_step_deps())
+        self._pending: dict[str, set[str]] = {}
+
+        # Index over _pending so that resolving a step only has to visit its direct successors:
+        # the number of each pending step's deps that have not yet resolved, the pending steps
+        # that depend on each unresolved step, and the pending steps whose deps have all
+        # resolved and are waiting to be sorted into the buckets below by _update
+        self._unresolved_dep_counts: dict[str, int] = {}
+        self._pending_dependents: dict[str, set[str]] = defaultdict(set)
+        self._ready_to_evaluate: set[str] = set()
+        self._resolved: set[str] = set()
+        # steps are evaluated in the order they were added to _pending
+        self._pending_order: dict[str, int] = {}
+        self._pending_counter: int = 0
 
         # track mapping keys from DynamicOutputs, step_key, output_name -> list of keys
         # to _gathering while in flight
@@ -88,8 +102,10 @@ def __init__(
         # track which upstream deps caused a step to skip
         self._skipped_deps: dict[str, Sequence[str]] = {}
 
-        # steps move in to these buckets as a result of _update calls
-        self._executable: list[str] = []
+        # steps move in to these buckets as a result of _update calls. _executable is a heap
+        # ordered by sort key and then by the order in which steps became executable
+        self._executable: list[tuple[float, int, str]] = []
+        self._executable_counter: int = 0
         self._pending_skip: list[str] = []
         self._pending_retry: list[str] = []
         self._pending_abandon: list[str] = []
@@ -110,6 +126,9 @@ def __init__(
 
         self._interrupted: bool = False
 
+        for step_key, deps in self._plan.get_executable_step_deps().items():
+            self._add_pending(step_key, deps)
+
         # Start the show by loading _executable with the set of _pending steps that have no deps
         self._update()
 
@@ -163,7 +182,10 @@ def __exit__(
     def _pending_state_str(self) -> str:
         assert not self.is_complete
         pending_action = (
-            self._executable + self._pending_abandon + self._pending_retry + self._pending_skip
+            [step_key for _, _, step_key in sorted(self._executable)]
+            + self._pending_abandon
+            + self._pending_retry
+            + self._pending_skip
         )
         return "{pending_str}{in_flight_str}{action_str}{retry_str}{claim_str}".format(
             in_flight_str=f"\nSteps still in flight: {self._in_flight}" if self._in_flight else "",
@@ -185,16 +207,53 @@ def _pending_state_str(self) -> str:
             ),
         )
 
-    def _should_skip_step(self, step_key: str, successful_or_skipped_steps: set[str]) -> bool:
+    def _add_pending(self, step_key: str, deps: set[str]) -> None:
+        self._pending[step_key] = deps
+        self._pending_order[step_key] = self._pending_counter
+        self._pending_counter += 1
+
+        unresolved_deps = [dep for dep in deps if dep not in self._resolved]
+        self._unresolved_dep_counts[step_key] = len(unresolved_deps)
+        for dep in unresolved_deps:
+            self._pending_dependents[dep].add(step_key)
+        if not unresolved_deps:
+            self._ready_to_evaluate.add(step_key)
+
+    def _remove_pending(self, step_key: str) -> None:
+        del self._pending[step_key]
+        del self._pending_order[step_key]
+        del self._unresolved_dep_counts[step_key]
+
+    def _mark_resolved(self, step_key: str) -> None:
+        if step_key in self._resolved:
+            return
+        self._resolved.add(step_key)
+
+        for dependent_key in self._pending_dependents.pop(step_key, ()):
+            count = self._unresolved_dep_counts.get(dependent_key)
+            if count is None:
+                continue
+            self._unresolved_dep_counts[dependent_key] = count - 1
+            if count == 1:
+                self._ready_to_evaluate.add(dependent_key)
+
+    def _add_executable(self, step_key: str) -> None:
+        step = self.get_step_by_key(step_key)
+        heapq.heappush(
+            self._executable, (self._sort_key_fn(step), self._executable_counter, step_key)
+        )
+        self._executable_counter += 1
+
+    def _should_skip_step(self, step_key: str) -> bool:
         step = self.get_step_by_key(step_key)
         for step_input in step.step_inputs:
             missing_source_handles = []
 
             for source_handle in step_input.get_step_output_handle_dependencies():
                 if (
-                    source_handle.step_key in successful_or_skipped_steps
-                    and source_handle not in self._step_outputs
-                ):
+                    source_handle.step_key in self._success
+                    or source_handle.step_key in self._skipped
+                ) and source_handle not in self._step_outputs:
                     missing_source_handles.append(source_handle)
 
             if missing_source_handles:
@@ -211,41 +270,28 @@ def _update(self) -> None:
         """Moves steps from _pending to _executable / _pending_skip / _pending_retry
         as a function of what has been _completed.
         """
-        new_steps_to_execute: list[str] = []
-        new_steps_to_skip: list[str] = []
-        new_steps_to_abandon: list[str] = []
-
-        successful_or_skipped_steps = self._success | self._skipped
-        failed_or_abandoned_steps = self._failed | self._abandoned
-        resolved_steps = self._success | self._skipped | self._failed | self._abandoned
-
         if self._new_dynamic_mappings:
             new_step_deps = self._plan.resolve(self._completed_dynamic_outputs)
             for step_key, deps in new_step_deps.items():
-                self._pending[step_key] = deps
+                self._add_pending(step_key, deps)
 
             self._new_dynamic_mappings = False
 
-        for step_key, depends_on_steps in self._pending.items():
-            if depends_on_steps.issubset(resolved_steps):
-                if self._should_skip_step(step_key, successful_or_skipped_steps):
-                    new_steps_to_skip.append(step_key)
-                elif depends_on_steps.intersection(failed_or_abandoned_steps):
-                    new_steps_to_abandon.append(step_key)
-                else:
-                    new_steps_to_execute.append(step_key)
-
-        for key in new_steps_to_execute:
-            self._executable.append(key)
-            del self._pending[key]
+        new_steps_to_execute: list[str] = []
+        for step_key in sorted(self._ready_to_evaluate, key=self._pending_order.__getitem__):
+            depends_on_steps = self._pending[step_key]
+            if self._should_skip_step(step_key):
+                self._pending_skip.append(step_key)
+            elif any(dep in self._failed or dep in self._abandoned for dep in depends_on_steps):
+                self._pending_abandon.append(step_key)
+            else:
+                new_steps_to_execute.append(step_key)
+            self._remove_pending(step_key)
 
-        for key in new_steps_to_skip:
-            self._pending_skip.append(key)
-            del self._pending[key]
+        self._ready_to_evaluate.clear()
 
-        for key in new_steps_to_abandon:
-            self._pending_abandon.append(key)
-            del self._pending[key]
+        for key in new_steps_to_execute:
+            self._add_executable(key)
 
         ready_to_retry = []
         tick_time = time.time()
@@ -254,10 +300,13 @@ def _update(self) -> None:
                 ready_to_retry.append(key)
 
         for key in ready_to_retry:
-            self._executable.append(key)
+            self._add_executable(key)
             del self._waiting_to_retry[key]
 
-    def sleep_interval(self):
+    def get_next_timer_interval(self) -> Optional[float]:
+        """Seconds until the next step retry or pending concurrency claim check is due, or None
+        if nothing is waiting on a timer. Negative if one is already overdue.
+        """
         now = time.time()
         intervals = []
         if self._waiting_to_retry:
@@ -273,7 +322,11 @@ def sleep_interval(self):
         if intervals:
             return min(intervals)
 
-        return 0
+        return None
+
+    def sleep_interval(self):
+        interval = self.get_next_timer_interval()
+        return interval if interval is not None else 0
 
     def sleep_til_ready(self) -> None:
         sleep_amt = self.sleep_interval()
@@ -306,11 +359,6 @@ def get_steps_to_execute(
 
         self._update()
 
-        steps = sorted(
-            [self.get_step_by_key(key) for key in self._executable],
-            key=self._sort_key_fn,
-        )
-
         run_scoped_concurrency_limits_counter = None
         if self._tag_concurrency_limits:
             in_flight_steps = [self.get_step_by_key(key) for key in self._in_flight]
@@ -320,8 +368,10 @@ def get_steps_to_execute(
             )
 
         batch: list[ExecutionStep] = []
+        # steps that are executable but could not be launched yet, returned to the heap after
+        blocked: list[tuple[float, int, str]] = []
 
-        for step in steps:
+        while self._executable:
             if limit is not None and len(batch) >= limit:
                 break
 
@@ -331,8 +381,12 @@ def get_steps_to_execute(
             ):
                 break
 
+            entry = heapq.heappop(self._executable)
+            step = self.get_step_by_key(entry[2])
+
             if run_scoped_concurrency_limits_counter:
                 if run_scoped_concurrency_limits_counter.is_blocked(step):
+                    blocked.append(entry)
                     continue
 
             if run_scoped_concurrency_limits_counter:
@@ -348,13 +402,16 @@ def get_steps_to_execute(
                 if not self._instance_concurrency_context.claim(
                     step_concurrency_key, step.key, step_priority
                 ):
+                    blocked.append(entry)
                     continue
 
             batch.append(step)
 
+        for entry in blocked:
+            heapq.heappush(self._executable, entry)
+
         for step in batch:
             self._in_flight.add(step.key)
-            self._executable.remove(step.key)
             self._prep_for_dynamic_outputs(step)
 
         return batch
@@ -363,13 +420,12 @@ def get_steps_to_skip(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_skip = list(self._pending_skip)
+        steps_to_skip = self._pending_skip
+        self._pending_skip = []
         for key in steps_to_skip:
             step = self.get_step_by_key(key)
             steps.append(step)
             self._in_flight.add(key)
-            self._pending_skip.remove(key)
-            self._gathering_dynamic_outputs  # noqa: B018
             self._skip_for_dynamic_outputs(step)
 
         return sorted(steps, key=self._sort_key_fn)
@@ -378,11 +434,11 @@ def get_steps_to_abandon(self) -> Sequence[ExecutionStep]:
         self._update()
 
         steps = []
-        steps_to_abandon = list(self._pending_abandon)
+        steps_to_abandon = self._pending_abandon
+        self._pending_abandon = []
         for key in steps_to_abandon:
             steps.append(self.get_step_by_key(key))
             self._in_flight.add(key)
-            self._pending_abandon.remove(key)
 
         return sorted(steps, key=self._sort_key_fn)
 
@@ -434,20 +490,24 @@ def plan_events_iterator(
     def mark_failed(self, step_key: str) -> None:
         self._failed.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_success(self, step_key: str) -> None:
         self._success.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_skipped(self, step_key: str) -> None:
         self._skipped.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
         self._resolve_any_dynamic_outputs(step_key)
 
     def mark_abandoned(self, step_key: str) -> None:
         self._abandoned.add(step_key)
         self._mark_complete(step_key)
+        self._mark_resolved(step_key)
 
     def mark_interrupted(self) -> None:
         self._interrupted = True
@@ -467,11 +527,12 @@ def mark_up_for_retry(self, step_key: str, at_time: Optional[float] = None) -> N
             if at_time:
                 self._waiting_to_retry[step_key] = at_time
             else:
-                self._pending[step_key] = self._plan.get_executable_step_deps()[step_key]
+                self._add_pending(step_key, self._plan.get_executable_step_deps()[step_key])
 
         elif self._retry_mode.deferred:
             # do not attempt to execute again
             self._abandoned.add(step_key)
+            self._mark_resolved(step_key)
 
         self._retry_state.mark_attempt(step_key)
 
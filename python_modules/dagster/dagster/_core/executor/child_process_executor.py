@@ -3,12 +3,14 @@
 import os
 import queue
 import sys
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from multiprocessing import Queue
+from multiprocessing.connection import wait as wait_for_connections
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, NamedTuple, Optional, Union
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
 
 from typing_extensions import Literal
 
@@ -101,11 +103,46 @@ def _execute_command_in_child_process(event_queue: Queue, command: ChildProcessC
 """Sentinel value."""
 
 
+class ChildProcessEventSelector:
+    """Waits on many child processes at once for any of them to have an event or to exit.
+
+    Child process executions that are given a selector register the read end of their event queue
+    and the sentinel of their process with it while the process runs, and poll their queue without
+    blocking. The caller then drives all of the executions from a single loop that blocks in
+    `wait` whenever none of them has anything to report, instead of each execution blocking for a
+    tick in turn.
+    """
+
+    def __init__(self):
+        self._handles: dict[BaseProcess, tuple[Any, int]] = {}
+
+    def register(self, process: BaseProcess, event_queue: Queue) -> None:
+        # the read end of the queue's pipe is readable whenever an event is waiting to be received
+        self._handles[process] = (event_queue._reader, process.sentinel)  # type: ignore  # noqa: SLF001
+
+    def unregister(self, process: BaseProcess) -> None:
+        self._handles.pop(process, None)
+
+    def wait(self, timeout: float) -> bool:
+        """Block until a registered process has an event or has exited, or until `timeout` seconds
+        have passed. Returns whether any process is ready.
+        """
+        handles = [
+            handle for process_handles in self._handles.values() for handle in process_handles
+        ]
+        if not handles:
+            time.sleep(timeout)
+            return False
+        return bool(wait_for_connections(handles, timeout))
+
+
 def _poll_for_event(
-    process, event_queue
+    process, event_queue, timeout: float = TICK
 ) -> Optional[Union["DagsterEvent", Literal["PROCESS_DEAD_AND_QUEUE_EMPTY"]]]:
     try:
-        return event_queue.get(block=True, timeout=TICK)
+        if timeout > 0:
+            return event_queue.get(block=True, timeout=timeout)
+        return event_queue.get(block=False)
     except queue.Empty:
         if not process.is_alive():
             # There is a possibility that after the last queue.get the
@@ -121,7 +158,9 @@ def _poll_for_event(
 
 
 def execute_child_process_command(
-    multiprocessing_ctx: MultiprocessingBaseContext, command: ChildProcessCommand
+    multiprocessing_ctx: MultiprocessingBaseContext,
+    command: ChildProcessCommand,
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
     """Execute a ChildProcessCommand in a new process.
 
@@ -142,6 +181,10 @@ def execute_child_process_command(
     Args:
         multiprocessing_ctx: The multiprocessing context to execute in (spawn, forkserver, fork)
         command (ChildProcessCommand): The command to execute in the child process.
+        selector (Optional[ChildProcessEventSelector]): If provided, the child process is
+            registered with the selector while it runs and the queue is polled without blocking,
+            so None is yielded immediately whenever no event is available. Otherwise each poll
+            blocks for up to a tick.
 
     Warning: if the child process is in an infinite loop, this will
     also infinitely loop.
@@ -149,17 +192,21 @@ def execute_child_process_command(
     check.inst_param(command, "command", ChildProcessCommand)
 
     event_queue = multiprocessing_ctx.Queue()
+    process = None
+    poll_timeout = 0 if selector else TICK
     try:
         process = multiprocessing_ctx.Process(  # type: ignore
             target=_execute_command_in_child_process, args=(event_queue, command)
         )
         process.start()
+        if selector:
+            selector.register(process, event_queue)
         yield process
 
         completed_properly = False
 
         while not completed_properly:
-            event = _poll_for_event(process, event_queue)
+            event = _poll_for_event(process, event_queue, poll_timeout)
 
             if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
                 break
@@ -175,4 +222,6 @@ def execute_child_process_command(
 
         process.join()
     finally:
+        if selector and process is not None:
+            selector.unregister(process)
         event_queue.close()
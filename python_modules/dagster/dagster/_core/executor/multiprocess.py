@@ -6,7 +6,7 @@
 from contextlib import ExitStack
 from multiprocessing.context import BaseContext as MultiprocessingBaseContext
 from multiprocessing.process import BaseProcess
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from dagster import _check as check
 from dagster._core.definitions.metadata import MetadataValue
@@ -32,10 +32,18 @@
     ChildProcessCommand,
     ChildProcessCrashException,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
 )
+from dagster._core.executor.step_worker_pool import (
+    StepWorker,
+    StepWorkerCommand,
+    StepWorkerPool,
+    StepWorkerTask,
+)
 from dagster._core.instance import DagsterInstance
+from dagster._time import get_current_timestamp
 from dagster._utils import get_run_crash_explanation, start_termination_thread
 from dagster._utils.error import SerializableErrorInfo, serializable_error_info_from_exc_info
 from dagster._utils.timing import TimerResult, format_duration, time_execution_scope
@@ -46,6 +54,9 @@
 
 DELEGATE_MARKER = "multiprocess_subprocess_init"
 
+MAX_WAIT_INTERVAL = 0.5
+"""The longest the executor blocks waiting on child processes before checking for interrupts."""
+
 
 class MultiprocessExecutorChildProcessCommand(ChildProcessCommand):
     def __init__(
@@ -59,6 +70,7 @@ def __init__(
         retry_mode: RetryMode,
         known_state: Optional[KnownExecutionState],
         repository_load_data: Optional[RepositoryLoadData],
+        launch_timestamp: Optional[float] = None,
     ):
         self.run_config = run_config
         self.dagster_run = dagster_run
@@ -69,38 +81,26 @@ def __init__(
         self.retry_mode = retry_mode
         self.known_state = known_state
         self.repository_load_data = repository_load_data
+        self.launch_timestamp = (
+            launch_timestamp if launch_timestamp is not None else get_current_timestamp()
+        )
 
     def execute(self) -> Iterator[DagsterEvent]:
-        recon_job = self.recon_pipeline
         with DagsterInstance.from_ref(self.instance_ref) as instance:
             done_event = threading.Event()
             start_termination_thread(self.term_event, done_event)
             try:
-                log_manager = create_context_free_log_manager(instance, self.dagster_run)
-
-                yield DagsterEvent.step_worker_started(
-                    log_manager,
-                    self.dagster_run.job_name,
-                    message=f'Executing step "{self.step_key}" in subprocess.',
-                    metadata={
-                        "pid": MetadataValue.text(str(os.getpid())),
-                    },
-                    step_key=self.step_key,
-                )
-                execution_plan = create_execution_plan(
-                    job=recon_job,
+                yield from _execute_step_in_child_process(
+                    instance=instance,
+                    recon_job=self.recon_pipeline,
+                    dagster_run=self.dagster_run,
                     run_config=self.run_config,
-                    step_keys_to_execute=[self.step_key],
+                    step_key=self.step_key,
                     known_state=self.known_state,
+                    retry_mode=self.retry_mode,
                     repository_load_data=self.repository_load_data,
-                )
-                yield from execute_plan_iterator(
-                    execution_plan,
-                    recon_job,
-                    self.dagster_run,
-                    run_config=self.run_config,
-                    retry_mode=self.retry_mode.for_inner_plan(),
-                    instance=instance,
+                    message=f'Executing step "{self.step_key}" in subprocess.',
+                    launch_timestamp=self.launch_timestamp,
                 )
             finally:
                 # set events to stop the termination thread on exit
@@ -108,6 +108,136 @@ def execute(self) -> Iterator[DagsterEvent]:
                 self.term_event.set()
 
 
+class MultiprocessExecutorStepWorkerCommand(StepWorkerCommand):
+    """Executes steps in the long-lived processes of a StepWorkerPool. The instance is opened and
+    the job is loaded once per worker rather than once per step.
+    """
+
+    def __init__(
+        self,
+        run_config: Mapping[str, object],
+        dagster_run: "DagsterRun",
+        instance_ref: "InstanceRef",
+        recon_pipeline: ReconstructableJob,
+        retry_mode: RetryMode,
+        repository_load_data: Optional[RepositoryLoadData],
+    ):
+        self.run_config = run_config
+        self.dagster_run = dagster_run
+        self.instance_ref = instance_ref
+        self.recon_pipeline = recon_pipeline
+        self.retry_mode = retry_mode
+        self.repository_load_data = repository_load_data
+        self._instance: Optional[DagsterInstance] = None
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, "_instance": None}
+
+    def initialize(self, exit_stack: ExitStack) -> None:
+        self._instance = exit_stack.enter_context(DagsterInstance.from_ref(self.instance_ref))
+        # the loaded definition is cached on the reconstructable job for subsequent steps
+        self.recon_pipeline.get_definition()
+
+    def execute_step(self, task: StepWorkerTask) -> Iterator[DagsterEvent]:
+        check.invariant(self._instance is not None, "Worker must be initialized")
+        yield from _execute_step_in_child_process(
+            instance=check.not_none(self._instance),
+            recon_job=self.recon_pipeline,
+            dagster_run=self.dagster_run,
+            run_config=self.run_config,
+            step_key=task.step_key,
+            known_state=task.known_state,
+            retry_mode=self.retry_mode,
+            repository_load_data=self.repository_load_data,
+            message=f'Executing step "{task.step_key}" in worker process.',
+            launch_timestamp=task.launch_timestamp,
+        )
+
+
+def _execute_step_in_child_process(
+    instance: DagsterInstance,
+    recon_job: ReconstructableJob,
+    dagster_run: "DagsterRun",
+    run_config: Mapping[str, object],
+    step_key: str,
+    known_state: Optional[KnownExecutionState],
+    retry_mode: RetryMode,
+    repository_load_data: Optional[RepositoryLoadData],
+    message: str,
+    launch_timestamp: float,
+) -> Iterator[DagsterEvent]:
+    log_manager = create_context_free_log_manager(instance, dagster_run)
+
+    # Loading the definition imports the user's code. It is cached on the reconstructable job, so
+    # this is free when the worker has executed a step before and is otherwise the first half of
+    # create_execution_plan below.
+    recon_job.get_definition()
+    time_to_first_user_code_ms = (get_current_timestamp() - launch_timestamp) * 1000
+
+    yield DagsterEvent.step_worker_started(
+        log_manager,
+        dagster_run.job_name,
+        message=message,
+        metadata={
+            "pid": MetadataValue.text(str(os.getpid())),
+            "time_to_first_user_code_ms": MetadataValue.float(time_to_first_user_code_ms),
+        },
+        step_key=step_key,
+    )
+    execution_plan = create_execution_plan(
+        job=recon_job,
+        run_config=run_config,
+        step_keys_to_execute=[step_key],
+        known_state=known_state,
+        repository_load_data=repository_load_data,
+    )
+    yield from execute_plan_iterator(
+        execution_plan,
+        recon_job,
+        dagster_run,
+        run_config=run_config,
+        retry_mode=retry_mode.for_inner_plan(),
+        instance=instance,
+    )
+
+
+def _get_wait_timeout(active_execution: ActiveExecution) -> float:
+    interval = active_execution.get_next_timer_interval()
+    if interval is None:
+        return MAX_WAIT_INTERVAL
+    return max(0.0, min(interval, MAX_WAIT_INTERVAL))
+
+
+def get_forkserver_preload_modules(
+    recon_job: ReconstructableJob,
+    explicit_preload: Optional[Sequence[str]],
+    preload_code_location: Optional[bool],
+) -> list[str]:
+    """The modules to import in the forkserver process, which every step process is forked from.
+
+    Explicitly listed modules are always preloaded. The module that the job's code location was
+    loaded from is preloaded if `preload_code_location` is set, or by default when no modules are
+    listed explicitly. If there is nothing else to preload, the `dagster` library is preloaded.
+    """
+    preload = list(explicit_preload) if explicit_preload is not None else []
+
+    if preload_code_location or (preload_code_location is None and explicit_preload is None):
+        # only jobs loaded from a module or package have a module name the forkserver can import
+        module = recon_job.get_module()
+        if module is not None and module not in preload:
+            preload.append(module)
+
+    if explicit_preload is None and not preload:
+        preload = ["dagster"]
+
+    # we import this module first to avoid user code like
+    # pyspark.serializers._hijack_namedtuple from breaking us
+    if "dagster._core.executor.multiprocess" not in preload:
+        preload = ["dagster._core.executor.multiprocess", *preload]
+
+    return preload
+
+
 class MultiprocessExecutor(Executor):
     def __init__(
         self,
@@ -116,6 +246,10 @@ def __init__(
         tag_concurrency_limits: Optional[list[dict[str, Any]]] = None,
         start_method: Optional[str] = None,
         explicit_forkserver_preload: Optional[Sequence[str]] = None,
+        use_worker_pool: bool = False,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+        forkserver_preload_code_location: Optional[bool] = None,
     ):
         self._retries = check.inst_param(retries, "retries", RetryMode)
         if not max_concurrent:
@@ -141,6 +275,16 @@ def __init__(
             )
         self._start_method = start_method
         self._explicit_forkserver_preload = explicit_forkserver_preload
+        self._forkserver_preload_code_location = check.opt_bool_param(
+            forkserver_preload_code_location, "forkserver_preload_code_location"
+        )
+        self._use_worker_pool = check.bool_param(use_worker_pool, "use_worker_pool")
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
 
     @property
     def retries(self) -> RetryMode:
@@ -156,25 +300,10 @@ def execute(
 
         multiproc_ctx = multiprocessing.get_context(self._start_method)
         if self._start_method == "forkserver":
-            module = job.get_module()
-            # if explicitly listed in config we will use that
-            if self._explicit_forkserver_preload is not None:
-                preload = self._explicit_forkserver_preload
-
-            # or if the reconstructable job has a module target, we will use that
-            elif module is not None:
-                preload = [module]
-
-            # base case is to preload the dagster library
-            else:
-                preload = ["dagster"]
-
-            # we import this module first to avoid user code like
-            # pyspark.serializers._hijack_namedtuple from breaking us
-            if "dagster._core.executor.multiprocess" not in preload:
-                preload = ["dagster._core.executor.multiprocess", *preload]
-
-            multiproc_ctx.set_forkserver_preload(list(preload))
+            preload = get_forkserver_preload_modules(
+                job, self._explicit_forkserver_preload, self._forkserver_preload_code_location
+            )
+            multiproc_ctx.set_forkserver_preload(preload)
 
         limit = self._max_concurrent
         tag_concurrency_limits = self._tag_concurrency_limits
@@ -203,14 +332,34 @@ def execute(
                     instance_concurrency_context=instance_concurrency_context,
                 )
             )
+            worker_pool: Optional[StepWorkerPool] = None
+            if self._use_worker_pool:
+                worker_pool = StepWorkerPool(
+                    multiproc_ctx,
+                    MultiprocessExecutorStepWorkerCommand(
+                        run_config=plan_context.run_config,
+                        dagster_run=plan_context.dagster_run,
+                        instance_ref=plan_context.instance.get_ref(),
+                        recon_pipeline=job,
+                        retry_mode=self.retries,
+                        repository_load_data=execution_plan.repository_load_data,
+                    ),
+                    max_steps_per_worker=self._max_steps_per_worker,
+                    max_worker_memory_mb=self._max_worker_memory_mb,
+                )
+                stack.callback(worker_pool.shutdown)
+
             active_iters: dict[str, Iterator[Optional[DagsterEvent]]] = {}
             errors: dict[int, SerializableErrorInfo] = {}
             processes: dict[str, BaseProcess] = {}
             term_events: dict[str, Any] = {}
             stopping: bool = False
+            selector = ChildProcessEventSelector()
 
             try:
                 while (not stopping and not active_execution.is_complete) or active_iters:
+                    made_progress = False
+
                     if active_execution.check_for_interrupts():
                         yield DagsterEvent.engine_event(
                             plan_context,
@@ -236,8 +385,24 @@ def execute(
                         if not steps:
                             break
 
+                        made_progress = True
                         for step in steps:
                             step_context = plan_context.for_step(step)
+                            if worker_pool is not None:
+                                worker = worker_pool.acquire()
+                                term_events[step.key] = worker.term_event
+                                active_iters[step.key] = execute_step_in_worker_pool(
+                                    worker_pool,
+                                    worker,
+                                    step_context,
+                                    step,
+                                    errors,
+                                    processes,
+                                    active_execution.get_known_state(),
+                                    selector,
+                                )
+                                continue
+
                             term_events[step.key] = multiproc_ctx.Event()
                             active_iters[step.key] = execute_step_out_of_process(
                                 multiproc_ctx,
@@ -250,6 +415,7 @@ def execute(
                                 self.retries,
                                 active_execution.get_known_state(),
                                 execution_plan.repository_load_data,
+                                selector,
                             )
 
                     # process active iterators
@@ -260,6 +426,7 @@ def execute(
                             if event_or_none is None:
                                 continue
                             else:
+                                made_progress = True
                                 yield event_or_none
                                 active_execution.handle_event(event_or_none)
 
@@ -290,6 +457,8 @@ def execute(
                             empty_iters.append(key)
 
                     # clear and mark complete finished iterators
+                    if empty_iters:
+                        made_progress = True
                     for key in empty_iters:
                         del active_iters[key]
                         del term_events[key]
@@ -299,6 +468,11 @@ def execute(
 
                     # process skipped and abandoned steps
                     yield from active_execution.plan_events_iterator(plan_context)
+
+                    if not made_progress:
+                        # Nothing happened this time around, so block until a child process
+                        # reports an event or exits, or a retry or concurrency claim check is due.
+                        selector.wait(_get_wait_timeout(active_execution))
             except Exception:
                 if not stopping and active_iters:
                     serializable_error = serializable_error_info_from_exc_info(sys.exc_info())
@@ -373,6 +547,7 @@ def execute_step_out_of_process(
     retries: RetryMode,
     known_state: KnownExecutionState,
     repository_load_data: Optional[RepositoryLoadData],
+    selector: Optional[ChildProcessEventSelector] = None,
 ) -> Iterator[Optional[DagsterEvent]]:
     command = MultiprocessExecutorChildProcessCommand(
         run_config=step_context.run_config,
@@ -384,6 +559,7 @@ def execute_step_out_of_process(
         retry_mode=retries,
         known_state=known_state,
         repository_load_data=repository_load_data,
+        launch_timestamp=get_current_timestamp(),
     )
 
     yield DagsterEvent.step_worker_starting(
@@ -392,7 +568,44 @@ def execute_step_out_of_process(
         metadata={},
     )
 
-    for ret in execute_child_process_command(multiproc_ctx, command):
+    yield from _handle_child_process_results(
+        execute_child_process_command(multiproc_ctx, command, selector), step, errors, processes
+    )
+
+
+def execute_step_in_worker_pool(
+    worker_pool: StepWorkerPool,
+    worker: StepWorker,
+    step_context: IStepContext,
+    step: ExecutionStep,
+    errors: dict[int, SerializableErrorInfo],
+    processes: dict[str, BaseProcess],
+    known_state: KnownExecutionState,
+    selector: Optional[ChildProcessEventSelector] = None,
+) -> Iterator[Optional[DagsterEvent]]:
+    yield DagsterEvent.step_worker_starting(
+        step_context,
+        f'Handing "{step.key}" to worker process (pid: {worker.pid}).',
+        metadata={},
+    )
+
+    yield from _handle_child_process_results(
+        worker_pool.execute_step(
+            worker, StepWorkerTask(step.key, known_state, get_current_timestamp()), selector
+        ),
+        step,
+        errors,
+        processes,
+    )
+
+
+def _handle_child_process_results(
+    results: Iterator[Optional[Union[DagsterEvent, ChildProcessEvent, BaseProcess]]],
+    step: ExecutionStep,
+    errors: dict[int, SerializableErrorInfo],
+    processes: dict[str, BaseProcess],
+) -> Iterator[Optional[DagsterEvent]]:
+    for ret in results:
         if ret is None or isinstance(ret, DagsterEvent):
             yield ret
         elif isinstance(ret, ChildProcessEvent):
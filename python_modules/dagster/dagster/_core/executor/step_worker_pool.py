@@ -0,0 +1,334 @@
+"""Facilities for executing many steps in a pool of long-lived child processes.
+
+Where `child_process_executor` starts a fresh process for every command, the processes in a
+`StepWorkerPool` perform their (potentially expensive) setup once and then execute steps handed to
+them one at a time, until they are recycled or the pool is shut down.
+"""
+
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from contextlib import ExitStack
+from multiprocessing import Queue
+from multiprocessing.context import BaseContext as MultiprocessingBaseContext
+from multiprocessing.process import BaseProcess
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+import dagster._check as check
+from dagster._core.errors import DagsterExecutionInterruptedError
+from dagster._core.execution.plan.state import KnownExecutionState
+from dagster._core.executor.child_process_executor import (
+    PROCESS_DEAD_AND_QUEUE_EMPTY,
+    TICK,
+    ChildProcessCrashException,
+    ChildProcessEvent,
+    ChildProcessEventSelector,
+    ChildProcessStartEvent,
+    ChildProcessSystemErrorEvent,
+    _poll_for_event,
+)
+from dagster._seven import IS_WINDOWS
+from dagster._utils import start_termination_thread
+from dagster._utils.error import serializable_error_info_from_exc_info
+from dagster._utils.interrupts import capture_interrupts
+
+if TYPE_CHECKING:
+    from dagster._core.events import DagsterEvent
+
+WORKER_SHUTDOWN_TIMEOUT = 5.0
+"""Seconds to wait for an idle worker to exit after being asked to shut down."""
+
+
+class StepWorkerTask(NamedTuple):
+    step_key: str
+    known_state: Optional[KnownExecutionState]
+    # when the parent process handed the step to the worker
+    launch_timestamp: float
+
+
+class StepWorkerDoneEvent(
+    NamedTuple("StepWorkerDoneEvent", [("pid", int), ("recycle", bool)]), ChildProcessEvent
+):
+    """Sent by a worker once it has finished executing a step. If `recycle` is set, the worker
+    exits instead of waiting for another step.
+    """
+
+
+class StepWorkerCommand(ABC):
+    """Inherit from this class in order to execute steps in a StepWorkerPool.
+
+    The object must be picklable; it is sent to each worker process once, when the worker starts.
+    """
+
+    @abstractmethod
+    def initialize(self, exit_stack: ExitStack) -> None:
+        """This method is invoked once in each worker process, before it executes any steps.
+
+        Resources that live for as long as the worker should be entered on `exit_stack`.
+        """
+
+    @abstractmethod
+    def execute_step(self, task: StepWorkerTask) -> Iterator["DagsterEvent"]:
+        """This method is invoked in the worker process for every step it is handed."""
+
+
+def get_peak_memory_usage_bytes() -> int:
+    """The peak resident set size of the current process, in bytes."""
+    if IS_WINDOWS:
+        import psutil
+
+        return psutil.Process().memory_info().peak_wset
+
+    import resource
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes everywhere else
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def _should_recycle(
+    num_steps: int, max_steps: Optional[int], max_memory_bytes: Optional[int]
+) -> bool:
+    if max_steps is not None and num_steps >= max_steps:
+        return True
+    if max_memory_bytes is not None and get_peak_memory_usage_bytes() >= max_memory_bytes:
+        return True
+    return False
+
+
+def _execute_steps_in_worker_process(
+    task_queue: Queue,
+    event_queue: Queue,
+    term_event: Any,
+    command: StepWorkerCommand,
+    max_steps: Optional[int],
+    max_memory_bytes: Optional[int],
+) -> None:
+    """Target of each worker process. Executes tasks from `task_queue` until it receives None or
+    decides to recycle itself, communicating with the parent process across `event_queue`.
+    """
+    check.inst_param(command, "command", StepWorkerCommand)
+
+    with capture_interrupts():
+        pid = os.getpid()
+        event_queue.put(ChildProcessStartEvent(pid=pid))
+        idle_event = threading.Event()
+        idle_event.set()
+        try:
+            with ExitStack() as stack:
+                command.initialize(stack)
+                # the termination thread only interrupts the worker while a step is in flight
+                start_termination_thread(term_event, idle_event)
+
+                num_steps = 0
+                while True:
+                    task = task_queue.get()
+                    if task is None:
+                        break
+
+                    idle_event.clear()
+                    try:
+                        for step_event in command.execute_step(task):
+                            event_queue.put(step_event)
+                    finally:
+                        idle_event.set()
+
+                    num_steps += 1
+                    recycle = _should_recycle(num_steps, max_steps, max_memory_bytes)
+                    event_queue.put(StepWorkerDoneEvent(pid=pid, recycle=recycle))
+                    if recycle:
+                        break
+
+        except (
+            Exception,
+            KeyboardInterrupt,
+            DagsterExecutionInterruptedError,
+        ):
+            event_queue.put(
+                ChildProcessSystemErrorEvent(
+                    pid=pid, error_info=serializable_error_info_from_exc_info(sys.exc_info())
+                )
+            )
+        finally:
+            # stop the termination thread, waiting on term_event, without interrupting
+            idle_event.set()
+            term_event.set()
+
+
+class StepWorker:
+    """Parent-side handle for a single worker process in a StepWorkerPool."""
+
+    def __init__(
+        self,
+        process: BaseProcess,
+        task_queue: Queue,
+        event_queue: Queue,
+        term_event: Any,
+    ):
+        self.process = process
+        self.task_queue = task_queue
+        self.event_queue = event_queue
+        self.term_event = term_event
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self.process.pid
+
+    def close(self) -> None:
+        self.task_queue.close()
+        self.event_queue.close()
+
+
+class StepWorkerPool:
+    """A pool of worker processes that each execute a StepWorkerCommand for many steps.
+
+    Workers are started lazily, at most one per step in flight. A worker that has finished a step
+    returns to the pool to be handed the next one, unless it has executed `max_steps_per_worker`
+    steps or its peak memory usage has reached `max_worker_memory_mb`, in which case it exits and
+    a fresh worker is started in its place when needed.
+
+    Args:
+        multiprocessing_ctx: The multiprocessing context to start workers in (spawn, forkserver)
+        command (StepWorkerCommand): The command each worker initializes once and then invokes for
+            every step.
+        max_steps_per_worker (Optional[int]): Recycle a worker after it has executed this many
+            steps. By default workers are never recycled based on their step count.
+        max_worker_memory_mb (Optional[int]): Recycle a worker once its peak resident memory
+            reaches this many megabytes. By default workers are never recycled based on memory.
+    """
+
+    def __init__(
+        self,
+        multiprocessing_ctx: MultiprocessingBaseContext,
+        command: StepWorkerCommand,
+        max_steps_per_worker: Optional[int] = None,
+        max_worker_memory_mb: Optional[int] = None,
+    ):
+        self._multiprocessing_ctx = multiprocessing_ctx
+        self._command = check.inst_param(command, "command", StepWorkerCommand)
+        self._max_steps_per_worker = check.opt_int_param(
+            max_steps_per_worker, "max_steps_per_worker"
+        )
+        self._max_worker_memory_mb = check.opt_int_param(
+            max_worker_memory_mb, "max_worker_memory_mb"
+        )
+        self._idle_workers: list[StepWorker] = []
+        self._workers: list[StepWorker] = []
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    def acquire(self) -> StepWorker:
+        """Take an idle worker from the pool, starting a new one if none is available. The worker
+        belongs to the caller until it is passed to `execute_step`.
+        """
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker.process.is_alive():
+                return worker
+            self._discard(worker)
+
+        return self._start_worker()
+
+    def execute_step(
+        self,
+        worker: StepWorker,
+        task: StepWorkerTask,
+        selector: Optional[ChildProcessEventSelector] = None,
+    ) -> Iterator[Optional[Union["DagsterEvent", ChildProcessEvent, BaseProcess]]]:
+        """Execute a step in an acquired worker and return the worker to the pool afterwards.
+
+        Yields the same family of objects as `execute_child_process_command`: None while nothing
+        has happened, the worker process object, ChildProcessEvents, and the events yielded by the
+        command. Raises ChildProcessCrashException if the worker dies while executing the step.
+        If a selector is provided, the worker is registered with it while it executes the step,
+        as in `execute_child_process_command`.
+        """
+        check.inst_param(worker, "worker", StepWorker)
+        check.inst_param(task, "task", StepWorkerTask)
+
+        poll_timeout = 0 if selector else TICK
+        worker.task_queue.put(task)
+        if selector:
+            selector.register(worker.process, worker.event_queue)
+        try:
+            yield worker.process
+
+            while True:
+                event = _poll_for_event(worker.process, worker.event_queue, poll_timeout)
+
+                if event == PROCESS_DEAD_AND_QUEUE_EMPTY:
+                    self._discard(worker)
+                    raise ChildProcessCrashException(
+                        pid=worker.process.pid, exit_code=worker.process.exitcode
+                    )
+
+                if isinstance(event, StepWorkerDoneEvent):
+                    if event.recycle:
+                        worker.process.join()
+                        self._discard(worker)
+                    else:
+                        self._idle_workers.append(worker)
+                    return
+
+                yield event
+
+                if isinstance(event, ChildProcessSystemErrorEvent):
+                    # the worker exits after reporting an error it could not handle
+                    worker.process.join()
+                    self._discard(worker)
+                    return
+        finally:
+            if selector:
+                selector.unregister(worker.process)
+
+    def shutdown(self) -> None:
+        """Stop every worker in the pool. Idle workers are asked to exit; workers that are still
+        executing a step are terminated.
+        """
+        for worker in self._idle_workers:
+            worker.task_queue.put(None)
+
+        for worker in self._idle_workers:
+            worker.process.join(timeout=WORKER_SHUTDOWN_TIMEOUT)
+
+        for worker in list(self._workers):
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            self._discard(worker)
+
+        self._idle_workers = []
+
+    def _start_worker(self) -> StepWorker:
+        task_queue = self._multiprocessing_ctx.Queue()
+        event_queue = self._multiprocessing_ctx.Queue()
+        term_event = self._multiprocessing_ctx.Event()
+        max_memory_bytes = (
+            self._max_worker_memory_mb * 1024 * 1024
+            if self._max_worker_memory_mb is not None
+            else None
+        )
+        process = self._multiprocessing_ctx.Process(  # type: ignore
+            target=_execute_steps_in_worker_process,
+            args=(
+                task_queue,
+                event_queue,
+                term_event,
+                self._command,
+                self._max_steps_per_worker,
+                max_memory_bytes,
+            ),
+        )
+        process.start()
+        worker = StepWorker(process, task_queue, event_queue, term_event)
+        self._workers.append(worker)
+        return worker
+
+    def _discard(self, worker: StepWorker) -> None:
+        if worker in self._workers:
+            self._workers.remove(worker)
+            worker.close()
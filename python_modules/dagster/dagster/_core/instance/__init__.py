@@ -2,11 +2,12 @@
 import logging.config
 import os
 import sys
+import threading
 import warnings
 import weakref
 from abc import abstractmethod
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from enum import Enum
 from tempfile import TemporaryDirectory
 from types import TracebackType
@@ -49,9 +50,11 @@
 from dagster._core.instance.config import (
     DAGSTER_CONFIG_YAML_FILENAME,
     DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT,
+    DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS,
     get_default_tick_retention_settings,
     get_tick_retention_settings,
 )
+from dagster._core.instance.event_write_behind import EventWriteBehindQueue
 from dagster._core.instance.ref import InstanceRef
 from dagster._core.log_manager import get_log_record_metadata
 from dagster._core.origin import JobPythonOrigin
@@ -158,6 +161,8 @@
         ExecutionStepSnap,
         JobSnap,
     )
+    from dagster._core.snap.job_snapshot import JobLineageSnap
+    from dagster._core.snap.node import NodeDefsSnapshot
     from dagster._core.storage.asset_check_execution_record import (
         AssetCheckExecutionRecord,
         AssetCheckInstanceSupport,
@@ -203,6 +208,19 @@ def _is_batch_writing_enabled() -> bool:
     return _get_event_batch_size() > 0
 
 
+# Sets the maximum number of events that may be pending in the write-behind queue. When set to a
+# positive value, `handle_new_event` enqueues events of every type and returns immediately, and a
+# background thread coalesces pending events into `store_event_batch` calls. Run-level events flush
+# the queue and are written synchronously, so run status updates keep their ordering relative to
+# all other events of the run. Defaults to 0, which makes write-behind opt-in.
+def _get_event_write_behind_queue_size() -> int:
+    return int(os.getenv("DAGSTER_EVENT_WRITE_BEHIND_QUEUE_SIZE", "0"))
+
+
+def _is_write_behind_enabled() -> bool:
+    return _get_event_write_behind_queue_size() > 0
+
+
 def _check_run_equality(
     pipeline_run: DagsterRun, candidate_run: DagsterRun
 ) -> Mapping[str, tuple[Any, Any]]:
@@ -492,6 +510,10 @@ def __init__(
         # Used for batched event handling
         self._event_buffer: dict[str, list[EventLogEntry]] = defaultdict(list)
 
+        # Used for write-behind event handling, created on first use
+        self._event_write_behind_queue: Optional[EventWriteBehindQueue] = None
+        self._event_write_behind_queue_lock = threading.Lock()
+
     # ctors
 
     @public
@@ -905,6 +927,20 @@ def code_server_reload_timeout(self) -> int:
     def wait_for_local_code_server_processes_on_shutdown(self) -> bool:
         return self.code_server_settings.get("wait_for_local_processes_on_shutdown", False)
 
+    @property
+    def code_server_max_concurrent_location_loads(self) -> int:
+        return self.code_server_settings.get(
+            "max_concurrent_location_loads", DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS
+        )
+
+    @property
+    def code_server_location_load_timeout(self) -> Optional[int]:
+        return self.code_server_settings.get("location_load_timeout")
+
+    @property
+    def code_server_defer_job_snapshots(self) -> bool:
+        return self.code_server_settings.get("defer_job_snapshots", False)
+
     @property
     def run_monitoring_max_resume_run_attempts(self) -> int:
         return self.run_monitoring_settings.get("max_resume_run_attempts", 0)
@@ -949,6 +985,10 @@ def auto_materialize_respect_materialization_data_versions(self) -> bool:
             "respect_materialization_data_versions", False
         )
 
+    @property
+    def auto_materialize_skip_unchanged_entities(self) -> bool:
+        return self.get_settings("auto_materialize").get("skip_unchanged_entities", False)
+
     @property
     def auto_materialize_max_tick_retries(self) -> int:
         return self.get_settings("auto_materialize").get("max_tick_retries", 3)
@@ -1014,6 +1054,8 @@ def reindex(self, print_fn: PrintFn = lambda _: None) -> None:
         print_fn("Done.")
 
     def dispose(self) -> None:
+        if self._event_write_behind_queue:
+            self._event_write_behind_queue.shutdown()
         self._local_artifact_storage.dispose()
         self._run_storage.dispose()
         if self._run_coordinator:
@@ -1070,6 +1112,14 @@ def get_run_record_by_id(self, run_id: str) -> Optional[RunRecord]:
     def get_job_snapshot(self, snapshot_id: str) -> "JobSnap":
         return self._run_storage.get_job_snapshot(snapshot_id)
 
+    @traced
+    def get_job_snapshot_node_defs(self, snapshot_id: str) -> "NodeDefsSnapshot":
+        return self._run_storage.get_job_snapshot_node_defs(snapshot_id)
+
+    @traced
+    def get_job_snapshot_lineage(self, snapshot_id: str) -> Optional["JobLineageSnap"]:
+        return self._run_storage.get_job_snapshot_lineage(snapshot_id)
+
     @traced
     def has_job_snapshot(self, snapshot_id: str) -> bool:
         return self._run_storage.has_job_snapshot(snapshot_id)
@@ -1859,6 +1909,20 @@ def get_run_records(
             filters, limit, order_by, ascending, cursor, bucket_by
         )
 
+    async def get_run_records_async(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
+    ) -> Sequence[RunRecord]:
+        """Async variant of `get_run_records`, which does not block the event loop."""
+        return await self._run_storage.get_run_records_async(
+            filters, limit, order_by, ascending, cursor, bucket_by
+        )
+
     @traced
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         """Get run partition data for a given partitioned job."""
@@ -1914,6 +1978,40 @@ def get_records_for_run(
     ) -> "EventLogConnection":
         return self._event_storage.get_records_for_run(run_id, cursor, of_type, limit, ascending)
 
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", set["DagsterEventType"]]] = None,
+        page_size: Optional[int] = None,
+        ascending: bool = True,
+    ) -> Iterator["EventLogRecord"]:
+        """Yields all of the event log records of a run, fetching them from the event log storage
+        in bounded pages so that memory use does not grow with the size of the run.
+        """
+        from dagster._core.storage.event_log.base import DEFAULT_EVENT_LOG_PAGE_SIZE
+
+        return self._event_storage.iter_records_for_run(
+            run_id,
+            cursor,
+            of_type,
+            page_size if page_size is not None else DEFAULT_EVENT_LOG_PAGE_SIZE,
+            ascending,
+        )
+
+    async def get_records_for_run_async(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union["DagsterEventType", set["DagsterEventType"]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> "EventLogConnection":
+        """Async variant of `get_records_for_run`, which does not block the event loop."""
+        return await self._event_storage.get_records_for_run_async(
+            run_id, cursor, of_type, limit, ascending
+        )
+
     def watch_event_logs(self, run_id: str, cursor: Optional[str], cb: "EventHandlerFn") -> None:
         return self._event_storage.watch(run_id, cursor, cb)
 
@@ -2069,6 +2167,18 @@ def fetch_materializations(
         """
         return self._event_storage.fetch_materializations(records_filter, limit, cursor, ascending)
 
+    async def fetch_materializations_async(
+        self,
+        records_filter: Union[AssetKey, "AssetRecordsFilter"],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> "EventRecordsResult":
+        """Async variant of `fetch_materializations`, which does not block the event loop."""
+        return await self._event_storage.fetch_materializations_async(
+            records_filter, limit, cursor, ascending
+        )
+
     @traced
     @deprecated(breaking_version="2.0")
     def fetch_planned_materializations(
@@ -2302,6 +2412,21 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    @traced
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: "DagsterEventType",
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id of the given event type for each partition of each of a set
+        of asset keys.
+
+        Returns a mapping of asset key to a mapping of partition to storage id.
+        """
+        return self._event_storage.get_latest_storage_ids_by_partition_for_assets(
+            asset_keys, event_type
+        )
+
     @traced
     def get_latest_planned_materialization_info(
         self,
@@ -2430,11 +2555,18 @@ def handle_new_event(
         to the storage layer in a single batch. If an error occurrs during batch writing, then we
         fall back to iterative individual event writes.
 
+        If write-behind is enabled (via `DAGSTER_EVENT_WRITE_BEHIND_QUEUE_SIZE`), all events
+        except run-level events are instead placed on a bounded queue and written in batches by a
+        background thread, and subscribers are notified once the events have been stored.
+        Run-level events first flush the queue and are then handled synchronously.
+
         Args:
             event (EventLogEntry): The event to handle.
             batch_metadata (Optional[DagsterEventBatchMetadata]): Metadata for batch writing.
         """
-        from dagster._core.events import RunFailureReason
+        if _is_write_behind_enabled():
+            self._handle_new_event_write_behind(event)
+            return
 
         if batch_metadata is None or not _is_batch_writing_enabled():
             events = [event]
@@ -2447,6 +2579,45 @@ def handle_new_event(
             else:
                 return
 
+        self._store_and_dispatch_events(events)
+
+    def _handle_new_event_write_behind(self, event: "EventLogEntry") -> None:
+        from dagster._core.events import DagsterEventType
+
+        write_behind_queue = self._get_event_write_behind_queue()
+        dagster_event = event.dagster_event
+        if dagster_event and dagster_event.is_job_event:
+            # Run-level events drive run status and signal the end of a run, so everything queued
+            # ahead of them is written before they are handled synchronously.
+            write_behind_queue.flush()
+            self._store_and_dispatch_events([event])
+            return
+
+        if dagster_event and dagster_event.event_type == DagsterEventType.STEP_START:
+            # Make the events of previously executed steps visible to the step that is starting,
+            # e.g. so that data version lookups see upstream materializations.
+            write_behind_queue.flush()
+
+        write_behind_queue.put(event)
+
+    def _get_event_write_behind_queue(self) -> EventWriteBehindQueue:
+        if self._event_write_behind_queue is None:
+            with self._event_write_behind_queue_lock:
+                if self._event_write_behind_queue is None:
+                    self._event_write_behind_queue = EventWriteBehindQueue(
+                        self._store_events,
+                        max_size=_get_event_write_behind_queue_size(),
+                        dispatch_fn=self._dispatch_events,
+                    )
+        return self._event_write_behind_queue
+
+    def _store_events(self, events: Sequence["EventLogEntry"]) -> None:
+        if len(events) == 1:
+            self._event_storage.store_event(events[0])
+        else:
+            self._event_storage.store_event_batch(events)
+
+    def _store_and_dispatch_events(self, events: Sequence["EventLogEntry"]) -> None:
         if len(events) == 1:
             self._event_storage.store_event(events[0])
         else:
@@ -2465,6 +2636,11 @@ def handle_new_event(
                 for event in events:
                     self._event_storage.store_event(event)
 
+        self._dispatch_events(events)
+
+    def _dispatch_events(self, events: Sequence["EventLogEntry"]) -> None:
+        from dagster._core.events import RunFailureReason
+
         for event in events:
             run_id = event.run_id
             if (
@@ -194,6 +194,7 @@ def python_logs_config_schema() -> Field:
 
 
 DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT = 180
+DEFAULT_MAX_CONCURRENT_CODE_LOCATION_LOADS = 8
 
 
 def get_default_tick_retention_settings(
@@ -394,11 +395,32 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                 ),
             }
         ),
+        "snapshot_cache": Field(
+            {
+                "enabled": Field(
+                    Bool,
+                    is_required=False,
+                    default_value=True,
+                    description="Whether to cache job and execution plan snapshots read from run "
+                    "storage in memory.",
+                ),
+                "max_size_bytes": Field(
+                    int,
+                    is_required=False,
+                    description="The maximum total size of the serialized snapshots to keep in "
+                    "the in-memory snapshot cache of each process.",
+                ),
+            },
+            is_required=False,
+        ),
         "code_servers": Field(
             {
                 "local_startup_timeout": Field(int, is_required=False),
                 "reload_timeout": Field(int, is_required=False),
                 "wait_for_local_processes_on_shutdown": Field(bool, is_required=False),
+                "max_concurrent_location_loads": Field(int, is_required=False),
+                "location_load_timeout": Field(int, is_required=False),
+                "defer_job_snapshots": Field(bool, is_required=False),
             },
             is_required=False,
         ),
@@ -422,6 +444,14 @@ def dagster_instance_config_schema() -> Mapping[str, Field]:
                     ),
                 ),
                 "use_sensors": Field(BoolSource, is_required=False),
+                "skip_unchanged_entities": Field(
+                    BoolSource,
+                    is_required=False,
+                    description=(
+                        "Whether to skip evaluating the automation conditions of entities whose"
+                        " inputs have not changed since their previous evaluation"
+                    ),
+                ),
                 "use_threads": Field(Bool, is_required=False, default_value=False),
                 "num_workers": Field(
                     int,
@@ -0,0 +1,242 @@
+import atexit
+import logging
+import os
+import queue
+import threading
+import weakref
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Optional, Union
+
+import dagster._check as check
+
+if TYPE_CHECKING:
+    from dagster._core.events.log import EventLogEntry
+
+
+class _FlushRequest:
+    """Marker placed on the queue to signal that all events ahead of it should be written."""
+
+    def __init__(self, shutdown: bool = False):
+        self.shutdown = shutdown
+        self.done = threading.Event()
+
+
+class EventWriteBehindQueue:
+    """Bounded in-process queue that hands events off to a background flusher thread.
+
+    Whenever the flusher wakes up it drains every event that accumulated while the previous write
+    was in flight and passes them to `write_fn` as a single batch, so events of all types are
+    coalesced into as few storage round trips as the storage latency allows. Events are always
+    written in the order in which they were enqueued. Producers block once `max_size` events are
+    pending, which bounds memory usage and applies backpressure when storage falls behind.
+
+    If writing a batch fails, its events are written one at a time. Events that still cannot be
+    written are kept, and retried by the next call to `flush` or `shutdown`, which raise the error
+    to their caller if the retry fails too. Only `write_fn` is retried: each event is passed to
+    `dispatch_fn` once, after it has been written, so that a failing subscriber can't cause an
+    event to be written more than once.
+
+    Args:
+        write_fn (Callable[[Sequence[EventLogEntry]], None]): Called on the flusher thread with
+            each batch of events, in order.
+        max_size (int): Maximum number of events that may be pending at once. Also bounds the
+            size of a single batch.
+        logger (Optional[logging.Logger]): Logger that write and dispatch failures are reported
+            to.
+        dispatch_fn (Optional[Callable[[Sequence[EventLogEntry]], None]]): Called with the events
+            that have been written, in the order in which they were written.
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Sequence["EventLogEntry"]], None],
+        max_size: int,
+        logger: Optional[logging.Logger] = None,
+        dispatch_fn: Optional[Callable[[Sequence["EventLogEntry"]], None]] = None,
+    ):
+        self._write_fn = check.callable_param(write_fn, "write_fn")
+        self._dispatch_fn = check.opt_callable_param(dispatch_fn, "dispatch_fn")
+        self._max_size = check.int_param(max_size, "max_size")
+        check.invariant(self._max_size > 0, "max_size must be positive")
+        self._logger = logger or logging.getLogger("dagster")
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue[Union[EventLogEntry, _FlushRequest]] = queue.Queue(
+            maxsize=self._max_size
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._pid = os.getpid()
+        self._exit_flush_registered = False
+        # events that could not be written by the flusher thread, protected by _lock
+        self._failed_events: list[EventLogEntry] = []
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def put(self, event: "EventLogEntry") -> None:
+        """Enqueue an event to be written by the flusher thread."""
+        if self._is_flusher_thread():
+            # Events reported while a batch is being written (e.g. by an event subscriber) cannot
+            # wait on the flusher, since that is the current thread.
+            self._write([event])
+            return
+
+        self._ensure_started()
+        self._queue.put(event)
+
+    def flush(self) -> None:
+        """Block until every event enqueued before this call has been written, and retry the
+        events that the flusher thread failed to write.
+        """
+        self._request_flush(shutdown=False)
+        self._retry_failed_events()
+
+    def shutdown(self) -> None:
+        """Write all pending events and stop the flusher thread. The queue is restarted on the
+        next call to `put`.
+        """
+        self._request_flush(shutdown=True)
+        self._retry_failed_events()
+
+    def _retry_failed_events(self) -> None:
+        if self._is_flusher_thread():
+            return
+
+        with self._lock:
+            failed_events = self._failed_events
+            self._failed_events = []
+
+        written: list[EventLogEntry] = []
+        try:
+            for event in failed_events:
+                self._write_fn([event])
+                written.append(event)
+        except Exception:
+            # keep the events that were not written for the next retry, ahead of any that failed
+            # in the meantime, and raise to the caller
+            with self._lock:
+                self._failed_events = failed_events[len(written) :] + self._failed_events
+            raise
+        finally:
+            self._dispatch(written)
+
+    def _request_flush(self, shutdown: bool) -> None:
+        if self._is_flusher_thread():
+            return
+
+        with self._lock:
+            thread = self._thread if self._pid == os.getpid() else None
+            if thread is None or not thread.is_alive():
+                return
+            request = _FlushRequest(shutdown=shutdown)
+            self._queue.put(request)
+            if shutdown:
+                self._thread = None
+
+        request.done.wait()
+        if shutdown:
+            thread.join()
+
+    def _is_flusher_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._pid != os.getpid():
+                # The queue was inherited from a parent process via fork. Anything still pending
+                # belongs to the parent, and the parent's flusher thread does not exist here.
+                self._queue = queue.Queue(maxsize=self._max_size)
+                self._thread = None
+                self._pid = os.getpid()
+
+            if self._thread is not None and self._thread.is_alive():
+                return
+
+            self._thread = threading.Thread(
+                target=self._run, name="dagster-event-write-behind", daemon=True
+            )
+            self._thread.start()
+            if not self._exit_flush_registered:
+                _register_exit_flush(self)
+                self._exit_flush_registered = True
+
+    def _run(self) -> None:
+        while True:
+            batch: list[EventLogEntry] = []
+            item = self._queue.get()
+            while True:
+                if isinstance(item, _FlushRequest):
+                    self._write(batch)
+                    batch = []
+                    item.done.set()
+                    if item.shutdown:
+                        return
+                else:
+                    batch.append(item)
+
+                if len(batch) >= self._max_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            self._write(batch)
+
+    def _write(self, events: Sequence["EventLogEntry"]) -> None:
+        if not events:
+            return
+        try:
+            self._write_fn(events)
+        except Exception:
+            if len(events) == 1:
+                self._handle_failed_event(events[0])
+                return
+            self._logger.exception(
+                f"Exception while writing a batch of {len(events)} buffered events to the event"
+                " log. Falling back to writing them one at a time."
+            )
+        else:
+            self._dispatch(events)
+            return
+
+        for event in events:
+            try:
+                self._write_fn([event])
+            except Exception:
+                self._handle_failed_event(event)
+            else:
+                self._dispatch([event])
+
+    def _dispatch(self, events: Sequence["EventLogEntry"]) -> None:
+        if not events or self._dispatch_fn is None:
+            return
+        try:
+            self._dispatch_fn(events)
+        except Exception:
+            # The events have already been written, so they are not retried.
+            self._logger.exception(
+                f"Exception while dispatching {len(events)} written events to subscribers."
+            )
+
+    def _handle_failed_event(self, event: "EventLogEntry") -> None:
+        # The flusher keeps draining the queue rather than blocking every subsequent event, and
+        # leaves the event to be retried by the next flush, which surfaces the error to its caller.
+        self._logger.exception(
+            "Exception while writing a buffered event to the event log. It will be retried on the"
+            " next flush."
+        )
+        with self._lock:
+            self._failed_events.append(event)
+
+
+def _register_exit_flush(write_behind_queue: EventWriteBehindQueue) -> None:
+    queue_ref = weakref.ref(write_behind_queue)
+
+    def _flush_on_exit() -> None:
+        write_behind_queue = queue_ref()
+        if write_behind_queue is not None:
+            write_behind_queue.shutdown()
+
+    atexit.register(_flush_on_exit)
@@ -451,6 +451,7 @@ def from_dir(
             "run_monitoring",
             "run_retries",
             "code_servers",
+            "snapshot_cache",
             "retention",
             "backfills",
             "sensors",
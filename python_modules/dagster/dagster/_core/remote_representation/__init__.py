@@ -29,6 +29,7 @@
     RemoteJobSubsetResult as RemoteJobSubsetResult,
     RepositoryErrorSnap as RepositoryErrorSnap,
     RepositorySnap as RepositorySnap,
+    RepositorySnapUpdate as RepositorySnapUpdate,
     ScheduleExecutionErrorSnap as ScheduleExecutionErrorSnap,
     ScheduleSnap as ScheduleSnap,
     SensorExecutionErrorSnap as SensorExecutionErrorSnap,
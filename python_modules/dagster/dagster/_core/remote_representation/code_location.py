@@ -3,7 +3,7 @@
 from abc import abstractmethod
 from collections.abc import Mapping, Sequence
 from contextlib import AbstractContextManager
-from functools import cached_property
+from functools import cached_property, partial
 from typing import TYPE_CHECKING, AbstractSet, Any, Optional, Union, cast  # noqa: UP035
 
 import dagster._check as check
@@ -11,7 +11,7 @@
 from dagster._api.list_repositories import sync_list_repositories_grpc
 from dagster._api.notebook_data import sync_get_streaming_external_notebook_data_grpc
 from dagster._api.snapshot_execution_plan import sync_get_external_execution_plan_grpc
-from dagster._api.snapshot_job import sync_get_external_job_subset_grpc
+from dagster._api.snapshot_job import sync_get_external_job_subset_grpc, sync_get_job_data_snap_grpc
 from dagster._api.snapshot_partition import (
     sync_get_external_partition_config_grpc,
     sync_get_external_partition_names_grpc,
@@ -44,6 +44,8 @@
     RemoteRepository,
 )
 from dagster._core.remote_representation.external_data import (
+    JobDataSnap,
+    JobRefSnap,
     PartitionNamesSnap,
     RepositorySnap,
     ScheduleExecutionErrorSnap,
@@ -56,6 +58,7 @@
     CodeLocationOrigin,
     GrpcServerCodeLocationOrigin,
     InProcessCodeLocationOrigin,
+    RemoteRepositoryOrigin,
 )
 from dagster._core.snap.execution_plan_snapshot import snapshot_from_execution_plan
 from dagster._grpc.impl import (
@@ -729,9 +732,12 @@ def __init__(
 
             self._container_context = list_repositories_response.container_context
 
+            # with deferred snapshots, JobDataSnaps are only fetched when a job is first accessed
+            self._defer_snapshots = instance.code_server_defer_job_snapshots
             self._repository_snaps = sync_get_streaming_external_repositories_data_grpc(
                 self.client,
                 self,
+                defer_snapshots=self._defer_snapshots,
             )
 
             self.remote_repositories = {
@@ -742,6 +748,11 @@ def __init__(
                         code_location=self,
                     ),
                     instance,
+                    ref_to_data_fn=(
+                        partial(self._get_job_data_snap, repo_name)
+                        if self._defer_snapshots
+                        else None
+                    ),
                 )
                 for repo_name, repo_data in self._repository_snaps.items()
             }
@@ -749,6 +760,11 @@ def __init__(
             self.cleanup()
             raise
 
+    def _get_job_data_snap(self, repository_name: str, job_ref: JobRefSnap) -> JobDataSnap:
+        return sync_get_job_data_snap_grpc(
+            self.client, RemoteRepositoryOrigin(self.origin, repository_name), job_ref
+        )
+
     @property
     def server_id(self) -> str:
         return check.not_none(self._server_id)
@@ -89,7 +89,7 @@
 from dagster._core.storage.io_manager import IOManagerDefinition
 from dagster._core.storage.tags import COMPUTE_KIND_TAG
 from dagster._core.utils import is_valid_email
-from dagster._record import IHaveNew, record, record_custom
+from dagster._record import IHaveNew, copy, record, record_custom
 from dagster._serdes import whitelist_for_serdes
 from dagster._serdes.serdes import (
     FieldSerializer,
@@ -747,6 +747,55 @@ class RepositoryErrorSnap:
     error: Optional[SerializableErrorInfo]
 
 
+@whitelist_for_serdes
+@record
+class RepositorySnapUpdate:
+    """Sent by a code server in place of a RepositorySnap to clients that identify the version of
+    the RepositorySnap they already hold, so that the parts they hold are not sent again.
+
+    If `base_snapshot_id` is None, `repository_snap` is the full RepositorySnap. Otherwise the
+    update is relative to the RepositorySnap with id `base_snapshot_id`, and `repository_snap` is
+    None if nothing changed. If something changed, its `job_datas` and `asset_nodes` only contain
+    the entries that differ from the base, and `job_names` and `asset_keys` list all entries in
+    order.
+    """
+
+    snapshot_id: str
+    base_snapshot_id: Optional[str]
+    repository_snap: Optional[RepositorySnap]
+    job_names: Optional[Sequence[str]] = None
+    asset_keys: Optional[Sequence[AssetKey]] = None
+
+    def apply(self, base: Optional[RepositorySnap]) -> RepositorySnap:
+        """Returns the RepositorySnap with id `snapshot_id`, given the RepositorySnap with id
+        `base_snapshot_id`.
+        """
+        if self.base_snapshot_id is None:
+            return check.not_none(self.repository_snap)
+
+        base = check.not_none(base, "Base RepositorySnap is required to apply a delta update")
+        if self.repository_snap is None:
+            return base
+
+        job_datas = self.repository_snap.job_datas
+        if self.job_names is not None:
+            job_datas_by_name = {job_data.name: job_data for job_data in base.job_datas or []}
+            job_datas_by_name.update(
+                {job_data.name: job_data for job_data in self.repository_snap.job_datas or []}
+            )
+            job_datas = [job_datas_by_name[job_name] for job_name in self.job_names]
+
+        asset_nodes = self.repository_snap.asset_nodes
+        if self.asset_keys is not None:
+            asset_nodes_by_key = {node.asset_key: node for node in base.asset_nodes}
+            asset_nodes_by_key.update(
+                {node.asset_key: node for node in self.repository_snap.asset_nodes}
+            )
+            asset_nodes = [asset_nodes_by_key[asset_key] for asset_key in self.asset_keys]
+
+        return copy(self.repository_snap, job_datas=job_datas, asset_nodes=asset_nodes)
+
+
 @whitelist_for_serdes(storage_name="ExternalSensorExecutionErrorData")
 @record
 class SensorExecutionErrorSnap:
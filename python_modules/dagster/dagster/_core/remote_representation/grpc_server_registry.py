@@ -94,7 +94,11 @@ def __init__(
             additional_timeout_msg, "additional_timeout_msg"
         )
 
+        # Guards _active_entries, _all_processes and _origin_locks
         self._lock = threading.Lock()
+        # Held while a server is created for an origin, so that servers for different origins
+        # can start up concurrently
+        self._origin_locks: dict[str, threading.Lock] = {}
 
         self._all_processes: list[GrpcServerProcess] = []
 
@@ -137,22 +141,13 @@ def reload_grpc_endpoint(
         self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin
     ) -> GrpcServerEndpoint:
         check.inst_param(code_location_origin, "code_location_origin", CodeLocationOrigin)
-        with self._lock:
-            origin_id = code_location_origin.get_id()
-            if origin_id in self._active_entries:
-                # Free the map entry for this origin so that _get_grpc_endpoint will create
-                # a new process
-                del self._active_entries[origin_id]
-
-            return self._get_grpc_endpoint(code_location_origin)
+        return self._get_grpc_endpoint(code_location_origin, reload=True)
 
     def get_grpc_endpoint(
         self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin
     ) -> GrpcServerEndpoint:
         check.inst_param(code_location_origin, "code_location_origin", CodeLocationOrigin)
-
-        with self._lock:
-            return self._get_grpc_endpoint(code_location_origin)
+        return self._get_grpc_endpoint(code_location_origin, reload=False)
 
     def _get_loadable_target_origin(
         self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin
@@ -164,8 +159,12 @@ def _get_loadable_target_origin(
         )
         return code_location_origin.loadable_target_origin
 
+    def _get_origin_lock(self, origin_id: str) -> threading.Lock:
+        with self._lock:
+            return self._origin_locks.setdefault(origin_id, threading.Lock())
+
     def _get_grpc_endpoint(
-        self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin
+        self, code_location_origin: ManagedGrpcPythonEnvCodeLocationOrigin, reload: bool
     ) -> GrpcServerEndpoint:
         origin_id = code_location_origin.get_id()
         loadable_target_origin = self._get_loadable_target_origin(code_location_origin)
@@ -175,45 +174,53 @@ def _get_grpc_endpoint(
                 f" {code_location_origin.location_name}"
             )
 
-        if origin_id not in self._active_entries:
-            refresh_server = True
-        else:
-            active_entry = self._active_entries[origin_id]
-            refresh_server = loadable_target_origin != active_entry.loadable_target_origin
-
-        new_server_id: Optional[str]
-        if refresh_server:
-            try:
-                new_server_id = str(uuid.uuid4())
-                server_process = GrpcServerProcess(
-                    instance_ref=self.instance_ref,
-                    location_name=code_location_origin.location_name,
-                    loadable_target_origin=loadable_target_origin,
-                    heartbeat=True,
-                    heartbeat_timeout=self._heartbeat_ttl,
-                    fixed_server_id=new_server_id,
-                    startup_timeout=self._startup_timeout,
-                    log_level=self._log_level,
-                    inject_env_vars_from_instance=self._inject_env_vars_from_instance,
-                    container_image=self._container_image,
-                    container_context=self._container_context,
-                    additional_timeout_msg=self._additional_timeout_msg,
-                )
-                self._all_processes.append(server_process)
-                self._active_entries[origin_id] = ServerRegistryEntry(
-                    process=server_process,
-                    loadable_target_origin=loadable_target_origin,
-                    creation_timestamp=get_current_timestamp(),
-                    server_id=new_server_id,
-                )
-            except Exception:
-                self._active_entries[origin_id] = ErrorRegistryEntry(
-                    error=serializable_error_info_from_exc_info(sys.exc_info()),
-                    loadable_target_origin=loadable_target_origin,
-                    creation_timestamp=get_current_timestamp(),
-                )
-
-        active_entry = self._active_entries[origin_id]
+        with self._get_origin_lock(origin_id):
+            with self._lock:
+                if reload:
+                    # Free the map entry for this origin so that a new process is created
+                    self._active_entries.pop(origin_id, None)
+
+                active_entry = self._active_entries.get(origin_id)
+
+            if (
+                active_entry is None
+                or loadable_target_origin != active_entry.loadable_target_origin
+            ):
+                # Wait for the new server to start up without holding _lock, so that
+                # endpoints for other origins can be returned or created in the meantime
+                try:
+                    new_server_id = str(uuid.uuid4())
+                    server_process = GrpcServerProcess(
+                        instance_ref=self.instance_ref,
+                        location_name=code_location_origin.location_name,
+                        loadable_target_origin=loadable_target_origin,
+                        heartbeat=True,
+                        heartbeat_timeout=self._heartbeat_ttl,
+                        fixed_server_id=new_server_id,
+                        startup_timeout=self._startup_timeout,
+                        log_level=self._log_level,
+                        inject_env_vars_from_instance=self._inject_env_vars_from_instance,
+                        container_image=self._container_image,
+                        container_context=self._container_context,
+                        additional_timeout_msg=self._additional_timeout_msg,
+                    )
+                    active_entry = ServerRegistryEntry(
+                        process=server_process,
+                        loadable_target_origin=loadable_target_origin,
+                        creation_timestamp=get_current_timestamp(),
+                        server_id=new_server_id,
+                    )
+                    with self._lock:
+                        self._all_processes.append(server_process)
+                        self._active_entries[origin_id] = active_entry
+                except Exception:
+                    active_entry = ErrorRegistryEntry(
+                        error=serializable_error_info_from_exc_info(sys.exc_info()),
+                        loadable_target_origin=loadable_target_origin,
+                        creation_timestamp=get_current_timestamp(),
+                    )
+                    with self._lock:
+                        self._active_entries[origin_id] = active_entry
 
         if isinstance(active_entry, ErrorRegistryEntry):
             raise DagsterUserCodeProcessError(
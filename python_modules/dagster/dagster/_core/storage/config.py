@@ -17,19 +17,18 @@ class MySqlStorageConfigDb(TypedDict):
     port: int
 
 
+def mysql_db_config() -> UserConfigSchema:
+    return {
+        "username": StringSource,
+        "password": StringSource,
+        "hostname": StringSource,
+        "db_name": StringSource,
+        "port": Field(IntSource, is_required=False, default_value=3306),
+    }
+
+
 def mysql_config() -> UserConfigSchema:
-    return Selector(
-        {
-            "mysql_url": StringSource,
-            "mysql_db": {
-                "username": StringSource,
-                "password": StringSource,
-                "hostname": StringSource,
-                "db_name": StringSource,
-                "port": Field(IntSource, is_required=False, default_value=3306),
-            },
-        }
-    )
+    return Selector({"mysql_url": StringSource, "mysql_db": mysql_db_config()})
 
 
 class PostgresStorageConfig(TypedDict):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import TYPE_CHECKING, AbstractSet, NamedTuple, Optional, Union  # noqa: UP035
 
 import dagster._check as check
@@ -34,6 +34,7 @@
 from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
 from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_value
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.storage_executor import run_storage_call
 from dagster._core.storage.tags import MULTIDIMENSIONAL_PARTITION_PREFIX
 from dagster._utils import PrintFn
 from dagster._utils.concurrency import ConcurrencyClaimStatus, ConcurrencyKeyInfo
@@ -44,6 +45,9 @@
     from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
 
 
+DEFAULT_EVENT_LOG_PAGE_SIZE = 1000
+
+
 class EventLogConnection(NamedTuple):
     records: Sequence[EventLogRecord]
     cursor: str
@@ -244,6 +248,75 @@ def get_records_for_run(
             limit (Optional[int]): Max number of records to return.
         """
 
+    async def get_records_for_run_async(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, set[DagsterEventType]]] = None,
+        limit: Optional[int] = None,
+        ascending: bool = True,
+    ) -> EventLogConnection:
+        """Async variant of `get_records_for_run`, which does not block the event loop. By default,
+        the sync method is run on the bounded storage executor.
+        """
+        return await run_storage_call(
+            self.get_records_for_run, run_id, cursor, of_type, limit, ascending
+        )
+
+    def iter_records_for_run(
+        self,
+        run_id: str,
+        cursor: Optional[str] = None,
+        of_type: Optional[Union[DagsterEventType, set[DagsterEventType]]] = None,
+        page_size: int = DEFAULT_EVENT_LOG_PAGE_SIZE,
+        ascending: bool = True,
+    ) -> Iterator[EventLogRecord]:
+        """Yields all of the event log records of a run after the given cursor. Records are fetched
+        in pages of `page_size`, each resuming after the storage id of the last record of the
+        previous page, so memory use is bounded by the page size rather than the size of the run.
+        No connection is held open between pages.
+
+        Args:
+            run_id (str): The id of the run for which to fetch logs.
+            cursor (Optional[str]): Cursor value after which to start fetching records.
+            of_type (Optional[DagsterEventType]): the dagster event type to filter the logs.
+            page_size (int): Max number of records to fetch per query.
+        """
+        check.int_param(page_size, "page_size")
+        check.invariant(page_size > 0, "page_size must be positive")
+
+        has_more = True
+        while has_more:
+            connection = self.get_records_for_run(run_id, cursor, of_type, page_size, ascending)
+            yield from connection.records
+            cursor = connection.cursor
+            has_more = connection.has_more
+
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Mapping[str, EventLogConnection]:
+        """Get the event log records after the given cursor for each of a set of runs. Storages
+        that can fetch the records of many runs in a single query should override this.
+
+        Args:
+            cursors_by_run_id (Mapping[str, Optional[str]]): The cursor to fetch records after, for
+                each run id.
+            limit (Optional[int]): Max number of records to return across all runs. Runs that
+                were not queried because the limit was reached are omitted from the result.
+        """
+        connections_by_run_id = {}
+        remaining = limit
+        for run_id, cursor in cursors_by_run_id.items():
+            if remaining is not None and remaining <= 0:
+                break
+            connection = self.get_records_for_run(run_id, cursor, limit=remaining)
+            connections_by_run_id[run_id] = connection
+            if remaining is not None:
+                remaining -= len(connection.records)
+        return connections_by_run_id
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         """Get a summary of events that have ocurred in a run."""
         return build_run_stats_from_events(
@@ -382,6 +455,26 @@ def update_asset_cached_status_data(
     ) -> None:
         pass
 
+    def can_maintain_asset_status_cache_on_write(self) -> bool:
+        """Whether the storage applies partition status changes to the cached status of each asset
+        as events are stored, so that cache values marked as maintained on write can be read
+        without scanning the event log.
+        """
+        return False
+
+    def replace_asset_cached_status_data(
+        self,
+        asset_key: AssetKey,
+        cache_values: "AssetStatusCacheValue",
+        expected_cache_values: Optional["AssetStatusCacheValue"],
+    ) -> bool:
+        """Atomically replaces the cached status of the asset, if it is still equal to the expected
+        cache value and no event for the asset has been stored after the latest storage id of the
+        new cache value. Returns whether the cached status was replaced. Only supported by storages
+        that maintain the cached status on write.
+        """
+        raise NotImplementedError()
+
     def get_asset_keys(
         self,
         prefix: Optional[Sequence[str]] = None,
@@ -476,6 +569,27 @@ def get_latest_storage_id_by_partition(
     ) -> Mapping[str, int]:
         pass
 
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        """Fetch the latest storage id of the given event type for each partition of each of a set
+        of asset keys. Storages that can fetch the storage ids of many assets in a single query
+        should override this.
+
+        Returns a mapping of asset key to a mapping of partition to storage id. Asset keys without
+        any partitioned events are omitted.
+        """
+        latest_storage_ids_by_asset_key = {}
+        for asset_key in asset_keys:
+            latest_storage_id_by_partition = self.get_latest_storage_id_by_partition(
+                asset_key, event_type
+            )
+            if latest_storage_id_by_partition:
+                latest_storage_ids_by_asset_key[asset_key] = latest_storage_id_by_partition
+        return latest_storage_ids_by_asset_key
+
     @abstractmethod
     def get_latest_tags_by_partition(
         self,
@@ -625,6 +739,20 @@ def fetch_materializations(
     ) -> EventRecordsResult:
         raise NotImplementedError()
 
+    async def fetch_materializations_async(
+        self,
+        records_filter: Union[AssetKey, AssetRecordsFilter],
+        limit: int,
+        cursor: Optional[str] = None,
+        ascending: bool = False,
+    ) -> EventRecordsResult:
+        """Async variant of `fetch_materializations`, which does not block the event loop. By
+        default, the sync method is run on the bounded storage executor.
+        """
+        return await run_storage_call(
+            self.fetch_materializations, records_filter, limit, cursor, ascending
+        )
+
     @abstractmethod
     def fetch_observations(
         self,
@@ -81,6 +81,14 @@ def upgrade(self):
 
     def store_event(self, event):
         super().store_event(event)
+        self._notify_handlers(event)
+
+    def store_event_batch(self, events):
+        super().store_event_batch(events)
+        for event in events:
+            self._notify_handlers(event)
+
+    def _notify_handlers(self, event):
         self._storage_id += 1
 
         handlers = list(self._handlers[event.run_id])
@@ -1,13 +1,12 @@
+import logging
 import os
 import threading
-from typing import TYPE_CHECKING, Callable, NamedTuple, Optional
+import time
+from typing import Callable, NamedTuple, Optional
 
 import dagster._check as check
 from dagster._core.events.log import EventLogEntry
-from dagster._core.storage.event_log.base import EventLogCursor, EventLogStorage
-
-if TYPE_CHECKING:
-    from collections.abc import MutableMapping
+from dagster._core.storage.event_log.base import EventLogConnection, EventLogCursor, EventLogStorage
 
 INIT_POLL_PERIOD = 0.250  # 250ms
 MAX_POLL_PERIOD = 16.0  # 16s
@@ -25,14 +24,40 @@ class CallbackAfterCursor(NamedTuple):
     callback: Callable[[EventLogEntry, str], None]
 
 
+class WatchedRun:
+    """The polling state of a single watched run_id.
+
+    cursor (Optional[str]): cursor after which to fetch the next EventLogEntrys for the run
+    callbacks (list[CallbackAfterCursor]): callbacks of the Observers watching the run
+    poll_period (float): seconds between polls of the run, which backs off while the run is idle
+    next_poll_time (float): monotonic time at which the run is next due to be polled
+    """
+
+    def __init__(self, cursor: Optional[str], next_poll_time: float):
+        self.cursor = cursor
+        self.callbacks: list[CallbackAfterCursor] = []
+        self.poll_period = INIT_POLL_PERIOD
+        self.next_poll_time = next_poll_time
+
+
+def _storage_id_for_cursor(cursor: Optional[str]) -> Optional[int]:
+    if not cursor:
+        return None
+    cursor_obj = EventLogCursor.parse(cursor)
+    return cursor_obj.storage_id() if cursor_obj.is_id_cursor() else None
+
+
 class SqlPollingEventWatcher:
-    """Event Log Watcher that uses a multithreaded polling approach to retrieving new events for run_ids
-    This class' job is to manage a collection of threads that each poll the event log for a given run_id
-    Uses one thread (SqlPollingRunIdEventWatcherThread) per watched run_id.
+    """Event Log Watcher that polls the event log for new events of all watched run_ids from a
+    single thread. Every INIT_POLL_PERIOD, the runs that are due to be polled are fetched with one
+    call to `EventLogStorage.get_records_for_runs`, and the new EventLogEntrys are fanned out to the
+    callbacks watching each run. Runs without new events back off exponentially, up to
+    MAX_POLL_PERIOD between polls.
 
     LOCKING INFO:
-        ORDER: _dict_lock -> run_id_thread.callback_fn_list_lock
-        INVARIANTS: _dict_lock protects _run_id_to_watcher_dict
+        INVARIANTS: _lock protects _watched_runs and the WatchedRuns it contains. It is reentrant
+            and held while callbacks are executed, so that callbacks may unwatch runs, and no
+            callback is executed after it has been unwatched.
     """
 
     def __init__(self, event_log_storage: EventLogStorage):
@@ -40,15 +65,18 @@ def __init__(self, event_log_storage: EventLogStorage):
             event_log_storage, "event_log_storage", EventLogStorage
         )
 
-        # INVARIANT: dict_lock protects _run_id_to_watcher_dict
-        self._dict_lock: threading.Lock = threading.Lock()
-        self._run_id_to_watcher_dict: MutableMapping[str, SqlPollingRunIdEventWatcherThread] = {}
+        # INVARIANT: _lock protects _watched_runs
+        self._lock: threading.RLock = threading.RLock()
+        self._watched_runs: dict[str, WatchedRun] = {}
+        self._should_thread_exit = threading.Event()
+        self._thread: Optional[threading.Thread] = None
         self._disposed = False
+        self._chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
 
     def has_run_id(self, run_id: str) -> bool:
         run_id = check.str_param(run_id, "run_id")
-        with self._dict_lock:
-            _has_run_id = run_id in self._run_id_to_watcher_dict
+        with self._lock:
+            _has_run_id = run_id in self._watched_runs
         return _has_run_id
 
     def watch_run(
@@ -62,14 +90,25 @@ def watch_run(
         callback = check.callable_param(callback, "callback")
         check.invariant(not self._disposed, "Attempted to watch_run after close")
 
-        with self._dict_lock:
-            if run_id not in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id] = SqlPollingRunIdEventWatcherThread(
-                    self._event_log_storage, run_id
+        with self._lock:
+            now = time.monotonic()
+            if run_id not in self._watched_runs:
+                # only fetch the events that the first Observer of the run has not seen yet
+                self._watched_runs[run_id] = WatchedRun(
+                    cursor=cursor if _storage_id_for_cursor(cursor) is not None else None,
+                    next_poll_time=now + INIT_POLL_PERIOD,
+                )
+            watched_run = self._watched_runs[run_id]
+            watched_run.callbacks.append(CallbackAfterCursor(cursor, callback))
+            # a new Observer should see new events promptly, even if the run has been idle
+            watched_run.poll_period = INIT_POLL_PERIOD
+            watched_run.next_poll_time = min(watched_run.next_poll_time, now + INIT_POLL_PERIOD)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="sql-event-watch", daemon=True
                 )
-                self._run_id_to_watcher_dict[run_id].daemon = True
-                self._run_id_to_watcher_dict[run_id].start()
-            self._run_id_to_watcher_dict[run_id].add_callback(cursor, callback)
+                self._thread.start()
 
     def unwatch_run(
         self,
@@ -78,113 +117,85 @@ def unwatch_run(
     ) -> None:
         run_id = check.str_param(run_id, "run_id")
         handler = check.callable_param(handler, "handler")
-        with self._dict_lock:
-            if run_id in self._run_id_to_watcher_dict:
-                self._run_id_to_watcher_dict[run_id].remove_callback(handler)
-                if self._run_id_to_watcher_dict[run_id].should_thread_exit.is_set():
-                    del self._run_id_to_watcher_dict[run_id]
+        with self._lock:
+            watched_run = self._watched_runs.get(run_id)
+            if watched_run is None:
+                return
+            watched_run.callbacks = [
+                callback_with_cursor
+                for callback_with_cursor in watched_run.callbacks
+                if callback_with_cursor.callback != handler
+            ]
+            if not watched_run.callbacks:
+                del self._watched_runs[run_id]
 
     def close(self) -> None:
         if not self._disposed:
             self._disposed = True
-            with self._dict_lock:
-                for watcher_thread in self._run_id_to_watcher_dict.values():
-                    if not watcher_thread.should_thread_exit.is_set():
-                        watcher_thread.should_thread_exit.set()
-                for run_id in self._run_id_to_watcher_dict:
-                    self._run_id_to_watcher_dict[run_id].join()
-                self._run_id_to_watcher_dict = {}
-
-
-class SqlPollingRunIdEventWatcherThread(threading.Thread):
-    """subclass of Thread that watches a given run_id for new Events by polling every POLLING_CADENCE.
-
-    Holds a list of callbacks (_callback_fn_list) each passed in by an `Observer`. Note that
-        the callbacks have a cursor associated; this means that the callbacks should be
-        only executed on EventLogEntrys with an associated id >= callback.cursor
-    Exits when `self.should_thread_exit` is set.
-
-    LOCKING INFO:
-        INVARIANTS: _callback_fn_list_lock protects _callback_fn_list
-
-    """
-
-    def __init__(self, event_log_storage: EventLogStorage, run_id: str):
-        super().__init__()
-        self._event_log_storage = check.inst_param(
-            event_log_storage, "event_log_storage", EventLogStorage
-        )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._callback_fn_list_lock: threading.Lock = threading.Lock()
-        self._callback_fn_list: list[CallbackAfterCursor] = []
-        self._should_thread_exit = threading.Event()
-        self.name = f"sql-event-watch-run-id-{self._run_id}"
-
-    @property
-    def should_thread_exit(self) -> threading.Event:
-        return self._should_thread_exit
-
-    def add_callback(self, cursor: Optional[str], callback: Callable[[EventLogEntry, str], None]):
-        """Observer has started watching this run.
-            Add a callback to execute on new EventLogEntrys after the given cursor.
-
-        Args:
-            cursor (Optional[str]): event log cursor for the callback to execute
-            callback (Callable[[EventLogEntry, str], None]): callback to update the Dagster UI
+            self._should_thread_exit.set()
+            if self._thread:
+                self._thread.join()
+                self._thread = None
+            with self._lock:
+                self._watched_runs = {}
+
+    def _run(self) -> None:
+        while not self._should_thread_exit.wait(INIT_POLL_PERIOD):
+            try:
+                self.poll()
+            except Exception:
+                logging.exception("Exception while polling the event log for watched runs.")
+
+    def poll(self) -> None:
+        """Fetches the new EventLogEntrys of all watched runs that are due to be polled, and
+        executes the callbacks watching those runs on them.
         """
-        cursor = check.opt_str_param(cursor, "cursor")
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list.append(CallbackAfterCursor(cursor, callback))
-
-    def remove_callback(self, callback: Callable[[EventLogEntry, str], None]):
-        """Observer has stopped watching this run;
-            Remove a callback from the list of callbacks to execute on new EventLogEntrys.
-
-            Also kill thread if no callbacks remaining (i.e. no Observers are watching this run_id)
+        with self._lock:
+            now = time.monotonic()
+            due_watched_runs = {
+                run_id: watched_run
+                for run_id, watched_run in self._watched_runs.items()
+                if watched_run.next_poll_time <= now
+            }
+        if not due_watched_runs:
+            return
+
+        connections_by_run_id = self._event_log_storage.get_records_for_runs(
+            {run_id: watched_run.cursor for run_id, watched_run in due_watched_runs.items()},
+            limit=self._chunk_limit,
+        )
 
-        Args:
-            callback (Callable[[EventLogEntry, str], None]): callback to remove from list of callbacks
-        """
-        callback = check.callable_param(callback, "callback")
-        with self._callback_fn_list_lock:
-            self._callback_fn_list = [
-                callback_with_cursor
-                for callback_with_cursor in self._callback_fn_list
-                if callback_with_cursor.callback != callback
-            ]
-            if not self._callback_fn_list:
-                self._should_thread_exit.set()
-
-    def run(self) -> None:
-        """Polling function to update Observers with EventLogEntrys from Event Log DB.
-        Wakes every POLLING_CADENCE &
-            1. executes a SELECT query to get new EventLogEntrys
-            2. fires each callback (taking into account the callback.cursor) on the new EventLogEntrys
-        Uses max_index_so_far as a cursor in the DB to make sure that only new records are retrieved.
-        """
-        cursor = None
-        wait_time = INIT_POLL_PERIOD
-
-        chunk_limit = int(os.getenv("DAGSTER_POLLING_EVENT_WATCHER_BATCH_SIZE", "1000"))
-
-        while not self._should_thread_exit.wait(wait_time):
-            conn = self._event_log_storage.get_records_for_run(
-                self._run_id,
-                cursor=cursor,
-                limit=chunk_limit,
-            )
-            cursor = conn.cursor
-            for event_record in conn.records:
-                with self._callback_fn_list_lock:
-                    for callback_with_cursor in self._callback_fn_list:
-                        if (
-                            callback_with_cursor.cursor is None
-                            or EventLogCursor.parse(callback_with_cursor.cursor).storage_id()
-                            < event_record.storage_id
-                        ):
-                            callback_with_cursor.callback(
-                                event_record.event_log_entry,
-                                str(EventLogCursor.from_storage_id(event_record.storage_id)),
-                            )
-            wait_time = INIT_POLL_PERIOD if conn.records else min(wait_time * 2, MAX_POLL_PERIOD)
+        with self._lock:
+            now = time.monotonic()
+            for run_id, connection in connections_by_run_id.items():
+                watched_run = due_watched_runs[run_id]
+                # skip runs that were unwatched, or unwatched and rewatched, during the query
+                if self._watched_runs.get(run_id) is not watched_run:
+                    continue
+                self._process_connection(run_id, watched_run, connection, now)
+
+    def _process_connection(
+        self, run_id: str, watched_run: WatchedRun, connection: EventLogConnection, now: float
+    ) -> None:
+        watched_run.cursor = connection.cursor
+        if connection.records or connection.has_more:
+            watched_run.poll_period = INIT_POLL_PERIOD
+        else:
+            watched_run.poll_period = min(watched_run.poll_period * 2, MAX_POLL_PERIOD)
+        watched_run.next_poll_time = now + watched_run.poll_period
+
+        for callback_with_cursor in list(watched_run.callbacks):
+            after_storage_id = _storage_id_for_cursor(callback_with_cursor.cursor)
+            for event_record in connection.records:
+                # a callback may unwatch the run, or be unwatched by another callback
+                if callback_with_cursor not in watched_run.callbacks:
+                    break
+                if after_storage_id is not None and event_record.storage_id <= after_storage_id:
+                    continue
+                try:
+                    callback_with_cursor.callback(
+                        event_record.event_log_entry,
+                        str(EventLogCursor.from_storage_id(event_record.storage_id)),
+                    )
+                except Exception:
+                    logging.exception("Exception in callback for event watch on run %s.", run_id)
@@ -1,5 +1,6 @@
 import logging
 import os
+import threading
 from abc import abstractmethod
 from collections import OrderedDict, defaultdict
 from collections.abc import Iterable, Iterator, Mapping, Sequence
@@ -18,6 +19,7 @@
 )
 
 import sqlalchemy as db
+import sqlalchemy.dialects as db_dialects
 import sqlalchemy.exc as db_exc
 from sqlalchemy.engine import Connection
 from typing_extensions import TypeAlias
@@ -60,7 +62,7 @@
     AssetCheckExecutionRecord,
     AssetCheckExecutionRecordStatus,
 )
-from dagster._core.storage.dagster_run import DagsterRunStatsSnapshot
+from dagster._core.storage.dagster_run import FINISHED_STATUSES, DagsterRunStatsSnapshot
 from dagster._core.storage.event_log.base import (
     AssetCheckSummaryRecord,
     AssetEntry,
@@ -172,6 +174,18 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        """Context manager yielding a connection to access the event logs for a specific run that
+        has begun a transaction.
+        """
+        with self.run_connection(run_id) as conn:
+            if conn.in_transaction():
+                yield conn
+            else:
+                with conn.begin():
+                    yield conn
+
     @abstractmethod
     def upgrade(self) -> None:
         """This method should perform any schema migrations necessary to bring an
@@ -443,9 +457,12 @@ def store_event(self, event: EventLogEntry) -> None:
 
         event_id = None
 
-        with self.run_connection(run_id) as conn:
+        store_status_cache_changes = self.should_store_asset_status_cache_changes([event])
+        with self.run_transaction(run_id) as conn:
             result = conn.execute(insert_event_statement)
             event_id = result.inserted_primary_key[0]
+            if store_status_cache_changes:
+                self.store_asset_status_cache_changes(conn, [event], [event_id])
 
         if (
             event.is_dagster_event
@@ -464,6 +481,146 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Store a batch of events with a constant number of statements, regardless of batch size.
+
+        All events are written with a single multi-row insert into the event log table. The asset
+        index rows of every affected asset key are then maintained with one upsert per set of
+        updated columns, the asset event tags with one bulk insert, and asset check executions
+        with one bulk insert and one bulk update.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        run_ids = {event.run_id for event in events}
+        store_status_cache_changes = self.should_store_asset_status_cache_changes(events)
+        with self.run_transaction(next(iter(run_ids)) if len(run_ids) == 1 else None) as conn:
+            event_ids = self._insert_event_batch(conn, events)
+            if store_status_cache_changes:
+                self.store_asset_status_cache_changes(conn, events, event_ids)
+
+        self._store_indexed_event_batch(events, event_ids)
+
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
+        """Insert the given events into the event log table, returning the storage ids of the
+        inserted rows in the same order. Storage ids are only guaranteed to be returned for events
+        that need them to be indexed (asset and asset check events).
+        """
+        rows = [self._event_to_row(event) for event in events]
+        if getattr(conn.dialect, "insert_executemany_returning_sort_by_parameter_order", False):
+            result = conn.execute(
+                SqlEventLogStorageTable.insert().returning(
+                    SqlEventLogStorageTable.c.id, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+            return [cast(int, row[0]) for row in result.fetchall()]
+
+        # The dialect cannot report the ids generated by a multi-row insert. Consecutive events that
+        # do not need to be indexed are inserted together, and the others one at a time, so that
+        # rows are still inserted in order.
+        event_ids: list[Optional[int]] = []
+        pending_rows: list[dict[str, Any]] = []
+        for event, row in zip(events, rows):
+            if not _is_indexed_event(event):
+                pending_rows.append(row)
+                continue
+            if pending_rows:
+                conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+                event_ids.extend([None] * len(pending_rows))
+                pending_rows = []
+            result = conn.execute(SqlEventLogStorageTable.insert().values(**row))
+            event_ids.append(result.inserted_primary_key[0])
+        if pending_rows:
+            conn.execute(SqlEventLogStorageTable.insert(), pending_rows)
+            event_ids.extend([None] * len(pending_rows))
+        return event_ids
+
+    def _store_indexed_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
+    ) -> None:
+        asset_events: list[EventLogEntry] = []
+        asset_event_ids: list[int] = []
+        check_events: list[EventLogEntry] = []
+        check_event_ids: list[Optional[int]] = []
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+            if event.dagster_event_type in ASSET_EVENTS and event.get_dagster_event().asset_key:
+                if event_id is None:
+                    raise DagsterInvariantViolationError(
+                        "Cannot store asset event tags for null event id."
+                    )
+                asset_events.append(event)
+                asset_event_ids.append(event_id)
+            if event.dagster_event_type in ASSET_CHECK_EVENTS:
+                check_events.append(event)
+                check_event_ids.append(event_id)
+
+        if asset_events:
+            self.store_asset_event_batch(asset_events, asset_event_ids)
+            self.store_asset_event_tags(asset_events, asset_event_ids)
+
+        if check_events:
+            self.store_asset_check_event_batch(check_events, check_event_ids)
+
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        """Bulk version of `store_asset_event`, updating the asset index rows of every asset key
+        in the batch as if each event had been stored in order.
+        """
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_asset_key_index_cols()
+        )
+        with self.index_connection() as conn:
+            for columns, rows in group_asset_key_rows_by_columns(values_by_asset_key).items():
+                if conn.dialect.name == "sqlite":
+                    query = db_dialects.sqlite.insert(AssetKeyTable).values(rows)
+                    if columns:
+                        query = query.on_conflict_do_update(
+                            index_elements=[AssetKeyTable.c.asset_key],
+                            set_={column: query.excluded[column] for column in columns},
+                        )
+                    else:
+                        query = query.on_conflict_do_nothing()
+                    conn.execute(query)
+                    continue
+
+                for row in rows:
+                    values = {column: row[column] for column in columns}
+                    try:
+                        conn.execute(AssetKeyTable.insert().values(**row))
+                    except db_exc.IntegrityError:
+                        if values:
+                            conn.execute(
+                                AssetKeyTable.update()
+                                .values(**values)
+                                .where(AssetKeyTable.c.asset_key == row["asset_key"])
+                            )
+
+    def _get_asset_entry_values_by_asset_key(
+        self,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[int],
+        has_asset_key_index_cols: bool,
+    ) -> Mapping[str, Mapping[str, Any]]:
+        # Later events overwrite the values written by earlier events for the same asset key, so
+        # merging the values in order is equivalent to applying one update per event.
+        values_by_asset_key: dict[str, dict[str, Any]] = {}
+        for event, event_id in zip(events, event_ids):
+            asset_key = check.not_none(event.get_dagster_event().asset_key)
+            values_by_asset_key.setdefault(asset_key.to_string(), {}).update(
+                self._get_asset_entry_values(event, event_id, has_asset_key_index_cols)
+            )
+        return values_by_asset_key
+
     def get_records_for_run(
         self,
         run_id,
@@ -557,6 +714,77 @@ def get_records_for_run(
             has_more=bool(limit and len(results) == limit),
         )
 
+    def get_records_for_runs(
+        self,
+        cursors_by_run_id: Mapping[str, Optional[str]],
+        limit: Optional[int] = None,
+    ) -> Mapping[str, EventLogConnection]:
+        check.mapping_param(cursors_by_run_id, "cursors_by_run_id", key_type=str)
+        storage_ids_by_run_id = {}
+        for run_id, cursor in cursors_by_run_id.items():
+            cursor_obj = EventLogCursor.parse(cursor) if cursor else None
+            if cursor_obj and not cursor_obj.is_id_cursor():
+                # offset cursors are relative to each run, so cannot be combined into one query
+                return super().get_records_for_runs(cursors_by_run_id, limit)
+            storage_ids_by_run_id[run_id] = cursor_obj.storage_id() if cursor_obj else None
+
+        if self.is_run_sharded or not storage_ids_by_run_id:
+            return super().get_records_for_runs(cursors_by_run_id, limit)
+
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.id,
+                    SqlEventLogStorageTable.c.run_id,
+                    SqlEventLogStorageTable.c.event,
+                ]
+            )
+            .where(
+                db.or_(
+                    *(
+                        SqlEventLogStorageTable.c.run_id == run_id
+                        if storage_id is None
+                        else db.and_(
+                            SqlEventLogStorageTable.c.run_id == run_id,
+                            SqlEventLogStorageTable.c.id > storage_id,
+                        )
+                        for run_id, storage_id in storage_ids_by_run_id.items()
+                    )
+                )
+            )
+            .order_by(SqlEventLogStorageTable.c.id.asc())
+        )
+        if limit:
+            query = query.limit(limit)
+
+        with self.run_connection(run_id=None) as conn:
+            results = conn.execute(query).fetchall()
+
+        has_more = bool(limit and len(results) == limit)
+        records_by_run_id: dict[str, list[EventLogRecord]] = defaultdict(list)
+        for record_id, run_id, json_str in results:
+            try:
+                event_log_entry = deserialize_value(json_str, EventLogEntry)
+            except (seven.JSONDecodeError, DeserializationError) as err:
+                raise DagsterEventLogInvalidForRun(run_id=run_id) from err
+            records_by_run_id[run_id].append(
+                EventLogRecord(storage_id=record_id, event_log_entry=event_log_entry)
+            )
+
+        connections_by_run_id = {}
+        for run_id, cursor in cursors_by_run_id.items():
+            records = records_by_run_id.get(run_id, [])
+            if records:
+                next_cursor = EventLogCursor.from_storage_id(records[-1].storage_id).to_string()
+            elif cursor:
+                next_cursor = cursor
+            else:
+                next_cursor = EventLogCursor.from_storage_id(-1).to_string()
+            connections_by_run_id[run_id] = EventLogConnection(
+                records=records, cursor=next_cursor, has_more=has_more
+            )
+        return connections_by_run_id
+
     def get_stats_for_run(self, run_id: str) -> DagsterRunStatsSnapshot:
         check.str_param(run_id, "run_id")
 
@@ -1536,6 +1764,169 @@ def update_asset_cached_status_data(
                     .values(cached_status_data=serialize_value(cache_values))
                 )
 
+    def can_maintain_asset_status_cache_on_write(self) -> bool:
+        return self.can_write_asset_status_cache()
+
+    def replace_asset_cached_status_data(
+        self,
+        asset_key: AssetKey,
+        cache_values: "AssetStatusCacheValue",
+        expected_cache_values: Optional["AssetStatusCacheValue"],
+    ) -> bool:
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        asset_key_str = asset_key.to_string()
+        latest_event_id_query = db_select([db.func.max(SqlEventLogStorageTable.c.id)]).where(
+            db.and_(
+                SqlEventLogStorageTable.c.asset_key == asset_key_str,
+                SqlEventLogStorageTable.c.dagster_event_type.in_(
+                    [
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        DagsterEventType.ASSET_MATERIALIZATION_PLANNED.value,
+                    ]
+                ),
+            )
+        )
+        with self.index_transaction() as conn:
+            row = conn.execute(
+                db_select([AssetKeyTable.c.cached_status_data])
+                .where(AssetKeyTable.c.asset_key == asset_key_str)
+                .with_for_update()
+            ).fetchone()
+            if row is None or AssetStatusCacheValue.from_db_string(row[0]) != expected_cache_values:
+                return False
+
+            # events that were stored before the cache value was written are not applied to it
+            latest_event_id = conn.execute(latest_event_id_query).scalar()
+            if latest_event_id and latest_event_id > cache_values.latest_storage_id:
+                return False
+
+            # SQLite ignores the row lock, so the update is also conditioned on the row being
+            # unchanged since it was read
+            result = conn.execute(
+                AssetKeyTable.update()
+                .where(
+                    db.and_(
+                        AssetKeyTable.c.asset_key == asset_key_str,
+                        AssetKeyTable.c.cached_status_data == row[0],
+                    )
+                )
+                .values(cached_status_data=serialize_value(cache_values))
+            )
+        return result.rowcount > 0
+
+    def should_store_asset_status_cache_changes(self, events: Sequence[EventLogEntry]) -> bool:
+        return (
+            any(_affects_asset_status_cache(event) for event in events)
+            and self.can_maintain_asset_status_cache_on_write()
+        )
+
+    def store_asset_status_cache_changes(
+        self,
+        conn: Connection,
+        events: Sequence[EventLogEntry],
+        event_ids: Sequence[Optional[int]],
+    ) -> None:
+        """Applies the materializations, planned materializations and run ends among the given
+        events to the cached status of the affected assets, for the cache values that are
+        maintained on write. Should only be called if `should_store_asset_status_cache_changes`
+        returned True for the events, which must be checked before the transaction is begun.
+
+        Must be called on the connection that inserted the events, in the same transaction and after
+        the events were inserted, so that readers never see the events without the matching cache
+        changes. The cache rows are locked, so that concurrent writers do not overwrite each other's
+        changes. SQLite does not support row locks, but the insert has already taken the database
+        write lock, which serializes writers until the transaction commits.
+        """
+        from dagster._core.storage.partition_status_cache import AssetStatusCacheValue
+
+        asset_key_strs: set[str] = set()
+        planned_asset_key_strs_by_run_id: dict[str, set[str]] = {}
+        for event in events:
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            if (
+                dagster_event.is_step_materialization
+                or dagster_event.is_asset_materialization_planned
+            ) and dagster_event.asset_key:
+                asset_key_strs.add(dagster_event.asset_key.to_string())
+                if dagster_event.is_asset_materialization_planned and dagster_event.partition:
+                    self._planned_partitioned_asset_keys.add(
+                        event.run_id, dagster_event.asset_key.to_string()
+                    )
+            elif (
+                EVENT_TYPE_TO_PIPELINE_RUN_STATUS.get(dagster_event.event_type) in FINISHED_STATUSES
+            ):
+                # Only runs whose planned events were stored by this process are known here. The
+                # end of any other run is applied when the cached status is read, which checks the
+                # status of the runs that still have in progress partitions.
+                planned_asset_key_strs_by_run_id[event.run_id] = (
+                    self._planned_partitioned_asset_keys.pop(event.run_id)
+                )
+
+        for run_asset_key_strs in planned_asset_key_strs_by_run_id.values():
+            asset_key_strs.update(run_asset_key_strs)
+
+        if not asset_key_strs:
+            return
+
+        rows = conn.execute(
+            db_select([AssetKeyTable.c.asset_key, AssetKeyTable.c.cached_status_data])
+            .where(AssetKeyTable.c.asset_key.in_(asset_key_strs))
+            .order_by(AssetKeyTable.c.asset_key.asc())
+            .with_for_update()
+        ).fetchall()
+
+        stored_cache_values: dict[str, AssetStatusCacheValue] = {}
+        for asset_key_str, cached_status_data in rows:
+            cache_value = AssetStatusCacheValue.from_db_string(cached_status_data)
+            if cache_value and cache_value.can_apply_changes_on_write:
+                stored_cache_values[asset_key_str] = cache_value
+
+        if not stored_cache_values:
+            return
+
+        cache_values = dict(stored_cache_values)
+        for event, event_id in zip(events, event_ids):
+            if not event.is_dagster_event:
+                continue
+            dagster_event = event.get_dagster_event()
+            asset_key_str = dagster_event.asset_key.to_string() if dagster_event.asset_key else None
+            if asset_key_str in cache_values and dagster_event.is_step_materialization:
+                cache_values[asset_key_str] = cache_values[
+                    asset_key_str
+                ].with_materialized_partition(check.not_none(event_id), dagster_event.partition)
+            elif asset_key_str in cache_values and dagster_event.is_asset_materialization_planned:
+                cache_values[asset_key_str] = cache_values[asset_key_str].with_planned_partition(
+                    check.not_none(event_id), event.run_id, dagster_event.partition
+                )
+            elif (
+                event.run_id in planned_asset_key_strs_by_run_id
+                and EVENT_TYPE_TO_PIPELINE_RUN_STATUS.get(dagster_event.event_type)
+                in FINISHED_STATUSES
+            ):
+                for run_asset_key_str in planned_asset_key_strs_by_run_id[event.run_id]:
+                    if run_asset_key_str in cache_values:
+                        cache_values[run_asset_key_str] = cache_values[
+                            run_asset_key_str
+                        ].with_finished_run(
+                            event.run_id,
+                            failed=dagster_event.event_type == DagsterEventType.RUN_FAILURE,
+                        )
+
+        for asset_key_str, cache_value in cache_values.items():
+            if cache_value != stored_cache_values[asset_key_str]:
+                conn.execute(
+                    AssetKeyTable.update()
+                    .where(AssetKeyTable.c.asset_key == asset_key_str)
+                    .values(cached_status_data=serialize_value(cache_value))
+                )
+
+    @cached_property
+    def _planned_partitioned_asset_keys(self) -> "_PlannedAssetKeysByRunId":
+        return _PlannedAssetKeysByRunId()
+
     def _fetch_backcompat_materialization_times(
         self, asset_keys: Sequence[AssetKey]
     ) -> Mapping[AssetKey, datetime]:
@@ -1918,6 +2309,49 @@ def get_latest_storage_id_by_partition(
             latest_materialization_storage_id_by_partition[cast(str, row[0])] = cast(int, row[1])
         return latest_materialization_storage_id_by_partition
 
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence[AssetKey],
+        event_type: DagsterEventType,
+    ) -> Mapping[AssetKey, Mapping[str, int]]:
+        check.sequence_param(asset_keys, "asset_keys", of_type=AssetKey)
+        check.inst_param(event_type, "event_type", DagsterEventType)
+
+        asset_keys = list(dict.fromkeys(asset_keys))
+        if not asset_keys:
+            return {}
+
+        asset_keys_by_str = {asset_key.to_string(): asset_key for asset_key in asset_keys}
+        query = (
+            db_select(
+                [
+                    SqlEventLogStorageTable.c.asset_key,
+                    SqlEventLogStorageTable.c.partition,
+                    db.func.max(SqlEventLogStorageTable.c.id).label("id"),
+                ]
+            )
+            .where(
+                db.and_(
+                    SqlEventLogStorageTable.c.asset_key.in_(list(asset_keys_by_str)),
+                    SqlEventLogStorageTable.c.partition != None,  # noqa: E711
+                    SqlEventLogStorageTable.c.dagster_event_type == event_type.value,
+                )
+            )
+            .group_by(SqlEventLogStorageTable.c.asset_key, SqlEventLogStorageTable.c.partition)
+        )
+        query = self._add_assets_wipe_filter_to_query(
+            query, self._get_assets_details(asset_keys), asset_keys
+        )
+
+        with self.index_connection() as conn:
+            rows = conn.execute(query).fetchall()
+
+        latest_storage_ids_by_asset_key: dict[AssetKey, dict[str, int]] = defaultdict(dict)
+        for row in rows:
+            asset_key = asset_keys_by_str[cast(str, row[0])]
+            latest_storage_ids_by_asset_key[asset_key][cast(str, row[1])] = cast(int, row[2])
+        return latest_storage_ids_by_asset_key
+
     def get_latest_tags_by_partition(
         self,
         asset_key: AssetKey,
@@ -2805,21 +3239,127 @@ def store_asset_check_event(self, event: EventLogEntry, event_id: Optional[int])
             else:
                 self._update_asset_check_evaluation(event, event_id)
 
-    def _store_asset_check_evaluation_planned(
-        self, event: EventLogEntry, event_id: Optional[int]
+    def store_asset_check_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[Optional[int]]
     ) -> None:
+        """Bulk version of `store_asset_check_event`. Planned and runless evaluation events are
+        written with a single insert, and evaluations of planned checks with a single update.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+
+        check.invariant(
+            self.supports_asset_checks,
+            "Asset checks require a database schema migration. Run `dagster instance migrate`.",
+        )
+
+        insert_rows = []
+        update_params = []
+        for event, event_id in zip(events, event_ids):
+            if event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED:
+                insert_rows.append(
+                    {
+                        **self._get_asset_check_evaluation_planned_values(event),
+                        "evaluation_event_storage_id": None,
+                        "materialization_event_storage_id": None,
+                    }
+                )
+            elif event.dagster_event_type == DagsterEventType.ASSET_CHECK_EVALUATION:
+                evaluation = cast(
+                    AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
+                )
+                values = self._get_asset_check_evaluation_values(event, event_id)
+                if event.run_id == "" or event.run_id is None:
+                    insert_rows.append(
+                        {
+                            "asset_key": evaluation.asset_key.to_string(),
+                            "check_name": evaluation.check_name,
+                            "run_id": event.run_id,
+                            **values,
+                        }
+                    )
+                else:
+                    update_params.append(
+                        {
+                            "b_asset_key": evaluation.asset_key.to_string(),
+                            "b_check_name": evaluation.check_name,
+                            "b_run_id": event.run_id,
+                            **{f"b_{column}": value for column, value in values.items()},
+                        }
+                    )
+
+        with self.index_connection() as conn:
+            if insert_rows:
+                conn.execute(AssetCheckExecutionsTable.insert(), insert_rows)
+
+            if update_params:
+                rows_updated = conn.execute(
+                    AssetCheckExecutionsTable.update()
+                    .where(
+                        db.and_(
+                            AssetCheckExecutionsTable.c.asset_key == db.bindparam("b_asset_key"),
+                            AssetCheckExecutionsTable.c.check_name == db.bindparam("b_check_name"),
+                            AssetCheckExecutionsTable.c.run_id == db.bindparam("b_run_id"),
+                        )
+                    )
+                    .values(
+                        **{
+                            column: db.bindparam(f"b_{column}")
+                            for column in _ASSET_CHECK_EVALUATION_COLUMNS
+                        }
+                    ),
+                    update_params,
+                ).rowcount
+
+                # as with the single event path, evaluations without a planned row (e.g. from the
+                # external instance of step launchers) match no rows and are not recorded
+                if rows_updated > len(update_params):
+                    raise DagsterInvariantViolationError(
+                        f"Updated {rows_updated} rows for {len(update_params)} asset check"
+                        " evaluations as a result of duplicate AssetCheckPlanned events."
+                    )
+
+    def _get_asset_check_evaluation_planned_values(self, event: EventLogEntry) -> dict[str, Any]:
         planned = cast(
             AssetCheckEvaluationPlanned, check.not_none(event.dagster_event).event_specific_data
         )
+        return {
+            "asset_key": planned.asset_key.to_string(),
+            "check_name": planned.check_name,
+            "run_id": event.run_id,
+            "execution_status": AssetCheckExecutionRecordStatus.PLANNED.value,
+            "evaluation_event": serialize_value(event),
+            "evaluation_event_timestamp": self._event_insert_timestamp(event),
+        }
+
+    def _get_asset_check_evaluation_values(
+        self, event: EventLogEntry, event_id: Optional[int]
+    ) -> dict[str, Any]:
+        evaluation = cast(
+            AssetCheckEvaluation, check.not_none(event.dagster_event).event_specific_data
+        )
+        return {
+            "execution_status": (
+                AssetCheckExecutionRecordStatus.SUCCEEDED.value
+                if evaluation.passed
+                else AssetCheckExecutionRecordStatus.FAILED.value
+            ),
+            "evaluation_event": serialize_value(event),
+            "evaluation_event_timestamp": self._event_insert_timestamp(event),
+            "evaluation_event_storage_id": event_id,
+            "materialization_event_storage_id": (
+                evaluation.target_materialization_data.storage_id
+                if evaluation.target_materialization_data
+                else None
+            ),
+        }
+
+    def _store_asset_check_evaluation_planned(
+        self, event: EventLogEntry, event_id: Optional[int]
+    ) -> None:
         with self.index_connection() as conn:
             conn.execute(
                 AssetCheckExecutionsTable.insert().values(
-                    asset_key=planned.asset_key.to_string(),
-                    check_name=planned.check_name,
-                    run_id=event.run_id,
-                    execution_status=AssetCheckExecutionRecordStatus.PLANNED.value,
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
+                    **self._get_asset_check_evaluation_planned_values(event)
                 )
             )
 
@@ -2839,19 +3379,7 @@ def _store_runless_asset_check_evaluation(
                     asset_key=evaluation.asset_key.to_string(),
                     check_name=evaluation.check_name,
                     run_id=event.run_id,
-                    execution_status=(
-                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
-                        if evaluation.passed
-                        else AssetCheckExecutionRecordStatus.FAILED.value
-                    ),
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                    evaluation_event_storage_id=event_id,
-                    materialization_event_storage_id=(
-                        evaluation.target_materialization_data.storage_id
-                        if evaluation.target_materialization_data
-                        else None
-                    ),
+                    **self._get_asset_check_evaluation_values(event, event_id),
                 )
             )
 
@@ -2870,21 +3398,7 @@ def _update_asset_check_evaluation(self, event: EventLogEntry, event_id: Optiona
                         AssetCheckExecutionsTable.c.run_id == event.run_id,
                     )
                 )
-                .values(
-                    execution_status=(
-                        AssetCheckExecutionRecordStatus.SUCCEEDED.value
-                        if evaluation.passed
-                        else AssetCheckExecutionRecordStatus.FAILED.value
-                    ),
-                    evaluation_event=serialize_value(event),
-                    evaluation_event_timestamp=self._event_insert_timestamp(event),
-                    evaluation_event_storage_id=event_id,
-                    materialization_event_storage_id=(
-                        evaluation.target_materialization_data.storage_id
-                        if evaluation.target_materialization_data
-                        else None
-                    ),
-                )
+                .values(**self._get_asset_check_evaluation_values(event, event_id))
             ).rowcount
 
         # 0 isn't normally expected, but occurs with the external instance of step launchers where
@@ -3130,6 +3644,73 @@ def get_updated_data_version_partitions(
         return updated_partitions
 
 
+MAX_RUNS_WITH_PLANNED_ASSET_KEYS = 1000
+
+
+class _PlannedAssetKeysByRunId:
+    """The asset keys of the partitioned materialization planned events stored by this process,
+    for the most recent runs, so that the end of a run can be applied to the cached status of its
+    assets without querying the event log.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._asset_key_strs_by_run_id: OrderedDict[str, set[str]] = OrderedDict()
+
+    def add(self, run_id: str, asset_key_str: str) -> None:
+        with self._lock:
+            if run_id not in self._asset_key_strs_by_run_id:
+                self._asset_key_strs_by_run_id[run_id] = set()
+                if len(self._asset_key_strs_by_run_id) > MAX_RUNS_WITH_PLANNED_ASSET_KEYS:
+                    self._asset_key_strs_by_run_id.popitem(last=False)
+            self._asset_key_strs_by_run_id[run_id].add(asset_key_str)
+
+    def pop(self, run_id: str) -> set[str]:
+        with self._lock:
+            return self._asset_key_strs_by_run_id.pop(run_id, set())
+
+
+_ASSET_CHECK_EVALUATION_COLUMNS = (
+    "execution_status",
+    "evaluation_event",
+    "evaluation_event_timestamp",
+    "evaluation_event_storage_id",
+    "materialization_event_storage_id",
+)
+
+
+def _is_indexed_event(event: EventLogEntry) -> bool:
+    return event.is_dagster_event and (
+        (
+            event.dagster_event_type in ASSET_EVENTS
+            and event.get_dagster_event().asset_key is not None
+        )
+        or event.dagster_event_type in ASSET_CHECK_EVENTS
+    )
+
+
+def _affects_asset_status_cache(event: EventLogEntry) -> bool:
+    if not event.is_dagster_event:
+        return False
+    dagster_event = event.get_dagster_event()
+    return (
+        (dagster_event.is_step_materialization or dagster_event.is_asset_materialization_planned)
+        and dagster_event.asset_key is not None
+    ) or EVENT_TYPE_TO_PIPELINE_RUN_STATUS.get(dagster_event.event_type) in FINISHED_STATUSES
+
+
+def group_asset_key_rows_by_columns(
+    values_by_asset_key: Mapping[str, Mapping[str, Any]],
+) -> Mapping[tuple[str, ...], Sequence[dict[str, Any]]]:
+    """Groups asset key rows by the set of columns they update, since a multi-row insert requires
+    every row to have the same columns.
+    """
+    rows_by_columns: dict[tuple[str, ...], list[dict[str, Any]]] = defaultdict(list)
+    for asset_key_str, values in values_by_asset_key.items():
+        rows_by_columns[tuple(sorted(values.keys()))].append({"asset_key": asset_key_str, **values})
+    return rows_by_columns
+
+
 def _get_from_row(row: SqlAlchemyRow, column: str) -> object:
     """Utility function for extracting a column from a sqlalchemy row proxy, since '_asdict' is not
     supported in sqlalchemy 1.3.
@@ -257,6 +257,8 @@ def store_event(self, event: EventLogEntry) -> None:
         with self.run_connection(run_id) as conn:
             conn.execute(insert_event_statement)
 
+        store_status_cache_changes = self.should_store_asset_status_cache_changes([event])
+
         if event.is_dagster_event and event.dagster_event.asset_key:  # type: ignore
             check.invariant(
                 event.dagster_event_type in ASSET_EVENTS,
@@ -264,12 +266,13 @@ def store_event(self, event: EventLogEntry) -> None:
                 " observations in index database",
             )
 
-            event_id = None
-
-            # mirror the event in the cross-run index database
+            # mirror the event in the cross-run index database, where the cached status of assets
+            # is updated in the same transaction
             with self.index_connection() as conn:
                 result = conn.execute(insert_event_statement)
                 event_id = result.inserted_primary_key[0]
+                if store_status_cache_changes:
+                    self.store_asset_status_cache_changes(conn, [event], [event_id])
 
             self.store_asset_event(event, event_id)
 
@@ -287,6 +290,56 @@ def store_event(self, event: EventLogEntry) -> None:
             # should mirror run status change events in the index shard
             with self.index_connection() as conn:
                 conn.execute(insert_event_statement)
+                if store_status_cache_changes:
+                    self.store_asset_status_cache_changes(conn, [event], [None])
+
+    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
+        """Overridden method to write each run's events to its shard with a single multi-row
+        insert, and to replicate asset and run status events in the index shard with another.
+
+        Args:
+            events (Sequence[EventLogEntry]): The events to store, in order.
+        """
+        check.sequence_param(events, "events", of_type=EventLogEntry)
+        if not events:
+            return
+
+        rows_by_run_id = defaultdict(list)
+        for event in events:
+            rows_by_run_id[event.run_id].append(self._event_to_row(event))
+        for run_id, rows in rows_by_run_id.items():
+            with self.run_connection(run_id) as conn:
+                conn.execute(SqlEventLogStorageTable.insert(), rows)
+
+        index_positions = []
+        for i, event in enumerate(events):
+            if not event.is_dagster_event:
+                continue
+            if event.get_dagster_event().asset_key:
+                check.invariant(
+                    event.dagster_event_type in ASSET_EVENTS,
+                    "Can only store asset materializations, materialization_planned, and"
+                    " observations in index database",
+                )
+                index_positions.append(i)
+            elif event.dagster_event_type in EVENT_TYPE_TO_PIPELINE_RUN_STATUS:
+                # should mirror run status change events in the index shard
+                index_positions.append(i)
+
+        # asset check events are not mirrored in the index shard, so have no storage id
+        event_ids: list[Optional[int]] = [None] * len(events)
+        if index_positions:
+            # mirror the events in the cross-run index database
+            index_events = [events[i] for i in index_positions]
+            store_status_cache_changes = self.should_store_asset_status_cache_changes(index_events)
+            with self.index_connection() as conn:
+                index_event_ids = self._insert_event_batch(conn, index_events)
+                if store_status_cache_changes:
+                    self.store_asset_status_cache_changes(conn, index_events, index_event_ids)
+            for i, event_id in zip(index_positions, index_event_ids):
+                event_ids[i] = event_id
+
+        self._store_indexed_event_batch(events, event_ids)
 
     def get_event_records(
         self,
@@ -472,18 +525,76 @@ def watch(self, run_id: str, cursor: Optional[str], callback: EventHandlerFn) ->
         if not self._obs:
             self._obs = Observer()
             self._obs.start()
+            # a single handler watches the shards of all runs and dispatches on the modified path
+            self._obs.schedule(SqliteEventLogStorageWatchdog(self), self._base_dir, recursive=True)
 
-        watchdog = SqliteEventLogStorageWatchdog(self, run_id, callback, cursor)
-        self._watchers[run_id][callback] = (
-            watchdog,
-            self._obs.schedule(watchdog, self._base_dir, recursive=True),
-        )
+        self._watchers[run_id][callback] = cursor
 
     def end_watch(self, run_id: str, handler: EventHandlerFn) -> None:
-        if handler in self._watchers[run_id]:
-            event_handler, watch = self._watchers[run_id][handler]
-            self._obs.remove_handler_for_watch(event_handler, watch)  # type: ignore  # (possible none)
+        if run_id in self._watchers and handler in self._watchers[run_id]:
             del self._watchers[run_id][handler]
+            if not self._watchers[run_id]:
+                del self._watchers[run_id]
+
+    def on_modified(self, run_id: str) -> None:
+        """Fetches the new events for the given run with a single query, starting from the earliest
+        cursor of the callbacks watching the run, and executes each callback on the events after its
+        own cursor.
+        """
+        storage_ids_by_callback: dict[EventHandlerFn, Optional[int]] = {}
+        for callback, cursor in list(self._watchers.get(run_id, {}).items()):
+            cursor_obj = EventLogCursor.parse(cursor) if cursor else None
+            if cursor_obj and not cursor_obj.is_id_cursor():
+                # offset cursors cannot be compared to storage ids, so are queried separately
+                connection = self.get_records_for_run(run_id, cursor)
+                self._process_records_for_callback(run_id, callback, connection.records)
+            else:
+                storage_ids_by_callback[callback] = cursor_obj.storage_id() if cursor_obj else None
+
+        if not storage_ids_by_callback:
+            return
+
+        storage_ids = list(storage_ids_by_callback.values())
+        min_storage_id = None if None in storage_ids else min(storage_ids)  # type: ignore
+        connection = self.get_records_for_run(
+            run_id,
+            str(EventLogCursor.from_storage_id(min_storage_id))
+            if min_storage_id is not None
+            else None,
+        )
+        for callback, storage_id in storage_ids_by_callback.items():
+            self._process_records_for_callback(
+                run_id,
+                callback,
+                [
+                    record
+                    for record in connection.records
+                    if storage_id is None or record.storage_id > storage_id
+                ],
+            )
+
+    def _process_records_for_callback(
+        self, run_id: str, callback: EventHandlerFn, records: Sequence[EventLogRecord]
+    ) -> None:
+        for record in records:
+            # the callback may have been unwatched by an earlier event
+            if callback not in self._watchers.get(run_id, {}):
+                return
+
+            cursor = str(EventLogCursor.from_storage_id(record.storage_id))
+            self._watchers[run_id][callback] = cursor
+            status = None
+            try:
+                status = callback(record.event_log_entry, cursor)
+            except Exception:
+                logging.exception("Exception in callback for event watch on run %s.", run_id)
+
+            if (
+                status == DagsterRunStatus.SUCCESS
+                or status == DagsterRunStatus.FAILURE
+                or status == DagsterRunStatus.CANCELED
+            ):
+                self.end_watch(run_id, callback)
 
     def dispose(self) -> None:
         if self._obs:
@@ -505,43 +616,12 @@ def supports_global_concurrency_limits(self) -> bool:
 
 
 class SqliteEventLogStorageWatchdog(PatternMatchingEventHandler):
-    def __init__(
-        self,
-        event_log_storage: SqliteEventLogStorage,
-        run_id: str,
-        callback: EventHandlerFn,
-        cursor: Optional[str],
-        **kwargs: Any,
-    ):
+    def __init__(self, event_log_storage: SqliteEventLogStorage, **kwargs: Any):
         self._event_log_storage = check.inst_param(
             event_log_storage, "event_log_storage", SqliteEventLogStorage
         )
-        self._run_id = check.str_param(run_id, "run_id")
-        self._cb = check.callable_param(callback, "callback")
-        self._log_path = event_log_storage.path_for_shard(run_id)
-        self._cursor = cursor
-        super().__init__(patterns=[self._log_path], **kwargs)
-
-    def _process_log(self) -> None:
-        connection = self._event_log_storage.get_records_for_run(self._run_id, self._cursor)
-        if connection.cursor:
-            self._cursor = connection.cursor
-        for record in connection.records:
-            status = None
-            try:
-                status = self._cb(
-                    record.event_log_entry, str(EventLogCursor.from_storage_id(record.storage_id))
-                )
-            except Exception:
-                logging.exception("Exception in callback for event watch on run %s.", self._run_id)
-
-            if (
-                status == DagsterRunStatus.SUCCESS
-                or status == DagsterRunStatus.FAILURE
-                or status == DagsterRunStatus.CANCELED
-            ):
-                self._event_log_storage.end_watch(self._run_id, self._cb)
+        super().__init__(patterns=[event_log_storage.path_for_shard("*")], **kwargs)
 
     def on_modified(self, event: FileSystemEvent) -> None:
-        check.invariant(event.src_path == self._log_path)
-        self._process_log()
+        run_id, _ = os.path.splitext(os.path.basename(str(event.src_path)))
+        self._event_log_storage.on_modified(run_id)
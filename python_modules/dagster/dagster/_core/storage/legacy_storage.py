@@ -55,7 +55,8 @@
         TickStatus,
     )
     from dagster._core.snap.execution_plan_snapshot import ExecutionPlanSnapshot
-    from dagster._core.snap.job_snapshot import JobSnap
+    from dagster._core.snap.job_snapshot import JobLineageSnap, JobSnap
+    from dagster._core.snap.node import NodeDefsSnapshot
     from dagster._core.storage.dagster_run import (
         DagsterRun,
         DagsterRunStatsSnapshot,
@@ -272,6 +273,12 @@ def add_job_snapshot(self, job_snapshot: "JobSnap", snapshot_id: Optional[str] =
     def get_job_snapshot(self, job_snapshot_id: str) -> "JobSnap":
         return self._storage.run_storage.get_job_snapshot(job_snapshot_id)
 
+    def get_job_snapshot_node_defs(self, job_snapshot_id: str) -> "NodeDefsSnapshot":
+        return self._storage.run_storage.get_job_snapshot_node_defs(job_snapshot_id)
+
+    def get_job_snapshot_lineage(self, job_snapshot_id: str) -> Optional["JobLineageSnap"]:
+        return self._storage.run_storage.get_job_snapshot_lineage(job_snapshot_id)
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         return self._storage.run_storage.has_execution_plan_snapshot(execution_plan_snapshot_id)
 
@@ -431,6 +438,9 @@ def get_step_stats_for_run(
     def store_event(self, event: "EventLogEntry") -> None:
         return self._storage.event_log_storage.store_event(event)
 
+    def store_event_batch(self, events: Sequence["EventLogEntry"]) -> None:
+        return self._storage.event_log_storage.store_event_batch(events)
+
     def delete_events(self, run_id: str) -> None:
         return self._storage.event_log_storage.delete_events(run_id)
 
@@ -583,6 +593,15 @@ def get_latest_storage_id_by_partition(
             asset_key, event_type, partitions
         )
 
+    def get_latest_storage_ids_by_partition_for_assets(
+        self,
+        asset_keys: Sequence["AssetKey"],
+        event_type: "DagsterEventType",
+    ) -> Mapping["AssetKey", Mapping[str, int]]:
+        return self._storage.event_log_storage.get_latest_storage_ids_by_partition_for_assets(
+            asset_keys, event_type
+        )
+
     def get_latest_tags_by_partition(
         self,
         asset_key: "AssetKey",
@@ -649,6 +668,21 @@ def update_asset_cached_status_data(
             asset_key=asset_key, cache_values=cache_values
         )
 
+    def can_maintain_asset_status_cache_on_write(self) -> bool:
+        return self._storage.event_log_storage.can_maintain_asset_status_cache_on_write()
+
+    def replace_asset_cached_status_data(
+        self,
+        asset_key: "AssetKey",
+        cache_values: "AssetStatusCacheValue",
+        expected_cache_values: Optional["AssetStatusCacheValue"],
+    ) -> bool:
+        return self._storage.event_log_storage.replace_asset_cached_status_data(
+            asset_key=asset_key,
+            cache_values=cache_values,
+            expected_cache_values=expected_cache_values,
+        )
+
     def get_records_for_run(
         self,
         run_id: str,
@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable, Mapping, Sequence
 from enum import Enum
 from typing import TYPE_CHECKING, NamedTuple, Optional
 
@@ -45,6 +45,10 @@
 )
 RUN_FETCH_BATCH_SIZE = 100
 
+# The maximum number of partitions that the event log storage applies to a cache value maintained on
+# write before the value is folded on read
+MAX_PENDING_PARTITIONS = 1000
+
 
 class AssetPartitionStatus(Enum):
     """The status of asset partition."""
@@ -81,6 +85,9 @@ class AssetStatusCacheValue(
             ("serialized_failed_partition_subset", Optional[str]),
             ("serialized_in_progress_partition_subset", Optional[str]),
             ("earliest_in_progress_materialization_event_id", Optional[int]),
+            ("in_progress_partitions_by_run_id", Optional[Mapping[str, Sequence[str]]]),
+            ("pending_materialized_partitions", Optional[Sequence[str]]),
+            ("pending_failed_partitions", Optional[Sequence[str]]),
         ],
     ),
     LoadableBy[tuple[AssetKey, PartitionsDefinition]],
@@ -102,7 +109,15 @@ class AssetStatusCacheValue(
             in progress partition subsets, up to the latest storage id. None if the asset is unpartitioned.
         earliest_in_progress_materialization_event_id (Optional(int)): The event id of the earliest
             materialization planned event for a run that is still in progress. This is used to check
-            on the status of runs that are still in progress.
+            on the status of runs that are still in progress. When the cache value is maintained
+            on write, this is a lower bound for the earliest such event id.
+        in_progress_partitions_by_run_id (Optional(Mapping[str, Sequence[str]])): The in progress
+            partitions, keyed by the run that is materializing them. Only set on cache values that
+            the event log storage maintains as events are written, see `is_maintained_on_write`.
+        pending_materialized_partitions (Optional(Sequence[str])): Partitions materialized since the
+            serialized subsets were last computed, not yet folded into them.
+        pending_failed_partitions (Optional(Sequence[str])): Partitions that failed since the
+            serialized subsets were last computed, not yet folded into them.
     """
 
     def __new__(
@@ -113,6 +128,9 @@ def __new__(
         serialized_failed_partition_subset: Optional[str] = None,
         serialized_in_progress_partition_subset: Optional[str] = None,
         earliest_in_progress_materialization_event_id: Optional[int] = None,
+        in_progress_partitions_by_run_id: Optional[Mapping[str, Sequence[str]]] = None,
+        pending_materialized_partitions: Optional[Sequence[str]] = None,
+        pending_failed_partitions: Optional[Sequence[str]] = None,
     ):
         check.int_param(latest_storage_id, "latest_storage_id")
         check.opt_str_param(partitions_def_id, "partitions_def_id")
@@ -125,6 +143,18 @@ def __new__(
         check.opt_str_param(
             serialized_in_progress_partition_subset, "serialized_in_progress_partition_subset"
         )
+        check.opt_mapping_param(
+            in_progress_partitions_by_run_id,
+            "in_progress_partitions_by_run_id",
+            key_type=str,
+            value_type=list,
+        )
+        check.opt_sequence_param(
+            pending_materialized_partitions, "pending_materialized_partitions", of_type=str
+        )
+        check.opt_sequence_param(
+            pending_failed_partitions, "pending_failed_partitions", of_type=str
+        )
         return super().__new__(
             cls,
             latest_storage_id,
@@ -133,6 +163,130 @@ def __new__(
             serialized_failed_partition_subset,
             serialized_in_progress_partition_subset,
             earliest_in_progress_materialization_event_id,
+            in_progress_partitions_by_run_id,
+            pending_materialized_partitions,
+            pending_failed_partitions,
+        )
+
+    @property
+    def is_maintained_on_write(self) -> bool:
+        """Whether the event log storage applies partition status changes to this cache value as
+        events are stored, so that it can be read without scanning the event log.
+        """
+        return self.in_progress_partitions_by_run_id is not None
+
+    @property
+    def can_apply_changes_on_write(self) -> bool:
+        """Whether the event log storage should apply new events to this cache value as they are
+        stored. Once either list of pending partitions reaches `MAX_PENDING_PARTITIONS`, new events
+        are left for the next read to fold in from the event log, so that the size of the value
+        written with every event stays bounded.
+        """
+        return (
+            self.is_maintained_on_write
+            and len(self.pending_materialized_partitions or []) < MAX_PENDING_PARTITIONS
+            and len(self.pending_failed_partitions or []) < MAX_PENDING_PARTITIONS
+        )
+
+    @property
+    def has_pending_changes(self) -> bool:
+        """Whether changes applied on write have not yet been folded into the serialized subsets.
+        The serialized in progress subset is cleared whenever the in progress partitions change.
+        """
+        return bool(
+            self.pending_materialized_partitions
+            or self.pending_failed_partitions
+            or self.serialized_in_progress_partition_subset is None
+        )
+
+    def with_materialized_partition(
+        self, storage_id: int, partition: Optional[str]
+    ) -> "AssetStatusCacheValue":
+        """Applies a materialization event, stored with the given storage id, to a cache value that
+        is maintained on write.
+        """
+        if partition is None:
+            return self._replace(latest_storage_id=max(self.latest_storage_id, storage_id))
+
+        in_progress_partitions_by_run_id = check.not_none(self.in_progress_partitions_by_run_id)
+        if any(partition in partitions for partitions in in_progress_partitions_by_run_id.values()):
+            in_progress_partitions_by_run_id = _without_partition(
+                in_progress_partitions_by_run_id, partition
+            )
+            cache_value = self._replace(
+                serialized_in_progress_partition_subset=None,
+                earliest_in_progress_materialization_event_id=(
+                    self.earliest_in_progress_materialization_event_id
+                    if in_progress_partitions_by_run_id
+                    else None
+                ),
+                in_progress_partitions_by_run_id=in_progress_partitions_by_run_id,
+            )
+        else:
+            cache_value = self
+
+        return cache_value._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            pending_materialized_partitions=sorted(
+                {*(self.pending_materialized_partitions or []), partition}
+            ),
+            pending_failed_partitions=sorted(
+                set(self.pending_failed_partitions or []) - {partition}
+            )
+            or None,
+        )
+
+    def with_planned_partition(
+        self, storage_id: int, run_id: str, partition: Optional[str]
+    ) -> "AssetStatusCacheValue":
+        """Applies a materialization planned event, stored with the given storage id, to a cache
+        value that is maintained on write.
+        """
+        if partition is None:
+            return self._replace(latest_storage_id=max(self.latest_storage_id, storage_id))
+
+        in_progress_partitions_by_run_id = dict(
+            _without_partition(check.not_none(self.in_progress_partitions_by_run_id), partition)
+        )
+        in_progress_partitions_by_run_id[run_id] = sorted(
+            {*in_progress_partitions_by_run_id.get(run_id, []), partition}
+        )
+        return self._replace(
+            latest_storage_id=max(self.latest_storage_id, storage_id),
+            serialized_in_progress_partition_subset=None,
+            earliest_in_progress_materialization_event_id=min(
+                self.earliest_in_progress_materialization_event_id or storage_id, storage_id
+            ),
+            in_progress_partitions_by_run_id=in_progress_partitions_by_run_id,
+        )
+
+    def with_finished_run(self, run_id: str, failed: bool) -> "AssetStatusCacheValue":
+        """Applies the end of a run to a cache value that is maintained on write. Partitions that
+        were in progress in a failed run are marked as failed, and are otherwise dropped.
+        """
+        in_progress_partitions_by_run_id = check.not_none(self.in_progress_partitions_by_run_id)
+        if run_id not in in_progress_partitions_by_run_id:
+            return self
+
+        run_partitions = in_progress_partitions_by_run_id[run_id]
+        in_progress_partitions_by_run_id = {
+            other_run_id: partitions
+            for other_run_id, partitions in in_progress_partitions_by_run_id.items()
+            if other_run_id != run_id
+        }
+        return self._replace(
+            serialized_in_progress_partition_subset=None,
+            earliest_in_progress_materialization_event_id=(
+                self.earliest_in_progress_materialization_event_id
+                if in_progress_partitions_by_run_id
+                else None
+            ),
+            in_progress_partitions_by_run_id=in_progress_partitions_by_run_id,
+            pending_failed_partitions=(
+                sorted({*(self.pending_failed_partitions or []), *run_partitions})
+                if failed
+                else self.pending_failed_partitions
+            ),
         )
 
     @staticmethod
@@ -211,6 +365,16 @@ def get_in_progress_subset(
         )
 
 
+def _without_partition(
+    partitions_by_run_id: Mapping[str, Sequence[str]], partition: str
+) -> Mapping[str, Sequence[str]]:
+    without_partition = {
+        run_id: [p for p in partitions if p != partition]
+        for run_id, partitions in partitions_by_run_id.items()
+    }
+    return {run_id: partitions for run_id, partitions in without_partition.items() if partitions}
+
+
 def get_materialized_multipartitions(
     instance: DagsterInstance, asset_key: AssetKey, partitions_def: MultiPartitionsDefinition
 ) -> Sequence[str]:
@@ -283,6 +447,18 @@ def get_last_planned_storage_id(
     return info.storage_id
 
 
+def _get_latest_storage_id(
+    instance: DagsterInstance, asset_key: AssetKey, asset_record: Optional["AssetRecord"]
+) -> int:
+    last_materialization_storage_id = (
+        asset_record.asset_entry.last_materialization_storage_id if asset_record else None
+    )
+    return max(
+        last_materialization_storage_id or 0,
+        get_last_planned_storage_id(instance, asset_key, asset_record),
+    )
+
+
 def _build_status_cache(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -290,6 +466,7 @@ def _build_status_cache(
     dynamic_partitions_store: DynamicPartitionsStore,
     stored_cache_value: Optional[AssetStatusCacheValue],
     asset_record: Optional["AssetRecord"],
+    maintain_on_write: bool = False,
 ) -> Optional[AssetStatusCacheValue]:
     """This method refreshes the asset status cache for a given asset key. It recalculates
     the materialized partition subset for the asset key and updates the cache value.
@@ -373,7 +550,8 @@ def _build_status_cache(
         failed_subset,
         in_progress_subset,
         earliest_in_progress_materialization_event_id,
-    ) = build_failed_and_in_progress_partition_subset(
+        in_progress_partitions_by_run_id,
+    ) = _build_failed_and_in_progress_partition_subset(
         instance,
         asset_key,
         partitions_def,
@@ -392,24 +570,98 @@ def _build_status_cache(
         serialized_failed_partition_subset=failed_subset.serialize(),
         serialized_in_progress_partition_subset=in_progress_subset.serialize(),
         earliest_in_progress_materialization_event_id=earliest_in_progress_materialization_event_id,
+        in_progress_partitions_by_run_id=(
+            {
+                run_id: sorted(partitions)
+                for run_id, partitions in in_progress_partitions_by_run_id.items()
+            }
+            if maintain_on_write
+            else None
+        ),
     )
 
 
-def build_failed_and_in_progress_partition_subset(
+def _fold_status_cache(
     instance: DagsterInstance,
-    asset_key: AssetKey,
     partitions_def: PartitionsDefinition,
     dynamic_partitions_store: DynamicPartitionsStore,
+    stored_cache_value: AssetStatusCacheValue,
+) -> AssetStatusCacheValue:
+    """Folds the changes that the event log storage applied to a cache value maintained on write
+    into its serialized subsets. This does not read the event log. The only query is for the status
+    of the runs with in progress partitions, in case the end of one of those runs was not applied
+    to the cache value, e.g. because the run was deleted.
+    """
+    cache_value = stored_cache_value
+    run_ids = list(check.not_none(cache_value.in_progress_partitions_by_run_id).keys())
+    unfinished_run_ids = set()
+    for i in range(0, len(run_ids), RUN_FETCH_BATCH_SIZE):
+        for run in instance.get_runs(
+            filters=RunsFilter(run_ids=run_ids[i : i + RUN_FETCH_BATCH_SIZE])
+        ):
+            if run.status not in FINISHED_STATUSES:
+                unfinished_run_ids.add(run.run_id)
+            else:
+                cache_value = cache_value.with_finished_run(
+                    run.run_id, failed=run.status == DagsterRunStatus.FAILURE
+                )
+    for run_id in run_ids:
+        # Runs that are neither finished nor unfinished must have been deleted, so their partitions
+        # are considered neither in-progress nor failed
+        if run_id not in unfinished_run_ids:
+            cache_value = cache_value.with_finished_run(run_id, failed=False)
+
+    if not cache_value.has_pending_changes:
+        return cache_value
+
+    materialized_subset = cache_value.deserialize_materialized_partition_subsets(partitions_def)
+    failed_subset = cache_value.deserialize_failed_partition_subsets(partitions_def)
+
+    materialized_partitions = get_validated_partition_keys(
+        dynamic_partitions_store,
+        partitions_def,
+        set(cache_value.pending_materialized_partitions or []),
+    )
+    if materialized_partitions:
+        materialized_subset = materialized_subset.with_partition_keys(materialized_partitions)
+        failed_subset = failed_subset - partitions_def.empty_subset().with_partition_keys(
+            materialized_partitions
+        )
+
+    failed_partitions = get_validated_partition_keys(
+        dynamic_partitions_store, partitions_def, set(cache_value.pending_failed_partitions or [])
+    )
+    if failed_partitions:
+        failed_subset = failed_subset.with_partition_keys(failed_partitions)
+
+    in_progress_partitions = {
+        partition
+        for partitions in check.not_none(cache_value.in_progress_partitions_by_run_id).values()
+        for partition in partitions
+    }
+    in_progress_subset = partitions_def.empty_subset().with_partition_keys(
+        get_validated_partition_keys(
+            dynamic_partitions_store, partitions_def, in_progress_partitions
+        )
+    )
+
+    return cache_value._replace(
+        serialized_materialized_partition_subset=materialized_subset.serialize(),
+        serialized_failed_partition_subset=failed_subset.serialize(),
+        serialized_in_progress_partition_subset=in_progress_subset.serialize(),
+        pending_materialized_partitions=None,
+        pending_failed_partitions=None,
+    )
+
+
+def _get_failed_and_in_progress_partitions(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
     last_planned_materialization_storage_id: int,
-    failed_subset: Optional[PartitionsSubset[str]] = None,
     after_storage_id: Optional[int] = None,
-) -> tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
-    in_progress_partitions: set[str] = set()
-
+) -> tuple[set[str], Mapping[str, set[str]], Optional[int]]:
     incomplete_materializations = {}
 
-    failed_subset = failed_subset or partitions_def.empty_subset()
-
     # Fetch incomplete materializations if there have been any planned materializations since the
     # cursor
     if last_planned_materialization_storage_id and (
@@ -420,6 +672,7 @@ def build_failed_and_in_progress_partition_subset(
         )
 
     failed_partitions: set[str] = set()
+    in_progress_partitions_by_run_id: dict[str, set[str]] = {}
 
     cursor = None
     if incomplete_materializations:
@@ -442,7 +695,7 @@ def build_failed_and_in_progress_partition_subset(
                 if status == DagsterRunStatus.FAILURE:
                     failed_partitions.add(partition)
             elif run_id in unfinished_runs:
-                in_progress_partitions.add(partition)
+                in_progress_partitions_by_run_id.setdefault(run_id, set()).add(partition)
                 # If the run is not finished, keep track of the event id so we can check on it next time
                 if cursor is None or event_id < cursor:
                     cursor = event_id
@@ -451,6 +704,29 @@ def build_failed_and_in_progress_partition_subset(
                 # considered neither in-progress nor failed
                 pass
 
+    return failed_partitions, in_progress_partitions_by_run_id, cursor
+
+
+def _build_failed_and_in_progress_partition_subset(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    last_planned_materialization_storage_id: int,
+    failed_subset: Optional[PartitionsSubset[str]] = None,
+    after_storage_id: Optional[int] = None,
+) -> tuple[PartitionsSubset, PartitionsSubset, Optional[int], Mapping[str, set[str]]]:
+    failed_subset = failed_subset or partitions_def.empty_subset()
+
+    failed_partitions, in_progress_partitions_by_run_id, cursor = (
+        _get_failed_and_in_progress_partitions(
+            instance,
+            asset_key,
+            last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+            after_storage_id=after_storage_id,
+        )
+    )
+
     if failed_partitions:
         failed_subset = failed_subset.with_partition_keys(
             get_validated_partition_keys(
@@ -458,6 +734,12 @@ def build_failed_and_in_progress_partition_subset(
             )
         )
 
+    in_progress_partitions = {
+        partition
+        for partitions in in_progress_partitions_by_run_id.values()
+        for partition in partitions
+    }
+
     return (
         failed_subset,
         (
@@ -468,9 +750,58 @@ def build_failed_and_in_progress_partition_subset(
             else partitions_def.empty_subset()
         ),
         cursor,
+        in_progress_partitions_by_run_id,
     )
 
 
+def build_failed_and_in_progress_partition_subset(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: PartitionsDefinition,
+    dynamic_partitions_store: DynamicPartitionsStore,
+    last_planned_materialization_storage_id: int,
+    failed_subset: Optional[PartitionsSubset[str]] = None,
+    after_storage_id: Optional[int] = None,
+) -> tuple[PartitionsSubset, PartitionsSubset, Optional[int]]:
+    failed_subset, in_progress_subset, cursor, _ = _build_failed_and_in_progress_partition_subset(
+        instance,
+        asset_key,
+        partitions_def,
+        dynamic_partitions_store,
+        last_planned_materialization_storage_id=last_planned_materialization_storage_id,
+        failed_subset=failed_subset,
+        after_storage_id=after_storage_id,
+    )
+    return failed_subset, in_progress_subset, cursor
+
+
+def _can_maintain_on_write(
+    instance: DagsterInstance, partitions_def: Optional[PartitionsDefinition]
+) -> bool:
+    return (
+        partitions_def is not None
+        and is_cacheable_partition_type(partitions_def)
+        and instance.event_log_storage.can_maintain_asset_status_cache_on_write()
+    )
+
+
+def _store_status_cache(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    cache_value: AssetStatusCacheValue,
+    stored_cache_value: Optional[AssetStatusCacheValue],
+) -> bool:
+    if cache_value.is_maintained_on_write:
+        # The event log storage may have applied events to the stored cache value since it was
+        # read, in which case the new cache value is not written
+        return instance.event_log_storage.replace_asset_cached_status_data(
+            asset_key, cache_value, expected_cache_values=stored_cache_value
+        )
+
+    instance.update_asset_cached_status_data(asset_key, cache_value)
+    return True
+
+
 def get_and_update_asset_status_cache_value(
     instance: DagsterInstance,
     asset_key: AssetKey,
@@ -499,19 +830,141 @@ def get_and_update_asset_status_cache_value(
             dynamic_partitions_store=dynamic_partitions_store
         )
     )
-    updated_cache_value = _build_status_cache(
-        instance=instance,
-        asset_key=asset_key,
-        partitions_def=partitions_def,
-        dynamic_partitions_store=dynamic_partitions_store,
-        stored_cache_value=stored_cache_value if use_cached_value else None,
-        asset_record=asset_record,
-    )
+    maintain_on_write = _can_maintain_on_write(instance, partitions_def)
+    if (
+        maintain_on_write
+        and use_cached_value
+        and check.not_none(stored_cache_value).is_maintained_on_write
+    ):
+        updated_cache_value = _fold_status_cache(
+            instance,
+            check.not_none(partitions_def),
+            dynamic_partitions_store,
+            check.not_none(stored_cache_value),
+        )
+        if updated_cache_value.latest_storage_id < _get_latest_storage_id(
+            instance, asset_key, asset_record
+        ):
+            # some events were stored without being applied to the cache value, e.g. while the
+            # cache value was being rebuilt, so catch up by reading the event log
+            updated_cache_value = _build_status_cache(
+                instance=instance,
+                asset_key=asset_key,
+                partitions_def=partitions_def,
+                dynamic_partitions_store=dynamic_partitions_store,
+                stored_cache_value=updated_cache_value,
+                asset_record=asset_record,
+                maintain_on_write=True,
+            )
+    else:
+        updated_cache_value = _build_status_cache(
+            instance=instance,
+            asset_key=asset_key,
+            partitions_def=partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+            stored_cache_value=stored_cache_value if use_cached_value else None,
+            asset_record=asset_record,
+            maintain_on_write=maintain_on_write,
+        )
     if (
         updated_cache_value is not None
         and instance.event_log_storage.can_write_asset_status_cache()
         and updated_cache_value != stored_cache_value
     ):
-        instance.update_asset_cached_status_data(asset_key, updated_cache_value)
+        _store_status_cache(instance, asset_key, updated_cache_value, stored_cache_value)
 
     return updated_cache_value
+
+
+def check_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> Sequence[AssetPartitionStatus]:
+    """Compares a cache value maintained on write with the partition statuses computed from
+    scratch from the event log, and returns the statuses whose partitions disagree.
+
+    Failed partitions that were retried and then canceled are kept in the cache but not in a status
+    computed from scratch, so only failed partitions missing from the cache are reported. Events
+    stored while the check runs may be reported as inconsistencies.
+    """
+    if not partitions_def or not _can_maintain_on_write(instance, partitions_def):
+        return []
+
+    asset_record = next(iter(instance.get_asset_records(asset_keys=[asset_key])), None)
+    stored_cache_value = asset_record.asset_entry.cached_status if asset_record else None
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    if (
+        stored_cache_value is None
+        or not stored_cache_value.is_maintained_on_write
+        or stored_cache_value.partitions_def_id
+        != partitions_def.get_serializable_unique_identifier(
+            dynamic_partitions_store=dynamic_partitions_store
+        )
+    ):
+        # the cache value is rebuilt from the event log on the next read
+        return []
+
+    cache_value = _fold_status_cache(
+        instance, partitions_def, dynamic_partitions_store, stored_cache_value
+    )
+    rebuilt_cache_value = check.not_none(
+        _build_status_cache(
+            instance=instance,
+            asset_key=asset_key,
+            partitions_def=partitions_def,
+            dynamic_partitions_store=dynamic_partitions_store,
+            stored_cache_value=None,
+            asset_record=asset_record,
+            maintain_on_write=True,
+        )
+    )
+
+    def _keys(subset: PartitionsSubset) -> set[str]:
+        return set(subset.get_partition_keys())
+
+    inconsistent_statuses = []
+    if _keys(cache_value.deserialize_materialized_partition_subsets(partitions_def)) != _keys(
+        rebuilt_cache_value.deserialize_materialized_partition_subsets(partitions_def)
+    ):
+        inconsistent_statuses.append(AssetPartitionStatus.MATERIALIZED)
+    if _keys(rebuilt_cache_value.deserialize_failed_partition_subsets(partitions_def)) - _keys(
+        cache_value.deserialize_failed_partition_subsets(partitions_def)
+    ):
+        inconsistent_statuses.append(AssetPartitionStatus.FAILED)
+    if _keys(cache_value.deserialize_in_progress_partition_subsets(partitions_def)) != _keys(
+        rebuilt_cache_value.deserialize_in_progress_partition_subsets(partitions_def)
+    ):
+        inconsistent_statuses.append(AssetPartitionStatus.IN_PROGRESS)
+    return inconsistent_statuses
+
+
+def rebuild_asset_status_cache_value(
+    instance: DagsterInstance,
+    asset_key: AssetKey,
+    partitions_def: Optional[PartitionsDefinition],
+    dynamic_partitions_loader: Optional[DynamicPartitionsStore] = None,
+) -> Optional[AssetStatusCacheValue]:
+    """Recomputes the cache value of an asset from scratch from the event log, discarding the
+    stored cache value, and stores it.
+    """
+    asset_record = next(iter(instance.get_asset_records(asset_keys=[asset_key])), None)
+    stored_cache_value = asset_record.asset_entry.cached_status if asset_record else None
+    dynamic_partitions_store = dynamic_partitions_loader if dynamic_partitions_loader else instance
+    cache_value = _build_status_cache(
+        instance=instance,
+        asset_key=asset_key,
+        partitions_def=partitions_def,
+        dynamic_partitions_store=dynamic_partitions_store,
+        stored_cache_value=None,
+        asset_record=asset_record,
+        maintain_on_write=_can_maintain_on_write(instance, partitions_def),
+    )
+    if cache_value is not None and instance.event_log_storage.can_write_asset_status_cache():
+        if not _store_status_cache(instance, asset_key, cache_value, stored_cache_value):
+            check.failed(
+                f"Events were stored for asset {asset_key.to_user_string()} while its partitions"
+                " status cache was being rebuilt."
+            )
+    return cache_value
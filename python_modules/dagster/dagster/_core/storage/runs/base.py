@@ -9,6 +9,8 @@
 from dagster._core.execution.telemetry import RunTelemetryData
 from dagster._core.instance import MayHaveInstanceWeakref, T_DagsterInstance
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnap
+from dagster._core.snap.job_snapshot import JobLineageSnap
+from dagster._core.snap.node import NodeDefsSnapshot
 from dagster._core.storage.daemon_cursor import DaemonCursorStorage
 from dagster._core.storage.dagster_run import (
     DagsterRun,
@@ -19,6 +21,7 @@
     TagBucket,
 )
 from dagster._core.storage.sql import AlembicVersion
+from dagster._core.storage.storage_executor import run_storage_call
 from dagster._daemon.types import DaemonHeartbeat
 from dagster._utils import PrintFn
 
@@ -159,6 +162,22 @@ def get_run_records(
             List[RunRecord]: List of run records stored in the run storage.
         """
 
+    async def get_run_records_async(
+        self,
+        filters: Optional[RunsFilter] = None,
+        limit: Optional[int] = None,
+        order_by: Optional[str] = None,
+        ascending: bool = False,
+        cursor: Optional[str] = None,
+        bucket_by: Optional[Union[JobBucket, TagBucket]] = None,
+    ) -> Sequence[RunRecord]:
+        """Async variant of `get_run_records`, which does not block the event loop. By default, the
+        sync method is run on the bounded storage executor.
+        """
+        return await run_storage_call(
+            self.get_run_records, filters, limit, order_by, ascending, cursor, bucket_by
+        )
+
     @abstractmethod
     def get_run_tags(
         self,
@@ -267,6 +286,31 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnap:
             PipelineSnapshot
         """
 
+    def get_job_snapshot_node_defs(self, job_snapshot_id: str) -> NodeDefsSnapshot:
+        """Fetch the node definitions of a snapshot by ID. Storages which can load parts of a
+        snapshot should override this to avoid loading the entire snapshot.
+
+        Args:
+            job_snapshot_id (str)
+
+        Returns:
+            NodeDefsSnapshot
+        """
+        return self.get_job_snapshot(job_snapshot_id).node_defs_snapshot
+
+    def get_job_snapshot_lineage(self, job_snapshot_id: str) -> Optional[JobLineageSnap]:
+        """Fetch the lineage of a snapshot by ID, which references the snapshot of the job it
+        was subset from. Storages which can load parts of a snapshot should override this to avoid
+        loading the entire snapshot.
+
+        Args:
+            job_snapshot_id (str)
+
+        Returns:
+            Optional[JobLineageSnap]
+        """
+        return self.get_job_snapshot(job_snapshot_id).lineage_snapshot
+
     @abstractmethod
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         """Check to see if storage contains an execution plan snapshot.
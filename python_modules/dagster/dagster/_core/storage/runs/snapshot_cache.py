@@ -0,0 +1,78 @@
+import threading
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+import dagster._check as check
+from dagster._serdes.serdes import PackableValue
+
+DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES = 64 * 1024 * 1024
+
+
+class SnapshotCacheStats(NamedTuple):
+    num_hits: int
+    num_misses: int
+    num_entries: int
+    size_bytes: int
+    max_size_bytes: int
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        num_lookups = self.num_hits + self.num_misses
+        return self.num_hits / num_lookups if num_lookups else None
+
+
+class SnapshotCache:
+    """A bounded, thread-safe, in-process LRU cache of deserialized snapshot bodies, keyed by
+    snapshot id. Snapshot ids are hashes of the snapshot contents, so entries never go stale.
+
+    The size of each entry is accounted as the size of its serialized body, and the least recently
+    used entries are evicted once the total exceeds `max_size_bytes`.
+    """
+
+    def __init__(self, max_size_bytes: int = DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES):
+        self._max_size_bytes = check.int_param(max_size_bytes, "max_size_bytes")
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[PackableValue, int]] = OrderedDict()
+        self._size_bytes = 0
+        self._num_hits = 0
+        self._num_misses = 0
+
+    def get(self, snapshot_id: str) -> Optional[PackableValue]:
+        with self._lock:
+            entry = self._entries.get(snapshot_id)
+            if entry is None:
+                self._num_misses += 1
+                return None
+            self._num_hits += 1
+            self._entries.move_to_end(snapshot_id)
+            return entry[0]
+
+    def set(self, snapshot_id: str, snapshot: PackableValue, size_bytes: int) -> None:
+        if size_bytes > self._max_size_bytes:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(snapshot_id, None)
+            if existing is not None:
+                self._size_bytes -= existing[1]
+            self._entries[snapshot_id] = (snapshot, size_bytes)
+            self._size_bytes += size_bytes
+
+            while self._size_bytes > self._max_size_bytes:
+                _, (_, evicted_size_bytes) = self._entries.popitem(last=False)
+                self._size_bytes -= evicted_size_bytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def get_stats(self) -> SnapshotCacheStats:
+        with self._lock:
+            return SnapshotCacheStats(
+                num_hits=self._num_hits,
+                num_misses=self._num_misses,
+                num_entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_size_bytes=self._max_size_bytes,
+            )
@@ -28,6 +28,8 @@
 from dagster._core.execution.backfill import BulkActionsFilter, BulkActionStatus, PartitionBackfill
 from dagster._core.remote_representation.origin import RemoteJobOrigin
 from dagster._core.snap import ExecutionPlanSnapshot, JobSnap, create_execution_plan_snapshot_id
+from dagster._core.snap.job_snapshot import JobLineageSnap
+from dagster._core.snap.node import NodeDefsSnapshot
 from dagster._core.storage.dagster_run import (
     DagsterRun,
     DagsterRunStatus,
@@ -57,6 +59,11 @@
     SecondaryIndexMigrationTable,
     SnapshotsTable,
 )
+from dagster._core.storage.runs.snapshot_cache import (
+    DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES,
+    SnapshotCache,
+    SnapshotCacheStats,
+)
 from dagster._core.storage.sql import SqlAlchemyQuery
 from dagster._core.storage.sqlalchemy_compat import (
     db_fetch_mappings,
@@ -73,8 +80,15 @@
     RUN_FAILURE_REASON_TAG,
 )
 from dagster._daemon.types import DaemonHeartbeat
-from dagster._serdes import deserialize_value, serialize_value
-from dagster._serdes.serdes import deserialize_values
+from dagster._record import as_dict, record
+from dagster._serdes import (
+    deserialize_value,
+    serialize_value,
+    serialize_value_compact,
+    whitelist_for_serdes,
+)
+from dagster._serdes.serdes import PackableValue, deserialize_values
+from dagster._serdes.utils import hash_str
 from dagster._seven import JSONDecodeError
 from dagster._time import datetime_from_timestamp, get_current_datetime, utc_datetime_from_naive
 from dagster._utils import PrintFn
@@ -84,6 +98,32 @@
 class SnapshotType(Enum):
     PIPELINE = "PIPELINE"
     EXECUTION_PLAN = "EXECUTION_PLAN"
+    CHUNK = "CHUNK"
+
+
+# The large sub-objects of each snapshot type that are stored as separate, content-addressed
+# chunks when snapshot chunking is enabled
+CHUNKED_SNAPSHOT_FIELDS: Mapping[type, Sequence[str]] = {
+    JobSnap: [
+        "config_schema_snapshot",
+        "dagster_type_namespace_snapshot",
+        "node_defs_snapshot",
+        "dep_structure_snapshot",
+    ],
+    ExecutionPlanSnapshot: ["steps"],
+}
+
+
+@whitelist_for_serdes
+@record
+class ChunkedSnapshotManifest:
+    """Stored in place of a snapshot body when snapshot chunking is enabled. Holds the values of the
+    small fields of the snapshot inline, and the ids of the chunks holding its large fields.
+    """
+
+    snapshot_class_name: str
+    field_values: Mapping[str, Any]
+    chunk_ids_by_field: Mapping[str, str]
 
 
 class SqlRunStorage(RunStorage):
@@ -574,6 +614,15 @@ def get_job_snapshot(self, job_snapshot_id: str) -> JobSnap:
         check.str_param(job_snapshot_id, "job_snapshot_id")
         return self._get_snapshot(job_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    def get_job_snapshot_node_defs(self, job_snapshot_id: str) -> NodeDefsSnapshot:
+        check.str_param(job_snapshot_id, "job_snapshot_id")
+        return self._get_snapshot_field(job_snapshot_id, "node_defs_snapshot")  # type: ignore  # (allowed to return None?)
+
+    def get_job_snapshot_lineage(self, job_snapshot_id: str) -> Optional[JobLineageSnap]:
+        check.str_param(job_snapshot_id, "job_snapshot_id")
+        # the lineage is held inline in the manifest of chunked snapshots
+        return self._get_snapshot_field(job_snapshot_id, "lineage_snapshot")  # type: ignore
+
     def has_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> bool:
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return bool(self.get_execution_plan_snapshot(execution_plan_snapshot_id))
@@ -597,15 +646,96 @@ def get_execution_plan_snapshot(self, execution_plan_snapshot_id: str) -> Execut
         check.str_param(execution_plan_snapshot_id, "execution_plan_snapshot_id")
         return self._get_snapshot(execution_plan_snapshot_id)  # type: ignore  # (allowed to return None?)
 
+    @property
+    def compact_snapshot_serdes(self) -> bool:
+        """Whether job and execution plan snapshots are written with `serialize_value_compact`.
+        Snapshots written with either encoding can be read back regardless of this setting.
+        """
+        return False
+
+    @property
+    def chunked_snapshots(self) -> bool:
+        """Whether the large sub-objects of job and execution plan snapshots (e.g. config schema
+        and node definitions) are stored as separate chunks, addressed by the hash of their
+        contents. Chunks are shared between snapshots and can be loaded individually. Snapshots
+        written with or without chunking can be read back regardless of this setting.
+        """
+        return False
+
+    def _serialize_snapshot_value(self, snapshot_obj) -> str:
+        return (
+            serialize_value_compact(snapshot_obj)
+            if self.compact_snapshot_serdes
+            else serialize_value(snapshot_obj)
+        )
+
+    def _serialize_snapshot_body(self, snapshot_obj) -> bytes:
+        return zlib.compress(self._serialize_snapshot_value(snapshot_obj).encode("utf-8"))
+
     def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
         check.str_param(snapshot_id, "snapshot_id")
         check.not_none_param(snapshot_obj, "snapshot_obj")
         check.inst_param(snapshot_type, "snapshot_type", SnapshotType)
 
+        chunked_fields = CHUNKED_SNAPSHOT_FIELDS.get(type(snapshot_obj))
+        if self.chunked_snapshots and chunked_fields:
+            snapshot_obj = self._add_snapshot_chunks(snapshot_obj, chunked_fields)
+
+        self._insert_snapshot(
+            snapshot_id, self._serialize_snapshot_body(snapshot_obj), snapshot_type
+        )
+        return snapshot_id
+
+    def _add_snapshot_chunks(
+        self, snapshot_obj: Union[JobSnap, ExecutionPlanSnapshot], chunked_fields: Sequence[str]
+    ) -> ChunkedSnapshotManifest:
+        """Stores the given fields of the snapshot as chunks, skipping chunks that are already
+        stored, and returns the manifest to store in place of the snapshot.
+        """
+        field_values = (
+            snapshot_obj._asdict()
+            if isinstance(snapshot_obj, ExecutionPlanSnapshot)
+            else as_dict(snapshot_obj)
+        )
+        chunk_bodies_by_id: dict[str, str] = {}
+        chunk_ids_by_field: dict[str, str] = {}
+        for field in chunked_fields:
+            chunk_body = self._serialize_snapshot_value(field_values[field])
+            chunk_id = hash_str(chunk_body)
+            chunk_bodies_by_id[chunk_id] = chunk_body
+            chunk_ids_by_field[field] = chunk_id
+
+        existing_chunk_ids = {
+            row["snapshot_id"]
+            for row in self.fetchall(
+                db_select([SnapshotsTable.c.snapshot_id]).where(
+                    SnapshotsTable.c.snapshot_id.in_(list(chunk_bodies_by_id.keys()))
+                )
+            )
+        }
+        # chunks are written before the manifest, so that readers never see a manifest whose
+        # chunks are missing
+        for chunk_id, chunk_body in chunk_bodies_by_id.items():
+            if chunk_id not in existing_chunk_ids:
+                self._insert_snapshot(
+                    chunk_id, zlib.compress(chunk_body.encode("utf-8")), SnapshotType.CHUNK
+                )
+
+        return ChunkedSnapshotManifest(
+            snapshot_class_name=type(snapshot_obj).__name__,
+            field_values={
+                field: value for field, value in field_values.items() if field not in chunked_fields
+            },
+            chunk_ids_by_field=chunk_ids_by_field,
+        )
+
+    def _insert_snapshot(
+        self, snapshot_id: str, snapshot_body: bytes, snapshot_type: SnapshotType
+    ) -> None:
         with self.connect() as conn:
             snapshot_insert = SnapshotsTable.insert().values(
                 snapshot_id=snapshot_id,
-                snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                snapshot_body=snapshot_body,
                 snapshot_type=snapshot_type.value,
             )
             try:
@@ -614,8 +744,6 @@ def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotT
                 # on_conflict_do_nothing equivalent
                 pass
 
-            return snapshot_id
-
     def get_run_storage_id(self) -> str:
         query = db_select([InstanceInfo.c.run_storage_id])
         row = self.fetchone(query)
@@ -636,18 +764,93 @@ def _has_snapshot_id(self, snapshot_id: str) -> bool:
 
         return bool(row)
 
+    @property
+    def snapshot_cache(self) -> Optional[SnapshotCache]:
+        """The in-process cache of snapshot bodies read from this storage, configured by the
+        `snapshot_cache` settings of the instance. None if the cache is disabled.
+        """
+        if not hasattr(self, "_snapshot_cache"):
+            settings = self._instance.get_settings("snapshot_cache") if self.has_instance else {}
+            self._snapshot_cache = (
+                SnapshotCache(
+                    max_size_bytes=settings.get(
+                        "max_size_bytes", DEFAULT_SNAPSHOT_CACHE_MAX_SIZE_BYTES
+                    )
+                )
+                if settings.get("enabled", True)
+                else None
+            )
+        return self._snapshot_cache
+
+    def get_snapshot_cache_stats(self) -> Optional[SnapshotCacheStats]:
+        snapshot_cache = self.snapshot_cache
+        return snapshot_cache.get_stats() if snapshot_cache else None
+
+    def _get_snapshot_bodies(self, snapshot_ids: Sequence[str]) -> Mapping[str, PackableValue]:
+        snapshot_cache = self.snapshot_cache
+        snapshots_by_id: dict[str, PackableValue] = {}
+        if snapshot_cache:
+            for snapshot_id in snapshot_ids:
+                snapshot = snapshot_cache.get(snapshot_id)
+                if snapshot is not None:
+                    snapshots_by_id[snapshot_id] = snapshot
+
+        missing_snapshot_ids = [
+            snapshot_id for snapshot_id in snapshot_ids if snapshot_id not in snapshots_by_id
+        ]
+        if not missing_snapshot_ids:
+            return snapshots_by_id
+
+        rows = self.fetchall(
+            db_select([SnapshotsTable.c.snapshot_id, SnapshotsTable.c.snapshot_body]).where(
+                SnapshotsTable.c.snapshot_id.in_(missing_snapshot_ids)
+            )
+        )
+        for row in rows:
+            snapshot, size_bytes = _defensively_unpack_snapshot_body(
+                logging, [row["snapshot_body"]]
+            )
+            if snapshot is None:
+                continue
+            snapshots_by_id[row["snapshot_id"]] = snapshot
+            if snapshot_cache:
+                snapshot_cache.set(row["snapshot_id"], snapshot, size_bytes)
+        return snapshots_by_id
+
     def _get_snapshot(self, snapshot_id: str) -> Optional[JobSnap]:
-        query = db_select([SnapshotsTable.c.snapshot_body]).where(
-            SnapshotsTable.c.snapshot_id == snapshot_id
+        snapshot = self._get_snapshot_bodies([snapshot_id]).get(snapshot_id)
+        if snapshot is None or isinstance(snapshot, (ExecutionPlanSnapshot, JobSnap)):
+            return snapshot  # type: ignore
+        check.inst(snapshot, ChunkedSnapshotManifest)
+
+        chunks_by_id = self._get_snapshot_bodies(list(snapshot.chunk_ids_by_field.values()))
+        snapshot_class = next(
+            snapshot_class
+            for snapshot_class in CHUNKED_SNAPSHOT_FIELDS
+            if snapshot_class.__name__ == snapshot.snapshot_class_name
+        )
+        return snapshot_class(
+            **snapshot.field_values,
+            **{
+                field: chunks_by_id[chunk_id]
+                for field, chunk_id in snapshot.chunk_ids_by_field.items()
+            },
         )
 
-        row = self.fetchone(query)
+    def _get_snapshot_field(self, snapshot_id: str, field: str) -> Optional[PackableValue]:
+        """Loads a single field of a snapshot, only reading the chunk holding that field if the
+        snapshot is chunked.
+        """
+        snapshot = self._get_snapshot_bodies([snapshot_id]).get(snapshot_id)
+        if snapshot is None:
+            return None
+        if not isinstance(snapshot, ChunkedSnapshotManifest):
+            return getattr(snapshot, field)
+        if field in snapshot.field_values:
+            return snapshot.field_values[field]
 
-        return (
-            defensively_unpack_execution_plan_snapshot_query(logging, [row["snapshot_body"]])  # type: ignore
-            if row
-            else None
-        )
+        chunk_id = snapshot.chunk_ids_by_field[field]
+        return self._get_snapshot_bodies([chunk_id]).get(chunk_id)
 
     def get_run_partition_data(self, runs_filter: RunsFilter) -> Sequence[RunPartitionData]:
         if self.has_built_index(RUN_PARTITIONS) and self.has_run_stats_index_cols():
@@ -840,6 +1043,9 @@ def wipe(self) -> None:
             conn.execute(DaemonHeartbeatsTable.delete())
             conn.execute(BulkActionsTable.delete())
 
+        if self.snapshot_cache:
+            self.snapshot_cache.clear()
+
     def wipe_daemon_heartbeats(self) -> None:
         with self.connect() as conn:
             # https://stackoverflow.com/a/54386260/324449
@@ -1123,6 +1329,14 @@ def replace_job_origin(self, run: DagsterRun, job_origin: RemoteJobOrigin) -> No
 def defensively_unpack_execution_plan_snapshot_query(
     logger: logging.Logger, row: Sequence[Any]
 ) -> Optional[Union[ExecutionPlanSnapshot, JobSnap]]:
+    snapshot, _ = _defensively_unpack_snapshot_body(logger, row, (ExecutionPlanSnapshot, JobSnap))
+    return snapshot  # type: ignore
+
+
+def _defensively_unpack_snapshot_body(
+    logger: logging.Logger, row: Sequence[Any], as_type: Optional[tuple[type, type]] = None
+) -> tuple[Optional[PackableValue], int]:
+    """Returns the deserialized snapshot body, along with the size of its serialized form."""
     # minimal checking here because sqlalchemy returns a different type based on what version of
     # SqlAlchemy you are using
 
@@ -1131,22 +1345,22 @@ def _warn(msg: str) -> None:
 
     if not isinstance(row[0], bytes):
         _warn("First entry in row is not a binary type.")
-        return None
+        return None, 0
 
     try:
         uncompressed_bytes = zlib.decompress(row[0])
     except zlib.error:
         _warn("Could not decompress bytes stored in snapshot table.")
-        return None
+        return None, 0
 
     try:
         decoded_str = uncompressed_bytes.decode("utf-8")
     except UnicodeDecodeError:
         _warn("Could not unicode decode decompressed bytes stored in snapshot table.")
-        return None
+        return None, 0
 
     try:
-        return deserialize_value(decoded_str, (ExecutionPlanSnapshot, JobSnap))
+        return deserialize_value(decoded_str, as_type), len(uncompressed_bytes)
     except JSONDecodeError:
         _warn("Could not parse json in snapshot table.")
-        return None
+        return None, 0
@@ -10,6 +10,7 @@
 from typing_extensions import Self
 
 from dagster import (
+    Field,
     StringSource,
     _check as check,
 )
@@ -63,22 +64,47 @@ class SqliteRunStorage(SqlRunStorage, ConfigurableClass):
           config:
             base_dir: /path/to/dir
 
-    The ``base_dir`` param tells the run storage where on disk to store the database.
+    The ``base_dir`` param tells the run storage where on disk to store the database. Setting
+    ``compact_snapshot_serdes`` writes job and execution plan snapshots with the compact serdes
+    encoding, and setting ``chunked_snapshots`` stores their large sub-objects as chunks shared
+    between snapshots. Older versions of Dagster cannot read snapshots written with either setting.
     """
 
-    def __init__(self, conn_string: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        conn_string: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        compact_snapshot_serdes: bool = False,
+        chunked_snapshots: bool = False,
+    ):
         check.str_param(conn_string, "conn_string")
         self._conn_string = conn_string
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
+        self._compact_snapshot_serdes = check.bool_param(
+            compact_snapshot_serdes, "compact_snapshot_serdes"
+        )
+        self._chunked_snapshots = check.bool_param(chunked_snapshots, "chunked_snapshots")
         super().__init__()
 
     @property
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def compact_snapshot_serdes(self) -> bool:
+        return self._compact_snapshot_serdes
+
+    @property
+    def chunked_snapshots(self) -> bool:
+        return self._chunked_snapshots
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return {"base_dir": StringSource}
+        return {
+            "base_dir": StringSource,
+            "compact_snapshot_serdes": Field(bool, is_required=False),
+            "chunked_snapshots": Field(bool, is_required=False),
+        }
 
     @classmethod
     def from_config_value(
@@ -87,7 +113,13 @@ def from_config_value(
         return SqliteRunStorage.from_local(inst_data=inst_data, **config_value)
 
     @classmethod
-    def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] = None) -> Self:
+    def from_local(
+        cls,
+        base_dir: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        compact_snapshot_serdes: bool = False,
+        chunked_snapshots: bool = False,
+    ) -> Self:
         check.str_param(base_dir, "base_dir")
         mkdir_p(base_dir)
         conn_string = create_db_conn_string(base_dir, "runs")
@@ -118,7 +150,7 @@ def from_local(cls, base_dir: str, inst_data: Optional[ConfigurableClassData] =
             if "instance_info" not in table_names:
                 InstanceInfo.create(engine)
 
-        run_storage = cls(conn_string, inst_data)
+        run_storage = cls(conn_string, inst_data, compact_snapshot_serdes, chunked_snapshots)
 
         if should_mark_indexes:
             run_storage.migrate()
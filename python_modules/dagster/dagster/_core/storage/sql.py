@@ -13,6 +13,7 @@
 from typing_extensions import TypeAlias
 
 from dagster._utils import file_relative_path
+from dagster._utils.cache_stats import get_current_cache_stats
 
 create_engine = db.create_engine  # exported
 
@@ -170,6 +171,16 @@ def run_migrations_online(
 MYSQL_FLOAT_PRECISION: int = 32
 
 
+def _count_storage_query(*_args, **_kwargs) -> None:
+    stats = get_current_cache_stats()
+    if stats is not None:
+        stats.num_storage_queries += 1
+
+
+# count the statements executed against any storage while cache stats are being recorded
+db.event.listen(db.engine.Engine, "before_cursor_execute", _count_storage_query)
+
+
 # datetime issue fix from here: https://stackoverflow.com/questions/29711102/sqlalchemy-mysql-millisecond-or-microsecond-precision/29723278
 @compiles(db.DateTime, "mysql")
 def compile_datetime_and_add_precision_mysql(_element, _compiler, **_kw) -> str:
@@ -0,0 +1,44 @@
+import asyncio
+import functools
+import os
+import threading
+from typing import Callable, Optional, TypeVar
+
+from typing_extensions import ParamSpec
+
+from dagster._core.utils import InheritContextThreadPoolExecutor
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DEFAULT_STORAGE_ASYNC_MAX_WORKERS = 16
+
+_executor_lock = threading.Lock()
+_executor: Optional[InheritContextThreadPoolExecutor] = None
+
+
+def get_storage_executor() -> InheritContextThreadPoolExecutor:
+    """Returns the process-wide executor on which the async storage methods run their blocking
+    database calls. Its size bounds the number of concurrent storage queries issued by async
+    callers, and is configured with the DAGSTER_STORAGE_ASYNC_MAX_WORKERS environment variable.
+    """
+    global _executor  # noqa: PLW0603
+    with _executor_lock:
+        if _executor is None:
+            _executor = InheritContextThreadPoolExecutor(
+                max_workers=int(
+                    os.getenv(
+                        "DAGSTER_STORAGE_ASYNC_MAX_WORKERS", str(DEFAULT_STORAGE_ASYNC_MAX_WORKERS)
+                    )
+                ),
+                thread_name_prefix="dagster-storage",
+            )
+        return _executor
+
+
+async def run_storage_call(fn: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """Runs a blocking storage call on the storage executor without blocking the event loop. Context
+    variables of the caller are propagated to the call.
+    """
+    future = get_storage_executor().submit(functools.partial(fn, *args, **kwargs))
+    return await asyncio.wrap_future(future)
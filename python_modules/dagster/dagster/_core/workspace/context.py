@@ -1,12 +1,22 @@
 import logging
 import sys
 import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import ExitStack
 from itertools import count
-from typing import TYPE_CHECKING, AbstractSet, Any, Optional, TypeVar, Union  # noqa: UP035
+from typing import (  # noqa: UP035
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    NamedTuple,
+    Optional,
+    TypeVar,
+    Union,
+)
 
 from typing_extensions import Self
 
@@ -47,6 +57,7 @@
 from dagster._core.remote_representation.handle import InstigatorHandle
 from dagster._core.remote_representation.origin import (
     GrpcServerCodeLocationOrigin,
+    InProcessCodeLocationOrigin,
     ManagedGrpcPythonEnvCodeLocationOrigin,
 )
 from dagster._core.snap.dagster_types import DagsterTypeSnap
@@ -84,6 +95,9 @@
 
 WEBSERVER_GRPC_SERVER_HEARTBEAT_TTL = 45
 
+# How often to check for code locations that have exceeded their load timeout
+LOCATION_LOAD_TIMEOUT_CHECK_INTERVAL = 1.0
+
 
 class BaseWorkspaceRequestContext(LoadingContext):
     """This class is a request-scoped object that stores (1) a reference to all repository locations
@@ -594,6 +608,24 @@ def __exit__(self, exception_type, exception_value, traceback) -> None:
         pass
 
 
+class _LocationLoad:
+    """The progress of a code location that is being loaded by `WorkspaceProcessContext`."""
+
+    def __init__(self, origin: CodeLocationOrigin):
+        self.origin = origin
+        # monotonic time at which the load started running on the location load executor
+        self.start_time: Optional[float] = None
+        # the error entry that replaced the location in the workspace, if the load timed out
+        self.timeout_entry: Optional[CodeLocationEntry] = None
+        self.finished = False
+
+
+class _ReplacedLocation(NamedTuple):
+    entry: Optional[CodeLocationEntry]
+    watch_thread_shutdown_event: Optional[threading.Event]
+    watch_thread: Optional[threading.Thread]
+
+
 class WorkspaceProcessContext(IWorkspaceProcessContext):
     """Process-scoped object that tracks the state of a workspace.
 
@@ -628,7 +660,8 @@ def __init__(
 
         self._version = version
 
-        # Guards changes to _workspace_snapshot, _watch_thread_shutdown_events and _watch_threads
+        # Guards changes to _workspace_snapshot, _watch_thread_shutdown_events and _watch_threads.
+        # Code locations are loaded without holding it.
         self._lock = threading.Lock()
         self._watch_thread_shutdown_events: dict[str, threading.Event] = {}
         self._watch_threads: dict[str, threading.Thread] = {}
@@ -654,13 +687,15 @@ def __init__(
                 )
             )
 
-        self._workspace_snapshot: WorkspaceSnapshot = WorkspaceSnapshot(code_location_entries={})
-        self._update_workspace(
-            {
-                origin.location_name: self._load_location(origin, reload=False)
-                for origin in self._origins
-            }
+        self._location_load_timeout = instance.code_server_location_load_timeout
+        self._location_load_executor = ThreadPoolExecutor(
+            max_workers=instance.code_server_max_concurrent_location_loads,
+            thread_name_prefix="dagster-code-location-load",
         )
+        self._stack.callback(self._location_load_executor.shutdown, wait=False, cancel_futures=True)
+
+        self._workspace_snapshot: WorkspaceSnapshot = WorkspaceSnapshot(code_location_entries={})
+        self._load_locations(self._origins, reload=False)
 
     @property
     def workspace_load_target(self) -> Optional[WorkspaceLoadTarget]:
@@ -742,6 +777,7 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
         location_name = origin.location_name
         location = None
         error = None
+        start_time = time.perf_counter()
         try:
             if isinstance(origin, ManagedGrpcPythonEnvCodeLocationOrigin):
                 endpoint = (
@@ -787,8 +823,194 @@ def _load_location(self, origin: CodeLocationOrigin, reload: bool) -> CodeLocati
             ),
             update_timestamp=load_time,
             version_key=version_key,
+            load_duration=time.perf_counter() - start_time,
         )
 
+    def _load_locations(self, origins: Sequence[CodeLocationOrigin], reload: bool) -> None:
+        """Loads the given code locations, and replaces the locations in the workspace with them.
+
+        Locations are loaded concurrently on the location load executor, and each is swapped into
+        the workspace as soon as it finishes loading, so that requests can use the locations that
+        have loaded while the others are still loading. Until then, previously loaded locations
+        keep being served, and new locations are shown as loading. In-process locations import
+        user code into this process, so they are loaded one at a time on the calling thread.
+
+        A location that takes longer than the location load timeout to load is replaced with an
+        error, which is in turn replaced by the location if it does eventually finish loading.
+        """
+        now = get_current_timestamp()
+        with self._lock:
+            current_entries = self._workspace_snapshot.code_location_entries
+            self._workspace_snapshot = WorkspaceSnapshot(
+                code_location_entries={
+                    **current_entries,
+                    **{
+                        origin.location_name: CodeLocationEntry(
+                            origin=origin,
+                            code_location=None,
+                            load_error=None,
+                            load_status=CodeLocationLoadStatus.LOADING,
+                            display_metadata=origin.get_display_metadata(),
+                            update_timestamp=now,
+                            version_key=str(now),
+                        )
+                        for origin in origins
+                        if origin.location_name not in current_entries
+                    },
+                }
+            )
+
+        pending_loads: dict[Future, _LocationLoad] = {}
+        for origin in origins:
+            if not isinstance(origin, InProcessCodeLocationOrigin):
+                location_load = _LocationLoad(origin)
+                future = self._location_load_executor.submit(
+                    self._run_location_load, location_load, reload
+                )
+                pending_loads[future] = location_load
+
+        for origin in origins:
+            if isinstance(origin, InProcessCodeLocationOrigin):
+                entry = self._load_location(origin, reload=reload)
+                with self._lock:
+                    replaced = self._swap_location_entry(entry)
+                self._cleanup_replaced_locations([replaced])
+
+        while pending_loads:
+            done, _ = wait(
+                pending_loads,
+                timeout=(
+                    LOCATION_LOAD_TIMEOUT_CHECK_INTERVAL
+                    if self._location_load_timeout is not None
+                    else None
+                ),
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                # surface unexpected errors from the load, as when loading on the calling thread
+                future.result()
+            pending_loads = {
+                future: location_load
+                for future, location_load in pending_loads.items()
+                if future not in done and not self._maybe_time_out_location_load(location_load)
+            }
+
+        # remove the locations that are no longer in the workspace, in the order of the origins
+        with self._lock:
+            current_entries = self._workspace_snapshot.code_location_entries
+            location_names = {origin.location_name for origin in origins}
+            removed = [
+                _ReplacedLocation(
+                    entry=entry,
+                    watch_thread_shutdown_event=self._watch_thread_shutdown_events.pop(name, None),
+                    watch_thread=self._watch_threads.pop(name, None),
+                )
+                for name, entry in current_entries.items()
+                if name not in location_names
+            ]
+            self._workspace_snapshot = WorkspaceSnapshot(
+                code_location_entries={
+                    origin.location_name: current_entries[origin.location_name]
+                    for origin in origins
+                }
+            )
+
+        self._cleanup_replaced_locations(removed)
+
+    def _run_location_load(self, location_load: "_LocationLoad", reload: bool) -> None:
+        location_load.start_time = time.monotonic()
+        entry = self._load_location(location_load.origin, reload=reload)
+        with self._lock:
+            location_load.finished = True
+            # a location that timed out is only swapped in if its error is still in the workspace
+            is_stale = (
+                location_load.timeout_entry is not None
+                and self._workspace_snapshot.code_location_entries.get(
+                    location_load.origin.location_name
+                )
+                is not location_load.timeout_entry
+            )
+            replaced = self._swap_location_entry(entry) if not is_stale else None
+
+        if replaced:
+            self._cleanup_replaced_locations([replaced])
+        elif entry.code_location:
+            entry.code_location.cleanup()
+
+    def _maybe_time_out_location_load(self, location_load: "_LocationLoad") -> bool:
+        """Replaces the location with an error if it has exceeded the location load timeout, and
+        returns whether it did so.
+        """
+        if (
+            self._location_load_timeout is None
+            or location_load.start_time is None
+            or time.monotonic() - location_load.start_time < self._location_load_timeout
+        ):
+            return False
+
+        origin = location_load.origin
+        load_time = get_current_timestamp()
+        timeout_entry = CodeLocationEntry(
+            origin=origin,
+            code_location=None,
+            load_error=SerializableErrorInfo(
+                message=(
+                    f"Timed out after {self._location_load_timeout} seconds waiting for code"
+                    f" location {origin.location_name} to load. It will be updated if it"
+                    " finishes loading. You can increase the timeout by setting"
+                    " code_servers.location_load_timeout in your dagster.yaml."
+                ),
+                stack=[],
+                cls_name=None,
+            ),
+            load_status=CodeLocationLoadStatus.LOADED,
+            display_metadata=origin.get_display_metadata(),
+            update_timestamp=load_time,
+            version_key=str(load_time),
+        )
+        with self._lock:
+            if location_load.finished:
+                return False
+            location_load.timeout_entry = timeout_entry
+            replaced = self._swap_location_entry(timeout_entry)
+
+        warnings.warn(
+            f"Error loading repository location {origin.location_name}:"
+            f"{check.not_none(timeout_entry.load_error).message}"
+        )
+        self._cleanup_replaced_locations([replaced])
+        return True
+
+    def _swap_location_entry(self, entry: CodeLocationEntry) -> "_ReplacedLocation":
+        """Replaces the entry of a location in the workspace, and restarts the thread watching it.
+        Must be called while holding _lock, and the returned location cleaned up after releasing it.
+        """
+        location_name = entry.origin.location_name
+        replaced = _ReplacedLocation(
+            entry=self._workspace_snapshot.code_location_entries.get(location_name),
+            watch_thread_shutdown_event=self._watch_thread_shutdown_events.pop(location_name, None),
+            watch_thread=self._watch_threads.pop(location_name, None),
+        )
+        self._workspace_snapshot = self._workspace_snapshot.with_code_location(location_name, entry)
+        if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
+            self._start_watch_thread(entry.origin)
+        return replaced
+
+    def _cleanup_replaced_locations(
+        self, replaced_locations: Sequence["_ReplacedLocation"]
+    ) -> None:
+        for replaced in replaced_locations:
+            if replaced.watch_thread_shutdown_event:
+                replaced.watch_thread_shutdown_event.set()
+
+        for replaced in replaced_locations:
+            if replaced.watch_thread:
+                replaced.watch_thread.join()
+
+        for replaced in replaced_locations:
+            if replaced.entry and replaced.entry.code_location:
+                replaced.entry.code_location.cleanup()
+
     def get_workspace_snapshot(self) -> WorkspaceSnapshot:
         with self._lock:
             return self._workspace_snapshot
@@ -836,46 +1058,10 @@ def shutdown_code_location(self, name: str) -> None:
             self._workspace_snapshot.code_location_entries[name].origin.shutdown_server()
 
     def refresh_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=False)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
+        self._load_locations(self._origins, reload=False)
 
     def reload_workspace(self) -> None:
-        updated_locations = {
-            origin.location_name: self._load_location(origin, reload=True)
-            for origin in self._origins
-        }
-        self._update_workspace(updated_locations)
-
-    def _update_workspace(self, new_locations: dict[str, CodeLocationEntry]):
-        # minimize lock time by only holding while swapping data old to new
-        with self._lock:
-            previous_events = self._watch_thread_shutdown_events
-            self._watch_thread_shutdown_events = {}
-
-            previous_threads = self._watch_threads
-            self._watch_threads = {}
-
-            previous_locations = self._workspace_snapshot.code_location_entries
-            self._workspace_snapshot = WorkspaceSnapshot(code_location_entries=new_locations)
-
-            # start monitoring for new locations
-            for entry in new_locations.values():
-                if isinstance(entry.origin, GrpcServerCodeLocationOrigin):
-                    self._start_watch_thread(entry.origin)
-
-        # clean up previous locations
-        for event in previous_events.values():
-            event.set()
-
-        for watch_thread in previous_threads.values():
-            watch_thread.join()
-
-        for entry in previous_locations.values():
-            if entry.code_location:
-                entry.code_location.cleanup()
+        self._load_locations(self._origins, reload=True)
 
     def create_request_context(self, source: Optional[object] = None) -> WorkspaceRequestContext:
         return WorkspaceRequestContext(
@@ -918,7 +1104,7 @@ def __enter__(self) -> Self:
         return self
 
     def __exit__(self, exception_type, exception_value, traceback) -> None:
-        self._update_workspace({})  # update to empty to close all current locations
+        self._load_locations([], reload=False)  # update to empty to close all current locations
         self._stack.close()
 
     def copy_for_test_instance(self, instance: DagsterInstance) -> "WorkspaceProcessContext":
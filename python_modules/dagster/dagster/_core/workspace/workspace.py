@@ -28,6 +28,8 @@ class CodeLocationEntry:
     display_metadata: Mapping[str, str]
     update_timestamp: float
     version_key: str
+    # seconds taken to load the location, or None if it has not finished loading
+    load_duration: Optional[float] = None
 
 
 @record
@@ -40,6 +42,7 @@ class CodeLocationStatusEntry:
     load_status: CodeLocationLoadStatus
     update_timestamp: float
     version_key: str
+    load_duration: Optional[float] = None
 
 
 @record
@@ -64,4 +67,5 @@ def location_status_from_location_entry(
         load_status=entry.load_status,
         update_timestamp=entry.update_timestamp,
         version_key=entry.version_key,
+        load_duration=entry.load_duration,
     )
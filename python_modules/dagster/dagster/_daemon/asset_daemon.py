@@ -22,6 +22,7 @@
 from dagster._core.definitions.asset_selection import AssetSelection
 from dagster._core.definitions.automation_condition_sensor_definition import (
     EMIT_BACKFILLS_METADATA_KEY,
+    MAX_EVALUATION_WORKERS_METADATA_KEY,
 )
 from dagster._core.definitions.automation_tick_evaluation_context import (
     AutomationTickEvaluationContext,
@@ -223,6 +224,13 @@ def asset_daemon_cursor_from_instigator_serialized_cursor(
     return deserialized_cursor
 
 
+def _get_max_evaluation_workers(sensor: Optional[RemoteSensor]) -> Optional[int]:
+    if not (sensor and sensor.metadata and sensor.metadata.standard_metadata):
+        return None
+    value = sensor.metadata.standard_metadata.get(MAX_EVALUATION_WORKERS_METADATA_KEY)
+    return cast(int, value.value) if value else None
+
+
 class AutoMaterializeLaunchContext:
     def __init__(
         self,
@@ -960,6 +968,7 @@ def _evaluate_auto_materialize_tick(
                 ),
                 auto_observe_asset_keys=auto_observe_asset_keys,
                 logger=self._logger,
+                max_evaluation_workers=_get_max_evaluation_workers(sensor),
             ).evaluate()
 
             check.invariant(new_cursor.evaluation_id == evaluation_id)
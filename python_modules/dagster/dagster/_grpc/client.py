@@ -32,10 +32,15 @@
     SensorExecutionArgs,
 )
 from dagster._grpc.utils import (
+    COMPACT_SERDES_METADATA,
+    REPOSITORY_SNAPSHOT_ID_METADATA_KEY,
+    STREAMING_COMPRESSION_METADATA,
+    StreamingChunkDecoder,
     default_grpc_timeout,
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    is_compressed_stream,
     max_rx_bytes,
     max_send_bytes,
 )
@@ -62,6 +67,14 @@ def client_heartbeat_thread(client: "DagsterGrpcClient", shutdown_event: Event)
             continue
 
 
+def _held_snapshot_id_metadata(
+    held_snapshot_id: Optional[str],
+) -> Optional[Sequence[tuple[str, str]]]:
+    if held_snapshot_id is None:
+        return None
+    return [(REPOSITORY_SNAPSHOT_ID_METADATA_KEY, held_snapshot_id)]
+
+
 class DagsterGrpcClient:
     def __init__(
         self,
@@ -70,6 +83,8 @@ def __init__(
         host: str = "localhost",
         use_ssl: bool = False,
         metadata: Optional[Sequence[tuple[str, str]]] = None,
+        compact_serdes: bool = False,
+        streaming_compression: bool = False,
     ):
         self.port = check.opt_int_param(port, "port")
 
@@ -80,6 +95,15 @@ def __init__(
         self._ssl_creds = grpc.ssl_channel_credentials() if use_ssl else None
 
         self._metadata = check.opt_sequence_param(metadata, "metadata")
+        self._compact_serdes = check.bool_param(compact_serdes, "compact_serdes")
+        if compact_serdes:
+            # ask the server for compact repository snapshots, see serialize_value_compact
+            self._metadata = [*self._metadata, COMPACT_SERDES_METADATA]
+        # streamed chunks are already gzip-compressed by gRPC, so compressing them with
+        # split_into_chunks too is opt-in, see the grpc_streaming_compression benchmark
+        self._streaming_compression = check.bool_param(
+            streaming_compression, "streaming_compression"
+        )
 
         check.invariant(
             port is not None if seven.IS_WINDOWS else True,
@@ -108,6 +132,21 @@ def metadata(self) -> Sequence[tuple[str, str]]:
     def use_ssl(self) -> bool:
         return self._use_ssl
 
+    @property
+    def compact_serdes(self) -> bool:
+        return self._compact_serdes
+
+    @property
+    def streaming_compression(self) -> bool:
+        return self._streaming_compression
+
+    def _streaming_chunks_metadata(
+        self, metadata: Optional[Sequence[tuple[str, str]]]
+    ) -> Sequence[tuple[str, str]]:
+        if not self._streaming_compression:
+            return self._call_metadata(metadata)
+        return self._call_metadata([*(metadata or []), STREAMING_COMPRESSION_METADATA])
+
     @contextmanager
     def _channel(self) -> Iterator[grpc.Channel]:
         options = [
@@ -152,15 +191,23 @@ async def _async_channel(self) -> AsyncIterator[grpc.Channel]:
         ) as channel:
             yield channel
 
+    def _call_metadata(
+        self, metadata: Optional[Sequence[tuple[str, str]]]
+    ) -> Sequence[tuple[str, str]]:
+        return [*self._metadata, *metadata] if metadata else self._metadata
+
     def _get_response(
         self,
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
     ):
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            return getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            return getattr(stub, method)(
+                request, metadata=self._call_metadata(metadata), timeout=timeout
+            )
 
     async def _gen_response(
         self,
@@ -226,35 +273,137 @@ def _get_streaming_response(
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
     ) -> Iterator[Any]:
         with self._channel() as channel:
             stub = DagsterApiStub(channel)
-            yield from getattr(stub, method)(request, metadata=self._metadata, timeout=timeout)
+            yield from getattr(stub, method)(
+                request, metadata=self._call_metadata(metadata), timeout=timeout
+            )
 
     async def _gen_streaming_response(
         self,
         method: str,
         request: google.protobuf.message.Message,
         timeout: int = DEFAULT_GRPC_TIMEOUT,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
     ) -> AsyncIterator[Any]:
         async with self._async_channel() as channel:
             stub = DagsterApiStub(channel)
             async for response in getattr(stub, method)(
-                request, metadata=self._metadata, timeout=timeout
+                request, metadata=self._call_metadata(metadata), timeout=timeout
             ):
                 yield response
 
+    def _get_streaming_chunks(
+        self,
+        method: str,
+        request: google.protobuf.message.Message,
+        chunk_field: str,
+        timeout: int = DEFAULT_GRPC_TIMEOUT,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
+    ) -> Iterator[tuple[int, str]]:
+        """Streams the chunks of a value serialized by the server, as (sequence number, chunk)
+        pairs. If `streaming_compression` is set, the server is asked to compress the chunks, in
+        which case each chunk is decoded as soon as it is received.
+        """
+        with self._channel() as channel:
+            stub = DagsterApiStub(channel)
+            call = getattr(stub, method)(
+                request,
+                metadata=self._streaming_chunks_metadata(metadata),
+                timeout=timeout,
+            )
+            decoder = (
+                StreamingChunkDecoder() if is_compressed_stream(call.initial_metadata()) else None
+            )
+            for response in call:
+                chunk = getattr(response, chunk_field)
+                yield response.sequence_number, decoder.decode(chunk) if decoder else chunk
+
+    async def _gen_streaming_chunks(
+        self,
+        method: str,
+        request: google.protobuf.message.Message,
+        chunk_field: str,
+        timeout: int = DEFAULT_GRPC_TIMEOUT,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
+    ) -> AsyncIterator[tuple[int, str]]:
+        async with self._async_channel() as channel:
+            stub = DagsterApiStub(channel)
+            call = getattr(stub, method)(
+                request,
+                metadata=self._streaming_chunks_metadata(metadata),
+                timeout=timeout,
+            )
+            decoder = (
+                StreamingChunkDecoder()
+                if is_compressed_stream(await call.initial_metadata())
+                else None
+            )
+            async for response in call:
+                chunk = getattr(response, chunk_field)
+                yield response.sequence_number, decoder.decode(chunk) if decoder else chunk
+
+    def _streaming_chunk_query(
+        self,
+        method: str,
+        request_type: type[google.protobuf.message.Message],
+        chunk_field: str = "serialized_chunk",
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        custom_timeout_message=None,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
+        **kwargs,
+    ) -> Iterator[tuple[int, str]]:
+        try:
+            yield from self._get_streaming_chunks(
+                method,
+                request=request_type(**kwargs),
+                chunk_field=chunk_field,
+                timeout=timeout,
+                metadata=metadata,
+            )
+        except Exception as e:
+            self._raise_grpc_exception(
+                e, timeout=timeout, custom_timeout_message=custom_timeout_message
+            )
+
+    async def _gen_streaming_chunk_query(
+        self,
+        method: str,
+        request_type: type[google.protobuf.message.Message],
+        chunk_field: str = "serialized_chunk",
+        timeout=DEFAULT_GRPC_TIMEOUT,
+        custom_timeout_message=None,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
+        **kwargs,
+    ) -> AsyncIterable[tuple[int, str]]:
+        try:
+            async for sequence_number_and_chunk in self._gen_streaming_chunks(
+                method,
+                request=request_type(**kwargs),
+                chunk_field=chunk_field,
+                timeout=timeout,
+                metadata=metadata,
+            ):
+                yield sequence_number_and_chunk
+        except Exception as e:
+            self._raise_grpc_exception(
+                e, timeout=timeout, custom_timeout_message=custom_timeout_message
+            )
+
     def _streaming_query(
         self,
         method: str,
         request_type: type[google.protobuf.message.Message],
         timeout=DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message=None,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
         **kwargs,
     ) -> Iterator[Any]:
         try:
             yield from self._get_streaming_response(
-                method, request=request_type(**kwargs), timeout=timeout
+                method, request=request_type(**kwargs), timeout=timeout, metadata=metadata
             )
         except Exception as e:
             self._raise_grpc_exception(
@@ -267,11 +416,12 @@ async def _gen_streaming_query(
         request_type: type[google.protobuf.message.Message],
         timeout=DEFAULT_GRPC_TIMEOUT,
         custom_timeout_message=None,
+        metadata: Optional[Sequence[tuple[str, str]]] = None,
         **kwargs,
     ) -> AsyncIterable[Any]:
         try:
             async for response in self._gen_streaming_response(
-                method, request=request_type(**kwargs), timeout=timeout
+                method, request=request_type(**kwargs), timeout=timeout, metadata=metadata
             ):
                 yield response
         except Exception as e:
@@ -374,8 +524,9 @@ def external_partition_set_execution_params(
             PartitionSetExecutionParamArgs,
         )
 
-        chunks = list(
-            self._streaming_query(
+        return "".join(
+            chunk
+            for _, chunk in self._streaming_chunk_query(
                 "ExternalPartitionSetExecutionParams",
                 api_pb2.ExternalPartitionSetExecutionParamsRequest,
                 serialized_partition_set_execution_param_args=serialize_value(
@@ -384,8 +535,6 @@ def external_partition_set_execution_params(
             )
         )
 
-        return "".join([chunk.serialized_chunk for chunk in chunks])
-
     def external_pipeline_subset(self, pipeline_subset_snapshot_args: JobSubsetSnapshotArgs) -> str:
         check.inst_param(
             pipeline_subset_snapshot_args,
@@ -448,18 +597,25 @@ def streaming_external_repository(
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+        held_snapshot_id: Optional[str] = None,
     ) -> Iterator[dict]:
-        for res in self._streaming_query(
+        """Streams the serialized RepositorySnap of the given repository. If `held_snapshot_id` is
+        not None, the server may instead send a RepositorySnapUpdate relative to the RepositorySnap
+        with that snapshot id, or to nothing if it is empty.
+        """
+        for sequence_number, chunk in self._streaming_chunk_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
+            chunk_field="serialized_external_repository_chunk",
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
             timeout=timeout,
+            metadata=_held_snapshot_id_metadata(held_snapshot_id),
         ):
             yield {
-                "sequence_number": res.sequence_number,
-                "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "sequence_number": sequence_number,
+                "serialized_external_repository_chunk": chunk,
             }
 
     async def gen_streaming_external_repository(
@@ -467,18 +623,21 @@ async def gen_streaming_external_repository(
         remote_repository_origin: RemoteRepositoryOrigin,
         defer_snapshots: bool = False,
         timeout=DEFAULT_REPOSITORY_GRPC_TIMEOUT,
+        held_snapshot_id: Optional[str] = None,
     ) -> AsyncIterable[dict]:
-        async for res in self._gen_streaming_query(
+        async for sequence_number, chunk in self._gen_streaming_chunk_query(
             "StreamingExternalRepository",
             api_pb2.ExternalRepositoryRequest,
+            chunk_field="serialized_external_repository_chunk",
             # Rename parameter
             serialized_repository_python_origin=serialize_value(remote_repository_origin),
             defer_snapshots=defer_snapshots,
             timeout=timeout,
+            metadata=_held_snapshot_id_metadata(held_snapshot_id),
         ):
             yield {
-                "sequence_number": res.sequence_number,
-                "serialized_external_repository_chunk": res.serialized_external_repository_chunk,
+                "sequence_number": sequence_number,
+                "serialized_external_repository_chunk": chunk,
             }
 
     def _is_unimplemented_error(self, e: Exception) -> bool:
@@ -2,16 +2,22 @@
 import sys
 import threading
 from contextlib import ExitStack
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Union
 
 import dagster._check as check
 from dagster._core.instance import InstanceRef
+from dagster._core.remote_representation.external_data import RepositoryErrorSnap, RepositorySnap
 from dagster._core.remote_representation.grpc_server_registry import GrpcServerRegistry
-from dagster._core.remote_representation.origin import ManagedGrpcPythonEnvCodeLocationOrigin
+from dagster._core.remote_representation.origin import (
+    ManagedGrpcPythonEnvCodeLocationOrigin,
+    RemoteRepositoryOrigin,
+)
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
 from dagster._grpc.__generated__ import api_pb2
 from dagster._grpc.__generated__.api_pb2_grpc import DagsterApiServicer
 from dagster._grpc.client import DEFAULT_GRPC_TIMEOUT
+from dagster._grpc.repository_snap_cache import RepositorySnapCache
+from dagster._grpc.server import STREAMING_CHUNK_SIZE
 from dagster._grpc.types import (
     CancelExecutionRequest,
     CancelExecutionResult,
@@ -20,6 +26,12 @@
     ShutdownServerResult,
     StartRunResult,
 )
+from dagster._grpc.utils import (
+    COMPACT_SERDES_METADATA,
+    REPOSITORY_SNAPSHOT_ID_METADATA_KEY,
+    STREAMING_COMPRESSION_METADATA,
+    split_into_chunks,
+)
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._utils.error import serializable_error_info_from_exc_info
 
@@ -70,6 +82,9 @@ def __init__(
 
         self._reload_lock = threading.Lock()
 
+        # kept across reloads, so that clients can be sent deltas from the previous load
+        self._repository_snap_cache = RepositorySnapCache()
+
         self._grpc_server_registry = self._exit_stack.enter_context(
             GrpcServerRegistry(
                 instance_ref=self._instance_ref,
@@ -212,8 +227,63 @@ def GetServerId(self, request, context):
     def GetCurrentImage(self, request, context):
         return self._query("GetCurrentImage", request, context)
 
+    def _get_serialized_external_repository_data(self, request, context) -> Optional[str]:
+        """Returns the serialized RepositorySnap or RepositorySnapUpdate for clients that can apply
+        updates, or None to proxy the call. The RepositorySnapCache lives in this process rather
+        than in the code server subprocess, so that clients holding a RepositorySnap from before
+        a reload can be sent only what changed.
+        """
+        invocation_metadata = context.invocation_metadata()
+        held_snapshot_id = dict(invocation_metadata).get(REPOSITORY_SNAPSHOT_ID_METADATA_KEY)
+        if held_snapshot_id is None:
+            return None
+
+        client = self._client
+        if not client:
+            raise Exception("No available client to code serer")
+
+        repository_origin = deserialize_value(
+            request.serialized_repository_python_origin, RemoteRepositoryOrigin
+        )
+
+        def _load() -> Union[RepositorySnap, RepositoryErrorSnap]:
+            chunks = client.streaming_external_repository(
+                repository_origin, defer_snapshots=request.defer_snapshots
+            )
+            return deserialize_value(
+                "".join(chunk["serialized_external_repository_chunk"] for chunk in chunks),
+                (RepositorySnap, RepositoryErrorSnap),
+            )
+
+        return self._repository_snap_cache.get_serialized(
+            repository_origin.repository_name,
+            request.defer_snapshots,
+            _load,
+            compact=COMPACT_SERDES_METADATA in invocation_metadata,
+            held_snapshot_id=held_snapshot_id,
+            source=client,
+        )
+
     def StreamingExternalRepository(self, request, context):
-        return self._streaming_query("StreamingExternalRepository", request, context)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
+        )
+        if serialized_external_repository_data is None:
+            return self._streaming_query("StreamingExternalRepository", request, context)
+
+        compress = STREAMING_COMPRESSION_METADATA in context.invocation_metadata()
+        if compress:
+            context.send_initial_metadata([STREAMING_COMPRESSION_METADATA])
+        return (
+            api_pb2.StreamingExternalRepositoryEvent(
+                sequence_number=i, serialized_external_repository_chunk=chunk
+            )
+            for i, chunk in enumerate(
+                split_into_chunks(
+                    serialized_external_repository_data, STREAMING_CHUNK_SIZE, compress
+                )
+            )
+        )
 
     def Heartbeat(self, request, context):
         return self._query("Heartbeat", request, context)
@@ -240,7 +310,15 @@ def ExternalPipelineSubsetSnapshot(self, request, context):
         return self._query("ExternalPipelineSubsetSnapshot", request, context)
 
     def ExternalRepository(self, request, context):
-        return self._query("ExternalRepository", request, context)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
+        )
+        if serialized_external_repository_data is None:
+            return self._query("ExternalRepository", request, context)
+
+        return api_pb2.ExternalRepositoryReply(
+            serialized_external_repository_data=serialized_external_repository_data
+        )
 
     def ExternalJob(self, request, context):
         return self._query("ExternalJob", request, context)
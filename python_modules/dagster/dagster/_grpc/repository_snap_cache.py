@@ -0,0 +1,178 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Callable, NamedTuple, Optional, Union
+
+from dagster._core.definitions.events import AssetKey
+from dagster._core.remote_representation.external_data import (
+    RepositoryErrorSnap,
+    RepositorySnap,
+    RepositorySnapUpdate,
+)
+from dagster._record import copy
+from dagster._serdes import serialize_value, serialize_value_compact
+from dagster._serdes.utils import create_snapshot_id, hash_str
+
+DEFAULT_MAX_VERSIONS_PER_REPOSITORY = 8
+
+
+class RepositorySnapVersion(NamedTuple):
+    """The ids of the parts of a RepositorySnap that are sent individually in delta updates."""
+
+    job_data_ids: Mapping[str, str]
+    asset_node_ids: Mapping[AssetKey, str]
+
+
+class _CachedRepositorySnap:
+    def __init__(self, repository_snap: RepositorySnap, source: object):
+        self.repository_snap = repository_snap
+        self.source = source
+
+        job_data_ids = {
+            job_data.name: create_snapshot_id(job_data)
+            for job_data in repository_snap.job_datas or []
+        }
+        asset_node_ids = {
+            node.asset_key: create_snapshot_id(node) for node in repository_snap.asset_nodes
+        }
+        remainder_id = create_snapshot_id(
+            copy(
+                repository_snap,
+                job_datas=[] if repository_snap.job_datas is not None else None,
+                asset_nodes=[],
+            )
+        )
+        self.snapshot_id = hash_str(
+            ":".join([remainder_id, *job_data_ids.values(), *asset_node_ids.values()])
+        )
+        # deltas identify parts by job name and asset key, so they require these to be unique
+        self.version = (
+            RepositorySnapVersion(job_data_ids, asset_node_ids)
+            if len(job_data_ids) == len(repository_snap.job_datas or [])
+            and len(asset_node_ids) == len(repository_snap.asset_nodes)
+            else None
+        )
+        self._serialized: dict[tuple[bool, Optional[str]], str] = {}
+
+    def _build_delta(
+        self, base_snapshot_id: str, base_version: RepositorySnapVersion
+    ) -> RepositorySnapUpdate:
+        version = self.version
+        assert version
+        repository_snap = self.repository_snap
+
+        changed_job_datas = (
+            [
+                job_data
+                for job_data in repository_snap.job_datas
+                if base_version.job_data_ids.get(job_data.name)
+                != version.job_data_ids[job_data.name]
+            ]
+            if repository_snap.job_datas is not None
+            else None
+        )
+        changed_asset_nodes = [
+            node
+            for node in repository_snap.asset_nodes
+            if base_version.asset_node_ids.get(node.asset_key)
+            != version.asset_node_ids[node.asset_key]
+        ]
+        return RepositorySnapUpdate(
+            snapshot_id=self.snapshot_id,
+            base_snapshot_id=base_snapshot_id,
+            repository_snap=copy(
+                repository_snap, job_datas=changed_job_datas, asset_nodes=changed_asset_nodes
+            ),
+            job_names=list(version.job_data_ids) if changed_job_datas is not None else None,
+            asset_keys=list(version.asset_node_ids),
+        )
+
+    def serialize(
+        self,
+        compact: bool,
+        held_snapshot_id: Optional[str],
+        base_version: Optional[RepositorySnapVersion],
+    ) -> str:
+        serialize = serialize_value_compact if compact else serialize_value
+
+        if held_snapshot_id == self.snapshot_id:
+            return serialize(
+                RepositorySnapUpdate(
+                    snapshot_id=self.snapshot_id,
+                    base_snapshot_id=held_snapshot_id,
+                    repository_snap=None,
+                )
+            )
+
+        value: Callable[[], Union[RepositorySnap, RepositorySnapUpdate]]
+        if held_snapshot_id is None:
+            # the client does not support updates, so send the RepositorySnap itself
+            cache_key = (compact, None)
+            value = lambda: self.repository_snap
+        elif base_version is not None and self.version is not None:
+            cache_key = (compact, held_snapshot_id)
+            value = lambda: self._build_delta(held_snapshot_id, base_version)
+        else:
+            cache_key = (compact, "")
+            value = lambda: RepositorySnapUpdate(
+                snapshot_id=self.snapshot_id,
+                base_snapshot_id=None,
+                repository_snap=self.repository_snap,
+            )
+
+        if cache_key not in self._serialized:
+            self._serialized[cache_key] = serialize(value())
+        return self._serialized[cache_key]
+
+
+class RepositorySnapCache:
+    """Memoizes the RepositorySnaps served by a code server and their serialized forms, so that
+    each is only built and serialized once per load of the code, rather than once per request.
+
+    It also remembers the versions of the RepositorySnaps that it has served before, so that a
+    client which sends the snapshot id of the RepositorySnap it already holds can be sent a
+    RepositorySnapUpdate that is either empty, or only contains the jobs and assets that changed.
+    """
+
+    def __init__(self, max_versions_per_repository: int = DEFAULT_MAX_VERSIONS_PER_REPOSITORY):
+        self._max_versions_per_repository = max_versions_per_repository
+        self._lock = threading.Lock()
+        self._cached: dict[tuple[str, bool], _CachedRepositorySnap] = {}
+        self._versions: dict[tuple[str, bool], OrderedDict[str, RepositorySnapVersion]] = {}
+
+    def get_serialized(
+        self,
+        repository_name: str,
+        defer_snapshots: bool,
+        load: Callable[[], Union[RepositorySnap, RepositoryErrorSnap]],
+        compact: bool = False,
+        held_snapshot_id: Optional[str] = None,
+        source: object = None,
+    ) -> str:
+        """Returns the serialized RepositorySnap of the given repository, calling `load` to build
+        it if it is not cached, or was cached from a different `source`. Errors are not cached.
+
+        If `held_snapshot_id` is not None, a serialized RepositorySnapUpdate is returned instead,
+        relative to the RepositorySnap with that snapshot id if it is known.
+        """
+        key = (repository_name, defer_snapshots)
+        with self._lock:
+            cached = self._cached.get(key)
+            if cached is None or cached.source is not source:
+                loaded = load()
+                if isinstance(loaded, RepositoryErrorSnap):
+                    return serialize_value(loaded)
+
+                cached = _CachedRepositorySnap(loaded, source)
+                self._cached[key] = cached
+                if cached.version is not None:
+                    versions = self._versions.setdefault(key, OrderedDict())
+                    versions[cached.snapshot_id] = cached.version
+                    versions.move_to_end(cached.snapshot_id)
+                    while len(versions) > self._max_versions_per_repository:
+                        versions.popitem(last=False)
+
+            base_version = (
+                self._versions.get(key, {}).get(held_snapshot_id) if held_snapshot_id else None
+            )
+            return cached.serialize(compact, held_snapshot_id, base_version)
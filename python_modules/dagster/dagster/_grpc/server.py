@@ -1,6 +1,5 @@
 import json
 import logging
-import math
 import multiprocessing
 import os
 import queue
@@ -68,6 +67,7 @@
     get_partition_tags,
     start_run_in_subprocess,
 )
+from dagster._grpc.repository_snap_cache import RepositorySnapCache
 from dagster._grpc.types import (
     CanCancelExecutionRequest,
     CanCancelExecutionResult,
@@ -89,10 +89,14 @@
     StartRunResult,
 )
 from dagster._grpc.utils import (
+    COMPACT_SERDES_METADATA,
+    REPOSITORY_SNAPSHOT_ID_METADATA_KEY,
+    STREAMING_COMPRESSION_METADATA,
     default_grpc_server_shutdown_grace_period,
     get_loadable_targets,
     max_rx_bytes,
     max_send_bytes,
+    split_into_chunks,
 )
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._serdes.ipc import IPCErrorMessage, open_ipc_subprocess
@@ -375,6 +379,8 @@ def __init__(
         self._execution_lock = threading.Lock()
 
         self._serializable_load_error = None
+        # memoizes the RepositorySnaps built from the loaded repositories
+        self._repository_snap_cache = RepositorySnapCache()
 
         self._entry_point = (
             check.sequence_param(entry_point, "entry_point", of_type=str)
@@ -664,7 +670,7 @@ def ExternalNotebookData(
     def ExternalPartitionSetExecutionParams(
         self,
         request: api_pb2.ExternalPartitionSetExecutionParamsRequest,
-        _context: grpc.ServicerContext,
+        context: grpc.ServicerContext,
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
         try:
             args = deserialize_value(
@@ -690,7 +696,7 @@ def ExternalPartitionSetExecutionParams(
                 )
             )
 
-        yield from self._split_serialized_data_into_chunk_events(serialized_data)
+        yield from self._split_serialized_data_into_chunk_events(serialized_data, context)
 
     def ExternalPartitionConfig(
         self, request: api_pb2.ExternalPartitionConfigRequest, _context: grpc.ServicerContext
@@ -786,7 +792,7 @@ def ExternalPipelineSubsetSnapshot(
         )
 
     def _get_serialized_external_repository_data(
-        self, request: api_pb2.ExternalRepositoryRequest
+        self, request: api_pb2.ExternalRepositoryRequest, context: grpc.ServicerContext
     ) -> str:
         try:
             repository_origin = deserialize_value(
@@ -794,11 +800,16 @@ def _get_serialized_external_repository_data(
                 RemoteRepositoryOrigin,
             )
 
-            return serialize_value(
-                RepositorySnap.from_def(
-                    self._get_repo_for_origin(repository_origin),
-                    defer_snapshots=request.defer_snapshots,
-                )
+            repo_def = self._get_repo_for_origin(repository_origin)
+            invocation_metadata = context.invocation_metadata()
+            return self._repository_snap_cache.get_serialized(
+                repository_origin.repository_name,
+                request.defer_snapshots,
+                lambda: RepositorySnap.from_def(repo_def, defer_snapshots=request.defer_snapshots),
+                compact=COMPACT_SERDES_METADATA in invocation_metadata,
+                held_snapshot_id=dict(invocation_metadata).get(REPOSITORY_SNAPSHOT_ID_METADATA_KEY),
+                # repositories with dynamic definitions are snapshotted again on every request
+                source=None if repo_def.has_static_definitions else object(),
             )
         except Exception:
             _maybe_log_exception(self._logger, "Repository")
@@ -807,9 +818,11 @@ def _get_serialized_external_repository_data(
             )
 
     def ExternalRepository(
-        self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalRepositoryRequest, context: grpc.ServicerContext
     ) -> api_pb2.ExternalRepositoryReply:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
+        )
 
         return api_pb2.ExternalRepositoryReply(
             serialized_external_repository_data=serialized_external_repository_data,
@@ -838,49 +851,40 @@ def ExternalJob(
             )
 
     def StreamingExternalRepository(
-        self, request: api_pb2.ExternalRepositoryRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalRepositoryRequest, context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingExternalRepositoryEvent]:
-        serialized_external_repository_data = self._get_serialized_external_repository_data(request)
-
-        num_chunks = int(
-            math.ceil(float(len(serialized_external_repository_data)) / STREAMING_CHUNK_SIZE)
+        serialized_external_repository_data = self._get_serialized_external_repository_data(
+            request, context
         )
 
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_external_repository_data),
-            )
-
+        for i, chunk in enumerate(
+            self._split_serialized_data_into_chunks(serialized_external_repository_data, context)
+        ):
             yield api_pb2.StreamingExternalRepositoryEvent(
-                sequence_number=i,
-                serialized_external_repository_chunk=serialized_external_repository_data[
-                    start_index:end_index
-                ],
+                sequence_number=i, serialized_external_repository_chunk=chunk
             )
 
+    def _split_serialized_data_into_chunks(
+        self, serialized_data: str, context: grpc.ServicerContext
+    ) -> Iterator[str]:
+        compress = STREAMING_COMPRESSION_METADATA in context.invocation_metadata()
+        if compress:
+            context.send_initial_metadata([STREAMING_COMPRESSION_METADATA])
+        return split_into_chunks(serialized_data, STREAMING_CHUNK_SIZE, compress)
+
     def _split_serialized_data_into_chunk_events(
-        self, serialized_data: str
+        self, serialized_data: str, context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
-        num_chunks = int(math.ceil(float(len(serialized_data)) / STREAMING_CHUNK_SIZE))
-        for i in range(num_chunks):
-            start_index = i * STREAMING_CHUNK_SIZE
-            end_index = min(
-                (i + 1) * STREAMING_CHUNK_SIZE,
-                len(serialized_data),
-            )
-
-            yield api_pb2.StreamingChunkEvent(
-                sequence_number=i,
-                serialized_chunk=serialized_data[start_index:end_index],
-            )
+        for i, chunk in enumerate(
+            self._split_serialized_data_into_chunks(serialized_data, context)
+        ):
+            yield api_pb2.StreamingChunkEvent(sequence_number=i, serialized_chunk=chunk)
 
     def ExternalScheduleExecution(
-        self, request: api_pb2.ExternalScheduleExecutionRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalScheduleExecutionRequest, context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
         yield from self._split_serialized_data_into_chunk_events(
-            self._external_schedule_execution(request)
+            self._external_schedule_execution(request), context
         )
 
     def SyncExternalScheduleExecution(self, request, _context: grpc.ServicerContext):
@@ -952,10 +956,10 @@ def SyncExternalSensorExecution(
 
     @retrieve_metrics()
     def ExternalSensorExecution(
-        self, request: api_pb2.ExternalSensorExecutionRequest, _context: grpc.ServicerContext
+        self, request: api_pb2.ExternalSensorExecutionRequest, context: grpc.ServicerContext
     ) -> Iterable[api_pb2.StreamingChunkEvent]:
         yield from self._split_serialized_data_into_chunk_events(
-            self._external_sensor_execution(request)
+            self._external_sensor_execution(request), context
         )
 
     def ShutdownServer(
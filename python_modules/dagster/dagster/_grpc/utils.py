@@ -1,5 +1,8 @@
+import base64
+import codecs
 import os
-from collections.abc import Sequence
+import zlib
+from collections.abc import Iterable, Iterator, Sequence
 from typing import TYPE_CHECKING, Optional
 
 import dagster._check as check
@@ -15,6 +18,23 @@
 _DEFAULT_GRPC_TIMEOUT_IF_NO_ENV_VAR_SET = 60
 _DEFAULT_REPOSITORY_TIMEOUT_IF_NO_ENV_VAR_SET = 180
 
+# Call metadata sent by clients that can read repository snapshots written with
+# `serialize_value_compact`. Servers that don't recognize it keep responding with JSON.
+COMPACT_SERDES_METADATA = ("dagster-serdes-format", "compact")
+
+# Call metadata key sent by clients that can apply a RepositorySnapUpdate, whose value is the
+# snapshot id of the RepositorySnap that the client already holds, or empty if it holds none.
+# Servers that don't recognize it keep responding with the full RepositorySnap.
+REPOSITORY_SNAPSHOT_ID_METADATA_KEY = "dagster-repository-snapshot-id"
+
+# Call metadata sent by clients that opt in to streamed chunks compressed by
+# `split_into_chunks`. Servers that recognize it send it back as initial metadata before
+# streaming compressed chunks. Servers that don't keep streaming uncompressed chunks.
+STREAMING_COMPRESSION_METADATA = ("dagster-streaming-compression", "zlib")
+
+# Chunks are compressed on every request, so favor speed over size
+STREAMING_COMPRESSION_LEVEL = 1
+
 
 def get_loadable_targets(
     python_file: Optional[str],
@@ -64,6 +84,43 @@ def get_loadable_targets(
         check.failed("invalid")
 
 
+def split_into_chunks(serialized_data: str, chunk_size: int, compress: bool) -> Iterator[str]:
+    """Splits serialized data into chunks of `chunk_size` characters to be streamed. If `compress`
+    is True, each chunk is instead the base64-encoded zlib frame of those characters, which is
+    flushed so that a `StreamingChunkDecoder` can decode it as soon as it is received.
+    """
+    compressor = zlib.compressobj(STREAMING_COMPRESSION_LEVEL) if compress else None
+    for start_index in range(0, len(serialized_data), chunk_size):
+        chunk = serialized_data[start_index : start_index + chunk_size]
+        if not compressor:
+            yield chunk
+            continue
+
+        is_last_chunk = start_index + chunk_size >= len(serialized_data)
+        frame = compressor.compress(chunk.encode("utf-8")) + compressor.flush(
+            zlib.Z_FINISH if is_last_chunk else zlib.Z_SYNC_FLUSH
+        )
+        yield base64.b64encode(frame).decode("ascii")
+
+
+def is_compressed_stream(initial_metadata: Optional[Iterable[tuple[str, str]]]) -> bool:
+    """Whether the server announced in its initial metadata that it streams compressed chunks."""
+    return any(tuple(item) == STREAMING_COMPRESSION_METADATA for item in initial_metadata or ())
+
+
+class StreamingChunkDecoder:
+    """Decodes the compressed chunks produced by `split_into_chunks` one at a time, as they are
+    received, so that the compressed stream is never held in memory as a whole.
+    """
+
+    def __init__(self):
+        self._decompressor = zlib.decompressobj()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+
+    def decode(self, chunk: str) -> str:
+        return self._text_decoder.decode(self._decompressor.decompress(base64.b64decode(chunk)))
+
+
 def max_rx_bytes() -> int:
     env_set = os.getenv("DAGSTER_GRPC_MAX_RX_BYTES")
     if env_set:
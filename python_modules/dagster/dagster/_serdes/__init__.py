@@ -13,6 +13,7 @@
     get_storage_name as get_storage_name,
     pack_value as pack_value,
     serialize_value as serialize_value,
+    serialize_value_compact as serialize_value_compact,
     unpack_value as unpack_value,
     whitelist_for_serdes as whitelist_for_serdes,
 )
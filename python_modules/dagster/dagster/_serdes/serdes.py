@@ -149,6 +149,7 @@ class WhitelistMap(NamedTuple):
     object_deserializers: dict[str, "ObjectSerializer"]
     enum_serializers: dict[str, "EnumSerializer"]
     object_type_map: dict[str, type]
+    compact_field_tables: dict[tuple[str, tuple[str, ...]], "CompactFieldTable"]
 
     def register_object(
         self,
@@ -226,6 +227,7 @@ def create() -> "WhitelistMap":
             object_deserializers={},
             enum_serializers={},
             object_type_map={},
+            compact_field_tables={},
         )
 
 
@@ -1078,6 +1080,97 @@ def _wrap_object(
     return _LazySerializationWrapper(obj, whitelist_map, descent_path)
 
 
+###################################################################################################
+# Compact encoding
+###################################################################################################
+
+# Values serialized with the compact encoding start with this header. No JSON document can start
+# with it, so `deserialize_value` tells the two encodings apart without any other context.
+COMPACT_SERDES_HEADER: Final = "#serdes-compact/1\n"
+
+# Whitelisted objects are encoded as a JSON object with this single key, mapping to a list holding
+# the index of the object's field table followed by its field values in table order.
+_COMPACT_OBJECT_KEY: Final = "\x00"
+
+
+class CompactFieldTable(NamedTuple):
+    """The field layout of a whitelisted class in the compact encoding. Tables are cached in the
+    `WhitelistMap` and written once per serialized value, instead of repeating the field names for
+    every instance.
+    """
+
+    storage_name: str
+    storage_field_names: tuple[str, ...]
+
+
+class _CompactObjectHandler:
+    """The object_handler for _transform_for_serialization when producing the compact encoding.
+    Records the field tables referenced by a single serialized value.
+    """
+
+    __slots__ = ["field_tables", "table_indices", "whitelist_map"]
+
+    def __init__(self, whitelist_map: WhitelistMap):
+        self.whitelist_map = whitelist_map
+        self.field_tables: list[CompactFieldTable] = []
+        self.table_indices: dict[tuple[str, tuple[str, ...]], int] = {}
+
+    def __call__(
+        self,
+        obj: SerializableObject,
+        whitelist_map: WhitelistMap,
+        descent_path: str,
+    ) -> Mapping[str, JsonSerializableValue]:
+        klass_name = obj.__class__.__name__
+        serializer = whitelist_map.object_serializers[klass_name]
+        # go through pack_items so that the compact encoding holds the same items as the JSON one,
+        # including any changes made by serializers that override it
+        items = dict(serializer.pack_items(obj, whitelist_map, self, descent_path))
+        storage_name = cast(str, items.pop("__class__"))
+        storage_field_names = tuple(items)
+        table_key = (klass_name, storage_field_names)
+        table_index = self.table_indices.get(table_key)
+        if table_index is None:
+            table = whitelist_map.compact_field_tables.get(table_key)
+            if table is None:
+                table = CompactFieldTable(storage_name, storage_field_names)
+                whitelist_map.compact_field_tables[table_key] = table
+            table_index = len(self.field_tables)
+            self.table_indices[table_key] = table_index
+            self.field_tables.append(table)
+
+        packed: list[JsonSerializableValue] = [table_index, *items.values()]
+        return {_COMPACT_OBJECT_KEY: packed}
+
+
+def serialize_value_compact(
+    val: PackableValue,
+    whitelist_map: WhitelistMap = _WHITELIST_MAP,
+) -> str:
+    """Serialize an object to a string using the compact encoding.
+
+    Whitelisted objects are written as positional lists of field values, with the field names of
+    each class stored once in a table after the header. The result can be read back with
+    `deserialize_value`, but not with a plain JSON parser, so it should only be used where the
+    reader is known to be able to handle it (e.g. opted-in gRPC calls and snapshot storage).
+    """
+    object_handler = _CompactObjectHandler(whitelist_map)
+    body = seven.json.dumps(
+        _transform_for_serialization(
+            val,
+            whitelist_map=whitelist_map,
+            object_handler=object_handler,
+            descent_path=_root(val),
+        ),
+        separators=(",", ":"),
+    )
+    field_tables = seven.json.dumps(
+        [[table.storage_name, table.storage_field_names] for table in object_handler.field_tables],
+        separators=(",", ":"),
+    )
+    return f"{COMPACT_SERDES_HEADER}{field_tables}\n{body}"
+
+
 ###################################################################################################
 # Deserialize / Unpack
 ###################################################################################################
@@ -1123,6 +1216,9 @@ def deserialize_value(
 
     - Parse the input string as JSON with an object_hook for custom types.
     - Optionally, check that the resulting object is of the expected type.
+
+    Strings produced by `serialize_value_compact` are detected by their header and decoded with
+    the matching field tables.
     """
     check.str_param(val, "val")
 
@@ -1170,10 +1266,15 @@ def deserialize_values(
         unpacked_values = []
         for val in vals:
             context = UnpackContext()
-            unpacked_value = seven.json.loads(
-                val,
-                object_hook=partial(_unpack_object, whitelist_map=whitelist_map, context=context),
-            )
+            if val.startswith(COMPACT_SERDES_HEADER):
+                unpacked_value = _deserialize_compact(val, whitelist_map, context)
+            else:
+                unpacked_value = seven.json.loads(
+                    val,
+                    object_hook=partial(
+                        _unpack_object, whitelist_map=whitelist_map, context=context
+                    ),
+                )
             unpacked_value = context.finalize_unpack(unpacked_value)
             if as_type and not (
                 is_named_tuple_instance(unpacked_value)
@@ -1242,6 +1343,36 @@ def _unpack_object(val: dict, whitelist_map: WhitelistMap, context: UnpackContex
     return val
 
 
+def _deserialize_compact(
+    val: str, whitelist_map: WhitelistMap, context: UnpackContext
+) -> UnpackedValue:
+    tables_end = val.index("\n", len(COMPACT_SERDES_HEADER))
+    field_tables = [
+        (storage_name, field_names, whitelist_map.object_deserializers.get(storage_name))
+        for storage_name, field_names in seven.json.loads(
+            val[len(COMPACT_SERDES_HEADER) : tables_end]
+        )
+    ]
+
+    def _unpack_compact_object(obj: dict) -> UnpackedValue:
+        packed = obj.get(_COMPACT_OBJECT_KEY)
+        if packed is None:
+            return _unpack_object(obj, whitelist_map, context)
+
+        storage_name, field_names, deserializer = field_tables[packed[0]]
+        unpacked_dict = dict(zip(field_names, packed[1:]))
+        if deserializer is None:
+            return context.observe_unknown_value(
+                UnknownSerdesValue(
+                    f'Attempted to deserialize class "{storage_name}" which is not in the whitelist.',
+                    {"__class__": storage_name, **unpacked_dict},
+                )
+            )
+        return deserializer.unpack(unpacked_dict, whitelist_map, context)
+
+    return seven.json.loads(val[tables_end + 1 :], object_hook=_unpack_compact_object)
+
+
 @overload
 def unpack_value(
     val: JsonSerializableValue,
@@ -0,0 +1,49 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+
+class CacheStats:
+    """Mutable counters for the cached method calls and storage queries made while a block of code
+    is executing. Counting is only enabled inside of a `record_cache_stats` block, so code that
+    does not opt in pays for a single context variable lookup per cached method call or query.
+
+    Storage queries are the statements executed against SQL storage (see
+    `dagster._core.storage.sql`), so a cached method miss is only counted as a query if it
+    actually reaches storage.
+    """
+
+    __slots__ = ("num_cache_hits", "num_cache_misses", "num_storage_queries")
+
+    def __init__(self):
+        self.num_cache_hits = 0
+        self.num_cache_misses = 0
+        self.num_storage_queries = 0
+
+    def add(self, other: "CacheStats") -> None:
+        self.num_cache_hits += other.num_cache_hits
+        self.num_cache_misses += other.num_cache_misses
+        self.num_storage_queries += other.num_storage_queries
+
+
+_current_cache_stats: ContextVar[Optional[CacheStats]] = ContextVar(
+    "current_cache_stats", default=None
+)
+
+
+def get_current_cache_stats() -> Optional[CacheStats]:
+    """Returns the CacheStats currently being recorded to, if any."""
+    return _current_cache_stats.get()
+
+
+@contextmanager
+def record_cache_stats(stats: CacheStats) -> Iterator[CacheStats]:
+    """Records cached method calls and storage queries made within this block to the given
+    CacheStats. Asyncio tasks created within the block inherit it.
+    """
+    token = _current_cache_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_cache_stats.reset(token)
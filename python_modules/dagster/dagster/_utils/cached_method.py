@@ -6,6 +6,7 @@
 from typing_extensions import Concatenate, ParamSpec
 
 from dagster._seven import get_arg_names
+from dagster._utils.cache_stats import get_current_cache_stats
 
 S = TypeVar("S")
 T = TypeVar("T")
@@ -109,9 +110,14 @@ async def _async_cached_method_wrapper(self: S, *args: P.args, **kwargs: P.kwarg
             canonical_kwargs = get_canonical_kwargs(*args, **kwargs)
             key = _make_key(canonical_kwargs)
 
+            stats = get_current_cache_stats()
             if key not in cache:
+                if stats is not None:
+                    stats.num_cache_misses += 1
                 result = await method(self, *args, **kwargs)
                 cache[key] = result
+            elif stats is not None:
+                stats.num_cache_hits += 1
             return cache[key]
 
         return cast(Callable[Concatenate[S, P], T], _async_cached_method_wrapper)
@@ -131,9 +137,14 @@ def _cached_method_wrapper(self: S, *args: P.args, **kwargs: P.kwargs) -> T:
 
             canonical_kwargs = get_canonical_kwargs(*args, **kwargs)
             key = _make_key(canonical_kwargs)
+            stats = get_current_cache_stats()
             if key not in cache:
+                if stats is not None:
+                    stats.num_cache_misses += 1
                 result = method(self, *args, **kwargs)
                 cache[key] = result
+            elif stats is not None:
+                stats.num_cache_hits += 1
             return cache[key]
 
         return _cached_method_wrapper
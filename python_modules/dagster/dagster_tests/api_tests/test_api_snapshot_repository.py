@@ -2,8 +2,19 @@
 import sys
 from contextlib import contextmanager
 
+import dagster._check as check
 import pytest
-from dagster import IntMetadataValue, TextMetadataValue, job, op, repository
+from dagster import (
+    AssetKey,
+    Definitions,
+    IntMetadataValue,
+    TextMetadataValue,
+    asset,
+    job,
+    op,
+    repository,
+)
+from dagster._api.snapshot_job import get_job_data_snap_cache_stats
 from dagster._api.snapshot_repository import (
     gen_streaming_external_repositories_data_grpc,
     sync_get_streaming_external_repositories_data_grpc,
@@ -13,6 +24,7 @@
 from dagster._core.remote_representation import (
     ManagedGrpcPythonEnvCodeLocationOrigin,
     RepositorySnap,
+    RepositorySnapUpdate,
 )
 from dagster._core.remote_representation.external import RemoteRepository
 from dagster._core.remote_representation.external_data import (
@@ -25,7 +37,16 @@
 from dagster._core.remote_representation.origin import RemoteRepositoryOrigin
 from dagster._core.test_utils import instance_for_test
 from dagster._core.types.loadable_target_origin import LoadableTargetOrigin
-from dagster._serdes.serdes import deserialize_value, get_storage_fields
+from dagster._grpc.__generated__ import api_pb2
+from dagster._grpc.client import DagsterGrpcClient
+from dagster._grpc.repository_snap_cache import RepositorySnapCache
+from dagster._grpc.utils import STREAMING_COMPRESSION_METADATA, StreamingChunkDecoder
+from dagster._serdes.serdes import (
+    COMPACT_SERDES_HEADER,
+    deserialize_value,
+    get_storage_fields,
+    serialize_value,
+)
 from dagster._serdes.utils import hash_str
 from dagster._utils.env import environ
 
@@ -56,6 +77,207 @@ def test_streaming_external_repositories_api_grpc(instance):
         assert async_repository_snaps == repository_snaps
 
 
+def test_external_repository_compact_serdes(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        compact_client = DagsterGrpcClient(
+            port=code_location.client.port,
+            socket=code_location.client.socket,
+            host=code_location.client.host,
+            compact_serdes=True,
+        )
+
+        ser_repo_data = code_location.client.external_repository(repo_origin)
+        compact_ser_repo_data = compact_client.external_repository(repo_origin)
+
+        assert not ser_repo_data.startswith(COMPACT_SERDES_HEADER)
+        assert compact_ser_repo_data.startswith(COMPACT_SERDES_HEADER)
+        assert len(compact_ser_repo_data) < len(ser_repo_data)
+        assert deserialize_value(compact_ser_repo_data, RepositorySnap) == deserialize_value(
+            ser_repo_data, RepositorySnap
+        )
+
+
+def test_streaming_external_repository_snapshot_updates(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+
+        def _fetch(held_snapshot_id):
+            return deserialize_value(
+                "".join(
+                    chunk["serialized_external_repository_chunk"]
+                    for chunk in code_location.client.streaming_external_repository(
+                        repo_origin, held_snapshot_id=held_snapshot_id
+                    )
+                ),
+                (RepositorySnap, RepositorySnapUpdate),
+            )
+
+        repository_snap = _fetch(None)
+        assert isinstance(repository_snap, RepositorySnap)
+
+        # a client holding nothing is sent the full snapshot along with its id
+        update = _fetch("")
+        assert isinstance(update, RepositorySnapUpdate)
+        assert update.base_snapshot_id is None
+        assert update.apply(None) == repository_snap
+
+        # a client holding the current snapshot is told that it is unchanged
+        unchanged = _fetch(update.snapshot_id)
+        assert isinstance(unchanged, RepositorySnapUpdate)
+        assert unchanged.base_snapshot_id == update.snapshot_id
+        assert unchanged.repository_snap is None
+        assert unchanged.apply(repository_snap) is repository_snap
+
+        # unknown snapshot ids fall back to the full snapshot
+        assert _fetch("not_a_snapshot_id").apply(None) == repository_snap
+
+        # refetching the code location's repositories is served from the held snapshot
+        repository_snaps = sync_get_streaming_external_repositories_data_grpc(
+            code_location.client, code_location
+        )
+        assert (
+            sync_get_streaming_external_repositories_data_grpc(code_location.client, code_location)[
+                "bar_repo"
+            ]
+            is repository_snaps["bar_repo"]
+        )
+
+
+def test_streaming_external_repository_compression(instance):
+    with get_bar_repo_code_location(instance) as code_location:
+        client = code_location.client
+        repo_origin = RemoteRepositoryOrigin(code_location.origin, "bar_repo")
+        serialized_repository_python_origin = serialize_value(repo_origin)
+
+        # clients that don't ask for compression are streamed the serialized snapshot as is
+        serialized_repository_snap = "".join(
+            event.serialized_external_repository_chunk
+            for event in client._streaming_query(  # noqa: SLF001
+                "StreamingExternalRepository",
+                api_pb2.ExternalRepositoryRequest,
+                serialized_repository_python_origin=serialized_repository_python_origin,
+            )
+        )
+        assert isinstance(deserialize_value(serialized_repository_snap), RepositorySnap)
+
+        compressed_chunks = [
+            event.serialized_external_repository_chunk
+            for event in client._streaming_query(  # noqa: SLF001
+                "StreamingExternalRepository",
+                api_pb2.ExternalRepositoryRequest,
+                metadata=[STREAMING_COMPRESSION_METADATA],
+                serialized_repository_python_origin=serialized_repository_python_origin,
+            )
+        ]
+        assert sum(len(chunk) for chunk in compressed_chunks) < len(serialized_repository_snap)
+
+        decoder = StreamingChunkDecoder()
+        assert "".join(decoder.decode(chunk) for chunk in compressed_chunks) == (
+            serialized_repository_snap
+        )
+
+        # clients only ask for compression if they opt in, and decode the chunks as they arrive
+        assert not client.streaming_compression
+        compressing_client = DagsterGrpcClient(
+            port=client.port, socket=client.socket, host=client.host, streaming_compression=True
+        )
+        for grpc_client in [client, compressing_client]:
+            assert (
+                "".join(
+                    chunk["serialized_external_repository_chunk"]
+                    for chunk in grpc_client.streaming_external_repository(repo_origin)
+                )
+                == serialized_repository_snap
+            )
+
+
+@op
+def op_one():
+    return 1
+
+
+@op
+def op_two():
+    return 2
+
+
+@job
+def job_one():
+    op_one()
+
+
+@job(name="job_two")
+def job_two_v1():
+    op_one()
+
+
+@job(name="job_two")
+def job_two_v2():
+    op_two()
+
+
+@asset
+def unchanged_asset():
+    return 1
+
+
+@asset(name="changed_asset")
+def changed_asset_v1():
+    return 1
+
+
+@asset(name="changed_asset", group_name="other")
+def changed_asset_v2():
+    return 2
+
+
+def test_repository_snap_cache_deltas():
+    snap_v1 = RepositorySnap.from_def(
+        Definitions(
+            assets=[unchanged_asset, changed_asset_v1], jobs=[job_one, job_two_v1]
+        ).get_repository_def()
+    )
+    snap_v2 = RepositorySnap.from_def(
+        Definitions(
+            assets=[unchanged_asset, changed_asset_v2], jobs=[job_one, job_two_v2]
+        ).get_repository_def()
+    )
+
+    cache = RepositorySnapCache()
+    update_v1 = deserialize_value(
+        cache.get_serialized("__repository__", False, lambda: snap_v1, held_snapshot_id=""),
+        RepositorySnapUpdate,
+    )
+    assert update_v1.base_snapshot_id is None
+
+    # the snapshot is built once per source
+    assert cache.get_serialized(
+        "__repository__", False, lambda: check.failed("reloaded")
+    ) == serialize_value(snap_v1)
+
+    delta = deserialize_value(
+        cache.get_serialized(
+            "__repository__",
+            False,
+            lambda: snap_v2,
+            held_snapshot_id=update_v1.snapshot_id,
+            source="reloaded",
+        ),
+        RepositorySnapUpdate,
+    )
+    assert delta.base_snapshot_id == update_v1.snapshot_id
+    assert delta.snapshot_id != update_v1.snapshot_id
+    assert delta.repository_snap
+    assert [job_data.name for job_data in check.not_none(delta.repository_snap.job_datas)] == [
+        "job_two"
+    ]
+    assert {node.asset_key for node in delta.repository_snap.asset_nodes} == {
+        AssetKey("changed_asset")
+    }
+    assert delta.apply(snap_v1) == snap_v2
+
+
 def test_streaming_external_repositories_error(instance):
     with get_bar_repo_code_location(instance) as code_location:
         code_location.repository_names = {"does_not_exist"}
@@ -203,6 +425,31 @@ def _ref_to_data(ref: JobRefSnap):
             expected += 1
 
 
+def test_code_location_defer_job_snapshots():
+    with instance_for_test(overrides={"code_servers": {"defer_job_snapshots": True}}) as instance:
+        with get_bar_repo_code_location(instance) as code_location:
+            repo = code_location.get_repository("bar_repo")
+            assert repo.repository_snap.job_datas is None
+            assert repo.repository_snap.job_refs
+
+            stats_before = get_job_data_snap_cache_stats()
+            jobs = repo.get_all_jobs()
+            assert {job.name for job in jobs} >= {"foo", "bar", "baz"}
+            assert get_job_data_snap_cache_stats().num_misses == stats_before.num_misses
+
+            foo_job = repo.get_full_job("foo")
+            assert foo_job.job_snapshot.name == "foo"
+            assert get_job_data_snap_cache_stats().num_misses == stats_before.num_misses + 1
+
+        # a reloaded location shares the JobDataSnaps already fetched in this process
+        with get_bar_repo_code_location(instance) as code_location:
+            foo_job = code_location.get_repository("bar_repo").get_full_job("foo")
+            assert foo_job.job_snapshot.name == "foo"
+            stats = get_job_data_snap_cache_stats()
+            assert stats.num_misses == stats_before.num_misses + 1
+            assert stats.num_hits == stats_before.num_hits + 1
+
+
 def test_job_data_snap_layout():
     # defend against assumptions made in
 
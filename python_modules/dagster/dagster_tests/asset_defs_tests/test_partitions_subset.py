@@ -2,15 +2,25 @@
 from unittest.mock import Mock
 
 import pytest
-from dagster import DailyPartitionsDefinition, MultiPartitionsDefinition, StaticPartitionsDefinition
-from dagster._core.definitions.partition import AllPartitionsSubset, DefaultPartitionsSubset
+from dagster import (
+    DailyPartitionsDefinition,
+    MultiPartitionKey,
+    MultiPartitionsDefinition,
+    PartitionKeyRange,
+    StaticPartitionsDefinition,
+)
+from dagster._core.definitions.partition import (
+    AllPartitionsSubset,
+    DefaultPartitionsSubset,
+    OrdinalPartitionsSubset,
+)
 from dagster._core.definitions.time_window_partitions import (
     PersistedTimeWindow,
     TimeWindowPartitionsDefinition,
     TimeWindowPartitionsSubset,
 )
 from dagster._core.errors import DagsterInvalidDeserializationVersionError
-from dagster._core.test_utils import freeze_time
+from dagster._core.test_utils import environ, freeze_time
 from dagster._serdes import deserialize_value, serialize_value
 from dagster._time import create_datetime, get_current_datetime
 
@@ -82,7 +92,7 @@ def test_get_subset_type():
 
 
 def test_empty_subsets():
-    assert type(static_partitions.empty_subset()) is DefaultPartitionsSubset
+    assert type(static_partitions.empty_subset()) is OrdinalPartitionsSubset
     assert type(time_window_partitions.empty_subset()) is TimeWindowPartitionsSubset
 
 
@@ -209,3 +219,103 @@ def test_partitions_set_short_circuiting() -> None:
 
     # Test short-circuiting of -. Returns an empty DefaultPartitionsSubset
     assert (default_ps - all_ps) == DefaultPartitionsSubset.create_empty_subset()
+
+
+def test_ordinal_partitions_subset_set_operations() -> None:
+    partition_keys = [str(i) for i in range(100)]
+    static_partitions_def = StaticPartitionsDefinition(partition_keys)
+    left_keys = {str(i) for i in [*range(0, 10), *range(20, 30), 55, 99]}
+    right_keys = {str(i) for i in [*range(5, 25), 55, 56]}
+
+    left = static_partitions_def.subset_with_partition_keys(left_keys)
+    right = static_partitions_def.subset_with_partition_keys(right_keys)
+    assert isinstance(left, OrdinalPartitionsSubset)
+    assert left.runs == ((0, 10), (20, 30), (55, 56), (99, 100))
+    assert len(left) == len(left_keys)
+    assert "55" in left and "56" not in left and "not_a_key" not in left
+
+    assert (left | right).get_partition_keys() == left_keys | right_keys
+    assert (left - right).get_partition_keys() == left_keys - right_keys
+    assert (left & right).get_partition_keys() == left_keys & right_keys
+    assert set(left.get_partition_keys_not_in_subset(static_partitions_def)) == (
+        set(partition_keys) - left_keys
+    )
+    assert left.get_partition_key_ranges(static_partitions_def) == [
+        PartitionKeyRange("0", "9"),
+        PartitionKeyRange("20", "29"),
+        PartitionKeyRange("55", "55"),
+        PartitionKeyRange("99", "99"),
+    ]
+    assert left.with_partition_key_range(
+        static_partitions_def, PartitionKeyRange("10", "19")
+    ).runs == ((0, 30), (55, 56), (99, 100))
+
+    # operations with subsets that store partition keys
+    assert left - DefaultPartitionsSubset(right_keys) == DefaultPartitionsSubset(
+        left_keys - right_keys
+    )
+    assert (left | DefaultPartitionsSubset({"50"})).runs == (
+        (0, 10),
+        (20, 30),
+        (50, 51),
+        (55, 56),
+        (99, 100),
+    )
+
+    # keys outside of the partitions definition can't be represented by ordinals
+    with_unknown_key = left.with_partition_keys(["not_a_key"])
+    assert with_unknown_key == DefaultPartitionsSubset(left_keys | {"not_a_key"})
+
+
+def test_ordinal_partitions_subset_serialization() -> None:
+    static_partitions_def = StaticPartitionsDefinition([str(i) for i in range(100_000)])
+    subset = static_partitions_def.subset_with_partition_keys([str(i) for i in range(50_000)])
+    unique_id = static_partitions_def.get_serializable_unique_identifier()
+
+    # by default, the partition keys are stored so that older processes can read the subset
+    key_serialized = subset.serialize()
+    assert key_serialized == DefaultPartitionsSubset(subset.get_partition_keys()).serialize()
+    assert static_partitions_def.deserialize_subset(key_serialized) == subset
+    other_partitions_def = StaticPartitionsDefinition([str(i) for i in range(1, 100_001)])
+    assert other_partitions_def.can_deserialize_subset(
+        key_serialized, unique_id, StaticPartitionsDefinition.__name__
+    )
+    # as with DefaultPartitionsSubset, keys that the partitions definition doesn't have are kept
+    assert other_partitions_def.deserialize_subset(key_serialized).get_partition_keys() == {
+        str(i) for i in range(50_000)
+    }
+
+    with environ({"DAGSTER_SERIALIZE_ORDINAL_PARTITIONS_SUBSETS": "1"}):
+        serialized = subset.serialize()
+    assert len(serialized) < 200
+
+    assert static_partitions_def.can_deserialize_subset(
+        serialized, unique_id, StaticPartitionsDefinition.__name__
+    )
+    assert static_partitions_def.deserialize_subset(serialized) == subset
+
+    # ordinals can't be deserialized against different partition keys
+    assert not other_partitions_def.can_deserialize_subset(
+        serialized, unique_id, StaticPartitionsDefinition.__name__
+    )
+    assert not other_partitions_def.can_deserialize_subset(serialized, None, None)
+    with pytest.raises(DagsterInvalidDeserializationVersionError):
+        StaticPartitionsDefinition(["a", "b"]).deserialize_subset(serialized)
+
+    # serdes stores the partition keys, since the runs are meaningless without the definition
+    round_trip_subset = deserialize_value(serialize_value(subset), DefaultPartitionsSubset)
+    assert round_trip_subset == subset
+
+
+def test_ordinal_multi_partitions_subset() -> None:
+    static_multi_partitions_def = MultiPartitionsDefinition(
+        {"abc": static_partitions, "xy": StaticPartitionsDefinition(["x", "y"])}
+    )
+    subset = static_multi_partitions_def.subset_with_partition_keys(["a|x", "a|y", "b|x"])
+    assert isinstance(subset, OrdinalPartitionsSubset)
+    assert subset.runs == ((0, 3),)
+    assert all(isinstance(key, MultiPartitionKey) for key in subset.get_partition_keys())
+    assert static_multi_partitions_def.deserialize_subset(subset.serialize()) == subset
+
+    # partition keys of multi-partitions definitions with a time dimension change over time
+    assert type(composite.empty_subset()) is DefaultPartitionsSubset
@@ -0,0 +1,125 @@
+import tempfile
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+from dagster import AssetKey, DagsterInstance, materialize
+from dagster._cli.asset import asset_rebuild_cache_command
+from dagster._core.storage.partition_status_cache import get_and_update_asset_status_cache_value
+from dagster._core.test_utils import instance_for_test
+from dagster._utils import file_relative_path
+
+from dagster_tests.cli_tests.command_tests.assets import partitioned_asset
+
+ASSETS_FILE = file_relative_path(__file__, "command_tests/assets.py")
+
+
+@pytest.fixture(name="instance_runner")
+def mock_instance_runner():
+    with tempfile.TemporaryDirectory() as dagster_home_temp:
+        with instance_for_test(
+            temp_dir=dagster_home_temp,
+        ) as instance:
+            runner = CliRunner(env={"DAGSTER_HOME": dagster_home_temp})
+            yield instance, runner
+
+
+def _get_cached_materialized_partitions(instance, asset_key, partitions_def):
+    asset_records = list(instance.get_asset_records([asset_key]))
+    assert len(asset_records) == 1
+    cached_status = asset_records[0].asset_entry.cached_status
+    return cached_status.deserialize_materialized_partition_subsets(
+        partitions_def
+    ).get_partition_keys()
+
+
+def test_rebuild_cache_selection(instance_runner):
+    _, runner = instance_runner
+
+    # only partitioned assets in the selection are rebuilt
+    result = runner.invoke(
+        asset_rebuild_cache_command,
+        ["-f", ASSETS_FILE, "--select", "asset1,partitioned_asset,differently_partitioned_asset"],
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "Rebuilt the partitions status cache of differently_partitioned_asset\n"
+        "Rebuilt the partitions status cache of partitioned_asset\n"
+    )
+
+    result = runner.invoke(asset_rebuild_cache_command, ["-f", ASSETS_FILE])
+    assert result.exit_code == 0, result.output
+    assert result.output == (
+        "Rebuilt the partitions status cache of differently_partitioned_asset\n"
+        "Rebuilt the partitions status cache of multi_run_partitioned_asset\n"
+        "Rebuilt the partitions status cache of partitioned_asset\n"
+        "Rebuilt the partitions status cache of single_run_partitioned_asset\n"
+    )
+
+    result = runner.invoke(
+        asset_rebuild_cache_command, ["-f", ASSETS_FILE, "--select", "nonexistent_asset"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+
+
+def test_check_cache(instance_runner):
+    instance, runner = instance_runner
+    if not instance.event_log_storage.can_maintain_asset_status_cache_on_write():
+        pytest.skip("storage cannot maintain the cached status on write")
+
+    asset_key = AssetKey("partitioned_asset")
+    partitions_def = partitioned_asset.partitions_def
+    materialize([partitioned_asset], instance=instance, partition_key="one")
+    materialize([partitioned_asset], instance=instance, partition_key="two")
+    cached_status = get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+    assert cached_status
+
+    check_args = ["-f", ASSETS_FILE, "--select", "partitioned_asset", "--check"]
+    result = runner.invoke(asset_rebuild_cache_command, check_args)
+    assert result.exit_code == 0, result.output
+    assert "The partitions status cache is consistent" in result.output
+
+    # drop a materialized partition from the cache
+    instance.update_asset_cached_status_data(
+        asset_key,
+        cached_status._replace(
+            serialized_materialized_partition_subset=partitions_def.empty_subset()  # pyright: ignore[reportOptionalMemberAccess]
+            .with_partition_keys(["one"])
+            .serialize()
+        ),
+    )
+
+    result = runner.invoke(asset_rebuild_cache_command, check_args)
+    assert result.exit_code == 1
+    assert "partitioned_asset: inconsistent MATERIALIZED partitions" in result.output
+    assert "Found 1 assets with an inconsistent partitions status cache" in result.output
+
+    # checking doesn't rebuild the cache
+    assert _get_cached_materialized_partitions(instance, asset_key, partitions_def) == {"one"}
+
+    result = runner.invoke(
+        asset_rebuild_cache_command, ["-f", ASSETS_FILE, "--select", "partitioned_asset"]
+    )
+    assert result.exit_code == 0, result.output
+    assert "Rebuilt the partitions status cache of partitioned_asset" in result.output
+    assert _get_cached_materialized_partitions(instance, asset_key, partitions_def) == {
+        "one",
+        "two",
+    }
+
+    result = runner.invoke(asset_rebuild_cache_command, check_args)
+    assert result.exit_code == 0, result.output
+    assert "The partitions status cache is consistent" in result.output
+
+
+def test_rebuild_cache_unsupported(instance_runner):
+    _, runner = instance_runner
+    with mock.patch.object(DagsterInstance, "can_read_asset_status_cache", return_value=False):
+        for args in [[], ["--check"]]:
+            result = runner.invoke(asset_rebuild_cache_command, ["-f", ASSETS_FILE, *args])
+            assert result.exit_code == 2
+            assert (
+                "Error, the instance does not support caching asset status. Rebuilding the cache"
+                " is not supported." in result.output
+            )
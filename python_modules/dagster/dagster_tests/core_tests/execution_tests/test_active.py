@@ -11,7 +11,7 @@
 from dagster._core.execution.plan.objects import StepRetryData, StepSuccessData
 from dagster._core.execution.plan.outputs import StepOutputData, StepOutputHandle
 from dagster._core.execution.retries import RetryMode
-from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG
+from dagster._core.storage.tags import GLOBAL_CONCURRENCY_TAG, PRIORITY_TAG
 from dagster._core.test_utils import instance_for_test
 from dagster._core.utils import make_new_run_id
 from dagster._utils.error import SerializableErrorInfo
@@ -351,3 +351,104 @@ def test_active_concurrency_sleep():
             )
             assert math.isclose(active_execution.sleep_interval(), 2.0, abs_tol=0.1)
             active_execution.mark_interrupted()
+
+
+def define_fan_out_fan_in_job(num_leaves):
+    @op
+    def root():
+        return 1
+
+    @op
+    def leaf(x):
+        return x
+
+    @op
+    def fan_in(xs):
+        return sum(xs)
+
+    @op
+    def downstream(x):
+        return x
+
+    @job
+    def fan_out_fan_in_job():
+        root_output = root()
+        leaf_outputs = [
+            leaf.alias(f"leaf_{i}").tag({PRIORITY_TAG: str(i)})(root_output)
+            for i in range(num_leaves)
+        ]
+        downstream(fan_in(leaf_outputs))
+
+    return fan_out_fan_in_job
+
+
+def _complete_step(active_execution, job_name, step_key):
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_OUTPUT.value,
+            job_name=job_name,
+            step_key=step_key,
+            event_specific_data=StepOutputData(
+                step_output_handle=StepOutputHandle(step_key, "result")
+            ),
+        )
+    )
+    active_execution.handle_event(
+        DagsterEvent(
+            DagsterEventType.STEP_SUCCESS.value,
+            job_name=job_name,
+            step_key=step_key,
+            event_specific_data=StepSuccessData(duration_ms=1.0),
+        )
+    )
+
+
+def test_active_execution_fan_out_fan_in():
+    num_leaves = 50
+    fan_out_fan_in_job = define_fan_out_fan_in_job(num_leaves)
+    with create_execution_plan(fan_out_fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["root"]
+        _complete_step(active_execution, fan_out_fan_in_job.name, "root")
+
+        # leaves are vended in priority order, highest first
+        step_keys = [step.key for step in active_execution.get_steps_to_execute(limit=10)]
+        assert step_keys == [f"leaf_{i}" for i in reversed(range(num_leaves - 10, num_leaves))]
+
+        step_keys += [step.key for step in active_execution.get_steps_to_execute()]
+        assert step_keys == [f"leaf_{i}" for i in reversed(range(num_leaves))]
+
+        for step_key in step_keys[:-1]:
+            _complete_step(active_execution, fan_out_fan_in_job.name, step_key)
+            # the fan-in step only becomes executable once every leaf has completed
+            assert active_execution.get_steps_to_execute() == []
+
+        _complete_step(active_execution, fan_out_fan_in_job.name, step_keys[-1])
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["fan_in"]
+        _complete_step(active_execution, fan_out_fan_in_job.name, "fan_in")
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["downstream"]
+        _complete_step(active_execution, fan_out_fan_in_job.name, "downstream")
+
+        assert active_execution.is_complete
+
+
+def test_active_execution_failure_abandons_transitive_downstream():
+    fan_out_fan_in_job = define_fan_out_fan_in_job(3)
+    with create_execution_plan(fan_out_fan_in_job).start(RetryMode.DISABLED) as active_execution:
+        assert [step.key for step in active_execution.get_steps_to_execute()] == ["root"]
+        _complete_step(active_execution, fan_out_fan_in_job.name, "root")
+        assert len(active_execution.get_steps_to_execute()) == 3
+
+        _complete_step(active_execution, fan_out_fan_in_job.name, "leaf_0")
+        active_execution.mark_failed("leaf_1")
+        assert active_execution.get_steps_to_execute() == []
+
+        # the fan-in step is abandoned once all of its upstream steps have resolved, and its
+        # downstream step is abandoned in turn
+        _complete_step(active_execution, fan_out_fan_in_job.name, "leaf_2")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["fan_in"]
+        active_execution.mark_abandoned("fan_in")
+        assert [step.key for step in active_execution.get_steps_to_abandon()] == ["downstream"]
+        active_execution.mark_abandoned("downstream")
+
+        assert active_execution.get_steps_to_execute() == []
+        assert active_execution.is_complete
@@ -45,6 +45,7 @@
     PartitionsSelector,
 )
 from dagster._core.errors import DagsterInvariantViolationError
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.asset_backfill import (
     AssetBackfillData,
     AssetBackfillIterationResult,
@@ -236,15 +237,23 @@ def test_from_asset_partitions_target_subset(
     )
 
 
-def _get_instance_queryer(
+def _get_asset_graph_view(
     instance: DagsterInstance, asset_graph: BaseAssetGraph, evaluation_time: datetime.datetime
-) -> CachingInstanceQueryer:
+) -> AssetGraphView:
     return AssetGraphView(
         temporal_context=TemporalContext(
             effective_dt=evaluation_time or get_current_datetime(), last_event_id=None
         ),
         instance=instance,
         asset_graph=asset_graph,
+    )
+
+
+def _get_instance_queryer(
+    instance: DagsterInstance, asset_graph: BaseAssetGraph, evaluation_time: datetime.datetime
+) -> CachingInstanceQueryer:
+    return _get_asset_graph_view(
+        instance, asset_graph, evaluation_time
     ).get_inner_queryer_for_back_compat()
 
 
@@ -395,6 +404,57 @@ def test_materializations_outside_of_backfill():
     )
 
 
+def test_prefetch_latest_storage_ids_by_partition():
+    partitions_def = StaticPartitionsDefinition(["a", "b", "c"])
+
+    @asset(partitions_def=partitions_def)
+    def upstream():
+        pass
+
+    @asset(partitions_def=partitions_def, deps=[upstream])
+    def downstream():
+        pass
+
+    @asset
+    def unpartitioned():
+        pass
+
+    assets = [upstream, downstream, unpartitioned]
+    asset_graph = get_asset_graph({"repo": assets})
+    instance = DagsterInstance.ephemeral()
+    materialize([upstream], partition_key="a", instance=instance)
+    materialize([upstream], partition_key="b", instance=instance)
+    materialize([downstream], partition_key="a", instance=instance)
+    materialize([unpartitioned], instance=instance)
+
+    expected_storage_ids = {
+        asset_key: instance.get_latest_storage_id_by_partition(
+            asset_key, DagsterEventType.ASSET_MATERIALIZATION
+        )
+        for asset_key in [upstream.key, downstream.key]
+    }
+
+    instance_queryer = _get_instance_queryer(instance, asset_graph, get_current_datetime())
+    with patch.object(
+        instance,
+        "get_latest_storage_ids_by_partition_for_assets",
+        wraps=instance.get_latest_storage_ids_by_partition_for_assets,
+    ) as bulk_query:
+        instance_queryer.prefetch_latest_storage_ids_by_partition(
+            [upstream.key, downstream.key, unpartitioned.key]
+        )
+    assert bulk_query.call_count == 1
+
+    # the prefetched storage ids are served without querying each asset
+    with patch.object(instance, "get_latest_storage_id_by_partition") as per_asset_query:
+        for asset_key, storage_ids in expected_storage_ids.items():
+            for partition_key in ["a", "b", "c"]:
+                assert instance_queryer.get_latest_materialization_or_observation_storage_id(
+                    AssetKeyPartitionKey(asset_key, partition_key)
+                ) == storage_ids.get(partition_key)
+    assert per_asset_query.call_count == 0
+
+
 def test_do_not_rerequest_while_existing_run_in_progress():
     @asset(
         partitions_def=DailyPartitionsDefinition("2023-01-01"),
@@ -578,7 +638,7 @@ def execute_asset_backfill_iteration_consume_generator(
         for result in execute_asset_backfill_iteration_inner(
             backfill_id=backfill_id,
             asset_backfill_data=asset_backfill_data,
-            instance_queryer=_get_instance_queryer(
+            asset_graph_view=_get_asset_graph_view(
                 instance, asset_graph, asset_backfill_data.backfill_start_datetime
             ),
             asset_graph=asset_graph,
@@ -32,13 +32,16 @@
     DagsterInvalidConfigError,
     DagsterInvariantViolationError,
 )
+from dagster._core.events import DagsterEventType
 from dagster._core.execution.api import create_execution_plan
 from dagster._core.instance import DagsterInstance, InstanceRef
 from dagster._core.instance.config import DEFAULT_LOCAL_CODE_SERVER_STARTUP_TIMEOUT
+from dagster._core.instance.event_write_behind import EventWriteBehindQueue
 from dagster._core.launcher import LaunchRunContext, RunLauncher
 from dagster._core.run_coordinator.queued_run_coordinator import QueuedRunCoordinator
 from dagster._core.snap import create_execution_plan_snapshot_id, snapshot_from_execution_plan
 from dagster._core.storage.asset_check_execution_record import AssetCheckExecutionRecordStatus
+from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import AssetPartitionStatus, AssetStatusCacheValue
 from dagster._core.storage.sqlite_storage import (
     _event_logs_directory,
@@ -795,3 +798,121 @@ def test_invalid_run_id():
             match="run_id must be a valid UUID. Got invalid_run_id",
         ):
             create_run_for_test(instance, job_name="foo_job", run_id="invalid_run_id")
+
+
+def test_event_write_behind():
+    @op
+    def emit_logs(context):
+        for i in range(10):
+            context.log.info(f"log {i}")
+        return 1
+
+    @op
+    def downstream(context, _x):
+        context.log.info("downstream")
+
+    @job
+    def write_behind_job():
+        downstream(emit_logs())
+
+    with environ({"DAGSTER_EVENT_WRITE_BEHIND_QUEUE_SIZE": "100"}):
+        with instance_for_test() as instance:
+            with patch.object(
+                instance.event_log_storage,
+                "store_event_batch",
+                wraps=instance.event_log_storage.store_event_batch,
+            ) as store_event_batch_mock:
+                result = write_behind_job.execute_in_process(instance=instance)
+                assert result.success
+
+                # all events were written before the run was marked as complete
+                run = instance.get_run_by_id(result.run_id)
+                assert run and run.is_success
+                records = instance.get_records_for_run(result.run_id).records
+                event_types = [record.event_log_entry.dagster_event_type for record in records]
+                assert event_types[-1] == DagsterEventType.RUN_SUCCESS
+                assert event_types.count(DagsterEventType.STEP_SUCCESS) == 2
+                assert [
+                    record.event_log_entry.user_message
+                    for record in records
+                    if not record.event_log_entry.is_dagster_event
+                ] == [*[f"log {i}" for i in range(10)], "downstream"]
+
+                # events that were not run-level events were coalesced into batches
+                assert store_event_batch_mock.call_count > 0
+                assert store_event_batch_mock.call_count < len(records)
+
+
+def test_event_write_behind_subscriber_ordering():
+    with environ({"DAGSTER_EVENT_WRITE_BEHIND_QUEUE_SIZE": "5"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            received = []
+            instance.add_event_listener(run.run_id, received.append)
+
+            for i in range(20):
+                instance.report_engine_event(f"engine event {i}", run)
+
+            # run-level events flush everything queued ahead of them
+            instance.report_run_failed(run)
+
+            assert [event.get_dagster_event().message for event in received[:20]] == [
+                f"engine event {i}" for i in range(20)
+            ]
+            assert received[-1].dagster_event_type == DagsterEventType.RUN_FAILURE
+            assert len(instance.all_logs(run.run_id)) == 21
+            run = instance.get_run_by_id(run.run_id)
+            assert run and run.status == DagsterRunStatus.FAILURE
+
+
+def test_event_write_behind_flushes_on_dispose():
+    with environ({"DAGSTER_EVENT_WRITE_BEHIND_QUEUE_SIZE": "1000"}):
+        with instance_for_test() as instance:
+            run = create_run_for_test(instance, job_name="foo_job")
+            for i in range(50):
+                instance.report_engine_event(f"engine event {i}", run)
+            instance.dispose()
+            assert len(instance.all_logs(run.run_id)) == 50
+
+
+def test_event_write_behind_write_failures():
+    written = []
+    dispatched = []
+    failing = {"bad", "worse"}
+
+    def write_fn(events):
+        if any(event in failing for event in events):
+            raise Exception("failed to write")
+        written.extend(events)
+
+    def dispatch_fn(events):
+        dispatched.extend(events)
+        if "a" in events:
+            raise Exception("failed to dispatch")
+
+    write_behind_queue = EventWriteBehindQueue(write_fn, max_size=100, dispatch_fn=dispatch_fn)
+    try:
+        for event in ["a", "bad", "b", "worse"]:
+            write_behind_queue.put(event)  # pyright: ignore[reportArgumentType]
+
+        # the events that can be written are not lost with the rest of their batch, and the
+        # events that cannot be written are retried by the flush, which surfaces the error
+        with pytest.raises(Exception, match="failed to write"):
+            write_behind_queue.flush()
+        assert written == ["a", "b"]
+
+        # a failing subscriber does not cause written events to be written again
+        assert dispatched == ["a", "b"]
+
+        # events after the one that failed the retry are kept for the next retry
+        failing.discard("bad")
+        with pytest.raises(Exception, match="failed to write"):
+            write_behind_queue.flush()
+        assert written == ["a", "b", "bad"]
+
+        failing.clear()
+        write_behind_queue.flush()
+        assert written == ["a", "b", "bad", "worse"]
+        assert dispatched == written
+    finally:
+        write_behind_queue.shutdown()
@@ -0,0 +1,92 @@
+import threading
+import time
+from collections.abc import Sequence
+from unittest import mock
+
+from dagster._core.remote_representation.code_location import CodeLocation
+from dagster._core.remote_representation.origin import (
+    CodeLocationOrigin,
+    RegisteredCodeLocationOrigin,
+)
+from dagster._core.test_utils import instance_for_test
+from dagster._core.workspace.context import WorkspaceProcessContext
+from dagster._core.workspace.load_target import WorkspaceLoadTarget
+from dagster._core.workspace.workspace import CodeLocationLoadStatus
+
+
+def _mock_location() -> CodeLocation:
+    location = mock.MagicMock(spec=CodeLocation)
+    location.get_display_metadata.return_value = {}
+    return location
+
+
+class RegisteredLocationsTarget(WorkspaceLoadTarget):
+    def __init__(self, location_names: Sequence[str]):
+        self._location_names = location_names
+
+    def create_origins(self) -> Sequence[CodeLocationOrigin]:
+        return [RegisteredCodeLocationOrigin(name) for name in self._location_names]
+
+
+def test_load_locations_concurrently():
+    location_names = ["loc_one", "loc_two", "loc_three"]
+    # every load waits for all of the others to start, so loading one at a time would fail
+    barrier = threading.Barrier(len(location_names), timeout=30)
+
+    def create_location(_origin, _instance):
+        barrier.wait()
+        return _mock_location()
+
+    with (
+        instance_for_test() as instance,
+        mock.patch.object(RegisteredCodeLocationOrigin, "create_location", create_location),
+        mock.patch.object(RegisteredCodeLocationOrigin, "reload_location", create_location),
+        WorkspaceProcessContext(instance, RegisteredLocationsTarget(location_names)) as context,
+    ):
+        snapshot = context.get_workspace_snapshot()
+        assert list(snapshot.code_location_entries) == location_names
+        for entry in snapshot.code_location_entries.values():
+            assert entry.code_location
+            assert entry.load_status == CodeLocationLoadStatus.LOADED
+            assert entry.load_duration is not None
+
+        statuses = context.create_request_context().get_code_location_statuses()
+        assert [status.location_name for status in statuses] == location_names
+        assert all(status.load_duration is not None for status in statuses)
+
+        barrier.reset()
+        context.reload_workspace()
+        assert all(
+            entry.code_location
+            for entry in context.get_workspace_snapshot().code_location_entries.values()
+        )
+
+
+def test_location_load_timeout():
+    slow_location_loaded = threading.Event()
+
+    def create_location(origin, _instance):
+        if origin.location_name == "slow_loc":
+            slow_location_loaded.wait(30)
+        return _mock_location()
+
+    with (
+        instance_for_test(overrides={"code_servers": {"location_load_timeout": 1}}) as instance,
+        mock.patch.object(RegisteredCodeLocationOrigin, "create_location", create_location),
+        WorkspaceProcessContext(
+            instance, RegisteredLocationsTarget(["fast_loc", "slow_loc"])
+        ) as context,
+    ):
+        entries = context.get_workspace_snapshot().code_location_entries
+        assert entries["fast_loc"].code_location
+        assert not entries["slow_loc"].code_location
+        assert entries["slow_loc"].load_error
+        assert "Timed out" in entries["slow_loc"].load_error.message
+
+        # the location replaces the timeout error once it finishes loading
+        slow_location_loaded.set()
+        start_time = time.time()
+        while not context.has_code_location("slow_loc"):
+            assert time.time() - start_time < 30
+            time.sleep(0.1)
+        assert not context.get_workspace_snapshot().code_location_entries["slow_loc"].load_error
@@ -0,0 +1,140 @@
+import datetime
+
+from click.testing import CliRunner
+from dagster import (
+    AssetMaterialization,
+    AutomationCondition,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._cli.asset import asset_profile_automation_conditions_command
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
+from dagster._core.definitions.declarative_automation.serialized_objects import (
+    AutomationConditionEvaluation,
+)
+from dagster._core.definitions.events import AssetKeyPartitionKey
+from dagster._core.instance_for_test import instance_for_test
+from dagster._serdes import deserialize_value, serialize_value
+from dagster._utils.cache_stats import CacheStats, record_cache_stats
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def root() -> None: ...
+
+
+@asset(
+    deps=[root],
+    partitions_def=DailyPartitionsDefinition("2020-01-01"),
+    automation_condition=AutomationCondition.eager() | AutomationCondition.on_missing(),
+)
+def downstream() -> None: ...
+
+
+defs = Definitions(assets=[root, downstream])
+
+
+def _check_inclusive(evaluation: AutomationConditionEvaluation) -> None:
+    stats = evaluation.stats
+    assert stats is not None
+    for child in evaluation.child_evaluations:
+        assert child.stats is not None
+        assert child.stats.num_storage_queries <= stats.num_storage_queries
+        assert child.stats.num_cache_hits <= stats.num_cache_hits
+        assert child.stats.num_cache_misses <= stats.num_cache_misses
+        _check_inclusive(child)
+
+
+def test_evaluation_stats() -> None:
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization(root.key))
+        result = evaluate_automation_conditions(
+            defs=defs,
+            instance=instance,
+            evaluation_time=datetime.datetime(2020, 2, 2, 1, tzinfo=datetime.timezone.utc),
+        )
+
+        for entity_result in result.results:
+            evaluation = entity_result.serializable_evaluation
+            _check_inclusive(evaluation)
+            assert (
+                deserialize_value(serialize_value(evaluation), AutomationConditionEvaluation).stats
+                == evaluation.stats
+            )
+
+        # the materialization of root must be read from storage
+        downstream_evaluation = next(
+            r.serializable_evaluation for r in result.results if r.key == downstream.key
+        )
+        assert downstream_evaluation.stats
+        assert downstream_evaluation.stats.num_storage_queries > 0
+
+
+def test_storage_queries_counted_once() -> None:
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization(root.key))
+        asset_partition = AssetKeyPartitionKey(root.key)
+
+        with record_cache_stats(CacheStats()) as stats:
+            assert instance.get_asset_records([root.key])
+        num_storage_queries = stats.num_storage_queries
+        assert num_storage_queries > 0
+
+        # loading through the queryer issues the same statements
+        queryer = AssetGraphView.for_test(defs, instance).get_inner_queryer_for_back_compat()
+        with record_cache_stats(CacheStats()) as stats:
+            assert queryer.get_asset_record(root.key)
+        assert stats.num_storage_queries == num_storage_queries
+
+        # the latest record is read from the already loaded asset record, so the cache miss does
+        # not reach storage
+        with record_cache_stats(CacheStats()) as stats:
+            assert queryer.get_latest_materialization_or_observation_record(asset_partition)
+        assert stats.num_cache_misses > 0
+        assert stats.num_storage_queries == 0
+
+        with record_cache_stats(CacheStats()) as stats:
+            assert queryer.get_latest_materialization_or_observation_record(asset_partition)
+        assert stats.num_cache_hits > 0
+        assert stats.num_cache_misses == 0
+
+
+def test_profile_automation_conditions_command() -> None:
+    with instance_for_test() as instance:
+        result = evaluate_automation_conditions(
+            defs=defs,
+            instance=instance,
+            evaluation_time=datetime.datetime(2020, 2, 2, 1, tzinfo=datetime.timezone.utc),
+        )
+        instance.schedule_storage.add_auto_materialize_asset_evaluations(  # pyright: ignore[reportOptionalMemberAccess]
+            5,
+            [
+                entity_result.serializable_evaluation.with_run_ids(set())
+                for entity_result in result.results
+            ],
+        )
+
+        runner = CliRunner(env={"DAGSTER_HOME": instance.root_directory})
+
+        output = runner.invoke(asset_profile_automation_conditions_command, ["downstream"])
+        assert output.exit_code == 0, output.output
+        lines = output.output.splitlines()
+        assert lines[0] == "Evaluation 5 of downstream"
+        assert lines[2].endswith("  OR")
+        assert any(line.endswith("  NEWLY_TRUE (newly_missing)") for line in lines)
+
+        output = runner.invoke(
+            asset_profile_automation_conditions_command, ["--evaluation-id", "5"]
+        )
+        assert output.exit_code == 0, output.output
+        assert any(line.startswith("missing ") for line in output.output.splitlines())
+
+        output = runner.invoke(
+            asset_profile_automation_conditions_command, ["--evaluation-id", "6"]
+        )
+        assert output.exit_code == 1
+        assert "No automation condition evaluation 6" in output.output
+
+        output = runner.invoke(asset_profile_automation_conditions_command, [])
+        assert output.exit_code == 2
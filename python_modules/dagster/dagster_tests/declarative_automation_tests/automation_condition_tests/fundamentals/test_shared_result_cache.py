@@ -0,0 +1,92 @@
+import asyncio
+from typing import cast
+
+from dagster import AutomationCondition, Definitions, asset, evaluate_automation_conditions
+from dagster._core.asset_graph_view.asset_graph_view import AssetGraphView
+from dagster._core.asset_graph_view.entity_subset import EntitySubset, _ValidatedEntitySubsetValue
+from dagster._core.definitions.declarative_automation.shared_result_cache import (
+    SharedAutomationResultCache,
+)
+from dagster._core.instance_for_test import instance_for_test
+
+
+@asset
+def parent() -> None: ...
+
+
+@asset(
+    deps=[parent],
+    automation_condition=AutomationCondition.any_deps_match(AutomationCondition.missing()),
+)
+def child_a() -> None: ...
+
+
+@asset(
+    deps=[parent],
+    automation_condition=AutomationCondition.any_deps_match(AutomationCondition.missing()),
+)
+def child_b() -> None: ...
+
+
+@asset(
+    deps=[parent],
+    automation_condition=AutomationCondition.any_deps_match(AutomationCondition.newly_requested()),
+)
+def child_c() -> None: ...
+
+
+@asset(
+    deps=[parent],
+    automation_condition=AutomationCondition.any_deps_match(AutomationCondition.newly_requested()),
+)
+def child_d() -> None: ...
+
+
+def _get_dep_result(result, key):
+    # ANY_DEPS_MATCH -> parent -> operand
+    return next(r for r in result.results if r.key == key).child_results[0].child_results[0]
+
+
+def test_results_shared_across_dependents() -> None:
+    with instance_for_test() as instance:
+        result = evaluate_automation_conditions(
+            defs=Definitions(assets=[parent, child_a, child_b, child_c, child_d]),
+            instance=instance,
+        )
+        assert result.get_num_requested(child_a.key) == 1
+        assert result.get_num_requested(child_b.key) == 1
+
+        # the evaluation of missing() over parent is shared
+        assert _get_dep_result(result, child_a.key) is _get_dep_result(result, child_b.key)
+        # newly_requested() reads the cursor of the root entity, so it is not shared
+        assert _get_dep_result(result, child_c.key) is not _get_dep_result(result, child_d.key)
+
+
+def test_size_based_eviction() -> None:
+    async def _run() -> None:
+        cache = SharedAutomationResultCache(max_size=2)
+        loop = asyncio.get_running_loop()
+        futures = [loop.create_future() for _ in range(3)]
+        subset = EntitySubset(
+            cast(AssetGraphView, None), parent.key, _ValidatedEntitySubsetValue(True)
+        )
+
+        cache.set("a", subset, futures[0])
+        cache.set("b", subset, futures[1])
+        # refresh "a", so that "b" is the least recently used entry
+        assert cache.get("a", subset) is futures[0]
+        cache.set("c", subset, futures[2])
+
+        assert cache.num_results == 2
+        assert cache.get("b", subset) is None
+        assert cache.get("a", subset) is futures[0]
+        assert cache.get("c", subset) is futures[2]
+        empty_subset = EntitySubset(
+            cast(AssetGraphView, None), parent.key, _ValidatedEntitySubsetValue(False)
+        )
+        assert cache.get("c", empty_subset) is None
+
+        cache.clear()
+        assert cache.num_results == 0
+
+    asyncio.run(_run())
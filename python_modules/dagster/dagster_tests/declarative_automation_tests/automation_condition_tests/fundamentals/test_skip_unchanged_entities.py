@@ -0,0 +1,113 @@
+import datetime
+
+from dagster import (
+    AssetKey,
+    AssetMaterialization,
+    AutomationCondition,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    evaluate_automation_conditions,
+)
+from dagster._core.instance_for_test import instance_for_test
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def root() -> None: ...
+
+
+@asset(deps=[root], automation_condition=AutomationCondition.eager())
+def downstream() -> None: ...
+
+
+@asset(automation_condition=AutomationCondition.on_cron("@daily"))
+def daily_cron() -> None: ...
+
+
+@asset(
+    partitions_def=DailyPartitionsDefinition("2020-01-01"),
+    automation_condition=AutomationCondition.on_missing(),
+)
+def daily_partitioned() -> None: ...
+
+
+defs = Definitions(assets=[root, downstream, daily_cron, daily_partitioned])
+
+
+def _evaluated_keys(result) -> set[AssetKey]:
+    return {r.key for r in result.results}
+
+
+def test_skip_unchanged_entities() -> None:
+    with instance_for_test(
+        overrides={"auto_materialize": {"skip_unchanged_entities": True}}
+    ) as instance:
+        current_time = datetime.datetime(2020, 2, 2, 1, tzinfo=datetime.timezone.utc)
+
+        # no previous cursors, so everything is evaluated
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {
+            root.key,
+            downstream.key,
+            daily_cron.key,
+            daily_partitioned.key,
+        }
+        assert result.total_requested == 0
+
+        # nothing has changed
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == set()
+        assert result.total_requested == 0
+
+        # events for other assets do not cause re-evaluation, but the skipped cursors still move
+        # past them
+        instance.report_runless_asset_event(AssetMaterialization("unrelated"))
+        last_event_id = instance.event_log_storage.get_maximum_record_id()
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == set()
+        assert all(
+            cursor.last_event_id == last_event_id
+            for cursor in result.cursor.previous_condition_cursors or []
+        )
+
+        # new event for root, so it and its children are evaluated
+        instance.report_runless_asset_event(AssetMaterialization(root.key))
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {root.key, downstream.key}
+        assert result.get_num_requested(downstream.key) == 1
+
+        # downstream was requested on the previous tick, so it is evaluated again
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {downstream.key}
+        assert result.total_requested == 0
+
+        # crossing midnight passes a cron tick and adds a new daily partition
+        current_time = datetime.datetime(2020, 2, 3, 1, tzinfo=datetime.timezone.utc)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {daily_cron.key, daily_partitioned.key}
+        assert result.get_num_requested(daily_cron.key) == 1
+        assert result.get_num_requested(daily_partitioned.key) == 1
+
+        # both were requested on the previous tick, so they are evaluated again
+        current_time += datetime.timedelta(minutes=1)
+        result = evaluate_automation_conditions(
+            defs=defs, instance=instance, cursor=result.cursor, evaluation_time=current_time
+        )
+        assert _evaluated_keys(result) == {daily_cron.key, daily_partitioned.key}
+        assert result.total_requested == 0
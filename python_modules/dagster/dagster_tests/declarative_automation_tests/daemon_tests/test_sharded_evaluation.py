@@ -0,0 +1,164 @@
+import datetime
+import logging
+
+import pytest
+from dagster import (
+    AssetCheckResult,
+    AssetMaterialization,
+    AssetSelection,
+    AssetSpec,
+    AutomationCondition,
+    AutomationConditionSensorDefinition,
+    DailyPartitionsDefinition,
+    Definitions,
+    asset,
+    asset_check,
+    multi_asset,
+)
+from dagster._check import CheckError
+from dagster._core.definitions.asset_daemon_cursor import AssetDaemonCursor
+from dagster._core.definitions.automation_tick_evaluation_context import (
+    AutomationTickEvaluationContext,
+    get_evaluation_shards,
+)
+from dagster._core.instance_for_test import instance_for_test
+from dagster._core.test_utils import mock_workspace_from_repos
+
+
+@asset(automation_condition=AutomationCondition.eager())
+def a() -> None: ...
+
+
+@asset(deps=[a], automation_condition=AutomationCondition.eager())
+def b() -> None: ...
+
+
+@asset_check(asset=b, automation_condition=AutomationCondition.eager())
+def b_check() -> AssetCheckResult:
+    return AssetCheckResult(passed=True)
+
+
+@asset(automation_condition=AutomationCondition.on_missing())
+def c() -> None: ...
+
+
+@asset(
+    partitions_def=DailyPartitionsDefinition("2020-01-01"),
+    automation_condition=AutomationCondition.on_missing(),
+)
+def d() -> None: ...
+
+
+@multi_asset(
+    specs=[
+        AssetSpec("e1", automation_condition=AutomationCondition.eager()),
+        AssetSpec("e2", automation_condition=AutomationCondition.eager()),
+    ],
+    can_subset=False,
+)
+def e(): ...
+
+
+defs = Definitions(assets=[a, b, c, d, e], asset_checks=[b_check])
+
+
+def test_get_evaluation_shards() -> None:
+    asset_graph = defs.get_asset_graph()
+    entity_keys = {
+        a.key,
+        b.key,
+        b_check.check_key,
+        c.key,
+        d.key,
+        *e.keys,
+    }
+
+    shards = get_evaluation_shards(entity_keys, asset_graph, 2)
+    assert len(shards) == 2
+    assert set().union(*shards) == entity_keys
+    # connected entities and execution sets always end up in the same shard
+    for component in [{a.key, b.key, b_check.check_key}, set(e.keys)]:
+        assert any(component <= shard for shard in shards)
+
+    # never more shards than connected components
+    assert len(get_evaluation_shards(entity_keys, asset_graph, 16)) == 4
+    assert get_evaluation_shards(entity_keys, asset_graph, 1) == [entity_keys]
+
+
+def _evaluate(instance, asset_graph, cursor, max_evaluation_workers):
+    return AutomationTickEvaluationContext(
+        evaluation_id=cursor.evaluation_id + 1,
+        instance=instance,
+        asset_graph=asset_graph,
+        cursor=cursor,
+        materialize_run_tags={},
+        observe_run_tags={},
+        auto_observe_asset_keys=set(),
+        asset_selection=AssetSelection.all(include_sources=True),
+        logger=logging.getLogger("dagster.automation"),
+        emit_backfills=False,
+        evaluation_time=datetime.datetime(2020, 2, 2, 1, tzinfo=datetime.timezone.utc),
+        max_evaluation_workers=max_evaluation_workers,
+    ).evaluate()
+
+
+def _run_request_keys(run_requests):
+    return sorted(
+        (
+            sorted(key.to_user_string() for key in run_request.asset_selection or []),
+            sorted(key.to_user_string() for key in run_request.asset_check_keys or []),
+            run_request.partition_key or "",
+        )
+        for run_request in run_requests
+    )
+
+
+def test_sharded_evaluation_matches_single_process() -> None:
+    asset_graph = mock_workspace_from_repos([defs.get_repository_def()]).asset_graph
+    with instance_for_test() as instance:
+        instance.report_runless_asset_event(AssetMaterialization(a.key))
+
+        sequential_cursor = AssetDaemonCursor.empty()
+        sharded_cursor = AssetDaemonCursor.empty()
+        for _ in range(2):
+            sequential_run_requests, sequential_cursor, sequential_evaluations = _evaluate(
+                instance, asset_graph, sequential_cursor, None
+            )
+            sharded_run_requests, sharded_cursor, sharded_evaluations = _evaluate(
+                instance, asset_graph, sharded_cursor, 2
+            )
+
+            assert _run_request_keys(sharded_run_requests) == _run_request_keys(
+                sequential_run_requests
+            )
+            assert {evaluation.key for evaluation in sharded_evaluations} == {
+                evaluation.key for evaluation in sequential_evaluations
+            }
+            assert {
+                (cursor.key, cursor.result_value_hash)
+                for cursor in sharded_cursor.previous_condition_cursors or []
+            } == {
+                (cursor.key, cursor.result_value_hash)
+                for cursor in sequential_cursor.previous_condition_cursors or []
+            }
+
+
+def test_max_evaluation_workers_sensor_definition() -> None:
+    sensor = AutomationConditionSensorDefinition(
+        "sharded", target=AssetSelection.all(), max_evaluation_workers=4
+    )
+    assert sensor.max_evaluation_workers == 4
+    assert (
+        AutomationConditionSensorDefinition(
+            "not_sharded", target=AssetSelection.all()
+        ).max_evaluation_workers
+        is None
+    )
+
+    with pytest.raises(CheckError, match="max_evaluation_workers"):
+        AutomationConditionSensorDefinition(
+            "user_code",
+            target=AssetSelection.all(),
+            use_user_code_server=True,
+            max_evaluation_workers=4,
+        )
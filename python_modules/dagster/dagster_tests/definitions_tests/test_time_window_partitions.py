@@ -24,6 +24,7 @@
     ScheduleType,
     TimeWindow,
     TimeWindowPartitionsSubset,
+    dst_safe_strftime,
     dst_safe_strptime,
 )
 from dagster._core.definitions.timestamp import TimestampWithTimezone
@@ -1172,6 +1173,78 @@ def test_dst_transition_daily_partitions() -> None:
     )
 
 
+@pytest.mark.parametrize(
+    "cron_schedule, fmt",
+    [
+        ("0 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("30 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("*/15 * * * *", DEFAULT_HOURLY_FORMAT_WITHOUT_TIMEZONE),
+        ("0 0 * * *", DATE_FORMAT),
+        ("30 2 * * *", "%Y-%m-%d-%H:%M"),
+        ("15 1 * * 0", DATE_FORMAT),
+        ("0 2 * * 3", "%Y-%m-%d-%H:%M"),
+        ("30 2 15 * *", "%Y-%m-%d-%H:%M"),
+    ],
+)
+@pytest.mark.parametrize(
+    "timezone", ["UTC", "US/Pacific", "Europe/Berlin", "Asia/Kolkata", "Australia/Lord_Howe"]
+)
+def test_closed_form_partition_arithmetic_matches_cron_iteration(
+    cron_schedule: str, fmt: str, timezone: str
+) -> None:
+    partitions_def = TimeWindowPartitionsDefinition(
+        start=datetime(2020, 3, 1), timezone=timezone, fmt=fmt, cron_schedule=cron_schedule
+    )
+    assert partitions_def._closed_form_ticks is not None  # noqa: SLF001
+
+    # spans the spring and fall DST transitions in both hemispheres
+    current_time = (
+        create_datetime(2020, 11, 5, 0, 7, tz=timezone)
+        if partitions_def.schedule_type == ScheduleType.HOURLY or cron_schedule.startswith("*/")
+        else create_datetime(2023, 4, 20, 0, 7, tz=timezone)
+    )
+    expected_windows = []
+    for window in partitions_def._iterate_time_windows(partitions_def.start.timestamp()):  # noqa: SLF001
+        if window.end.timestamp() > current_time.timestamp():
+            break
+        expected_windows.append(window)
+    expected_keys = [
+        dst_safe_strftime(window.start, timezone, fmt, cron_schedule) for window in expected_windows
+    ]
+
+    assert partitions_def.get_partition_keys(current_time=current_time) == expected_keys
+    assert (
+        partitions_def.get_partition_keys_between_indexes(
+            len(expected_keys) // 2, len(expected_keys) + 5, current_time=current_time
+        )
+        == expected_keys[len(expected_keys) // 2 :]
+    )
+    assert (
+        partitions_def.get_num_partitions_in_window(
+            TimeWindow(expected_windows[3].start, expected_windows[-3].end)
+        )
+        == len(expected_windows) - 5
+    )
+
+    sampled_idxs = sorted(random.sample(range(len(expected_keys)), 20))
+    sampled_windows = [
+        (expected_windows[idx].start.timestamp(), expected_windows[idx].end.timestamp())
+        for idx in sampled_idxs
+    ]
+    assert [
+        (window.start.timestamp(), window.end.timestamp())
+        for window in partitions_def.time_windows_for_partition_keys(
+            frozenset(expected_keys[idx] for idx in sampled_idxs), validate=False
+        )
+    ] == sampled_windows
+    assert [
+        (window.start.timestamp(), window.end.timestamp())
+        for window in (
+            partitions_def.time_window_for_partition_key(expected_keys[idx]) for idx in sampled_idxs
+        )
+    ] == sampled_windows
+
+
 def test_unique_identifier():
     assert (
         DailyPartitionsDefinition(start_date="2015-01-01").get_serializable_unique_identifier()
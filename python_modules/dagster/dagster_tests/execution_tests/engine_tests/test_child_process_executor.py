@@ -9,6 +9,7 @@
     ChildProcessCrashException,
     ChildProcessDoneEvent,
     ChildProcessEvent,
+    ChildProcessEventSelector,
     ChildProcessStartEvent,
     ChildProcessSystemErrorEvent,
     execute_child_process_command,
@@ -87,6 +88,53 @@ def test_basic_child_process_command_with_process_events():
     assert events[3].pid == child_pid
 
 
+def _drive_with_selector(commands):
+    selector = ChildProcessEventSelector()
+    iterators = [execute_child_process_command(multiprocessing_ctx, c, selector) for c in commands]
+    results = [[] for _ in commands]
+    active = set(range(len(commands)))
+    while active:
+        made_progress = False
+        for i in list(active):
+            try:
+                result = next(iterators[i])
+            except StopIteration:
+                active.remove(i)
+                made_progress = True
+                continue
+            if result is not None:
+                results[i].append(result)
+                made_progress = True
+        if active and not made_progress:
+            selector.wait(timeout=5)
+    return results
+
+
+def test_child_process_commands_with_selector():
+    results = _drive_with_selector(
+        [DoubleAStringChildProcessCommand("aa"), DoubleAStringChildProcessCommand("bb")]
+    )
+    for events, expected in zip(results, ["aaaa", "bbbb"]):
+        assert len(events) == 4
+        assert isinstance(events[0], BaseProcess)
+        assert isinstance(events[1], ChildProcessStartEvent)
+        assert events[2] == expected
+        assert isinstance(events[3], ChildProcessDoneEvent)
+
+
+def test_child_process_selector_wakes_on_exit():
+    with pytest.raises(ChildProcessCrashException) as exc:
+        _drive_with_selector([CrashyCommand()])
+    assert exc.value.exit_code == 1
+
+
+def test_child_process_selector_wait_timeout():
+    selector = ChildProcessEventSelector()
+    start = time.time()
+    assert not selector.wait(timeout=0.1)
+    assert time.time() - start >= 0.1
+
+
 def test_child_process_uncaught_exception():
     results = list(
         filter(
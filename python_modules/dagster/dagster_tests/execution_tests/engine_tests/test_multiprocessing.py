@@ -19,10 +19,12 @@
 )
 from dagster._check import CheckError
 from dagster._core.definitions.metadata import MetadataValue
+from dagster._core.definitions.reconstruct import ReconstructableJob
 from dagster._core.errors import DagsterUnmetExecutorRequirementsError
 from dagster._core.events import DagsterEvent, DagsterEventType
 from dagster._core.execution import execution_result
 from dagster._core.execution.api import execute_job
+from dagster._core.executor.multiprocess import get_forkserver_preload_modules
 from dagster._core.instance import DagsterInstance
 from dagster._core.storage.mem_io_manager import mem_io_manager
 from dagster._core.test_utils import instance_for_test
@@ -107,6 +109,124 @@ def test_forkserver_preload():
             assert result.output_for_node("adder") == 11
 
 
+@pytest.mark.skipif(os.name == "nt", reason="No forkserver on windows")
+def test_forkserver_preload_code_location():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "start_method": {
+                                "forkserver": {
+                                    "preload_modules": ["dagster"],
+                                    "preload_code_location": True,
+                                }
+                            }
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+
+def test_get_forkserver_preload_modules():
+    module = "dagster_tests.execution_tests.engine_tests.test_multiprocessing"
+    module_job = ReconstructableJob.for_module(module, "define_diamond_job")
+    file_job = ReconstructableJob.for_file(__file__, "define_diamond_job")
+    executor_module = "dagster._core.executor.multiprocess"
+
+    # defaults: the code location's module if there is one, otherwise dagster
+    assert get_forkserver_preload_modules(module_job, None, None) == [executor_module, module]
+    assert get_forkserver_preload_modules(file_job, None, None) == [executor_module, "dagster"]
+    assert get_forkserver_preload_modules(module_job, None, False) == [executor_module, "dagster"]
+
+    # explicit modules replace the default unless the code location is requested as well
+    assert get_forkserver_preload_modules(module_job, ["pandas"], None) == [
+        executor_module,
+        "pandas",
+    ]
+    assert get_forkserver_preload_modules(module_job, ["pandas"], True) == [
+        executor_module,
+        "pandas",
+        module,
+    ]
+    assert get_forkserver_preload_modules(module_job, [], None) == [executor_module]
+
+
+def test_step_worker_started_time_to_first_user_code():
+    with instance_for_test() as instance:
+        with execute_job(reconstructable(define_diamond_job), instance=instance) as result:
+            assert result.success
+            worker_started_events = [
+                event
+                for event in result.all_events
+                if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+            ]
+            assert len(worker_started_events) == 4
+            for event in worker_started_events:
+                metadata = event.event_specific_data.metadata  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue]
+                assert metadata["time_to_first_user_code_ms"].value > 0
+
+
+def _step_worker_pids(result: execution_result.ExecutionResult) -> dict[str, str]:
+    return {
+        event.step_key: event.event_specific_data.metadata["pid"].value  # pyright: ignore[reportOptionalMemberAccess,reportAttributeAccessIssue]
+        for event in result.all_events
+        if event.event_type == DagsterEventType.STEP_WORKER_STARTED
+    }
+
+
+def test_worker_pool_execution():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {"config": {"multiprocess": {"max_concurrent": 1, "worker_pool": {}}}},
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            # every step ran in the single worker process
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids.values())) == 1
+            assert int(next(iter(pids.values()))) != os.getpid()
+
+
+def test_worker_pool_recycles_workers():
+    with instance_for_test() as instance:
+        recon_job = reconstructable(define_diamond_job)
+        with execute_job(
+            recon_job,
+            run_config={
+                "execution": {
+                    "config": {
+                        "multiprocess": {
+                            "max_concurrent": 1,
+                            "worker_pool": {"max_steps_per_worker": 2},
+                        }
+                    }
+                },
+            },
+            instance=instance,
+        ) as result:
+            assert result.success
+            assert result.output_for_node("adder") == 11
+
+            pids = _step_worker_pids(result)
+            assert len(pids) == 4
+            assert len(set(pids.values())) == 2
+
+
 JUST_ADDER_CONFIG = {
     "ops": {"adder": {"inputs": {"left": {"value": 1}, "right": {"value": 1}}}},
 }
@@ -471,6 +591,21 @@ def test_crash_hard_multiprocessing():
             # documenting this behavior here though we may want to change it
 
 
+@pytest.mark.skipif(os.name == "nt", reason="Different exception on Windows: See issue #2791")
+def test_crash_hard_worker_pool():
+    with instance_for_test() as instance:
+        with execute_job(
+            reconstructable(segfault_job),
+            instance=instance,
+            run_config={"execution": {"config": {"multiprocess": {"worker_pool": {}}}}},
+            raise_on_error=False,
+        ) as result:
+            assert not result.success
+            failure_data = result.failure_data_for_node("segfault_op")
+            assert failure_data
+            assert failure_data.error.cls_name == "ChildProcessCrashException"  # pyright: ignore[reportOptionalMemberAccess]
+
+
 def get_dynamic_resource_init_failure_job():
     return get_dynamic_job_resource_init_failure(multiprocess_executor)[0]
 
@@ -1,10 +1,12 @@
 from dagster._core.test_utils import environ
 from dagster._grpc.utils import (
+    StreamingChunkDecoder,
     default_grpc_server_shutdown_grace_period,
     default_grpc_timeout,
     default_repository_grpc_timeout,
     default_schedule_grpc_timeout,
     default_sensor_grpc_timeout,
+    split_into_chunks,
 )
 
 
@@ -108,3 +110,23 @@ def test_override_grpc_timeouts():
         assert default_sensor_grpc_timeout() == 60
         assert default_grpc_server_shutdown_grace_period() == 60
         assert default_repository_grpc_timeout() == 300
+
+
+def test_split_into_compressed_chunks():
+    serialized_data = (
+        '{"name": "caf\u00e9 \u2603", "values": [' + ", ".join(str(i) for i in range(10000)) + "]}"
+    )
+
+    chunks = list(split_into_chunks(serialized_data, 1000, compress=False))
+    assert len(chunks) == len(serialized_data) // 1000 + 1
+    assert "".join(chunks) == serialized_data
+
+    compressed_chunks = list(split_into_chunks(serialized_data, 1000, compress=True))
+    assert len(compressed_chunks) == len(chunks)
+    assert sum(len(chunk) for chunk in compressed_chunks) < len(serialized_data)
+
+    # each chunk decodes to the characters it was compressed from as soon as it is received
+    decoder = StreamingChunkDecoder()
+    assert [decoder.decode(chunk) for chunk in compressed_chunks] == chunks
+
+    assert list(split_into_chunks("", 1000, compress=True)) == []
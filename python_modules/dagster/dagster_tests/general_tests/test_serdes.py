@@ -27,6 +27,7 @@
     get_storage_name,
     pack_value,
     serialize_value,
+    serialize_value_compact,
     unpack_value,
 )
 from dagster._serdes.utils import hash_str
@@ -1217,3 +1218,117 @@ class Wat: ...
 
     with pytest.raises(CheckError):
         get_storage_name(Wat, whitelist_map=test_env)
+
+
+def test_compact_serdes() -> None:
+    test_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(test_env)
+    class Color(Enum):
+        RED = "RED"
+        BLUE = "BLUE"
+
+    @_whitelist_for_serdes(
+        test_env,
+        storage_name="Bar",
+        storage_field_names={"color": "colour"},
+        old_fields={"shape": None},
+        field_serializers={"sizes": SetToSequenceFieldSerializer},
+    )
+    class Foo(NamedTuple):
+        color: Color
+        sizes: AbstractSet[int]
+        tags: Mapping[str, str]
+
+    @_whitelist_for_serdes(test_env)
+    @record
+    class Baz:
+        foos: Sequence[Foo]
+        by_color: Mapping[Color, int]
+        names: frozenset[str]
+
+    foo_1 = Foo(Color.RED, {1, 2}, {"a": "b"})
+    foo_2 = Foo(Color.BLUE, set(), {})
+    val = Baz(
+        foos=[foo_1, foo_2],
+        by_color=SerializableNonScalarKeyMapping({Color.RED: 1}),
+        names=frozenset({"x", "y"}),
+    )
+
+    serialized = serialize_value_compact(val, whitelist_map=test_env)
+    # field names are written once per class
+    assert serialized.count("colour") == 1
+    assert deserialize_value(serialized, Baz, whitelist_map=test_env) == val
+    assert deserialize_value(serialized, whitelist_map=test_env) == deserialize_value(
+        serialize_value(val, whitelist_map=test_env), whitelist_map=test_env
+    )
+
+
+def test_compact_serdes_custom_pack_items() -> None:
+    test_env = WhitelistMap.create()
+
+    class FooSerializer(NamedTupleSerializer):
+        def pack_items(self, *args, **kwargs):
+            for k, v in super().pack_items(*args, **kwargs):
+                if k == "color":
+                    yield "colour", v
+                else:
+                    yield k, v
+
+        def before_unpack(self, context, unpacked_dict: dict[str, Any]):
+            unpacked_dict["color"] = unpacked_dict.pop("colour")
+            return unpacked_dict
+
+    @_whitelist_for_serdes(test_env, serializer=FooSerializer, skip_when_none_fields={"shape"})
+    class Foo(NamedTuple):
+        color: str
+        shape: Optional[str] = None
+
+    @_whitelist_for_serdes(test_env)
+    class Qux(NamedTuple):
+        foos: Sequence[Foo]
+
+    val = Qux([Foo("red"), Foo("blue", "square")])
+    serialized = serialize_value_compact(val, whitelist_map=test_env)
+    # one table per distinct set of packed fields, using the names yielded by pack_items
+    assert '["Foo",["colour"]]' in serialized
+    assert '["Foo",["colour","shape"]]' in serialized
+    assert deserialize_value(serialized, Qux, whitelist_map=test_env) == val
+
+
+def test_compact_serdes_compat() -> None:
+    old_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(old_env)
+    class Foo(NamedTuple):
+        color: str
+
+    old_foo = Foo("red")
+    new_env = WhitelistMap.create()
+
+    @_whitelist_for_serdes(new_env)  # pyright: ignore[reportRedeclaration]
+    class Foo(NamedTuple):
+        color: str
+        shape: Optional[str] = None
+
+    @_whitelist_for_serdes(new_env)
+    class Qux(NamedTuple):
+        foo: Foo
+
+    # fields unknown to the reader are ignored, missing ones use their defaults
+    assert deserialize_value(
+        serialize_value_compact(Foo("red", "square"), whitelist_map=new_env),
+        whitelist_map=old_env,
+    ) == ("red",)
+    assert deserialize_value(
+        serialize_value_compact(old_foo, whitelist_map=old_env), whitelist_map=new_env
+    ) == Foo("red")
+
+    with pytest.raises(
+        DeserializationError,
+        match='Attempted to deserialize class "Qux" which is not in the whitelist',
+    ):
+        deserialize_value(
+            serialize_value_compact(Qux(Foo("red")), whitelist_map=new_env),
+            whitelist_map=old_env,
+        )
@@ -1,4 +1,5 @@
 import tempfile
+import threading
 import time
 from collections.abc import Mapping
 from contextlib import contextmanager
@@ -9,6 +10,7 @@
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.event_log import SqliteEventLogStorage, SqlPollingEventWatcher
 from dagster._core.storage.event_log.base import EventLogCursor
+from dagster._core.storage.event_log.polling_event_watcher import INIT_POLL_PERIOD
 from dagster._core.utils import make_new_run_id
 from dagster._serdes.config_class import ConfigurableClassData
 from typing_extensions import Self
@@ -147,3 +149,50 @@ def watch_two(event, _cursor):
 
     # calling end_watch after dispose does not error
     storage.end_watch(RUN_ID, watch_two)
+
+
+def test_multiplexed_runs():
+    with create_sqlite_run_event_logstorage() as storage:
+        run_ids = [make_new_run_id() for _ in range(3)]
+        watched = {run_id: [] for run_id in run_ids}
+
+        for run_id in run_ids:
+            storage.watch(run_id, None, lambda event, _cursor: watched[event.run_id].append(event))
+
+        for count, run_id in enumerate(run_ids):
+            storage.store_event(create_event(count, run_id=run_id))
+
+        attempts = 10
+        while any(len(events) < 1 for events in watched.values()) and attempts > 0:
+            time.sleep(0.1)
+            attempts -= 1
+
+        assert [int(watched[run_id][0].message) for run_id in run_ids] == [0, 1, 2]
+        # all runs are polled from a single thread
+        assert (
+            len([thread for thread in threading.enumerate() if thread.name == "sql-event-watch"])
+            == 1
+        )
+
+
+def test_idle_run_backoff():
+    with create_sqlite_run_event_logstorage() as storage:
+        watcher = SqlPollingEventWatcher(storage)
+        watched = []
+        watcher.watch_run(RUN_ID, None, lambda event, _cursor: watched.append(event))
+        # stop the polling thread, so that the test controls when runs are polled
+        watcher._should_thread_exit.set()  # noqa: SLF001
+        watcher._thread.join()  # noqa: SLF001  # type: ignore
+        watched_run = watcher._watched_runs[RUN_ID]  # noqa: SLF001
+
+        for _ in range(3):
+            watched_run.next_poll_time = 0
+            watcher.poll()
+        assert watched_run.poll_period == INIT_POLL_PERIOD * 8
+
+        storage.store_event(create_event(1))
+        watched_run.next_poll_time = 0
+        watcher.poll()
+        assert watched_run.poll_period == INIT_POLL_PERIOD
+        assert [int(event.message) for event in watched] == [1]
+        watcher.close()
@@ -3,11 +3,20 @@
 from contextlib import contextmanager
 
 import pytest
-from dagster import DagsterInstance
+import sqlalchemy as db
+from dagster import DagsterInstance, GraphDefinition, job, op
+from dagster._core.execution.api import create_execution_plan
+from dagster._core.snap import snapshot_from_execution_plan
 from dagster._core.storage.legacy_storage import LegacyRunStorage
 from dagster._core.storage.runs import InMemoryRunStorage, SqliteRunStorage
+from dagster._core.storage.runs.schema import SnapshotsTable
+from dagster._core.storage.runs.snapshot_cache import SnapshotCache
+from dagster._core.storage.runs.sql_run_storage import SnapshotType
+from dagster._core.storage.sqlalchemy_compat import db_select
 from dagster._core.storage.sqlite_storage import DagsterSqliteStorage
 from dagster._core.test_utils import instance_for_test
+from dagster._serdes import serialize_value
+from dagster._serdes.utils import serialize_pp
 
 from dagster_tests.storage_tests.utils.run_storage import TestRunStorage
 
@@ -130,3 +139,116 @@ def run_storage(self, instance):
 
     def test_storage_telemetry(self, storage):
         pass
+
+
+def test_sqlite_compact_snapshot_serdes():
+    job_snapshot = GraphDefinition(name="some_pipeline", node_defs=[]).to_job().get_job_snapshot()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        compact_storage = SqliteRunStorage.from_local(tempdir, compact_snapshot_serdes=True)
+        assert compact_storage.compact_snapshot_serdes
+        snapshot_id = compact_storage.add_job_snapshot(job_snapshot)
+        assert snapshot_id == job_snapshot.snapshot_id
+
+        # snapshots are readable regardless of the encoding the storage writes
+        for storage in [compact_storage, SqliteRunStorage.from_local(tempdir)]:
+            fetched_job_snapshot = storage.get_job_snapshot(snapshot_id)
+            assert serialize_pp(fetched_job_snapshot) == serialize_pp(job_snapshot)
+
+
+def test_sqlite_chunked_snapshots():
+    @op
+    def noop_op():
+        pass
+
+    @job
+    def job_one():
+        noop_op()
+
+    @job(tags={"foo": "bar"})
+    def job_two():
+        noop_op()
+        noop_op.alias("other_noop_op")()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        storage = SqliteRunStorage.from_local(tempdir, chunked_snapshots=True)
+        assert storage.chunked_snapshots
+
+        for job_def in [job_one, job_two]:
+            job_snapshot = job_def.get_job_snapshot()
+            snapshot_id = storage.add_job_snapshot(job_snapshot)
+            for fetching_storage in [storage, SqliteRunStorage.from_local(tempdir)]:
+                assert serialize_pp(fetching_storage.get_job_snapshot(snapshot_id)) == serialize_pp(
+                    job_snapshot
+                )
+                assert serialize_pp(
+                    fetching_storage.get_job_snapshot_node_defs(snapshot_id)
+                ) == serialize_pp(job_snapshot.node_defs_snapshot)
+
+        # the types and node definitions are identical between the two jobs, so only their
+        # config schemas and dependency structures are stored twice
+        with storage.connect() as conn:
+            chunk_count = conn.execute(
+                db_select([db.func.count()])
+                .select_from(SnapshotsTable)
+                .where(SnapshotsTable.c.snapshot_type == SnapshotType.CHUNK.value)
+            ).scalar()
+        assert chunk_count == 6
+
+        # the lineage is read from the manifest alone
+        assert storage.get_job_snapshot_lineage(snapshot_id) is None
+        subset_snapshot = job_two.get_subset(op_selection=["noop_op"]).get_job_snapshot()
+        subset_snapshot_id = storage.add_job_snapshot(subset_snapshot)
+        lineage_snapshot = storage.get_job_snapshot_lineage(subset_snapshot_id)
+        assert lineage_snapshot == subset_snapshot.lineage_snapshot
+        assert lineage_snapshot and lineage_snapshot.parent_snapshot_id == snapshot_id
+
+        execution_plan_snapshot = snapshot_from_execution_plan(
+            create_execution_plan(job_two), job_two.get_job_snapshot_id()
+        )
+        snapshot_id = storage.add_execution_plan_snapshot(execution_plan_snapshot)
+        assert serialize_pp(storage.get_execution_plan_snapshot(snapshot_id)) == serialize_pp(
+            execution_plan_snapshot
+        )
+
+
+def test_snapshot_cache():
+    job_snapshot = GraphDefinition(name="some_pipeline", node_defs=[]).to_job().get_job_snapshot()
+
+    with instance_for_test() as instance:
+        storage = instance.run_storage
+        assert isinstance(storage, SqliteRunStorage)
+        snapshot_id = storage.add_job_snapshot(job_snapshot)
+
+        assert storage.get_job_snapshot(snapshot_id) is storage.get_job_snapshot(snapshot_id)
+        stats = storage.get_snapshot_cache_stats()
+        assert stats
+        assert (stats.num_hits, stats.num_misses, stats.num_entries) == (1, 1, 1)
+        assert stats.hit_rate == 0.5
+        assert stats.size_bytes == len(serialize_value(job_snapshot))
+
+        storage.wipe()
+        assert storage.get_snapshot_cache_stats().num_entries == 0  # type: ignore
+
+    with instance_for_test(overrides={"snapshot_cache": {"enabled": False}}) as instance:
+        storage = instance.run_storage
+        assert isinstance(storage, SqliteRunStorage)
+        assert storage.snapshot_cache is None
+        snapshot_id = storage.add_job_snapshot(job_snapshot)
+        assert serialize_pp(storage.get_job_snapshot(snapshot_id)) == serialize_pp(job_snapshot)
+
+
+def test_snapshot_cache_eviction():
+    cache = SnapshotCache(max_size_bytes=10)
+    cache.set("a", "a", 4)
+    cache.set("b", "b", 4)
+    assert cache.get("a") == "a"
+    cache.set("c", "c", 4)
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
+
+    # entries larger than the cache are never stored
+    cache.set("d", "d", 11)
+    assert cache.get("d") is None
+    assert cache.get_stats().size_bytes == 8
@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 import logging  # noqa: F401; used by mock in string form
 import random
@@ -1096,6 +1097,103 @@ def test_basic_get_logs_for_run_multiple_runs_cursors(self, instance, storage):
 
             assert set(map(lambda e: e.run_id, out_events_two)) == {result_two.run_id}
 
+    def test_get_records_for_runs(self, instance, storage):
+        events_one, result_one = _synthesize_events(return_one_op_func)
+        events_two, result_two = _synthesize_events(return_one_op_func)
+
+        with create_and_delete_test_runs(instance, [result_one.run_id, result_two.run_id]):
+            for event in events_one:
+                storage.store_event(event)
+            for event in events_two:
+                storage.store_event(event)
+
+            records_one = storage.get_records_for_run(result_one.run_id).records
+            connections = storage.get_records_for_runs(
+                {result_one.run_id: None, result_two.run_id: None}
+            )
+            assert len(connections[result_one.run_id].records) == len(events_one)
+            assert len(connections[result_two.run_id].records) == len(events_two)
+            assert {
+                record.event_log_entry.run_id for record in connections[result_one.run_id].records
+            } == {result_one.run_id}
+
+            # each run is fetched after its own cursor
+            cursor_one = str(EventLogCursor.from_storage_id(records_one[1].storage_id))
+            connections = storage.get_records_for_runs(
+                {
+                    result_one.run_id: cursor_one,
+                    result_two.run_id: connections[result_two.run_id].cursor,
+                }
+            )
+            assert [record.storage_id for record in connections[result_one.run_id].records] == [
+                record.storage_id for record in records_one[2:]
+            ]
+            assert connections[result_one.run_id].cursor == str(
+                EventLogCursor.from_storage_id(records_one[-1].storage_id)
+            )
+            assert not connections[result_two.run_id].records
+            assert not connections[result_two.run_id].has_more
+
+            # the limit applies across all runs
+            connections = storage.get_records_for_runs(
+                {result_one.run_id: None, result_two.run_id: None}, limit=2
+            )
+            assert sum(len(connection.records) for connection in connections.values()) == 2
+            assert any(connection.has_more for connection in connections.values())
+
+    def test_iter_records_for_run(self, storage, test_run_id):
+        events, _ = _synthesize_events(return_one_op_func, run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        records = storage.get_records_for_run(test_run_id).records
+        assert len(records) == len(events)
+
+        for page_size in [1, 3, len(events), len(events) + 1]:
+            assert [
+                record.storage_id
+                for record in storage.iter_records_for_run(test_run_id, page_size=page_size)
+            ] == [record.storage_id for record in records]
+
+        cursor = str(EventLogCursor.from_storage_id(records[1].storage_id))
+        assert [
+            record.storage_id
+            for record in storage.iter_records_for_run(test_run_id, cursor=cursor, page_size=2)
+        ] == [record.storage_id for record in records[2:]]
+
+        assert [
+            record.storage_id
+            for record in storage.iter_records_for_run(test_run_id, page_size=2, ascending=False)
+        ] == [record.storage_id for record in reversed(records)]
+
+        step_start_records = storage.get_records_for_run(
+            test_run_id, of_type=DagsterEventType.STEP_START
+        ).records
+        assert [
+            record.storage_id
+            for record in storage.iter_records_for_run(
+                test_run_id, of_type=DagsterEventType.STEP_START, page_size=1
+            )
+        ] == [record.storage_id for record in step_start_records]
+
+    def test_get_records_for_run_async(self, instance, storage, test_run_id):
+        events, _ = _synthesize_events(return_one_op_func, run_id=test_run_id)
+        for event in events:
+            storage.store_event(event)
+
+        connection = storage.get_records_for_run(test_run_id, limit=2)
+        async_connection = asyncio.run(storage.get_records_for_run_async(test_run_id, limit=2))
+        assert [record.storage_id for record in async_connection.records] == [
+            record.storage_id for record in connection.records
+        ]
+        assert async_connection.cursor == connection.cursor
+        assert async_connection.has_more == connection.has_more
+
+        async_connection = asyncio.run(
+            storage.get_records_for_run_async(test_run_id, cursor=connection.cursor)
+        )
+        assert len(async_connection.records) == len(events) - 2
+
     # .watch() is async, there's a small chance they don't run before the asserts
     @pytest.mark.flaky(max_runs=2)
     def test_event_watcher_single_run_event(self, storage, test_run_id):
@@ -1289,6 +1387,162 @@ def foo():
         result = storage.fetch_materializations(foo.key, limit=100)
         assert len(result.records) == 2
 
+    def test_store_event_batch_mixed_events(self, storage, test_run_id):
+        asset_key_a = AssetKey(["batch", "a"])
+        asset_key_b = AssetKey(["batch", "b"])
+        check_key = AssetCheckKey(asset_key_a, "batch_check")
+
+        def _entry(event_type=None, event_specific_data=None, message=""):
+            return EventLogEntry(
+                error_info=None,
+                user_message=message,
+                level="debug",
+                run_id=test_run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    event_type.value,
+                    "nonce",
+                    event_specific_data=event_specific_data,
+                )
+                if event_type
+                else None,
+            )
+
+        def _materialization(asset_key, data_version):
+            return _entry(
+                DagsterEventType.ASSET_MATERIALIZATION,
+                StepMaterializationData(
+                    AssetMaterialization(asset_key=asset_key, tags={DATA_VERSION_TAG: data_version})
+                ),
+            )
+
+        events = [
+            _entry(message="log message"),
+            _entry(
+                DagsterEventType.ASSET_MATERIALIZATION_PLANNED,
+                AssetMaterializationPlannedData(asset_key_a),
+            ),
+            _entry(
+                DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED,
+                AssetCheckEvaluationPlanned(asset_key=asset_key_a, check_name="batch_check"),
+            ),
+            _entry(DagsterEventType.ENGINE_EVENT, EngineEventData.in_process(999)),
+            _materialization(asset_key_a, "1"),
+            _materialization(asset_key_b, "1"),
+            _entry(
+                DagsterEventType.ASSET_OBSERVATION,
+                AssetObservationData(AssetObservation(asset_key=asset_key_b)),
+            ),
+            _materialization(asset_key_a, "2"),
+            _entry(
+                DagsterEventType.ASSET_CHECK_EVALUATION,
+                AssetCheckEvaluation(
+                    asset_key=asset_key_a,
+                    check_name="batch_check",
+                    passed=True,
+                    metadata={},
+                ),
+            ),
+        ]
+
+        with ExitStack() as stack:
+            if isinstance(storage, SqlEventLogStorage):
+                # asset index rows are maintained in bulk rather than one statement per event
+                stack.enter_context(
+                    mock.patch.object(
+                        storage,
+                        "store_asset_event",
+                        side_effect=Exception("store_asset_event called"),
+                    )
+                )
+            storage.store_event_batch(events)
+
+        records = storage.get_records_for_run(test_run_id).records
+        assert [record.event_log_entry for record in records] == events
+
+        materializations_a = storage.fetch_materializations(asset_key_a, limit=10).records
+        assert len(materializations_a) == 2
+        asset_records = {
+            record.asset_entry.asset_key: record.asset_entry
+            for record in storage.get_asset_records([asset_key_a, asset_key_b])
+        }
+        # the asset index reflects the last materialization of each asset key in the batch
+        assert (
+            check.not_none(asset_records[asset_key_a].last_materialization_record).storage_id
+            == materializations_a[0].storage_id
+        )
+        assert (
+            check.not_none(asset_records[asset_key_a].last_materialization_record).event_log_entry
+            == events[7]
+        )
+        assert (
+            check.not_none(asset_records[asset_key_b].last_materialization_record).event_log_entry
+            == events[5]
+        )
+        assert asset_records[asset_key_a].last_run_id == test_run_id
+
+        assert storage.get_event_tags_for_asset(
+            asset_key_a, filter_event_id=materializations_a[0].storage_id
+        ) == [{DATA_VERSION_TAG: "2"}]
+
+        if storage.supports_asset_checks:
+            checks = storage.get_asset_check_execution_history(check_key, limit=10)
+            assert len(checks) == 1
+            assert checks[0].status == AssetCheckExecutionRecordStatus.SUCCEEDED
+            assert checks[0].run_id == test_run_id
+
+    def test_store_event_batch_asset_check_evaluation_without_planned(self, storage, test_run_id):
+        if not storage.supports_asset_checks:
+            pytest.skip("storage does not support asset checks")
+
+        asset_key = AssetKey(["batch", "unplanned"])
+
+        def _evaluation(check_name):
+            return EventLogEntry(
+                error_info=None,
+                user_message="",
+                level="debug",
+                run_id=test_run_id,
+                timestamp=time.time(),
+                dagster_event=DagsterEvent(
+                    DagsterEventType.ASSET_CHECK_EVALUATION.value,
+                    "nonce",
+                    event_specific_data=AssetCheckEvaluation(
+                        asset_key=asset_key, check_name=check_name, passed=True, metadata={}
+                    ),
+                ),
+            )
+
+        planned = EventLogEntry(
+            error_info=None,
+            user_message="",
+            level="debug",
+            run_id=test_run_id,
+            timestamp=time.time(),
+            dagster_event=DagsterEvent(
+                DagsterEventType.ASSET_CHECK_EVALUATION_PLANNED.value,
+                "nonce",
+                event_specific_data=AssetCheckEvaluationPlanned(
+                    asset_key=asset_key, check_name="planned_check"
+                ),
+            ),
+        )
+        storage.store_event_batch(
+            [planned, _evaluation("planned_check"), _evaluation("unplanned_check")]
+        )
+
+        checks = storage.get_asset_check_execution_history(
+            AssetCheckKey(asset_key, "planned_check"), limit=10
+        )
+        assert len(checks) == 1
+        assert checks[0].status == AssetCheckExecutionRecordStatus.SUCCEEDED
+        assert checks[0].run_id == test_run_id
+
+        # since no planned event is logged, we don't create a row in the summary table
+        assert not storage.get_asset_check_execution_history(
+            AssetCheckKey(asset_key, "unplanned_check"), limit=10
+        )
+
     def test_asset_materialization_fetch(self, storage, instance):
         asset_key = AssetKey(["path", "to", "asset_one"])
 
@@ -2787,6 +3041,74 @@ def _store_partition_event(asset_key, partition) -> int:
             latest_storage_ids["p1"] = _store_partition_event(a, "p1")
             _assert_storage_matches(latest_storage_ids)
 
+    def test_get_latest_storage_ids_by_partition_for_assets(self, storage, instance):
+        a = AssetKey(["a"])
+        b = AssetKey(["b"])
+        c = AssetKey(["c"])
+        run_id = make_new_run_id()
+
+        def _store_partition_event(asset_key, partition) -> None:
+            storage.store_event(
+                EventLogEntry(
+                    error_info=None,
+                    level="debug",
+                    user_message="",
+                    run_id=run_id,
+                    timestamp=time.time(),
+                    dagster_event=DagsterEvent(
+                        DagsterEventType.ASSET_MATERIALIZATION.value,
+                        "nonce",
+                        event_specific_data=StepMaterializationData(
+                            AssetMaterialization(asset_key=asset_key, partition=partition)
+                        ),
+                    ),
+                )
+            )
+
+        def _assert_storage_matches():
+            # matches the result of querying each asset on its own
+            expected = {
+                asset_key: storage.get_latest_storage_id_by_partition(
+                    asset_key, DagsterEventType.ASSET_MATERIALIZATION
+                )
+                for asset_key in [a, b, c]
+            }
+            assert storage.get_latest_storage_ids_by_partition_for_assets(
+                [a, b, c], DagsterEventType.ASSET_MATERIALIZATION
+            ) == {asset_key: ids for asset_key, ids in expected.items() if ids}
+
+        with create_and_delete_test_runs(instance, [run_id]):
+            assert (
+                storage.get_latest_storage_ids_by_partition_for_assets(
+                    [a, b], DagsterEventType.ASSET_MATERIALIZATION
+                )
+                == {}
+            )
+
+            _store_partition_event(a, "p1")
+            _store_partition_event(a, "p2")
+            _store_partition_event(b, "p1")
+            _store_partition_event(a, "p1")
+            _store_partition_event(c, None)
+            _assert_storage_matches()
+            assert set(
+                storage.get_latest_storage_ids_by_partition_for_assets(
+                    [a, b, c], DagsterEventType.ASSET_MATERIALIZATION
+                )
+            ) == {a, b}
+            assert (
+                storage.get_latest_storage_ids_by_partition_for_assets(
+                    [a, b], DagsterEventType.ASSET_OBSERVATION
+                )
+                == {}
+            )
+
+            storage.wipe_asset(a)
+            _assert_storage_matches()
+
+            _store_partition_event(a, "p2")
+            _assert_storage_matches()
+
     @pytest.mark.parametrize(
         "dagster_event_type",
         [DagsterEventType.ASSET_OBSERVATION, DagsterEventType.ASSET_MATERIALIZATION],
@@ -4764,6 +5086,9 @@ def yields_materialization():
                 serialized_failed_partition_subset="baz",
                 serialized_in_progress_partition_subset="qux",
                 earliest_in_progress_materialization_event_id=42,
+                in_progress_partitions_by_run_id={"run_id": ["quux"]},
+                pending_materialized_partitions=["corge"],
+                pending_failed_partitions=["grault"],
             )
 
             # Check that AssetStatusCacheValue has all fields set. This ensures that we test that the
@@ -1,4 +1,5 @@
 import time
+from unittest import mock
 
 import pytest
 from dagster import (
@@ -25,9 +26,12 @@
 from dagster._core.storage.dagster_run import DagsterRunStatus
 from dagster._core.storage.partition_status_cache import (
     RUN_FETCH_BATCH_SIZE,
+    AssetPartitionStatus,
     build_failed_and_in_progress_partition_subset,
+    check_asset_status_cache_value,
     get_and_update_asset_status_cache_value,
     get_last_planned_storage_id,
+    rebuild_asset_status_cache_value,
 )
 from dagster._core.test_utils import create_run_for_test
 from dagster._core.utils import make_new_run_id
@@ -783,6 +787,171 @@ def asset1(context):
         # run_1 is still in progress, but run_2 started after and failed, so we move on
         assert cached_status.earliest_in_progress_materialization_event_id is None  # pyright: ignore[reportOptionalMemberAccess]
 
+    def test_cache_maintained_on_write(self, instance):
+        if not instance.event_log_storage.can_maintain_asset_status_cache_on_write():
+            pytest.skip("storage cannot maintain the cached status on write")
+
+        partitions_def = StaticPartitionsDefinition(["good1", "good2", "fail1", "fail2"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1(context):
+            if context.partition_key.startswith("fail"):
+                raise Exception()
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="fail1", raise_on_error=False)
+
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get(asset_key).partitions_def
+        )
+        assert cached_status
+        assert cached_status.is_maintained_on_write
+        assert not cached_status.has_pending_changes
+
+        asset_job.execute_in_process(instance=instance, partition_key="good1")
+        asset_job.execute_in_process(instance=instance, partition_key="fail2", raise_on_error=False)
+        run = create_run_for_test(instance, status=DagsterRunStatus.STARTED)
+        instance.event_log_storage.store_event(
+            _create_test_planned_materialization_record(run.run_id, asset_key, "good2")
+        )
+
+        # the storage applied the new events to the stored cache value
+        stored_status = next(
+            iter(instance.get_asset_records([asset_key]))
+        ).asset_entry.cached_status
+        assert stored_status
+        assert stored_status.has_pending_changes
+        assert stored_status.pending_materialized_partitions == ["good1"]
+        assert stored_status.pending_failed_partitions == ["fail2"]
+        assert stored_status.in_progress_partitions_by_run_id == {run.run_id: ["good2"]}
+
+        traced_counter.set(Counter())
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get(asset_key).partitions_def
+        )
+        counts = traced_counter.get().counts()  # pyright: ignore[reportOptionalMemberAccess]
+        assert not counts.get("DagsterInstance.get_materialized_partitions")
+
+        assert cached_status
+        assert not cached_status.has_pending_changes
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1"}
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1", "fail2"}
+        assert cached_status.deserialize_in_progress_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good2"}
+        assert (
+            next(iter(instance.get_asset_records([asset_key]))).asset_entry.cached_status
+            == cached_status
+        )
+
+        instance.report_run_failed(run)
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get(asset_key).partitions_def
+        )
+        assert cached_status
+        assert cached_status.deserialize_failed_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"fail1", "fail2", "good2"}
+        assert (
+            cached_status.deserialize_in_progress_partition_subsets(
+                partitions_def
+            ).get_partition_keys()
+            == set()
+        )
+        assert check_asset_status_cache_value(instance, asset_key, partitions_def) == []
+
+    def test_cache_maintained_on_write_pending_partitions_limit(self, instance):
+        if not instance.event_log_storage.can_maintain_asset_status_cache_on_write():
+            pytest.skip("storage cannot maintain the cached status on write")
+
+        partitions_def = StaticPartitionsDefinition(["a", "b", "c", "d"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1(context):
+            pass
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="a")
+        assert get_and_update_asset_status_cache_value(instance, asset_key, partitions_def)
+
+        with mock.patch(
+            "dagster._core.storage.partition_status_cache.MAX_PENDING_PARTITIONS", new=2
+        ):
+            for partition_key in ["b", "c", "d"]:
+                asset_job.execute_in_process(instance=instance, partition_key=partition_key)
+
+            # once the limit is reached, the storage stops applying events to the cache value
+            stored_status = next(
+                iter(instance.get_asset_records([asset_key]))
+            ).asset_entry.cached_status
+            assert stored_status
+            assert stored_status.pending_materialized_partitions == ["b", "c"]
+            assert not stored_status.can_apply_changes_on_write
+
+            # the read catches up from the event log
+            cached_status = get_and_update_asset_status_cache_value(
+                instance, asset_key, partitions_def
+            )
+            assert cached_status
+            assert cached_status.can_apply_changes_on_write
+            assert cached_status.deserialize_materialized_partition_subsets(
+                partitions_def
+            ).get_partition_keys() == {"a", "b", "c", "d"}
+            assert check_asset_status_cache_value(instance, asset_key, partitions_def) == []
+
+    def test_check_and_rebuild_cache(self, instance):
+        if not instance.event_log_storage.can_maintain_asset_status_cache_on_write():
+            pytest.skip("storage cannot maintain the cached status on write")
+
+        partitions_def = StaticPartitionsDefinition(["good1", "good2"])
+
+        @asset(partitions_def=partitions_def)
+        def asset1(context):
+            pass
+
+        asset_key = AssetKey("asset1")
+        asset_graph = AssetGraph.from_assets([asset1])
+        asset_job = define_asset_job("asset_job").resolve(asset_graph=asset_graph)
+
+        asset_job.execute_in_process(instance=instance, partition_key="good1")
+        asset_job.execute_in_process(instance=instance, partition_key="good2")
+
+        cached_status = get_and_update_asset_status_cache_value(
+            instance, asset_key, asset_graph.get(asset_key).partitions_def
+        )
+        assert cached_status
+        assert check_asset_status_cache_value(instance, asset_key, partitions_def) == []
+
+        # drop a materialized partition from the cache
+        instance.update_asset_cached_status_data(
+            asset_key,
+            cached_status._replace(
+                serialized_materialized_partition_subset=partitions_def.empty_subset()
+                .with_partition_keys(["good1"])
+                .serialize()
+            ),
+        )
+        assert check_asset_status_cache_value(instance, asset_key, partitions_def) == [
+            AssetPartitionStatus.MATERIALIZED
+        ]
+
+        cached_status = rebuild_asset_status_cache_value(instance, asset_key, partitions_def)
+        assert cached_status
+        assert cached_status.deserialize_materialized_partition_subsets(
+            partitions_def
+        ).get_partition_keys() == {"good1", "good2"}
+        assert check_asset_status_cache_value(instance, asset_key, partitions_def) == []
+
     def test_failed_partitioned_asset_converted_to_multipartitioned(self, instance):
         daily_def = DailyPartitionsDefinition("2023-01-01")
 
@@ -1,3 +1,4 @@
+import asyncio
 import sys
 import tempfile
 import time
@@ -839,6 +840,12 @@ def _run_ids(records):
         assert _run_ids(storage.get_run_records(cursor=three, limit=1)) == [two]
         assert _run_ids(storage.get_run_records(cursor=one, limit=1, ascending=True)) == [two]
 
+        # the async variant returns the same records as the sync method
+        assert _run_ids(asyncio.run(storage.get_run_records_async())) == [three, two, one]
+        assert _run_ids(
+            asyncio.run(storage.get_run_records_async(cursor=three, limit=1, ascending=False))
+        ) == [two]
+
     def test_fetch_records_by_update_timestamp(self, storage, instance):
         assert storage
         self._skip_in_memory(storage)
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import ContextManager, Optional, cast  # noqa: UP035
 
 import dagster._check as check
@@ -17,6 +18,7 @@
 )
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
+from dagster._core.storage.event_log.sql_event_log import group_asset_key_rows_by_columns
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -170,6 +172,25 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 except db_exc.IntegrityError:
                     pass
 
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        # See SqlEventLogStorage.store_asset_event method for more details on the written values
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        with self.index_connection() as conn:
+            for columns, rows in group_asset_key_rows_by_columns(values_by_asset_key).items():
+                query = db_dialects.mysql.insert(AssetKeyTable).values(rows)
+                conn.execute(
+                    query.on_duplicate_key_update(
+                        # rows without updated columns are inserted only if missing
+                        {column: query.inserted[column] for column in columns}
+                        if columns
+                        else {"asset_key": query.inserted.asset_key}
+                    )
+                )
+
     def _connect(self) -> ContextManager[Connection]:
         return create_mysql_connection(self._engine, __file__, "event log")
 
@@ -5,8 +5,9 @@
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
+from dagster import Field, StringSource
 from dagster._config.config_schema import UserConfigSchema
-from dagster._core.storage.config import MySqlStorageConfig, mysql_config
+from dagster._core.storage.config import MySqlStorageConfig, mysql_db_config
 from dagster._core.storage.runs import (
     DaemonHeartbeatsTable,
     InstanceInfo,
@@ -54,11 +55,21 @@ class MySQLRunStorage(SqlRunStorage, ConfigurableClass):
 
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
+
+    Setting ``chunked_snapshots`` stores the large sub-objects of job and execution plan snapshots
+    as chunks shared between snapshots. Older versions of Dagster cannot read snapshots written
+    with this setting.
     """
 
-    def __init__(self, mysql_url: str, inst_data: Optional[ConfigurableClassData] = None):
+    def __init__(
+        self,
+        mysql_url: str,
+        inst_data: Optional[ConfigurableClassData] = None,
+        chunked_snapshots: bool = False,
+    ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.mysql_url = mysql_url
+        self._chunked_snapshots = check.bool_param(chunked_snapshots, "chunked_snapshots")
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -103,9 +114,19 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def chunked_snapshots(self) -> bool:
+        return self._chunked_snapshots
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return mysql_config()
+        # exactly one of mysql_url and mysql_db is required, as in `mysql_config`, which is checked
+        # in `mysql_url_from_config`
+        return {
+            "mysql_url": Field(StringSource, is_required=False),
+            "mysql_db": Field(mysql_db_config(), is_required=False),
+            "chunked_snapshots": Field(bool, is_required=False),
+        }
 
     def get_server_version(self) -> Optional[str]:
         with self.connect() as conn:
@@ -120,7 +141,11 @@ def get_server_version(self) -> Optional[str]:
     def from_config_value(
         cls, inst_data: Optional[ConfigurableClassData], config_value: MySqlStorageConfig
     ) -> "MySQLRunStorage":
-        return MySQLRunStorage(inst_data=inst_data, mysql_url=mysql_url_from_config(config_value))
+        return MySQLRunStorage(
+            inst_data=inst_data,
+            mysql_url=mysql_url_from_config(config_value),
+            chunked_snapshots=config_value.get("chunked_snapshots", False),
+        )
 
     @staticmethod
     def wipe_storage(mysql_url: str) -> None:
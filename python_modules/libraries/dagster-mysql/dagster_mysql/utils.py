@@ -51,8 +51,16 @@ def get_conn(conn_string: str) -> MySQLConnectionUnion:
 
 def mysql_url_from_config(config_value: MySqlStorageConfig) -> str:
     if config_value.get("mysql_url"):
+        check.invariant(
+            "mysql_db" not in config_value,
+            "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+        )
         return config_value["mysql_url"]
 
+    check.invariant(
+        "mysql_db" in config_value,
+        "mysql storage config must have exactly one of `mysql_url` or `mysql_db`",
+    )
     return get_conn_string(**config_value["mysql_db"])
 
 
@@ -2,6 +2,7 @@
 
 import pytest
 import yaml
+from dagster import GraphDefinition
 from dagster._core.test_utils import ensure_dagster_tests_import, environ, instance_for_test
 from dagster_mysql.run_storage import MySQLRunStorage
 
@@ -98,3 +99,27 @@ def test_load_from_config(self, conn_string):
                         from_url_instance._run_storage.mysql_url  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
                         == from_env_instance._run_storage.mysql_url  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
                     )
+
+    def test_load_chunked_snapshots_from_config(self, conn_string):
+        cfg = f"""
+          run_storage:
+            module: dagster_mysql.run_storage
+            class: MySQLRunStorage
+            config:
+              mysql_url: {conn_string}
+              chunked_snapshots: true
+        """
+
+        with instance_for_test(overrides=yaml.safe_load(cfg)) as instance:
+            run_storage = instance.run_storage
+            assert isinstance(run_storage, MySQLRunStorage)
+            assert run_storage.chunked_snapshots
+
+            job_snapshot = (
+                GraphDefinition(name="some_job", node_defs=[]).to_job().get_job_snapshot()
+            )
+            snapshot_id = run_storage.add_job_snapshot(job_snapshot)
+            assert run_storage.get_job_snapshot(snapshot_id) == job_snapshot
+            assert run_storage.get_job_snapshot_node_defs(snapshot_id) == (
+                job_snapshot.node_defs_snapshot
+            )
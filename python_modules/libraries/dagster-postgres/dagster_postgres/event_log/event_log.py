@@ -9,7 +9,7 @@
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.errors import DagsterInvariantViolationError
 from dagster._core.event_api import EventHandlerFn
-from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS, BATCH_WRITABLE_EVENTS
+from dagster._core.events import ASSET_CHECK_EVENTS, ASSET_EVENTS
 from dagster._core.events.log import EventLogEntry
 from dagster._core.storage.config import pg_config
 from dagster._core.storage.event_log import (
@@ -22,6 +22,7 @@
 from dagster._core.storage.event_log.base import EventLogCursor
 from dagster._core.storage.event_log.migration import ASSET_KEY_INDEX_COLS
 from dagster._core.storage.event_log.polling_event_watcher import SqlPollingEventWatcher
+from dagster._core.storage.event_log.sql_event_log import group_asset_key_rows_by_columns
 from dagster._core.storage.sql import (
     AlembicVersion,
     check_alembic_revision,
@@ -175,7 +176,8 @@ def store_event(self, event: EventLogEntry) -> None:
         check.inst_param(event, "event", EventLogEntry)
 
         insert_event_statement = self.prepare_insert_event(event)  # from SqlEventLogStorage.py
-        with self._connect() as conn:
+        store_status_cache_changes = self.should_store_asset_status_cache_changes([event])
+        with self.run_transaction(event.run_id) as conn:
             result = conn.execute(
                 insert_event_statement.returning(
                     SqlEventLogStorageTable.c.run_id, SqlEventLogStorageTable.c.id
@@ -190,6 +192,8 @@ def store_event(self, event: EventLogEntry) -> None:
                 {"notify_id": res[0] + "_" + str(res[1])},  # type: ignore
             )
             event_id = int(res[1])  # type: ignore
+            if store_status_cache_changes:
+                self.store_asset_status_cache_changes(conn, [event], [event_id])
 
         if (
             event.is_dagster_event
@@ -208,26 +212,12 @@ def store_event(self, event: EventLogEntry) -> None:
         if event.is_dagster_event and event.dagster_event_type in ASSET_CHECK_EVENTS:
             self.store_asset_check_event(event, event_id)
 
-    def store_event_batch(self, events: Sequence[EventLogEntry]) -> None:
-        check.sequence_param(events, "event", of_type=EventLogEntry)
-
-        check.invariant(
-            all(event.get_dagster_event().event_type in BATCH_WRITABLE_EVENTS for event in events),
-            f"{BATCH_WRITABLE_EVENTS} are the only currently supported events for batch writes.",
-        )
-
+    def _insert_event_batch(
+        self, conn: Connection, events: Sequence[EventLogEntry]
+    ) -> Sequence[Optional[int]]:
         insert_event_statement = self.prepare_insert_event_batch(events)
-        with self._connect() as conn:
-            result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
-            event_ids = [cast(int, row[0]) for row in result.fetchall()]
-
-        # We only update the asset table with the last event
-        self.store_asset_event(events[-1], event_ids[-1])
-
-        if any(event_id is None for event_id in event_ids):
-            raise DagsterInvariantViolationError("Cannot store asset event tags for null event id.")
-
-        self.store_asset_event_tags(events, event_ids)
+        result = conn.execute(insert_event_statement.returning(SqlEventLogStorageTable.c.id))
+        return [cast(int, row[0]) for row in result.fetchall()]
 
     def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
         check.inst_param(event, "event", EventLogEntry)
@@ -281,6 +271,25 @@ def store_asset_event(self, event: EventLogEntry, event_id: int) -> None:
                 query = query.on_conflict_do_nothing()
             conn.execute(query)
 
+    def store_asset_event_batch(
+        self, events: Sequence[EventLogEntry], event_ids: Sequence[int]
+    ) -> None:
+        # See PostgresEventLogStorage.store_asset_event for more details on the written values
+        values_by_asset_key = self._get_asset_entry_values_by_asset_key(
+            events, event_ids, self.has_secondary_index(ASSET_KEY_INDEX_COLS)
+        )
+        with self.index_connection() as conn:
+            for columns, rows in group_asset_key_rows_by_columns(values_by_asset_key).items():
+                query = db_dialects.postgresql.insert(AssetKeyTable).values(rows)
+                if columns:
+                    query = query.on_conflict_do_update(
+                        index_elements=[AssetKeyTable.c.asset_key],
+                        set_={column: query.excluded[column] for column in columns},
+                    )
+                else:
+                    query = query.on_conflict_do_nothing()
+                conn.execute(query)
+
     def add_dynamic_partitions(
         self, partitions_def_name: str, partition_keys: Sequence[str]
     ) -> None:
@@ -321,6 +330,12 @@ def index_transaction(self) -> Iterator[Connection]:
                 with conn.begin():
                     yield conn
 
+    @contextmanager
+    def run_transaction(self, run_id: Optional[str]) -> Iterator[Connection]:
+        # runs and the index share a single database
+        with self.index_transaction() as conn:
+            yield conn
+
     def has_table(self, table_name: str) -> bool:
         return bool(self._engine.dialect.has_table(self._engine.connect(), table_name))
 
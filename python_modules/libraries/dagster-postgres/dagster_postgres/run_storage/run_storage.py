@@ -1,4 +1,3 @@
-import zlib
 from collections.abc import Mapping
 from typing import ContextManager, Optional  # noqa: UP035
 
@@ -6,6 +5,7 @@
 import sqlalchemy as db
 import sqlalchemy.dialects as db_dialects
 import sqlalchemy.pool as db_pool
+from dagster import Field
 from dagster._config.config_schema import UserConfigSchema
 from dagster._core.storage.config import PostgresStorageConfig, pg_config
 from dagster._core.storage.runs import (
@@ -65,6 +65,10 @@ class PostgresRunStorage(SqlRunStorage, ConfigurableClass):
 
     Note that the fields in this config are :py:class:`~dagster.StringSource` and
     :py:class:`~dagster.IntSource` and can be configured from environment variables.
+
+    Setting ``chunked_snapshots`` stores the large sub-objects of job and execution plan snapshots
+    as chunks shared between snapshots. Older versions of Dagster cannot read snapshots written
+    with this setting.
     """
 
     def __init__(
@@ -72,12 +76,14 @@ def __init__(
         postgres_url: str,
         should_autocreate_tables: bool = True,
         inst_data: Optional[ConfigurableClassData] = None,
+        chunked_snapshots: bool = False,
     ):
         self._inst_data = check.opt_inst_param(inst_data, "inst_data", ConfigurableClassData)
         self.postgres_url = postgres_url
         self.should_autocreate_tables = check.bool_param(
             should_autocreate_tables, "should_autocreate_tables"
         )
+        self._chunked_snapshots = check.bool_param(chunked_snapshots, "chunked_snapshots")
 
         # Default to not holding any connections open to prevent accumulating connections per DagsterInstance
         self._engine = create_engine(
@@ -129,9 +135,16 @@ def optimize_for_webserver(self, statement_timeout: int, pool_recycle: int) -> N
     def inst_data(self) -> Optional[ConfigurableClassData]:
         return self._inst_data
 
+    @property
+    def chunked_snapshots(self) -> bool:
+        return self._chunked_snapshots
+
     @classmethod
     def config_type(cls) -> UserConfigSchema:
-        return pg_config()
+        return {
+            **pg_config(),
+            "chunked_snapshots": Field(bool, is_required=False),
+        }
 
     @classmethod
     def from_config_value(
@@ -141,6 +154,7 @@ def from_config_value(
             inst_data=inst_data,
             postgres_url=pg_url_from_config(config_value),
             should_autocreate_tables=config_value.get("should_autocreate_tables", True),
+            chunked_snapshots=config_value.get("chunked_snapshots", False),
         )
 
     @staticmethod
@@ -220,19 +234,20 @@ def set_cursor_values(self, pairs: Mapping[str, str]) -> None:
         with self.connect() as conn:
             conn.execute(upsert_stmt)
 
-    def _add_snapshot(self, snapshot_id: str, snapshot_obj, snapshot_type: SnapshotType) -> str:
+    def _insert_snapshot(
+        self, snapshot_id: str, snapshot_body: bytes, snapshot_type: SnapshotType
+    ) -> None:
         with self.connect() as conn:
             snapshot_insert = (
                 db_dialects.postgresql.insert(SnapshotsTable)
                 .values(
                     snapshot_id=snapshot_id,
-                    snapshot_body=zlib.compress(serialize_value(snapshot_obj).encode("utf-8")),
+                    snapshot_body=snapshot_body,
                     snapshot_type=snapshot_type.value,
                 )
                 .on_conflict_do_nothing()
             )
             conn.execute(snapshot_insert)
-            return snapshot_id
 
     def alembic_version(self) -> AlembicVersion:
         alembic_config = pg_alembic_config(__file__)
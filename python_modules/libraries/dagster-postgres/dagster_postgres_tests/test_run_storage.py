@@ -1,5 +1,6 @@
 import pytest
 import yaml
+from dagster import GraphDefinition
 from dagster._core.test_utils import ensure_dagster_tests_import, environ, instance_for_test
 from dagster_postgres.run_storage import PostgresRunStorage
 
@@ -85,3 +86,27 @@ def test_load_from_config(self, hostname):
                         from_url_instance._run_storage.postgres_url  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
                         == from_env_instance._run_storage.postgres_url  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
                     )
+
+    def test_load_chunked_snapshots_from_config(self, hostname):
+        cfg = f"""
+          run_storage:
+            module: dagster_postgres.run_storage
+            class: PostgresRunStorage
+            config:
+              postgres_url: postgresql://test:test@{hostname}:5432/test
+              chunked_snapshots: true
+        """
+
+        with instance_for_test(overrides=yaml.safe_load(cfg)) as instance:
+            run_storage = instance.run_storage
+            assert isinstance(run_storage, PostgresRunStorage)
+            assert run_storage.chunked_snapshots
+
+            job_snapshot = (
+                GraphDefinition(name="some_job", node_defs=[]).to_job().get_job_snapshot()
+            )
+            snapshot_id = run_storage.add_job_snapshot(job_snapshot)
+            assert run_storage.get_job_snapshot(snapshot_id) == job_snapshot
+            assert run_storage.get_job_snapshot_node_defs(snapshot_id) == (
+                job_snapshot.node_defs_snapshot
+            )